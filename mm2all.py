@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""Convert one freemind file(.mm) to several formats with a single parse.
+
+The map is parsed once and the same tree is handed to every requested
+emitter: markdown and textile (MMTransform), S5 slides (Mm2S5) and meeting
+notes (Mm2Notes).  None of them modifies the tree.
+
+  python mm2all.py map.mm                   # every format, next to map.mm
+  python mm2all.py map.mm --md post.md --s5 slides.html
+"""
+
+from __future__ import unicode_literals
+import optparse
+import os
+import sys
+import mmconfig
+import mmstream
+from mm2md import MMTransform, MakeBlogInGithub, getconf
+from mm2s5 import Mm2S5
+from mm2notes import Mm2Notes
+
+# format: (line separator, default output suffix)
+FORMATS = {
+    'md': (os.linesep, '.md'),
+    'textile': (os.linesep, '.textile'),
+    's5': ('\n', '.html'),
+    'notes': ('\n', '.notes.html'),
+}
+
+
+def emit(mmtree, fmt, conf=None, order_by_time=False):
+    """the lines of mmtree (a parsed <map>) in format fmt.
+
+    conf is an app.yaml post block: when given, the markdown gets the blog
+    front matter of mm2md."""
+    if fmt == 'md':
+        lines = MMTransform().tree2md(mmtree)
+        if conf is not None:
+            lines = MakeBlogInGithub().iter_blog(lines, conf)
+        return lines
+    if fmt == 'textile':
+        return MMTransform().tree2textile(mmtree)
+    if fmt == 's5':
+        mm2s5 = Mm2S5()
+        mm2s5.et_in = mmtree
+        return mm2s5.iter_slides()
+    if fmt == 'notes':
+        mm2notes = Mm2Notes()
+        mm2notes.et_in = mmtree
+        mm2notes.set_order_by_time(order_by_time)
+        return mm2notes.iter_notes()
+    raise ValueError('unknown format %r' % fmt)
+
+
+def export(infilename, outputs, conf=None, order_by_time=False):
+    """parse infilename once and write {format: output filename}"""
+    mmtree = mmstream.parse(infilename)
+    for fmt in sorted(outputs):
+        sep = FORMATS[fmt][0]
+        outfile = file(outputs[fmt], 'wb')
+        try:
+            mmstream.write_lines(outfile, emit(mmtree, fmt, conf, order_by_time), sep)
+            if fmt == 'notes':
+                # as Mm2Notes.write does
+                outfile.write(b'\n')
+        finally:
+            outfile.close()
+
+
+def main(argv):
+    parser = optparse.OptionParser('%prog [options] <mmfile>')
+    for fmt in sorted(FORMATS):
+        parser.add_option('--' + fmt, dest=fmt, metavar='FILE',
+                          help='write the %s output to FILE' % fmt)
+    parser.add_option('-c', '--config', dest='config',
+                      help='app.yaml: give the markdown the blog front matter of mm2md')
+    parser.add_option('-m', '--minutes', dest='order_by_time', action='store_true',
+                      help='order the meeting minutes by time and show the time')
+    (options, args) = parser.parse_args(argv[1:])
+    if len(args) != 1 or not args[0].endswith('.mm'):
+        parser.print_usage()
+        return -1
+    infile = args[0]
+
+    outputs = dict((fmt, getattr(options, fmt)) for fmt in FORMATS
+                   if getattr(options, fmt))
+    if not outputs:
+        base = infile[:-len('.mm')]
+        outputs = dict((fmt, base + FORMATS[fmt][1]) for fmt in FORMATS)
+
+    conf = None
+    if options.config:
+        conf = getconf(mmconfig.ConfigStore(options.config),
+                       os.path.basename(infile).decode('utf8'))
+
+    export(infile, outputs, conf, options.order_by_time)
+    for fmt in sorted(outputs):
+        print '%s is OK!' % outputs[fmt]
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
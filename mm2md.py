@@ -3,89 +3,169 @@
 
 from __future__ import unicode_literals
 from xml.etree import ElementTree
+import hashlib
+import io
+import itertools
+import json
+import multiprocessing
+import optparse
 import os
+import re
 import sys
-import yaml
+import time
+import traceback
+import mmarchive
+import mmcache
+import mmconfig
+import mmprofile
+import mmstream
+import mmwatch
 
+__version__ = '0.2'
+
+MANIFEST = '.mm2md-manifest.json'
 
 
 class MMTransform():
     """freemind's file(.mm) transform tools"""
 
+    # a mmprofile.Profile, used by iter_md and iter_textile
+    profile = None
+
     def mm2md(self, mmFileContent):
-        md = []
         mmtree = ElementTree.XML(mmFileContent)
-        for node in mmtree.find('node').findall('node'):
-            self._mm2SimpleMd(node, md)
         linesep = os.linesep
-        return linesep.join(md)
+        return linesep.join(self.tree2md(mmtree))
 
     def mm2textile(self, mmFileContent):
-        textile = []
         mmtree = ElementTree.XML(mmFileContent)
+        linesep = os.linesep
+        return linesep.join(self.tree2textile(mmtree))
+
+    def tree2md(self, mmtree):
+        """markdown lines of an already parsed map (its <map> element)"""
+        md = []
+        for node in mmtree.find('node').findall('node'):
+            self._mm2SimpleMd(node, md)
+        return md
+
+    def tree2textile(self, mmtree):
+        """textile lines of an already parsed map (its <map> element)"""
+        textile = []
         for node in mmtree.find('node').findall('node'):
             self._mm2SimpleTextile(node, textile)
-        linesep = os.linesep
-        return linesep.join(textile)
+        return textile
 
-    def _mm2SimpleMd(self, node, md, num=1):
-        if node.get('TEXT'):
-            branchcontent = []
-            i = 0
-            j = 0
-            linesep = ''
-            if num < 3:
-                linesep = os.linesep
-                if node.getchildren():
-                    branchcontent.append(linesep)
-                    branchcontent.append('#')
-                    while i < num:
-                        branchcontent.append('#')
-                        i = i+1
-                    branchcontent.append(' ')
-            else:
-                if node.getchildren():
-                    while j < num-3:
-                        branchcontent.append('    ')
-                        j = j+1
-                    branchcontent.append('- ')
-            self._dumpstr(node,md,branchcontent,linesep)
-            self._recursionMm2SimpleMd(node,md,num)
+    def iter_md(self, mmFile):
+        """yield the markdown lines of a .mm file (filename or file object)
+        without building the whole tree"""
+        return self._iterLines(mmFile, self._mdLine, 0)
+
+    def iter_textile(self, mmFile):
+        """yield the textile lines of a .mm file (filename or file object)
+        without building the whole tree"""
+        return self._iterLines(mmFile, self._textileLine, 1)
+
+    def iter_nodes(self, mmFile):
+        """yield (depth, node) for the nodes of a .mm file that show in its
+        posts, the root included: those with a TEXT, outside of the branch
+        of a node without one.  Only the attributes of node are reliable,
+        see mmstream.iterparse"""
+        skip = None
+        for event, depth, elem in mmstream.iterparse(mmFile):
+            if skip is not None:
+                if event == mmstream.END and depth == skip:
+                    skip = None
+                continue
+            if event == mmstream.START:
+                if elem.tag == 'node' and elem.get('TEXT'):
+                    yield depth, elem
+                else:
+                    skip = depth
 
+    def _iterLines(self, mmFile, line, offset):
+        # a node's line depends on whether it has children, so it is held
+        # back until its first child starts or it ends
+        pending = None
+        skip = None
+        profile = self.profile
+        for event, depth, elem in mmstream.iterparse(mmFile):
+            if profile is not None and event == mmstream.START and elem.tag == 'node':
+                if depth == 1:
+                    profile.start_branch(elem.get('TEXT'))
+                profile.nodes += 1
+            if skip is not None:
+                # a node without TEXT hides its whole branch
+                if event == mmstream.END and depth == skip:
+                    skip = None
+                continue
+            if depth == 0:
+                continue
+            if event == mmstream.START:
+                if pending is not None:
+                    yield line(pending[1], pending[0] + offset, True)
+                    pending = None
+                text = elem.get('TEXT')
+                if text:
+                    pending = (depth, text)
+                else:
+                    skip = depth
+            elif pending is not None:
+                yield line(pending[1], pending[0] + offset, False)
+                pending = None
 
-    def _dumpstr(self, node, md, branchcontent, linesep=''):
-        branchcontent.append(node.attrib['TEXT'])
+    def _mdLine(self, text, num, hasChildren):
+        branchcontent = []
+        linesep = ''
+        if num < 3:
+            linesep = os.linesep
+            if hasChildren:
+                branchcontent.append(linesep)
+                branchcontent.append('#' * (num + 1))
+                branchcontent.append(' ')
+        else:
+            if hasChildren:
+                branchcontent.append('    ' * (num - 3))
+                branchcontent.append('- ')
+        branchcontent.append(text)
         branchcontent.append(linesep)
-        md.append(''.join(branchcontent))
+        return ''.join(branchcontent)
 
-    def _recursionMm2SimpleTextile(self,node,md,num):
-        for childbranch in node.getchildren():
-            self._mm2SimpleTextile(childbranch, md, num + 1)
+    def _textileLine(self, text, num, hasChildren):
+        branchcontent = []
+        linesep = ''
+        if num < 4:
+            linesep = os.linesep
+            if hasChildren:
+                branchcontent.append(linesep)
+                branchcontent.append('h')
+                branchcontent.append(str(num))
+                branchcontent.append('. ')
+        else:
+            if hasChildren:
+                branchcontent.append('*' * (num - 2))
+                branchcontent.append(' ')
+        branchcontent.append(text)
+        branchcontent.append(linesep)
+        return ''.join(branchcontent)
 
-    def _recursionMm2SimpleMd(self,node,md,num):
-        for childbranch in node.getchildren():
-            self._mm2SimpleMd(childbranch, md, num + 1)
+    def _mm2SimpleMd(self, node, md, num=1):
+        self._walk(node, md, num, self._mdLine)
 
     def _mm2SimpleTextile(self, node, md, num=2):
-        if node.get('TEXT'):
-            branchcontent = []
-            i = 0
-            linesep = ''
-            if num < 4:
-                linesep = os.linesep
-                if node.getchildren():
-                    branchcontent.append(os.linesep)
-                    branchcontent.append('h')
-                    branchcontent.append(str(num))
-                    branchcontent.append('. ')
-            else:
-                if node.getchildren():
-                    while i < num-2:
-                        branchcontent.append('*')
-                        i = i+1
-                    branchcontent.append(' ')
-            self._dumpstr(node,md,branchcontent,linesep)
-            self._recursionMm2SimpleTextile(node,md,num)
+        self._walk(node, md, num, self._textileLine)
+
+    def _walk(self, node, md, num, line):
+        # explicit stack instead of one python frame per level, machine
+        # generated maps can be thousands of levels deep
+        stack = [(node, num)]
+        while stack:
+            node, num = stack.pop()
+            if node.get('TEXT'):
+                children = node[:]
+                md.append(line(node.attrib['TEXT'], num, len(children) > 0))
+                for childbranch in reversed(children):
+                    stack.append((childbranch, num + 1))
 
 
 class MakeBlogInGithub():
@@ -97,14 +177,25 @@ class MakeBlogInGithub():
         return conf4BlogListInGithub.bloglist[mdfile]
 
     def _getconfFromYaml(self,configFilename,mdFilename):
-        mdfile = 'default'
-        config = file(configFilename,'rb')
-        config.close()
-        if  config.has_key(mdFilename):
-            mdfile = mdFilename
-        return config[mdfile]
+        return getconf(mmconfig.ConfigStore(configFilename), mdFilename)
 
     def md2blog(self, md, config, mdFilename):
+        prefix = self._blogPrefix(config)
+        prefix.append(md)
+        return os.linesep.join(prefix)
+
+    def iter_blog(self, mdLines, config):
+        """yield the blog post line by line, mdLines may be a generator"""
+        empty = True
+        for line in self._blogPrefix(config):
+            yield line
+        for line in mdLines:
+            empty = False
+            yield line
+        if empty:
+            yield ''
+
+    def _blogPrefix(self, config):
         prefix = []
         prefix.append('---')
         prefix.append('layout : '+config['layout'])
@@ -113,8 +204,7 @@ class MakeBlogInGithub():
         prefix.append('title : ' + config['title'])
         prefix.append('---')
         prefix.append('[思维导图文件下载]('+config['mmLink']+')')
-        prefix.append(md)
-        return os.linesep.join(prefix)
+        return prefix
 
 def usage():
     print '''
@@ -127,39 +217,528 @@ def getconf(conf_dic, title):
     return conf_dic[key]
 
 
-def main(argv):
-    confile = file('/home/rain/code/FreeMindTools/app.yaml','rb')
-    config = yaml.load(confile)
-    dirconf = 'file_dir'
-    mmdir = config[dirconf]['mm']
-    mddir = config[dirconf]['md']
+def _openMap(mmdir, f_in_name, data, profile):
+    if data is not None:
+        return io.BytesIO(data)
+    if profile is None:
+        return file(os.path.join(mmdir,f_in_name),'rb')
+    return profile.open(os.path.join(mmdir,f_in_name))
+
 
-    mblog = MakeBlogInGithub()
+def _iterPost(mm, conf, profile):
     transform = MMTransform()
+    transform.profile = profile
+    return MakeBlogInGithub().iter_blog(transform.iter_md(mm), conf)
 
-    if len(argv) > 1:
-        file_list = [argv[1]]
-    else:
-        file_list = [f_name for f_name in os.listdir(mmdir) if f_name.decode('utf8').endswith('mm')]
-
-    for f_in_name in file_list:
-        conf = getconf(config,f_in_name.decode('utf8'))
-        mmFilename = f_in_name
-        mdFilename = conf['mdfname']
-        mm = file(os.path.join(mmdir,mmFilename),'rb')
-        md = file(os.path.join(mddir,mdFilename),'wb')
-        mdContent = transform.mm2md(mm.read())
-        blogContent = mblog.md2blog(mdContent,conf,mdFilename)
-        md.write(blogContent.encode('utf8'))
+
+def convertFile(mmdir, mddir, f_in_name, conf, profile=None, data=None, sidecars=(),
+                force=False):
+    """convert mmdir/f_in_name into its blog post in mddir.  data is the
+    content of the map when it comes from an archive (see mmarchive).
+    The post is also compressed into its sidecars (see mmstream.write_file),
+    again even if they are up to date when force is set.
+
+    An existing post with the same content is left untouched.  Return the
+    post's path, the sha1 of its content and whether it was (re)written."""
+    mdPath = os.path.join(mddir,conf['mdfname'])
+    mm = _openMap(mmdir, f_in_name, data, profile)
+    try:
+        lines = _iterPost(mm, conf, profile)
+        with mmprofile.phase(profile, 'render'):
+            digest, written = mmstream.write_file(mdPath, lines, os.linesep,
+                                                  profile and profile.open or open, sidecars,
+                                                  force)
+        if profile is not None:
+            profile.bytes = os.path.getsize(mdPath)
+    finally:
         mm.close()
-        md.close()
-        print os.path.join(mddir,mdFilename) + ' is OK!'
-    confile.close()
-    # textileFilename = 'textile.txt'
-    # textile = file(os.path.join(mddir,textileFilename),'wb')
-    # textile.write(transform.mm2textile(mm.read()).encode('utf8'))
-    # textile.close()
+    return mdPath, digest, written
+
+
+def convertPost(mmdir, f_in_name, conf, profile=None, data=None):
+    """the blog post of mmdir/f_in_name (or of data, see convertFile) as
+    bytes, for an output archive, and its sha1"""
+    mm = _openMap(mmdir, f_in_name, data, profile)
+    out = io.BytesIO()
+    try:
+        with mmprofile.phase(profile, 'render'):
+            mmstream.write_lines(out, _iterPost(mm, conf, profile), os.linesep)
+    finally:
+        mm.close()
+    post = out.getvalue()
+    if profile is not None:
+        profile.bytes = len(post)
+    return post, hashlib.sha1(post).hexdigest()
+
+
+def shardName(mdfname, node, number):
+    """the file name of the shard of node, the number-th of its post: the
+    post's name followed by the ID of node, or by number without one"""
+    stem, ext = os.path.splitext(mdfname)
+    return '%s-%s%s' % (stem, re.sub(r'[^\w-]', '_', node.get('ID') or str(number)), ext)
+
+
+def convertSharded(mmdir, mddir, f_in_name, conf, shardDepth, previous=None, profile=None,
+                   data=None, sidecars=(), force=False):
+    """convertFile splitting the post of a big map: every branch starting
+    at shardDepth (1 for the top-level branches) becomes a post of its own,
+    a shard (see shardName), and the post an index with the nodes above
+    shardDepth and links to the shards.
+
+    A shard is only rendered when its digest, that of its branch
+    (mmcache.digests) with conf and the version of this tool (confKey), is
+    not the one of previous, the manifest entry of the last run, or when
+    force is set; the shards of previous that are gone are removed.  Return
+    the post's path, the sha1 of the index, whether anything was
+    (re)written and {shard name: digest}."""
+    mdPath = os.path.join(mddir,conf['mdfname'])
+    mm = _openMap(mmdir, f_in_name, data, profile)
+    try:
+        mmtree = mmprofile.parse(profile, mm)
+    finally:
+        mm.close()
+    known = {}
+    if previous is not None:
+        known = previous.get('shards', {})
+        if force or previous.get('depth') != shardDepth:
+            # the same name may now hold another branch
+            known = dict.fromkeys(known)
+    key = confKey(conf)
+    transform = MMTransform()
+    blog = MakeBlogInGithub()
+    opener = profile and profile.open or open
+    index = []
+    shards = {}
+    written = False
+    links = False
+    with mmprofile.phase(profile, 'render'):
+        stack = [(node, 1) for node in reversed(mmtree.find('node')[:])]
+        while stack:
+            node, num = stack.pop()
+            text = node.get('TEXT')
+            if not text:
+                continue
+            children = node[:]
+            if num < shardDepth or not children:
+                if links:
+                    index.append('')
+                    links = False
+                index.append(transform._mdLine(text, num, len(children) > 0))
+                stack.extend((child, num + 1) for child in reversed(children))
+                continue
+            name = shardName(conf['mdfname'], node, len(shards) + 1)
+            shards[name] = hashlib.sha1(key + mmcache.digests(node)[node]).hexdigest()
+            if not links:
+                # the list of links is set apart by blank lines
+                index.append('')
+                links = True
+            index.append('- [%s]({%% post_url %s %%})' % (text, os.path.splitext(name)[0]))
+            shardPath = os.path.join(mddir,name)
+            if known.get(name) == shards[name] and mmstream.fresh_sidecars(shardPath,
+                                                                           sidecars):
+                continue
+            md = []
+            transform._mm2SimpleMd(node, md)
+            shardConf = dict(conf, title='%s - %s' % (conf['title'], text))
+            post = blog.md2blog(os.linesep.join(md), shardConf, name)
+            written = mmstream.write_file(shardPath, [post], os.linesep, opener,
+                                          sidecars, force)[1] or written
+        digest, indexWritten = mmstream.write_file(mdPath, blog.iter_blog(index, conf),
+                                                   os.linesep, opener, sidecars, force)
+    removeShards(mddir, [name for name in known if name not in shards])
+    if profile is not None:
+        profile.bytes = os.path.getsize(mdPath)
+    return mdPath, digest, written or indexWritten, shards
+
+
+def removeShards(mddir, names):
+    """remove the shards names from mddir, and their sidecars"""
+    for name in names:
+        path = os.path.join(mddir,name)
+        if os.path.exists(path):
+            os.remove(path)
+        mmstream.remove_sidecars(path)
+
+
+def confKey(conf):
+    """hash of what a post is made from besides its map: its app.yaml
+    block and the version of this tool"""
+    sha1 = hashlib.sha1()
+    sha1.update(__version__.encode('utf8'))
+    sha1.update(json.dumps(conf, sort_keys=True, default=str).encode('utf8'))
+    return sha1.digest()
+
+
+def inputKey(mmPath, conf, data=None):
+    """hash of everything a post is made from: the .mm bytes (data, when
+    the map comes from an archive), its app.yaml block and the version of
+    this tool"""
+    sha1 = hashlib.sha1(confKey(conf))
+    if data is None:
+        digest = mmstream.file_digest(mmPath)
+    else:
+        digest = hashlib.sha1(data).hexdigest()
+    sha1.update(digest.encode('utf8'))
+    return sha1.hexdigest()
+
+
+def loadManifest(path):
+    """{mm file name: {'key', 'output', 'digest'}} of the last run, see inputKey.
+    The entries of sharded posts also have the 'depth' and the 'shards' of
+    convertSharded"""
+    if not os.path.exists(path):
+        return {}
+    manifest = file(path,'rb')
+    try:
+        return json.load(manifest)
+    finally:
+        manifest.close()
+
+
+def saveManifest(path, entries):
+    manifest = file(path + '.tmp','wb')
+    json.dump(entries, manifest, indent=1, sort_keys=True, separators=(',', ': '))
+    manifest.close()
+    os.rename(path + '.tmp', path)
+
+
+def _convertJob(job):
+    """run convertFile for one batch entry unless its manifest entry shows
+    that the post is up to date.  Never raises so that one broken map does
+    not abort the whole batch"""
+    (mmdir, mddir, f_in_name, conf, previous, force, configTime, data, shardDepth,
+     sidecars) = job
+    start = time.time()
+    profile = None
+    if configTime is not None:
+        profile = mmprofile.Profile('mm2md', f_in_name)
+        profile.phases['config'] = configTime
+    result = _convert(mmdir, mddir, f_in_name, conf, previous, force, profile, data,
+                      shardDepth, sidecars)
+    if profile is not None:
+        profile.finish(status=result[1])
+    return (f_in_name, result[0], time.time() - start) + result[1:]
+
+
+def _convert(mmdir, mddir, f_in_name, conf, previous, force, profile, data,
+             shardDepth=None, sidecars=()):
+    """(mdPath, status, entry, post) of a _convertJob, post is the content
+    of the post when it goes to an archive (mddir is None)"""
+    post = None
+    try:
+        if isinstance(conf, Exception):
+            raise conf
+        with mmprofile.phase(profile, 'manifest'):
+            key = inputKey(os.path.join(mmdir,f_in_name), conf, data)
+        if mddir is None:
+            mdPath = conf['mdfname']
+            post, digest = convertPost(mmdir, f_in_name, conf, profile, data)
+            written = True
+        else:
+            mdPath = os.path.join(mddir,conf['mdfname'])
+            if (not force and previous is not None and previous['key'] == key
+                    and previous['output'] == conf['mdfname']
+                    and previous.get('depth') == shardDepth
+                    and mmstream.fresh_sidecars(mdPath, sidecars)):
+                return mdPath, 'skipped', previous, None
+            if shardDepth:
+                mdPath, digest, written, shards = convertSharded(
+                    mmdir, mddir, f_in_name, conf, shardDepth, previous, profile, data,
+                    sidecars, force)
+            else:
+                mdPath, digest, written = convertFile(mmdir, mddir, f_in_name, conf, profile,
+                                                      data, sidecars, force)
+                if previous is not None:
+                    removeShards(mddir, previous.get('shards', ()))
+    except Exception, e:
+        error = traceback.format_exception_only(type(e), e)[-1].strip()
+        return None, error.decode('utf8', 'replace'), previous, None
+    entry = {'key': key, 'output': conf['mdfname'], 'digest': digest}
+    if shardDepth:
+        entry.update(depth=shardDepth, shards=shards)
+    return mdPath, written and 'written' or 'unchanged', entry, post
+
+
+def runBatch(jobs, processes=1, manifest=None, archive=None):
+    """convert every (mmdir, mddir, f_in_name, conf, previous, force,
+    configTime, data, shardDepth, sidecars) job, in a pool of processes when
+    processes > 1, and print a line per file and a summary.  previous is the manifest entry of
+    the file (or None), the new entries are stored into manifest when given.
+    conf is the exception of its lookup when that failed (see _lookup), the
+    file then fails alone.  configTime is the time the lookup of conf took, when profiling (see
+    mmprofile), None otherwise.  data is the content of the map when it
+    comes from an archive, None when it is read from mmdir.  The jobs
+    without mddir have their posts added to archive, a mmarchive.Writer.
+    The posts are split into shards when shardDepth is given (see
+    convertSharded), and compressed into the sidecars (see
+    mmstream.write_file).  jobs may be a generator (see makeArchiveJobs).
+    Return the number of failed files."""
+    start = time.time()
+    workers = processes
+    if isinstance(jobs, list):
+        workers = min(processes, len(jobs))
+    if workers > 1:
+        pool = multiprocessing.Pool(workers)
+        results = pool.imap_unordered(_convertJob, jobs)
+    else:
+        pool = None
+        results = itertools.imap(_convertJob, jobs)
+
+    counts = {'written': 0, 'unchanged': 0, 'skipped': 0}
+    failed = []
+    busy = 0.0
+    for f_in_name, mdPath, seconds, status, entry, post in results:
+        busy += seconds
+        name = f_in_name.decode('utf8')
+        if post is not None:
+            mdPath = os.path.join(archive.path, archive.add(mdPath, post))
+        if status == 'written':
+            _report('%s is OK! (%.3fs)' % (mdPath, seconds))
+        elif status == 'unchanged':
+            _report('%s is OK, unchanged (%.3fs)' % (mdPath, seconds))
+        elif status == 'skipped':
+            _report('%s skipped, %s is up to date' % (name, mdPath))
+        else:
+            failed.append(f_in_name)
+            _report('%s FAILED (%.3fs): %s' % (name, seconds, status))
+        if status in counts:
+            counts[status] += 1
+            if manifest is not None:
+                manifest[name] = entry
+    if pool is not None:
+        pool.close()
+        pool.join()
+
+    _report('%d written, %d unchanged, %d skipped, %d failed in %.3fs (%.3fs of conversion, %d jobs)' % (
+        counts['written'], counts['unchanged'], counts['skipped'], len(failed),
+        time.time() - start, busy, processes))
+    return len(failed)
+
+
+def _report(message):
+    print message.encode('utf8')
+
+
+def loadConfig(path):
+    """app.yaml as a mmconfig.ConfigStore: only the blocks used are loaded"""
+    return mmconfig.ConfigStore(path)
+
+
+def listMaps(mmdir):
+    return [f_name for f_name in os.listdir(mmdir) if f_name.decode('utf8').endswith('mm')]
+
+
+def _lookup(config, f_in_name):
+    """getconf for the map f_in_name, or the exception it raised: a map
+    without a post block nor default.mm fails alone, in its job"""
+    try:
+        return getconf(config,f_in_name.decode('utf8'))
+    except Exception, e:
+        return e
+
+
+def _job(config, mmdir, mddir, f_in_name, manifest, force, profile, data=None,
+         shardDepth=None, sidecars=()):
+    start = time.time()
+    conf = _lookup(config, f_in_name)
+    configTime = None
+    if profile:
+        configTime = time.time() - start
+    return (mmdir, mddir, f_in_name, conf,
+            manifest.get(f_in_name.decode('utf8')), force, configTime, data, shardDepth,
+            sidecars)
+
+
+def _unique(config, jobs):
+    """the jobs, those of the maps with a post block of their own writing
+    the post of an earlier one failing instead: two posts configured with
+    the same mdfname would overwrite each other.  The maps without a block
+    share the post of default.mm, the last one wins as it always did"""
+    posts = {}
+    for job in jobs:
+        f_in_name, conf = job[2], job[3]
+        if (isinstance(conf, dict) and 'mdfname' in conf
+                and config.has_key(f_in_name.decode('utf8'))):
+            first = posts.setdefault(conf['mdfname'], f_in_name)
+            if first != f_in_name:
+                conf = ValueError('%s is the post of %s already'
+                                  % (conf['mdfname'], first.decode('utf8')))
+                job = job[:3] + (conf,) + job[4:]
+        yield job
+
+
+def makeJobs(config, file_list, manifest, force=False, profile=False, toArchive=False,
+             shardDepth=None, sidecars=()):
+    """the runBatch jobs of the maps of file_list in the mm directory, their
+    posts go to the md directory or, with toArchive, to an archive.  Of the
+    maps configured with the same post only the first one is converted
+    (see _unique)"""
+    mmdir = config['file_dir']['mm']
+    mddir = not toArchive and config['file_dir']['md'] or None
+    return list(_unique(config, (_job(config, mmdir, mddir, f_in_name, manifest, force,
+                                      profile, shardDepth=shardDepth, sidecars=sidecars)
+                                 for f_in_name in file_list)))
+
+
+def makeArchiveJobs(config, archivePath, names, manifest, force=False, profile=False,
+                    toArchive=False, shardDepth=None, sidecars=()):
+    """makeJobs for the maps of the zip or tar archive archivePath (only
+    those called one of names, when given).  A generator: the members are
+    read one at a time, as the batch goes"""
+    mddir = not toArchive and config['file_dir']['md'] or None
+    return _unique(config, (_job(config, archivePath, mddir, os.path.basename(name), manifest,
+                                 force, profile, data, shardDepth=shardDepth,
+                                 sidecars=sidecars)
+                            for name, data in mmarchive.iter_members(archivePath, b'mm')
+                            if not names or os.path.basename(name) in names))
+
+
+def watch(configPath, config, manifestPath, manifest, processes=1, interval=1.0,
+          shardDepth=None, sidecars=(), watcher=None):
+    """convert the maps again as they are saved, until interrupted.
+
+    A change of app.yaml converts the maps whose post block changed (every
+    map when file_dir changed).  watcher is the mmwatch.Watcher of the mm
+    directory when it was started already, before a first batch: the maps
+    saved during that batch are converted again"""
+    mmdir = config['file_dir']['mm']
+    if watcher is None:
+        watcher = mmwatch.Watcher(mmdir, b'mm', [configPath], interval)
+    _report('watching %s and %s (%s)' % (mmdir, configPath.decode('utf8'),
+                                         watcher.notifier and 'inotify' or 'polling'))
+    try:
+        while True:
+            changed = watcher.wait()
+            names = set(os.path.basename(path) for path in changed
+                        if path != configPath and os.path.exists(path))
+            if configPath in changed:
+                try:
+                    newConfig = loadConfig(configPath)
+                except Exception, e:
+                    error = traceback.format_exception_only(type(e), e)[-1].strip()
+                    _report('%s not reloaded: %s' % (configPath.decode('utf8'), error.decode('utf8', 'replace')))
+                    newConfig = config
+                if newConfig['file_dir'] != config['file_dir']:
+                    mmdir = newConfig['file_dir']['mm']
+                    watcher.close()
+                    watcher = mmwatch.Watcher(mmdir, b'mm', [configPath], interval)
+                    names = set(listMaps(mmdir))
+                else:
+                    names.update(f_name for f_name in listMaps(mmdir)
+                                 if _lookup(config, f_name) != _lookup(newConfig, f_name))
+                config = newConfig
+            if names:
+                runBatch(makeJobs(config, sorted(names), manifest, shardDepth=shardDepth,
+                                  sidecars=sidecars),
+                         processes, manifest)
+                saveManifest(manifestPath, manifest)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+    return 0
+
+
+def main(argv):
+    parser = optparse.OptionParser('%prog [options] [mmfile]')
+    parser.add_option('-c', '--config', dest='config',
+                      default='/home/rain/code/FreeMindTools/app.yaml',
+                      help='app.yaml to read the directories and posts from')
+    parser.add_option('-j', '--jobs', dest='jobs', type='int', default=1,
+                      help='convert the files in N processes')
+    parser.add_option('-f', '--force', dest='force', action='store_true',
+                      help='convert every file even if its post is up to date')
+    parser.add_option('-m', '--manifest', dest='manifest',
+                      help='where to remember what the posts were made from '
+                           '(default: .mm2md-manifest.json in the md directory)')
+    parser.add_option('-w', '--watch', dest='watch', action='store_true',
+                      help='keep running and convert the maps again when they '
+                           'or app.yaml change')
+    parser.add_option('--interval', dest='interval', type='float', default=1.0,
+                      help='seconds between two looks at the files in --watch '
+                           'mode without inotify')
+    parser.add_option('--profile', dest='profile', metavar='FILE',
+                      help='append the timings of every file to FILE as JSON '
+                           'lines, or write a cProfile dump of the run (of the '
+                           'main process only) if FILE ends with .prof')
+    parser.add_option('-a', '--archive', dest='archive', metavar='FILE',
+                      help='read the maps from the .mm files of this zip or tar '
+                           'archive instead of the mm directory')
+    parser.add_option('-o', '--output-archive', dest='outputArchive', metavar='FILE',
+                      help='write the posts into this new zip or tar archive '
+                           'instead of the md directory (every map is converted)')
+    parser.add_option('--shard-depth', dest='shardDepth', type='int', metavar='N',
+                      help='split every post into an index and a post per branch '
+                           'starting at depth N (1: the top-level branches); '
+                           'only the changed branches are written again')
+    parser.add_option('--gzip', dest='gzip', action='store_true',
+                      help='also write every post compressed with gzip (.gz) for '
+                           'the web server, unless it did not change')
+    parser.add_option('--zstd', dest='zstd', action='store_true',
+                      help='also write every post compressed with zstd (.zst), '
+                           'needs the zstandard module')
+    (options, args) = parser.parse_args(argv[1:])
+    for path in options.archive, options.outputArchive:
+        if path and not mmarchive.is_archive(path):
+            parser.error('%s is not a .zip, .tar, .tar.gz or .tar.bz2 archive' % path)
+    if options.watch and (options.archive or options.outputArchive):
+        parser.error('--watch works on the mm and md directories, not on archives')
+    if options.shardDepth is not None and (options.shardDepth < 1 or options.outputArchive):
+        parser.error('--shard-depth takes a depth of 1 or more and writes to the md directory')
+    try:
+        sidecars = mmstream.sidecars(options.gzip, options.zstd)
+    except ValueError, e:
+        parser.error(str(e))
+    if sidecars and options.outputArchive:
+        parser.error('--gzip and --zstd write next to the posts of the md directory')
+    output = mmprofile.output(options.profile)
+
+    config = loadConfig(options.config)
+    mmdir = config['file_dir']['mm']
+    mddir = config['file_dir']['md']
+
+    profile = output is not None and output.cprofile is None
+    toArchive = bool(options.outputArchive)
+    manifestPath = options.manifest or os.path.join(mddir, MANIFEST)
+    # the posts of an archive are all written again, nothing to skip
+    manifest = not toArchive and loadManifest(manifestPath) or {}
+    watcher = None
+    if options.watch:
+        # from now on: a map saved during the first batch is converted again
+        watcher = mmwatch.Watcher(mmdir, b'mm', [options.config], options.interval)
+    if options.archive:
+        jobs = makeArchiveJobs(config, options.archive, args[:1], manifest,
+                               options.force, profile, toArchive, options.shardDepth,
+                               sidecars)
+    else:
+        if args:
+            file_list = [args[0]]
+        else:
+            file_list = sorted(listMaps(mmdir))
+        jobs = makeJobs(config, file_list, manifest, options.force, profile, toArchive,
+                        options.shardDepth, sidecars)
+    if toArchive:
+        archive = mmarchive.Writer(options.outputArchive)
+        done = False
+        try:
+            failed = runBatch(jobs, options.jobs, None, archive)
+            done = True
+        finally:
+            # a batch cut short leaves neither the archive nor its temporary file
+            if done:
+                archive.close()
+            else:
+                archive.abort()
+    else:
+        failed = runBatch(jobs, options.jobs, manifest)
+        saveManifest(manifestPath, manifest)
+    if output is not None:
+        output.close()
+    if options.watch:
+        return watch(options.config, config, manifestPath, manifest, options.jobs,
+                     options.interval, options.shardDepth, sidecars, watcher)
+    return failed
 
 if __name__ == "__main__":
-    main(sys.argv)
+    sys.exit(main(sys.argv) and 1)
     # main([])
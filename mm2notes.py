@@ -26,9 +26,53 @@ try:
 except ImportError:
     from elementtree.ElementTree import XML
 
-import codecs
 import cgi
+import heapq
+import io
+import itertools
+import marshal
+import os
+import tempfile
 import time
+import mmarchive
+import mmprofile
+import mmstream
+
+# (section, lower case prefixes of its top level node), the first match wins
+SECTIONS = [
+    ('attendees', ('attendee', 'people', u'人员')),
+    ('topic', ('topic', 'subject', u'议题')),
+    ('discussed', ('discus', 'minutes', 'meeting', 'notes', u'记录')),
+    ('actionitems', ('action', 'a.i', 'ai', u'下一步工作')),
+    ('meetingday', (u'时间',)),
+    ('meetinglocation', (u'地点',)),
+]
+
+def _same(text):
+    return text
+
+class Markup:
+    """ The markup of the notes, built once for HTML and once for text so
+    that the handlers don't test as_html for every line.  The tags are
+    tuples of lines to extend the output with, empty in text """
+
+    def __init__(self, as_html):
+        if as_html:
+            self.escape = cgi.escape
+            self.ul, self.ul_end = ('<ul>',), ('</ul>',)
+            self.li, self.li_end = ('<li>',), ('</li>',)
+            self.title = '<b>%s</b><br/>'.__mod__
+            self.heading = '<h3>%s</h3>'.__mod__
+            bold = '<b>%s</b>'.__mod__
+            self.bold = lambda text: bold(cgi.escape(text))
+            self.nl = '<br/>\n'
+        else:
+            self.escape = self.title = self.heading = self.bold = _same
+            self.ul = self.ul_end = self.li = self.li_end = ()
+            self.nl = '\n'
+
+# the Markup of as_html
+MARKUP = {True: Markup(True), False: Markup(False)}
 
 class Mm2Notes:
     def __init__(self):
@@ -37,22 +81,44 @@ class Mm2Notes:
         self.title_text = ''
         self.full_html = True
         self.order_by_time = False
+        # filled by index()
+        self.children = {}
+        self.heights = {}
+        self.sections = {}
+        self.profile = None # a mmprofile.Profile
+        self.sidecars = () # compressed copies of the output, see mmstream.write_file
 
     def set_order_by_time(self, order_by_time):
         self.order_by_time = order_by_time
 
     def open(self, infilename):
         """ Open the .mm file and create a notes as a list of lines """
-        infile = file(infilename).read()
-        self.et_in = self.xmlparse(infile)
+        self.et_in = mmprofile.parse(self.profile, infilename)
         lines = self.convert()
         return lines
 
+    def iter_open(self, infilename):
+        """ Open the .mm file and return a generator of the notes lines """
+        self.et_in = mmprofile.parse(self.profile, infilename)
+        return self.iter_notes()
+
     def write(self, outfile, lines):
         """ Write out the lines, written as a convenience function
+
+        outfile is a binary file, the lines (possibly a generator, see
+        iter_notes) are written to it as UTF-8 while they are produced.
+        outfile may also be a file name, written with mmstream.write_file
+        and the compressed copies of self.sidecars.
+        Return the number of bytes written.
         """
-        outfile.write(u'\n'.join(lines))
+        if isinstance(outfile, basestring):
+            opener = self.profile and self.profile.open or open
+            mmstream.write_file(outfile, itertools.chain(lines, [u'']), u'\n', opener,
+                                self.sidecars)
+            return os.path.getsize(outfile)
+        written = mmstream.write_lines(outfile, lines, u'\n')
         outfile.write('\n')
+        return written + 1
 
 
     def xmlparse(self, text):
@@ -61,33 +127,146 @@ class Mm2Notes:
 
     def convert(self):
         """ Convert self.et_in to a HTML as a list of lines in S5 format """
+        return list(self.iter_notes())
 
-        topic = []
-        attendees = []
-        discussed = []
-        actionitems = []
-        meetingday = []
+    def iter_notes(self):
+        """ Convert self.et_in to the notes, yielding them a line at a time
+
+        The sections are written in a fixed order whatever their order in
+        the map, so each one is only rendered when its turn comes.
+        """
         self.title_text = self.et_in.find('node').attrib['TEXT']
 
         presentation = self.et_in.find('node')
-
+        with mmprofile.phase(self.profile, 'walk'):
+            self.index(presentation)
+        sections = self.sections
+
+        if self.full_html:
+            for line in self.html_head():
+                yield line
+        for line in self.handleTitle():
+            yield line
+        for name, handler in [
+                ('meetingday', self.handleMeetingDay),
+                ('meetinglocation', self.handleMeetingLocation),
+                ('attendees', self.handleAttendees),
+                ('topic', self.handleTopic),
+                ('actionitems', self.handleActionItems),
+                ('discussed', self.handleDiscussed)]:
+            if name in sections:
+                if self.profile:
+                    self.profile.start_branch(name, sections[name])
+                for line in handler(sections[name]):
+                    yield line
+        if self.full_html:
+            for line in self.html_tail():
+                yield line
+
+    def iter_meetings(self, infilenames):
+        """ The discussions of several meetings (.mm files) merged into one
+        transcript in time order, a line at a time.
+
+        The maps are parsed one after the other and the notes of their
+        discussion are spooled to a temporary file, not kept in memory.
+        The merge reads back one note per meeting at a time; notes of the
+        same time keep the order of the meetings.  A speaker's notes are
+        shown under the date and time of the first one. """
+        self.order_by_time = True
+        titles = []
+        meetings = []
+        spool = tempfile.TemporaryFile()
+        try:
+            for seq, infilename in enumerate(infilenames):
+                self.et_in = mmprofile.parse(self.profile, infilename)
+                presentation = self.et_in.find('node')
+                titles.append(presentation.attrib['TEXT'])
+                with mmprofile.phase(self.profile, 'walk'):
+                    self.index(presentation)
+                if 'discussed' in self.sections:
+                    start = spool.tell()
+                    for n, (curtime, name, text) in enumerate(
+                            self.iter_discussed(self.sections['discussed'])):
+                        marshal.dump((curtime, seq, n, name, text), spool)
+                    meetings.append(self._unspool(spool, start, spool.tell()))
+                self.et_in = None
+                self.children, self.heights, self.sections = {}, {}, {}
+            self.title_text = ' / '.join(titles)
+
+            if self.full_html:
+                for line in self.html_head():
+                    yield line
+            for line in self.handleTitle():
+                yield line
+            label = lambda name, curtime: self.show_user_time(name, curtime, True)
+            # (time, seq, n) is unique: the merge never compares the texts
+            minutes = ((curtime, name, text) for curtime, seq, n, name, text
+                       in heapq.merge(*meetings))
+            for line in self.format_discussed(minutes, label):
+                yield line
+            if self.full_html:
+                for line in self.html_tail():
+                    yield line
+        finally:
+            spool.close()
+
+    def _unspool(self, spool, start, end):
+        """ The notes iter_meetings wrote from start to end of spool, read
+        one at a time.  The readers of the meetings share spool """
+        while start < end:
+            spool.seek(start)
+            note = marshal.load(spool)
+            start = spool.tell()
+            yield note
+
+    def index(self, presentation):
+        """ Walk the sections of the map once, recording the child nodes and
+        the depth of the subtree of every node.  The handlers use this
+        instead of searching the tree again """
+        sections = {}
         for node in presentation.findall('node'):
-            node_name = node.attrib['TEXT']
-            if self.starts_with(node_name, ['attendee', 'people', u'人员']):
-                attendees = self.handleAttendees(node)
-            elif self.starts_with(node_name, ['topic', 'subject', u'议题']):
-                topic = self.handleTopic(node)
-            elif self.starts_with(node_name, ['discus', 'minutes',
-                    'meeting', 'notes', u'记录']):
-                discussed = self.handleDiscussed(node)
-            elif self.starts_with(node_name, ['action', 'a.i', 'ai', u'下一步工作']):
-                actionitems = self.handleActionItems(node)
-            elif self.starts_with(node_name, [u'时间']):
-                meetingday = self.handleMeetingDay(node)
-            elif self.starts_with(node_name, [u'地点']):
-                meetinglocation = self.handleMeetingLocation(node)
-        return self.html_wrapper(self.handleTitle() + meetingday + meetinglocation + attendees + topic
-                + actionitems + discussed)
+            section = self.classify(node.attrib['TEXT'])
+            if section:
+                sections[section] = node
+
+        children = {}
+        heights = {}
+        # post-order: a node's height is known once its children are done
+        stack = [(node, False) for node in sections.values()]
+        while stack:
+            node, done = stack.pop()
+            if done:
+                subnodes = children[node]
+                if subnodes:
+                    heights[node] = 1 + max([heights[x] for x in subnodes])
+                else:
+                    heights[node] = 0
+                continue
+            # slicing the children is much cheaper than findall's path
+            # machinery (and getchildren's deprecation warning)
+            subnodes = [x for x in node[:] if x.tag == 'node']
+            children[node] = subnodes
+            stack.append((node, True))
+            stack.extend([(x, False) for x in subnodes])
+
+        self.children = children
+        self.heights = heights
+        self.sections = sections
+
+    def classify(self, name):
+        """ The section a top level node called name stands for, or None """
+        name = name.lower()
+        for section, prefixes in SECTIONS:
+            if name.startswith(prefixes):
+                return section
+        return None
+
+    def subnodes(self, node):
+        """ The child nodes of node, from the index when it is there """
+        subnodes = self.children.get(node)
+        if subnodes is None:
+            subnodes = node.findall('node')
+        return subnodes
 
     def starts_with(self, name, list):
         for item in list:
@@ -96,7 +275,13 @@ class Mm2Notes:
         return False
 
     def html_wrapper(self, list):
-      head = [
+      if self.full_html:
+          return self.html_head() + list + self.html_tail()
+      else:
+          return list
+
+    def html_head(self):
+      return [
           '<?xml version="1.0" encoding="UTF-8"?>',
           '<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN" ',
           '"http://www.w3.org/TR/xhtml1/DTD/xhtml1-strict.dtd">',
@@ -106,20 +291,21 @@ class Mm2Notes:
           '</head>',
           '<body>',
       ]
-      tail = [
+
+    def html_tail(self):
+      return [
           '</body>',
           '</html>'
       ]
-      if self.full_html:
-          return head + list + tail
-      else:
-          return list
 
     def handleAttendees(self, node):
-        topnodes = node.findall('node')
+        topnodes = self.subnodes(node)
         # find the maximum depth in the attendee lists
 
-        mxd = self.maxdepth(topnodes)
+        if node in self.heights:
+            mxd = self.heights[node]
+        else:
+            mxd = self.maxdepth(topnodes)
         if mxd >= 3:
             # assume entity / attendee / email and ignore anything else
             names = self.threeLevelAttendees(node)
@@ -131,31 +317,56 @@ class Mm2Notes:
         else:
             # no names
             names = []
-        return [self.open_close('b', u'人员: ') + ', '.join(names) + self.nl()]
+        markup = MARKUP[self.as_html]
+        return [markup.bold(u'人员: ') + ', '.join(names) + markup.nl]
+
+    def attendees(self, node):
+        """ The (location, name, email) of the people of the attendees
+        section node, as handleAttendees reads them.  location and email
+        are None when there are none """
+        topnodes = self.subnodes(node)
+        if node in self.heights:
+            mxd = self.heights[node]
+        else:
+            mxd = self.maxdepth(topnodes)
+        if mxd >= 3:
+            return [(location.attrib['TEXT'], name, email)
+                    for location in topnodes for name, email in self.people(location)]
+        elif mxd == 2:
+            return [(None, name, email) for name, email in self.people(node)]
+        return [(None, x.attrib['TEXT'], None) for x in topnodes]
+
+    def people(self, node):
+        """ The (name, email) of the child nodes of node, see
+        twoLevelAttendees """
+        names = []
+        for line in self.subnodes(node):
+            emailnodes = self.subnodes(line)
+            email = None
+            if emailnodes and emailnodes[0].attrib['TEXT']:
+                email = emailnodes[0].attrib['TEXT']
+            names.append((line.attrib['TEXT'], email))
+        return names
 
     def maxdepth(self, nodes):
        """Returns the maximum depth of tree for the supplied list of nodes."""
-       if not nodes:
-         # empty list, zero depth
-         return 0
-       else:
-         depths = [self.maxdepth(x.findall('node')) for x in nodes]
-         return 1 + max(depths)
+       # empty list, zero depth
+       depth = 0
+       stack = [(x, 1) for x in nodes]
+       while stack:
+         node, cur = stack.pop()
+         if cur > depth:
+           depth = cur
+         stack.extend([(x, cur + 1) for x in node.findall('node')])
+       return depth
 
     def twoLevelAttendees(self, node):
         """ Top node is the person's name,
         If there's a sub node, it's the email, or something like that
         """
         names = []
-        for line in node.findall('node'):
-            fullname = line.attrib['TEXT']
-            emailnodes = line.findall('node')
-
-            if emailnodes:
-                email = emailnodes[0].attrib['TEXT']
-            else:
-                email = ''
-            if len(email) > 0:
+        for fullname, email in self.people(node):
+            if email:
                 names.append('%s (%s)' % (fullname, email))
             else:
                 names.append('%s' % (fullname))
@@ -166,7 +377,7 @@ class Mm2Notes:
         """ Here the top node is the location, the child nodes are the people """
 
         locations= []
-        for location in node.findall('node'):
+        for location in self.subnodes(node):
             loc_name = location.attrib['TEXT']
             names = self.twoLevelAttendees(location)
             locations.append("%s [%s]" % (loc_name, ', '.join(names)))
@@ -175,113 +386,154 @@ class Mm2Notes:
 
     def handleTopic(self, node):
         text = []
-        for line in node.findall('node'):
+        for line in self.subnodes(node):
             text.append(line.attrib['TEXT'])
 
-        return [self.open_close('b', u'议题: ') + ' '.join(text) + self.nl()]
+        markup = MARKUP[self.as_html]
+        return [markup.bold(u'议题: ') + ' '.join(text) + markup.nl]
 
     def handleMeetingDay(self, node):
         text = []
-        for line in node.findall('node'):
+        for line in self.subnodes(node):
             text.append(line.attrib['TEXT'])
 
-        return [self.open_close('b', u'时间: ') + ' '.join(text) + self.nl()]
+        markup = MARKUP[self.as_html]
+        return [markup.bold(u'时间: ') + ' '.join(text) + markup.nl]
 
 
     def handleMeetingLocation(self, node):
         text = []
-        for line in node.findall('node'):
+        for line in self.subnodes(node):
             text.append(line.attrib['TEXT'])
 
-        return [self.open_close('b', u'地点: ') + ' '.join(text) + self.nl()]
+        markup = MARKUP[self.as_html]
+        return [markup.bold(u'地点: ') + ' '.join(text) + markup.nl]
 
 
     def nl(self):
-        if self.as_html:
-            return '<br/>\n'
-        return '\n'
+        return MARKUP[self.as_html].nl
 
     def handleDiscussed(self, node):
-        people_time = []
-        for sub in node.findall('node'):
-            name = sub.attrib['TEXT']
-            for subsub in sub.findall('node'):
-                cur = []
-                time = int(subsub.attrib['CREATED'])
-                self.nest_text(subsub, cur)
-                text = '\n'.join(cur)
-                if len(text) > 0:
-                    people_time.append((time, name, text))
-
+        return self.format_discussed(self.iter_discussed(node))
+
+    def iter_discussed(self, node):
+        """ The (time, speaker, text) of every note of the discussion below
+        node: in time order with order_by_time, in the order of the map
+        otherwise.  The notes of the speakers are merged as they are
+        consumed, only the notes of a speaker out of CREATED order are
+        sorted first """
+        streams = [self._speaker_notes(sub) for sub in self.subnodes(node)]
         if self.order_by_time:
-            people_time.sort()
-        self.start_time = people_time[0][0]
+            return heapq.merge(*streams)
+        return itertools.chain(*streams)
+
+    def _speaker_notes(self, speaker):
+        """ The (time, speaker, text) of the notes of a speaker, produced
+        as they are asked for unless they have to be sorted """
+        name = speaker.attrib['TEXT']
+        notes = [(int(x.attrib['CREATED']), x) for x in self.subnodes(speaker)]
+        texts = self._iter_notes(name, notes)
+        if self.order_by_time and any(notes[i][0] >= notes[i + 1][0]
+                                      for i in xrange(len(notes) - 1)):
+            # out of CREATED order, or notes of the same time, which are
+            # ordered by their text
+            return iter(sorted(texts))
+        return texts
+
+    def _iter_notes(self, name, notes):
+        for curtime, node in notes:
+            cur = []
+            self.nest_text(node, cur)
+            text = '\n'.join(cur)
+            if len(text) > 0:
+                yield curtime, name, text
+
+    def format_discussed(self, minutes, label=None):
+        """ The lines of the minutes, (time, speaker, text) tuples, yielded
+        as they are consumed.  The consecutive notes of a speaker go under
+        label(speaker, time of the first one): the name, and the time with
+        order_by_time """
+        if label is None:
+            if self.order_by_time:
+                label = self.show_user_time
+            else:
+                label = lambda name, curtime: name
+        markup = MARKUP[self.as_html]
+        li, li_end = markup.li, markup.li_end
+        next_speaker = markup.ul_end + markup.li_end
         last_name = None
 
-        ret = [self.title(u'记录')]
-        self.open_tag('ul', ret)
-        for curtime, name, text in people_time:
+        ret = [markup.title(u'记录')]
+        ret.extend(markup.ul)
+        for curtime, name, text in minutes:
             if name != last_name:
-                last_name = name
-                if len(ret) > 2:
-                    self.close_tag('ul', ret)
-                    self.close_tag('li', ret)
-                self.open_tag('li', ret)
-                if self.order_by_time:
-                    ret.append(self.show_user_time(name, curtime))
+                if last_name is None:
+                    self.start_time = curtime
                 else:
-                    ret.append(name)
-                self.open_tag('ul', ret)
+                    ret.extend(next_speaker)
+                last_name = name
+                ret.extend(li)
+                ret.append(label(name, curtime))
+                ret.extend(markup.ul)
 
-            self.open_tag('li', ret)
+            ret.extend(li)
             ret.append(text)
-            self.close_tag('li', ret)
+            ret.extend(li_end)
+            for line in ret:
+                yield line
+            del ret[:]
 
-        self.close_tag('ul', ret)
-        self.close_tag('li', ret)
-        self.close_tag('ul', ret)
-
-        return ret
+        if last_name is not None:
+            ret.extend(next_speaker)
+        ret.extend(markup.ul_end)
+        for line in ret:
+            yield line
 
     def handleTitle(self):
-        if self.as_html:
-            return ["<h3>%s</h3>" % (self.title_text)]
-        return ["%s" %  (self.title_text)]
+        return [MARKUP[self.as_html].heading(self.title_text)]
 
     def handleActionItems(self, node):
-        ret = []
-        ret.append(self.title(u'下一步工作'))
-
-
-        self.open_tag('ul', ret)
-        for sub in node.findall('node'):
-            self.open_tag('li', ret)
+        markup = MARKUP[self.as_html]
+        ret = [markup.title(u'下一步工作')]
+        ret.extend(markup.ul)
+        for sub in self.subnodes(node):
+            ret.extend(markup.li)
             self.nest_text(sub, ret)
-            self.close_tag('li', ret)
+            ret.extend(markup.li_end)
 
-        self.close_tag('ul', ret)
+        ret.extend(markup.ul_end)
         return ret
 
-    def show_user_time(self, name, curtime):
+    def show_user_time(self, name, curtime, clock=False):
+        if clock:
+            return '%s (%s)' % (name, self.format_clock(curtime))
         return '%s (%s)' % (name, self.format_time(curtime))
 
     def nest_text(self, node, ret):
-        ret.append(self.escape(node.attrib['TEXT']))
-        subnodes = node.findall('node')
-
-        if len(subnodes) > 0:
-            self.open_tag('ul', ret)
-            for sub in node.findall('node'):
-                self.open_tag('li', ret)
-                self.nest_text(sub, ret)
-                self.close_tag('li', ret)
-
-            self.close_tag('ul', ret)
+        # the stack holds (node, the tags opening it) pairs and (None, the
+        # tags to close once a node's children are out), so that notes
+        # nested deeper than the recursion limit still work
+        markup = MARKUP[self.as_html]
+        escape, ul, li = markup.escape, markup.ul, markup.li
+        close_ul, close_li = (None, markup.ul_end), (None, markup.li_end)
+        stack = [(node, ())]
+        while stack:
+            node, tags = stack.pop()
+            ret.extend(tags)
+            if node is None:
+                continue
+            ret.append(escape(node.attrib['TEXT']))
+            subnodes = self.subnodes(node)
+
+            if subnodes:
+                ret.extend(ul)
+                stack.append(close_ul)
+                for sub in reversed(subnodes):
+                    stack.append(close_li)
+                    stack.append((sub, li))
 
     def title(self, name):
-        if self.as_html:
-            return '<b>%s</b><br/>' % (name)
-        return name
+        return MARKUP[self.as_html].title(name)
 
     def open_tag(self, tag, list):
         if self.as_html:
@@ -303,9 +555,11 @@ class Mm2Notes:
             return text
 
     def escape(self, text):
-        if self.as_html:
-            return cgi.escape(text)
-        return text
+        return MARKUP[self.as_html].escape(text)
+
+    def format_clock(self, curtime):
+        t = time.localtime(curtime / 1000.0)
+        return '%04d-%02d-%02d %02d:%02d:%02d' % t[:6]
 
     def format_time(self, curtime):
         timesecs = (curtime - self.start_time) / (1000)
@@ -323,38 +577,117 @@ class Mm2Notes:
             return '%d min' % (minutes)
         return '%d min %d sec' % (minutes, sec)
 
+def convert_archive(infile, outpath, order_by_time=False, output=None):
+    """ Convert every map of the zip or tar archive infile into an .html
+    file of outpath, an archive or a directory.  output is the
+    mmprofile.Output of --profile, if any.  Return the number of maps """
+    out = mmarchive.writer(outpath)
+    done = False
+    try:
+        for name, data in mmarchive.iter_members(infile):
+            mm2notes = Mm2Notes()
+            profile = mm2notes.profile = output and output.new('mm2notes', name)
+            mm2notes.set_order_by_time(order_by_time)
+            # with the trailing newline of write
+            lines = itertools.chain(mm2notes.iter_open(io.BytesIO(data)), [u''])
+            with mmprofile.phase(profile, 'render'):
+                written = out.add_lines(mmarchive.output_name(name, '.html'), lines, u'\n')
+            if profile:
+                profile.bytes = written
+                profile.finish()
+        done = True
+    finally:
+        if done:
+            out.close()
+        else:
+            out.abort()
+    return out.count
+
 def parse_command_line():
-    usage = """%prog <mmfile> -o [<htmloutput>]
+    usage = """%prog <mmfile> [<mmfile>...] -o [<htmloutput>]
 Create a FreeMind (.mm) document (see http://freemind.sourceforge.net/wiki/index.php/Main_Page)
 the main node will be the title page and the lower nodes will be pages.
+
+With several <mmfile>s their discussions are merged into one transcript
+ordered by time.
+
+<mmfile> may also be a zip or tar archive of maps, each one is converted
+into an .html file of <htmloutput>, a zip or tar archive or a directory
+(by default the current directory).
 """
     parser = OptionParser(usage)
     parser.add_option('-o', '--output', dest="outfile")
     parser.add_option('-m', '--minutes', dest="order_by_time",
         action='store_true',
         help="Order the minutes by time and show the time")
+    parser.add_option('--profile', dest='profile', metavar='FILE',
+        help="Append the timings of the conversion to FILE as a JSON line, "
+        "or write a cProfile dump if FILE ends with .prof")
+    parser.add_option('--gzip', dest='gzip', action='store_true',
+        help="Also write the output file compressed with gzip (.gz), "
+        "unless it did not change")
+    parser.add_option('--zstd', dest='zstd', action='store_true',
+        help="Also write it compressed with zstd (.zst), needs the zstandard module")
     (options, args) = parser.parse_args()
     if len(args) == 0:
         parser.print_usage()
         sys.exit(-1)
 
+    try:
+        sidecars = mmstream.sidecars(options.gzip, options.zstd)
+    except ValueError, e:
+        parser.error(str(e))
+    if sidecars and not options.outfile:
+        parser.error('--gzip and --zstd need an output file (-o)')
+
     infile = args[0]
-    if not infile.endswith('.mm'):
-        print "Input file must end with '.mm'"
-        parser.print_usage()
-        sys.exit(-1)
+    if mmarchive.is_archive(infile):
+        if sidecars:
+            parser.error('--gzip and --zstd are for the .mm files, not archives')
+        output = mmprofile.output(options.profile)
+        count = convert_archive(infile, options.outfile or '.',
+                                options.order_by_time, output)
+        print >> sys.stderr, '%d maps converted into %s' % (count, options.outfile or '.')
+        if output:
+            output.close()
+        return
+    for name in args:
+        if not name.endswith('.mm'):
+            print "Input file must end with '.mm' or be a zip or tar archive"
+            parser.print_usage()
+            sys.exit(-1)
 
     outfile = sys.stdout
     if options.outfile:
-        # Writing out the HTML in correct UTF-8 format is a little tricky.
         print "Outputting to '%s'" % (options.outfile)
-        outfile = codecs.open(options.outfile, 'w', 'utf-8')
+        outfile = options.outfile
+        if not sidecars:
+            outfile = file(options.outfile, 'wb')
 
+    output = mmprofile.output(options.profile)
     mm2notes = Mm2Notes()
-    lines = mm2notes.open(infile)
+    # several maps make one transcript: the profile is that of the run
+    profile = mm2notes.profile = output and output.new('mm2notes', ' + '.join(args))
     mm2notes.set_order_by_time(options.order_by_time)
-
-    mm2notes.write(outfile, lines)
+    mm2notes.sidecars = sidecars
+    if len(args) > 1:
+        lines = mm2notes.iter_meetings(args)
+    else:
+        lines = mm2notes.iter_open(infile)
+
+    with mmprofile.phase(profile, 'render'):
+        target = outfile
+        if profile and not isinstance(outfile, basestring):
+            target = profile.writer(outfile)
+        written = mm2notes.write(target, lines)
+    if outfile is not sys.stdout and not isinstance(outfile, basestring):
+        outfile.close()
+        mmstream.remove_sidecars(options.outfile)
+    if profile:
+        profile.bytes = written
+        profile.finish()
+    if output:
+        output.close()
 
 if __name__ == "__main__":
     parse_command_line()
@@ -23,7 +23,7 @@ If you create a mind map with FreeMind the title of the mind-map (center circle)
 will be the title of the slide.
 
 A top level node called "__meta__" can be used to set the metadata for
-the presentation.  The immediate children are keys and it's first child is a value.
+the presentation (deeper ones are only looked for with --deep-meta).  The immediate children are keys and it's first child is a value.
   title: Title of presentation, not needed since I get it from the top node
   subtitle: Witty subtitle of the presentation
   author: You probably want to change this.
@@ -48,14 +48,81 @@ The icons can have special meaning:
 __author__ = 'scott@forusers.com (Scott Kirkwood)'
 __version__ = '0.2.3'
 
+import io
+import os
 import sys
 import optparse
 from xml.etree import ElementTree
-import codecs
+import mmarchive
+import mmcache
+import mmprofile
+import mmstream
+
+# The <head> of the presentation, compiled by _head for each template
+HEAD = """
+      <title>%(title)s</title>
+      <meta name="version" content="S5 1.1" />
+      <meta name="generator" content="%(generator)s" />
+      <meta name="presdate" content="%(presdate)s" />
+      <meta name="author" content="%(author)s" />
+      <meta name="company" content="%(company)s" />
+      <meta http-equiv="Content-type" content="%(content_type)s" />
+      <!-- S5 format see Eric A. Meyer, http://meyerweb.com/eric/tools/s5/ -->
+      <link rel="stylesheet" href="ui/%(template)s/slides.css" type="text/css"
+        media="projection" id="slideProj" />
+      <link rel="stylesheet" href="ui/%(template)s/outline.css" type="text/css" x
+        media="screen" id="outlineStyle" />
+      <link rel="stylesheet" href="ui/%(template)s/print.css" type="text/css"
+        media="print" id="slidePrint" />
+      <link rel="stylesheet" href="ui/%(template)s/opera.css" type="text/css"
+        media="projection" id="operaFix" />
+      <script src="ui/%(template)s/slides.js" type="text/javascript"></script>
+      """
+_heads = {}
+
+def _head(template):
+  """ HEAD with the ui/<template> directory filled in, the rest of the
+  meta is left to format """
+  head = _heads.get(template)
+  if head is None:
+    head = _heads[template] = HEAD.replace(
+      '%(template)s', template.replace('%', '%%'))
+  return head
+
+_link = '<a href="%s">%s</a>'.__mod__
+
+def _compile_item(depth, no_ul):
+  """ The function rendering an item of a list at depth to its lines,
+  with the markup chosen once for the list instead of for every item """
+
+  if no_ul:
+    def item(text, line):
+      if not text:
+        return []
+      text = text.replace('<html>', '')
+      if 'LINK' in line.attrib:
+        text = _link((line.attrib['LINK'], text))
+      return [text]
+  else:
+    li = ('  ' * (depth + 3) + '<li>%s</li>').__mod__
+    def item(text, line):
+      if not text:
+        return []
+      text = text.replace('<html>', '')
+      if 'LINK' in line.attrib:
+        text = _link((line.attrib['LINK'], text))
+      return [li(text.replace('\n', '<br/>\n'))]
+  return item
 
 class Mm2S5:
   def __init__(self):
     self.et_in = None
+    self.cache = None # a mmcache.RenderCache for the slides and their lists
+    self._digests = None
+    self.profile = None # a mmprofile.Profile
+    self._lists = {} # the markup of the lists, see _list_markup
+    self.deep_meta = False # look for __meta__ below the top level too
+    self.sidecars = () # compressed copies of the output, see mmstream.write_file
     self.meta = {
       'title' : 'Title',
       'subtitle': '',
@@ -74,19 +141,33 @@ class Mm2S5:
 
   def open(self, infilename):
     """ Open the .mm file and create a S5 file as a list of lines """
-    infile = file(infilename).read()
-    self.et_in = self.xmlparse(infile)
+    self.et_in = mmprofile.parse(self.profile, infilename)
     lines = self.convert()
     return lines
 
+  def iter_open(self, infilename):
+    """ Open the .mm file and return a generator of the S5 lines """
+    self.et_in = mmprofile.parse(self.profile, infilename)
+    return self.iter_slides()
+
   def write(self, outfilename, lines):
     """ Write out the lines, written as a convenience function
 
-    Writing out the HTML in correct UTF-8 format is a little tricky."""
-
-    outfile = codecs.open(outfilename, 'w', 'utf-8')
-    outfile.write(u'\n'.join(lines))
+    lines may be a generator (see iter_slides), it is written out as it
+    is produced.  Writing out the HTML in correct UTF-8 format is a little
+    tricky.  With sidecars the file is left untouched when it did not
+    change, see mmstream.write_file; without them the old ones are
+    removed.  Return the number of bytes written."""
+
+    if self.sidecars:
+      opener = self.profile and self.profile.open or open
+      mmstream.write_file(outfilename, lines, u'\n', opener, self.sidecars)
+      return os.path.getsize(outfilename)
+    outfile = mmprofile.create(self.profile, outfilename)
+    written = mmstream.write_lines(outfile, lines, u'\n')
     outfile.close()
+    mmstream.remove_sidecars(outfilename)
+    return written
 
   def xmlparse(self, text):
     """ import the XML text into self.et_in  """
@@ -94,53 +175,45 @@ class Mm2S5:
 
   def convert(self):
     """ Convert self.et_in to a HTML as a list of lines in S5 format """
+    return list(self.iter_slides())
 
-    self._grab_meta()
+  def iter_slides(self):
+    """ Convert self.et_in to a HTML in S5 format, one line at a time """
 
-    lines = []
-    lines.append("""<?xml version="1.0" encoding="UTF-8"?>""")
-    lines.append("""<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN"
+    with mmprofile.phase(self.profile, 'walk'):
+      self._grab_meta()
+
+    yield """<?xml version="1.0" encoding="UTF-8"?>"""
+    yield """<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN"
       "http://www.w3.org/TR/xhtml1/DTD/xhtml1-strict.dtd">
-        <html xmlns="http://www.w3.org/1999/xhtml">""")
-    lines.append('<head>')
-    lines.append("""
-      <title>%(title)s</title>
-      <meta name="version" content="S5 1.1" />
-      <meta name="generator" content="%(generator)s" />
-      <meta name="presdate" content="%(presdate)s" />
-      <meta name="author" content="%(author)s" />
-      <meta name="company" content="%(company)s" />
-      <meta http-equiv="Content-type" content="%(content_type)s" />
-      <!-- S5 format see Eric A. Meyer, http://meyerweb.com/eric/tools/s5/ -->
-      <link rel="stylesheet" href="ui/%(template)s/slides.css" type="text/css"
-        media="projection" id="slideProj" />
-      <link rel="stylesheet" href="ui/%(template)s/outline.css" type="text/css" x
-        media="screen" id="outlineStyle" />
-      <link rel="stylesheet" href="ui/%(template)s/print.css" type="text/css"
-        media="print" id="slidePrint" />
-      <link rel="stylesheet" href="ui/%(template)s/opera.css" type="text/css"
-        media="projection" id="operaFix" />
-      <script src="ui/%(template)s/slides.js" type="text/javascript"></script>
-      """ % self.meta)
-    lines.append('</head>')
-    lines.append('<body>')
-    lines.append("""<div class="layout">
+        <html xmlns="http://www.w3.org/1999/xhtml">"""
+    yield '<head>'
+    yield _head(self.meta['template']) % self.meta
+    yield '</head>'
+    yield '<body>'
+    yield """<div class="layout">
         <div id="controls"><!-- DO NOT EDIT --></div>
         <div id="currentSlide"><!-- DO NOT EDIT --></div>
         <div id="header">%(header)s</div>
         <div id="footer">%(footer)s</div>
-      </div>""" % self.meta)
+      </div>""" % self.meta
 
-    lines.append('<div class="presentation">')
+    yield '<div class="presentation">'
 
     presentation = self.et_in.find('node')
-    lines.append('  <div class="slide">')
-    lines.append('    <h1>%s</h1>' % (self.meta['title']))
-    lines.append('    <h2>%s</h2>' % (self.meta['subtitle']))
-    lines.append('    <h3>%s</h3>' % (self.meta['author']))
-    lines.append('    <h4>%s</h4>' % (self.meta['company']))
-    lines.append('  </div>')
-
+    if self.cache:
+      with mmprofile.phase(self.profile, 'walk'):
+        self._digests = mmcache.digests(presentation)
+    yield '  <div class="slide">'
+    yield '    <h1>%s</h1>' % (self.meta['title'])
+    yield '    <h2>%s</h2>' % (self.meta['subtitle'])
+    yield '    <h3>%s</h3>' % (self.meta['author'])
+    yield '    <h4>%s</h4>' % (self.meta['company'])
+    yield '  </div>'
+
+    # The slides are rendered here, one after the other.  Handing them to
+    # a pool of processes does not pay: copying the branch of a slide and
+    # pickling it costs about three times as much as rendering it
     for page in presentation.findall('node'):
       # Skip the __meta__ node, if any
       if page.attrib['TEXT'] == '__meta__':
@@ -150,17 +223,19 @@ class Mm2S5:
       if 'skip' in attribs:
         continue
 
-      lines.append('  <div class="slide">')
-      lines.append('    <h1>%s</h1>' % (page.attrib['TEXT']))
-      lines.append('    <div class="slidecontent">')
-      self._doList(lines, page, 0)
-      lines.append('    </div>') # content
-      lines.append('  </div>') # slide
+      if self.profile:
+        self.profile.start_branch(page.attrib['TEXT'], page)
+      yield '  <div class="slide">'
+      yield '    <h1>%s</h1>' % (page.attrib['TEXT'])
+      yield '    <div class="slidecontent">'
+      for line in self._slide_content(page):
+        yield line
+      yield '    </div>' # content
+      yield '  </div>' # slide
 
-    lines.append('</div>') # Presentation
-    lines.append('</body>')
-    lines.append('</html>')
-    return lines
+    yield '</div>' # Presentation
+    yield '</body>'
+    yield '</html>'
 
   def _get_list_attributes(self, page):
     """ If there's a special icon, return some attributes
@@ -191,14 +266,23 @@ class Mm2S5:
     return ret
 
   def _grab_meta(self):
-    """ Grab a "page" called __meta__, if any """
+    """ Grab a "page" called __meta__, if any
+
+    FreeMind maps have it at the top level, only the children of the
+    title node are looked at unless deep_meta is set: then the whole map
+    is searched, which is a walk over every node before the slides. """
 
-    titles = self.et_in.find('node').attrib['TEXT'].split('\n')
+    presentation = self.et_in.find('node')
+    titles = presentation.attrib['TEXT'].split('\n')
 
     self.meta['title'] = titles[0]
     if len(titles) > 1:
       self.meta['subtitle'] = titles[1]
-    for cur_node in self.et_in.getiterator('node'):
+    if self.deep_meta:
+      candidates = mmstream.iternodes(self.et_in)
+    else:
+      candidates = presentation[:]
+    for cur_node in candidates:
       if cur_node.attrib.get('TEXT') == '__meta__': # Probably due to FreeMind 0.9, we might not have TEXT attribute
         for sub_attrib in cur_node.findall('node'):
           key = sub_attrib.attrib['TEXT']
@@ -209,15 +293,104 @@ class Mm2S5:
     if self.meta['footer'] == None:
       self.meta['footer'] = '<h1>%(company)s</h2><h2>%(title)s</h2>' % self.meta
 
+  def _slide_content(self, page):
+    """ The lines of the list of a slide, from the cache if there is one """
+    if not self._digests:
+      return self._iter_list(page, 0)
+    key = self.cache.key(page, self._digests[page], 0, 's5')
+    lines = self.cache.get(key)
+    if lines is None:
+      lines = list(self._iter_list(page, 0))
+      self.cache.put(key, lines)
+    return lines
+
   def _doList(self, lines, sub, depth):
-    """ Recurse this list of items
+    """ Append the list of items below sub to lines """
+    lines.extend(self._iter_list(sub, depth))
+
+  def _iter_list(self, sub, depth):
+    """ Walk this list of items
+
+    The nested lists are kept on an explicit stack rather than by
+    recursion, so that very deep maps don't run out of Python frames.
+    With a cache, the items of the first cache.depth levels (the slide
+    being the first one) are taken from it or stored into it once their
+    sub-list is closed. """
+
+    cache = self._digests and self.cache
+    out = [] # what was yielded so far, when caching
+    stack = []
+    start = self._open_list(sub, depth, stack)
+    if start:
+      yield start
+
+    while stack:
+      lines, attribs, depth, end, record, item = stack[-1]
+      line = next(lines, None)
+      if line is None:
+        stack.pop()
+        if end:
+          yield end
+          if cache:
+            out.append(end)
+        if record:
+          cache.put(record[0], out[record[1]:])
+        continue
 
-    Code is a little messier than I would like """
+      record = None
+      if cache and depth + 1 < cache.depth and len(line) > 0:
+        # the same item renders differently in an ol, a ul or no list
+        fmt = 's5 ' + ' '.join(sorted(attribs))
+        key = cache.key(line, self._digests[line], depth, fmt)
+        cached = cache.get(key)
+        if cached is not None:
+          for html in cached:
+            yield html
+          out.extend(cached)
+          continue
+        record = (key, len(out))
+
+      text = self._node_text(line)
+      if text == '__table__':
+        items = self._insert_table(text, line, depth)
+      else:
+        items = item(text, line)
+      for html in items:
+        yield html
+      if cache:
+        out.extend(items)
+      if text == '__table__':
+        if record:
+          cache.put(key, items)
+      else:
+        start = self._open_list(line, depth + 1, stack, record)
+        if start:
+          yield start
+          if cache:
+            out.append(start)
+
+  def _open_list(self, sub, depth, stack, record=None):
+    """ Push the list of items below sub on stack, if there is one.
+    Return the opening tag of the list, if any """
 
     if sub == None or len(sub) == 0:
-      return
+      return None
 
     attribs =  self._get_list_attributes(sub)
+    key = (depth, 'no_ul' in attribs, 'ol' in attribs, attribs.get('ul_class'))
+    markup = self._lists.get(key)
+    if markup is None:
+      markup = self._lists[key] = self._list_markup(depth, attribs)
+    start, end, item = markup
+
+    # slicing the children is much cheaper than findall's path machinery
+    items = [x for x in sub[:] if x.tag == 'node']
+    stack.append((iter(items), attribs, depth, end, record, item))
+    return start
+
+  def _list_markup(self, depth, attribs):
+    """ The opening and closing tags of a list at depth and the function
+    rendering its items, compiled once for every kind of list """
 
     if 'ul_class' in attribs:
       ul_class = ' class="%s"' % (attribs['ul_class'])
@@ -226,53 +399,36 @@ class Mm2S5:
     indent = '  ' * (depth + 2)
     if 'no_ul' not in attribs:
       if 'ol' in attribs:
-        lines.append('%s<ol%s>' % (indent, ul_class,))
+        start = '%s<ol%s>' % (indent, ul_class,)
         end = '%s</ol>' % (indent)
       else:
-        lines.append('%s<ul%s>' % (indent, ul_class,))
+        start = '%s<ul%s>' % (indent, ul_class,)
         end = '%s</ul>' % (indent)
     else:
+      start = None
       end = None
-
-    for line in sub.findall('node'):
-      text = line.attrib.get('TEXT') # Probably due to FreeMind 0.9, we might not have TEXT attribute
-      if not text: # FreeMind 0.9 's HTML node stores text in html format
-        p = (line
-          ._children[0]#Element richcontent
-          ._children[0]#Element html
-          ._children[1]#Element body
-          ._children[0])#Element p
-        if p.text:
-          text=p.text
-        elif p.tag == 'img':
-          text='<img src="%s">' % p.get('src')
-      if text == '__table__':
-        lines += self._insert_table(text, line, depth)
-      else:
-        lines += self._insert_line_item(text, line, depth, attribs)
-        self._doList(lines, line, depth + 1)
-
-    if end:
-      lines.append(end)
+    return start, end, _compile_item(depth, 'no_ul' in attribs)
+
+  def _node_text(self, line):
+    """ The text of a node, which FreeMind 0.9 HTML nodes keep in a
+    richcontent child instead of the TEXT attribute """
+    text = line.attrib.get('TEXT') # Probably due to FreeMind 0.9, we might not have TEXT attribute
+    if not text: # FreeMind 0.9 's HTML node stores text in html format
+      p = (line
+        [0]#Element richcontent
+        [0]#Element html
+        [1]#Element body
+        [0])#Element p
+      if p.text:
+        text=p.text
+      elif p.tag == 'img':
+        text='<img src="%s">' % p.get('src')
+    return text
 
   def _insert_line_item(self, text, line, depth, attribs):
     """ Insert a line item <li></li> """
 
-    indent = '  ' * (depth + 3)
-    lines = []
-    if not text:
-      return lines
-    text = text.replace('<html>', '')
-    if 'LINK'in line.attrib:
-      text = '<a href="%s">%s</a>' % (line.attrib['LINK'], text)
-
-    if 'no_ul' not in attribs:
-      text = text.replace('\n', '<br/>\n')
-      lines.append('%s<li>%s</li>' % (indent, text))
-    else:
-      lines.append('%s' % (text))
-
-    return lines
+    return _compile_item(depth, 'no_ul' in attribs)(text, line)
 
   def _insert_table(self, unused_text, line, depth):
     """ If we get a special node called __table__ insert the children
@@ -280,17 +436,46 @@ class Mm2S5:
 
     lines = []
     indent = '  ' * (depth + 2)
+    tr, tr_end = indent + '  <tr>', indent + '  </tr>'
+    td = (indent + '    <td>%s</td>').__mod__
     table = line
     lines.append('%s<table>' % (indent))
     for row in table.findall('node'):
-      lines.append('%s  <tr>' % (indent))
-      for col in row.getiterator('node'):
-        lines.append('%s    <td>%s</td>' % (indent, col.attrib['TEXT']))
+      lines.append(tr)
+      for col in mmstream.iternodes(row):
+        lines.append(td(col.attrib['TEXT']))
 
-      lines.append('%s  </tr>' % (indent))
+      lines.append(tr_end)
     lines.append('%s</table>' % (indent))
     return lines
 
+def convert_archive(infile, outpath, cache=None, output=None, deep_meta=False):
+  """ Convert every map of the zip or tar archive infile into an .html
+  file of outpath, an archive or a directory.  output is the
+  mmprofile.Output of --profile, if any.  Return the number of maps """
+
+  out = mmarchive.writer(outpath)
+  done = False
+  try:
+    for name, data in mmarchive.iter_members(infile):
+      mm2s5 = Mm2S5()
+      mm2s5.cache = cache
+      mm2s5.deep_meta = deep_meta
+      profile = mm2s5.profile = output and output.new('mm2s5', name)
+      lines = mm2s5.iter_open(io.BytesIO(data))
+      with mmprofile.phase(profile, 'render'):
+        written = out.add_lines(mmarchive.output_name(name, '.html'), lines, u'\n')
+      if profile:
+        profile.bytes = written
+        profile.finish()
+    done = True
+  finally:
+    if done:
+      out.close()
+    else:
+      out.abort()
+  return out.count
+
 def show_version():
     print 'mm2s5 version %s.' % __version__
     print 'Written by %s' % __author__
@@ -299,10 +484,28 @@ def parse_command_line():
     usage = """%prog <mmfile> [<htmloutput>]
 Create a FreeMind (.mm) document (see http://freemind.sourceforge.net/wiki/index.php/Main_Page)
 the main node will be the title page and the lower nodes will be pages.
+
+<mmfile> may also be a zip or tar archive of maps, each one is converted
+into an .html file of <htmloutput>, a zip or tar archive or a directory
+(by default the directory of <mmfile>).
 """
     parser = optparse.OptionParser(usage)
     parser.add_option('-v', '--version', dest='version', action='store_true',
                       help='Show version information and exit.')
+    parser.add_option('-c', '--cache', dest='cache', metavar='FILE',
+                      help='Keep the rendered slides in FILE and reuse those '
+                      'of the branches that did not change since the last run.')
+    parser.add_option('--profile', dest='profile', metavar='FILE',
+                      help='Append the timings of the conversion to FILE as a '
+                      'JSON line, or write a cProfile dump if FILE ends with .prof')
+    parser.add_option('--deep-meta', dest='deep_meta', action='store_true',
+                      help='Look for the __meta__ node in the whole map, not '
+                      'only at the top level.')
+    parser.add_option('--gzip', dest='gzip', action='store_true',
+                      help='Also write <htmloutput>.gz for the web server, '
+                      'unless <htmloutput> did not change.')
+    parser.add_option('--zstd', dest='zstd', action='store_true',
+                      help='Also write <htmloutput>.zst (needs the zstandard module).')
     (options, args) = parser.parse_args()
     if options.version:
         show_version()
@@ -312,22 +515,58 @@ the main node will be the title page and the lower nodes will be pages.
         sys.exit(-1)
 
     infile = args[0]
-    if not infile.endswith('.mm'):
-        print "Input file must end with '.mm'"
+    archive = mmarchive.is_archive(infile)
+    if not infile.endswith('.mm') and not archive:
+        print "Input file must end with '.mm' or be a zip or tar archive"
         parser.print_usage()
         sys.exit(-1)
 
-    if len(args) == 1:
+    if len(args) == 1 and archive:
+        outfile = os.path.dirname(infile) or '.'
+    elif len(args) == 1:
         outfile = infile.replace('.mm', '.html')
     elif len(args) == 2:
         outfile = args[1]
     else:
         parser.print_usage()
         sys.exit(-1)
-
+    try:
+        sidecars = mmstream.sidecars(options.gzip, options.zstd)
+    except ValueError, e:
+        parser.error(str(e))
+    if sidecars and archive:
+        parser.error('--gzip and --zstd are for a single .mm file')
+
+    output = mmprofile.output(options.profile)
+    if archive:
+      # every map of the archive, into an archive or a directory
+      cache = options.cache and mmcache.RenderCache(options.cache)
+      count = convert_archive(infile, outfile, cache or None, output,
+                              options.deep_meta)
+      print >> sys.stderr, '%d maps converted into %s' % (count, outfile)
+      if cache:
+        cache.close()
+        print >> sys.stderr, 'render cache: %s' % cache.summary()
+      if output:
+        output.close()
+      return
     mm2s5 = Mm2S5()
-    lines = mm2s5.open(infile)
-    mm2s5.write(outfile, lines)
+    profile = mm2s5.profile = output and output.new('mm2s5', infile)
+    mm2s5.deep_meta = options.deep_meta
+    mm2s5.sidecars = sidecars
+    if options.cache:
+      mm2s5.cache = mmcache.RenderCache(options.cache)
+    lines = mm2s5.iter_open(infile)
+    with mmprofile.phase(profile, 'render'):
+      written = mm2s5.write(outfile, lines)
+    if options.cache:
+      mm2s5.cache.close()
+      print >> sys.stderr, 'render cache: %s' % mm2s5.cache.summary()
+    if profile:
+      profile.bytes = written
+      profile.finish()
+    if output:
+      output.close()
 
 if __name__ == "__main__":
     parse_command_line()
@@ -2,27 +2,51 @@
 # encoding: utf-8
 
 from __future__ import unicode_literals
-from xml.etree import ElementTree
+import optparse
 import os
 import sys
-import yaml
+import time
 from mm2md import MMTransform
+import mmconfig
+import mmprofile
+import mmstream
 
 def main(argv):
-    confile = file('/home/rain/doc/FreeMindTools/app.yaml','rb')
-    config = yaml.load(confile)
+    parser = optparse.OptionParser('%prog [options] <mmfile>')
+    parser.add_option('--profile', dest='profile', metavar='FILE',
+                      help='append the timings of the conversion to FILE as a '
+                           'JSON line, or write a cProfile dump if FILE ends with .prof')
+    (options, args) = parser.parse_args(argv[1:])
+    output = mmprofile.output(options.profile)
+    profile = output and output.new('mm2wiki', args[0])
+
+    start = time.time()
+    config = mmconfig.ConfigStore('/home/rain/doc/FreeMindTools/app.yaml')
     dirconf = 'file_dir'
     mddir = config[dirconf]['md']
     mmdir = config[dirconf]['mm']
+    if profile:
+        profile.phases['config'] = time.time() - start
 
     textileFilename = 'wiki.txt'
-    mmFilename = argv[1]
-    mm = file(os.path.join(mmdir,mmFilename),'rb')
-    textile = file(os.path.join(mddir,textileFilename),'wb')
+    mmFilename = args[0]
+    if profile:
+        mm = profile.open(os.path.join(mmdir,mmFilename))
+    else:
+        mm = file(os.path.join(mmdir,mmFilename),'rb')
+    textile = mmprofile.create(profile, os.path.join(mddir,textileFilename))
     transform = MMTransform()
-    textile.write(transform.mm2textile(mm.read()).encode('utf8'))
+    transform.profile = profile
+    with mmprofile.phase(profile, 'render'):
+        written = mmstream.write_lines(textile, transform.iter_textile(mm), os.linesep)
+    mm.close()
     textile.close()
+    if profile:
+        profile.bytes = written
+        profile.finish()
+    if output:
+        output.close()
 
 if __name__ == "__main__":
     main(sys.argv)
-    # main([])
\ No newline at end of file
+    # main([])
@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""Maps read from, and converted files written to, zip and tar archives.
+
+Maps exported from a document store come as archives of thousands of
+small .mm files.  iter_members reads them member by member without
+unpacking them to disk; a tar archive (compressed or not) is read as a
+single stream.  Writer puts the converted files into a new archive, and
+DirectoryWriter into a directory, behind the same add/add_lines calls:
+
+  for name, data in iter_members('maps.tar.gz'):
+      out.add_lines(name.replace('.mm', '.html'), convert(data))
+"""
+
+import io
+import os
+import tarfile
+import time
+import zipfile
+
+import mmstream
+
+# the compression of a tar archive, by the end of its name
+TAR_MODES = [
+    ('.tar', ''),
+    ('.tar.gz', 'gz'),
+    ('.tgz', 'gz'),
+    ('.tar.bz2', 'bz2'),
+    ('.tbz2', 'bz2'),
+]
+
+
+def is_zip(path):
+    return path.lower().endswith('.zip')
+
+
+def _tar_mode(path):
+    """the compression of the tar archive path, None if it is not one"""
+    lower = path.lower()
+    for suffix, mode in TAR_MODES:
+        if lower.endswith(suffix):
+            return mode
+    return None
+
+
+def is_archive(path):
+    """whether path names a zip or tar archive"""
+    return is_zip(path) or _tar_mode(path) is not None
+
+
+def _name(name):
+    # zipfile returns the names flagged as UTF-8 as unicode, the other ones
+    # as bytes, like tarfile and os.listdir
+    if isinstance(name, unicode):
+        return name.encode('utf8')
+    return name
+
+
+def iter_members(path, suffix=b'.mm'):
+    """(name, data) of every file of the archive at path whose name ends
+    with suffix, in the order of the archive.  Only one member is in
+    memory at a time."""
+    if is_zip(path):
+        archive = zipfile.ZipFile(path)
+        try:
+            for info in archive.infolist():
+                name = _name(info.filename)
+                if name.endswith(suffix) and not name.endswith(b'/'):
+                    yield name, archive.read(info)
+        finally:
+            archive.close()
+        return
+    # r|*: a stream of any compression, no seeking back to an index
+    archive = tarfile.open(path, 'r|*')
+    try:
+        for info in archive:
+            name = _name(info.name)
+            if info.isfile() and name.endswith(suffix):
+                member = archive.extractfile(info)
+                try:
+                    yield name, member.read()
+                finally:
+                    member.close()
+    finally:
+        archive.close()
+
+
+def _unique_name(names, name):
+    """name, or name-2, name-3... before its extension when it is one of
+    names already, added to names"""
+    stem, ext = os.path.splitext(name)
+    number = 1
+    while name in names:
+        number += 1
+        name = '%s-%d%s' % (stem, number, ext)
+    names.add(name)
+    return name
+
+
+class Writer(object):
+    """a new zip or tar archive at path, made of the files added to it.
+    It is written to a temporary file that replaces path on close, or is
+    removed by abort.
+
+    A name added again is stored as name-2 (name-3...): two maps of the
+    same base name in different directories of an archive do not hide
+    each other."""
+
+    def __init__(self, path):
+        self.path = path
+        self.tmp = '%s.%d.tmp' % (path, os.getpid())
+        self.count = 0
+        self.names = set()
+        if is_zip(path):
+            self.zip = zipfile.ZipFile(self.tmp, 'w', zipfile.ZIP_DEFLATED)
+            self.tar = None
+        else:
+            self.zip = None
+            mode = _tar_mode(path)
+            self.tar = tarfile.open(self.tmp, mode and 'w:' + mode or 'w')
+
+    def add(self, name, data):
+        """store the bytes data as the file name, return the name it got"""
+        name = _unique_name(self.names, name)
+        now = time.time()
+        if self.zip is not None:
+            if isinstance(name, bytes):
+                # unicode names are flagged as UTF-8 in the archive
+                name = name.decode('utf8')
+            info = zipfile.ZipInfo(name, time.localtime(now)[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0644 << 16
+            self.zip.writestr(info, data)
+        else:
+            info = tarfile.TarInfo(_name(name))
+            info.size = len(data)
+            info.mtime = now
+            info.mode = 0644
+            self.tar.addfile(info, io.BytesIO(data))
+        self.count += 1
+        return name
+
+    def add_lines(self, name, lines, sep='\n'):
+        """store lines as the file name, see mmstream.write_lines.  Return
+        the number of bytes written"""
+        # the size of a member comes before its data: it is made in memory
+        data = io.BytesIO()
+        written = mmstream.write_lines(data, lines, sep)
+        self.add(name, data.getvalue())
+        return written
+
+    def close(self):
+        (self.zip or self.tar).close()
+        os.rename(self.tmp, self.path)
+
+    def abort(self):
+        """drop the archive, path is left as it was"""
+        (self.zip or self.tar).close()
+        os.remove(self.tmp)
+
+
+class DirectoryWriter(object):
+    """Writer writing the files to the directory path instead"""
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self.names = set()
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+    def add(self, name, data):
+        name = _unique_name(self.names, name)
+        out = open(os.path.join(self.path, name), 'wb')
+        try:
+            out.write(data)
+        finally:
+            out.close()
+        self.count += 1
+        return name
+
+    def add_lines(self, name, lines, sep='\n'):
+        name = _unique_name(self.names, name)
+        out = open(os.path.join(self.path, name), 'wb')
+        try:
+            written = mmstream.write_lines(out, lines, sep)
+        finally:
+            out.close()
+        self.count += 1
+        return written
+
+    def close(self):
+        pass
+
+    def abort(self):
+        pass
+
+
+def writer(path):
+    """a Writer when path names an archive, a DirectoryWriter otherwise"""
+    if is_archive(path):
+        return Writer(path)
+    return DirectoryWriter(path)
+
+
+def output_name(name, extension):
+    """the file name of the conversion of the member name: its base name
+    with the extension of the output"""
+    return os.path.splitext(os.path.basename(name))[0] + extension
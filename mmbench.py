@@ -0,0 +1,439 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""Benchmark the converters on synthetic mind maps.
+
+A deterministic generator writes .mm files of any shape (depth, fan-out,
+text length, share of CJK text, richcontent/HTML nodes, icons, __table__
+and __meta__ nodes, meeting sections, CREATED timestamps).  The runner
+converts them with mm2md (tree and streaming), mm2wiki's textile, mm2s5
+and mm2notes, on an ElementTree and on mmmodel's CompactMap, each in a
+fresh process, and reports per phase timings
+(parse / walk / serialize / write), throughput and peak RSS.
+
+  python mmbench.py                          # every scenario
+  python mmbench.py -s deep -s wide --save base.json
+  python mmbench.py --compare base.json      # show the change per number
+
+The -readall and -mapped converters load the map as the converters used
+to, reading the whole file into a string, and through memory mappings of
+--chunk-size bytes (mmstream.MappedFile); compare their peak RSS.
+"""
+
+from __future__ import unicode_literals
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape, quoteattr
+import json
+import multiprocessing
+import optparse
+import os
+import Queue
+import random
+import resource
+import shutil
+import sys
+import tempfile
+import time
+
+import mmstream
+from mmmodel import CompactMap
+from mm2md import MMTransform
+from mm2s5 import Mm2S5
+from mm2notes import Mm2Notes
+
+PHASES = ['parse', 'walk', 'serialize', 'write']
+
+# mappings of the -mapped converters, see mmstream.MappedFile
+CHUNK_SIZE = mmstream.CHUNK_SIZE
+
+# seconds between two checks that the process of a run is still alive
+POLL = 1.0
+
+SECTIONS = ['时间', '地点', 'Attendees', 'Topic', 'Action items', 'Discussion']
+
+# name: keyword arguments of generate
+SCENARIOS = {
+    'small': dict(depth=3, fanout=6),
+    'balanced': dict(depth=5, fanout=8),
+    'deep': dict(depth=2000, fanout=1, tables=0),
+    'wide': dict(depth=2, fanout=400, section_fanout=20),
+    'cjk': dict(depth=4, fanout=12, cjk_ratio=1.0, text_len=40),
+    'rich': dict(depth=4, fanout=12, rich_ratio=0.3, icon_ratio=0.5, tables=20),
+    # a long deck: 24 slides of 930 items, and 10k notes per meeting section
+    'deck': dict(depth=3, fanout=30, section_fanout=100, icon_ratio=0.2),
+    # not run unless asked for: about 1M nodes, 1.5GB as an ElementTree
+    'million': dict(depth=3, fanout=100, section_fanout=10),
+}
+DEFAULT_SCENARIOS = sorted(name for name in SCENARIOS if name != 'million')
+
+ICONS = ['button_ok', 'stop', 'full-1', 'idea', 'help']
+CJK_FIRST, CJK_LAST = 0x4e00, 0x9fa5
+LATIN = 'abcdefghijklmnopqrstuvwxyz     '
+
+
+class _MapWriter():
+    """state of one generate() call"""
+
+    def __init__(self, out, rnd, text_len, cjk_ratio, rich_ratio, icon_ratio):
+        self.out = out
+        self.rnd = rnd
+        self.text_len = text_len
+        self.cjk_ratio = cjk_ratio
+        self.rich_ratio = rich_ratio
+        self.icon_ratio = icon_ratio
+        self.count = 0
+        self.created = 1353300000000
+
+    def text(self):
+        rnd = self.rnd
+        if rnd.random() < self.cjk_ratio:
+            return ''.join(unichr(rnd.randint(CJK_FIRST, CJK_LAST))
+                           for i in range(self.text_len))
+        return ''.join(rnd.choice(LATIN) for i in range(self.text_len)).strip() or 'x'
+
+    def open(self, text=None, rich=False, icons=True):
+        """write the start tag of a node (and its icons/richcontent)"""
+        self.count += 1
+        self.created += self.rnd.randint(1, 60) * 1000
+        attrs = 'CREATED="%d" ID="ID_%d" MODIFIED="%d"' % (
+            self.created, self.count, self.created)
+        if text is None:
+            text = self.text()
+        if rich:
+            self.write('<node %s><richcontent TYPE="NODE"><html><head></head>'
+                       '<body><p>%s</p></body></html></richcontent>\n'
+                       % (attrs, escape(text)))
+        else:
+            self.write('<node %s TEXT=%s>\n' % (attrs, quoteattr(text)))
+        if icons and self.rnd.random() < self.icon_ratio:
+            self.write('<icon BUILTIN="%s"/>\n' % self.rnd.choice(ICONS))
+
+    def close(self):
+        self.write('</node>\n')
+
+    def leaf(self, text=None):
+        self.open(text, icons=False)
+        self.close()
+
+    def write(self, data):
+        self.out.write(data.encode('utf-8'))
+
+    def branch(self, text, depth, fanout, plain=False):
+        """a top level branch, depth levels deep with fanout children per
+        node.  plain branches (meeting sections) have no richcontent nodes"""
+        self.open(text, icons=not plain)
+        # [level, children still to write]; iterative so that deep maps work
+        stack = [[1, fanout]]
+        while stack:
+            level, left = stack[-1]
+            if level >= depth or left == 0:
+                self.close()
+                stack.pop()
+                continue
+            stack[-1][1] -= 1
+            # FreeMind HTML nodes have no TEXT, mm2s5 wants one on the
+            # first child of a list
+            rich = (not plain and level > 1 and left != fanout
+                    and self.rnd.random() < self.rich_ratio)
+            self.open(rich=rich, icons=not plain)
+            stack.append([level + 1, fanout])
+
+    def table(self, rows, cols):
+        self.open('__table__', icons=False)
+        for row in range(rows):
+            self.open('row %d' % row, icons=False)
+            for col in range(cols):
+                self.leaf('cell %d.%d' % (row, col))
+            self.close()
+        self.close()
+
+
+def generate(out, depth=4, fanout=5, text_len=24, cjk_ratio=0.3, rich_ratio=0.05,
+             icon_ratio=0.1, tables=1, meta=True, sections=True, section_fanout=None,
+             seed=0):
+    """Write a synthetic map to the binary file out, return its node count.
+
+    The map has fanout top level branches, each depth levels deep with
+    fanout children per node.  With sections the first branches are the
+    meeting sections mm2notes looks for (section_fanout children per node,
+    fanout by default), meta adds a __meta__ node and tables adds
+    __table__ nodes with fanout rows.  The same arguments always give the
+    same bytes.
+    """
+    writer = _MapWriter(out, random.Random(seed), text_len, cjk_ratio,
+                        rich_ratio, icon_ratio)
+    writer.write('<map version="0.9.0">\n')
+    writer.open('Benchmark map\nsynthetic', icons=False)
+    if meta:
+        writer.open('__meta__', icons=False)
+        for key, value in [('author', 'mmbench'), ('company', 'FreeMindTools')]:
+            writer.open(key, icons=False)
+            writer.leaf(value)
+            writer.close()
+        writer.close()
+    names = sections and SECTIONS[:fanout] or []
+    for name in names:
+        # Discussion needs speaker / note levels
+        writer.branch(name, max(depth, 3), section_fanout or fanout, plain=True)
+    for i in range(len(names), fanout):
+        writer.branch(None, depth, fanout)
+    if tables:
+        writer.open('Tables', icons=False)
+        for i in range(tables):
+            writer.table(fanout, 3)
+        writer.close()
+    writer.close()
+    writer.write('</map>\n')
+    return writer.count
+
+
+def _timed(phases, name, func, *args):
+    start = time.time()
+    result = func(*args)
+    phases[name] = time.time() - start
+    return result
+
+
+def _write(phases, outpath, data):
+    def write():
+        outfile = open(outpath, 'wb')
+        outfile.write(data)
+        outfile.close()
+    _timed(phases, 'write', write)
+
+
+def bench_md(path, outpath, phases, load=mmstream.parse):
+    tree = _timed(phases, 'parse', load, path)
+    md = _timed(phases, 'walk', MMTransform().tree2md, tree)
+    data = _timed(phases, 'serialize', lambda: os.linesep.join(md).encode('utf-8'))
+    _write(phases, outpath, data)
+    return len(data)
+
+
+def read_all(path):
+    """the tree of the map at path, read into a string first"""
+    infile = open(path, 'rb')
+    data = infile.read()
+    infile.close()
+    return ElementTree.XML(data)
+
+
+def load_mapped(path):
+    """the tree of the map at path, parsed from memory mappings"""
+    infile = mmstream.MappedFile(path, CHUNK_SIZE)
+    try:
+        return mmstream.parse(infile)
+    finally:
+        infile.close()
+
+
+def bench_md_stream(path, outpath, phases, mapped=False):
+    # parsing is interleaved with the walk
+    source = mapped and mmstream.MappedFile(path, CHUNK_SIZE) or path
+    md = _timed(phases, 'walk', lambda: list(MMTransform().iter_md(source)))
+    if mapped:
+        source.close()
+    data = _timed(phases, 'serialize', lambda: os.linesep.join(md).encode('utf-8'))
+    _write(phases, outpath, data)
+    return len(data)
+
+
+def bench_textile(path, outpath, phases, load=mmstream.parse):
+    tree = _timed(phases, 'parse', load, path)
+    textile = _timed(phases, 'walk', MMTransform().tree2textile, tree)
+    data = _timed(phases, 'serialize', lambda: os.linesep.join(textile).encode('utf-8'))
+    _write(phases, outpath, data)
+    return len(data)
+
+
+def bench_s5(path, outpath, phases, load=mmstream.parse, deep_meta=False):
+    mm2s5 = Mm2S5()
+    mm2s5.deep_meta = deep_meta
+    mm2s5.et_in = _timed(phases, 'parse', load, path)
+    lines = _timed(phases, 'walk', mm2s5.convert)
+    data = _timed(phases, 'serialize', lambda: '\n'.join(lines).encode('utf-8'))
+    _write(phases, outpath, data)
+    return len(data)
+
+
+def bench_notes(path, outpath, phases, load=mmstream.parse):
+    mm2notes = Mm2Notes()
+    mm2notes.et_in = _timed(phases, 'parse', load, path)
+    lines = _timed(phases, 'walk', mm2notes.convert)
+    data = _timed(phases, 'serialize', lambda: '\n'.join(lines).encode('utf-8'))
+    _write(phases, outpath, data)
+    return len(data)
+
+
+def _compact(bench):
+    """run bench on mmmodel.CompactMap instead of an ElementTree"""
+    return _loaded(bench, CompactMap)
+
+
+def _loaded(bench, load):
+    """run bench with the map loaded by load"""
+    return lambda path, outpath, phases: bench(path, outpath, phases, load)
+
+
+CONVERTERS = [
+    ('md', bench_md),
+    ('md-readall', _loaded(bench_md, read_all)),
+    ('md-mapped', _loaded(bench_md, load_mapped)),
+    ('md-stream', bench_md_stream),
+    ('md-stream-mapped', _loaded(bench_md_stream, True)),
+    ('md-compact', _compact(bench_md)),
+    ('textile', bench_textile),
+    ('s5', bench_s5),
+    ('s5-compact', _compact(bench_s5)),
+    # the __meta__ search over the whole map of before
+    ('s5-deep-meta', lambda path, outpath, phases: bench_s5(
+        path, outpath, phases, deep_meta=True)),
+    ('notes', bench_notes),
+    ('notes-compact', _compact(bench_notes)),
+]
+
+
+def _child(func, path, outpath, queue):
+    phases = {}
+    try:
+        size = func(path, outpath, phases)
+    except Exception, e:
+        queue.put({'error': '%s: %s' % (e.__class__.__name__, e)})
+        return
+    queue.put({'phases': phases, 'output_bytes': size,
+               'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss})
+
+
+def run_one(func, path, outpath, repeat=1):
+    """run a bench_* function in fresh processes, keep the fastest run"""
+    best = None
+    for i in range(repeat):
+        queue = multiprocessing.Queue()
+        proc = multiprocessing.Process(target=_child, args=(func, path, outpath, queue))
+        proc.start()
+        result = None
+        while result is None:
+            try:
+                result = queue.get(timeout=POLL)
+            except Queue.Empty:
+                if proc.is_alive():
+                    continue
+                # its result may have come in just before it exited
+                try:
+                    result = queue.get(timeout=POLL)
+                except Queue.Empty:
+                    break
+        proc.join()
+        if result is None:
+            # killed (out of memory...) or crashed without a word
+            return {'error': 'the process died, exit code %s' % proc.exitcode}
+        if 'error' in result:
+            return result
+        result['total'] = sum(result['phases'].values())
+        if best is None or result['total'] < best['total']:
+            best = result
+    return best
+
+
+def run(scenarios, converters, repeat=1, workdir=None):
+    """{'scenario/converter': result} for every scenario and converter"""
+    tmpdir = workdir or tempfile.mkdtemp(prefix='mmbench')
+    results = {}
+    try:
+        for scenario in scenarios:
+            path = os.path.join(tmpdir, scenario + '.mm')
+            mmfile = open(path, 'wb')
+            nodes = generate(mmfile, **SCENARIOS[scenario])
+            mmfile.close()
+            size = os.path.getsize(path)
+            for name, func in converters:
+                result = run_one(func, path, os.path.join(tmpdir, 'out'), repeat)
+                result['nodes'] = nodes
+                result['input_bytes'] = size
+                if 'total' in result:
+                    result['nodes_per_s'] = nodes / result['total']
+                    result['mb_per_s'] = size / 1048576.0 / result['total']
+                results['%s/%s' % (scenario, name)] = result
+                report_line('%s/%s' % (scenario, name), result)
+    finally:
+        if workdir is None:
+            shutil.rmtree(tmpdir)
+    return results
+
+
+def report_line(key, result):
+    if 'error' in result:
+        print '%-22s %s' % (key, result['error'])
+        return
+    phases = result['phases']
+    print '%-22s %8d %7.2fMB %s %7.3fs %9.0f n/s %6.2f MB/s %7.1fMB' % (
+        key, result['nodes'], result['input_bytes'] / 1048576.0,
+        ' '.join('%7s' % ('%.3f' % phases[p] if p in phases else '-') for p in PHASES),
+        result['total'], result['nodes_per_s'], result['mb_per_s'],
+        result['peak_rss_kb'] / 1024.0)
+
+
+def compare(baseline, results):
+    """print the relative change of the total time and peak RSS"""
+    print
+    print '%-22s %18s %18s' % ('change vs baseline', 'total', 'peak RSS')
+    for key in sorted(results):
+        new, old = results[key], baseline.get(key)
+        if old is None or 'total' not in new or 'total' not in old:
+            continue
+        print '%-22s %7.3fs %+8.1f%% %6.1fMB %+8.1f%%' % (
+            key, new['total'], 100.0 * (new['total'] - old['total']) / old['total'],
+            new['peak_rss_kb'] / 1024.0,
+            100.0 * (new['peak_rss_kb'] - old['peak_rss_kb']) / old['peak_rss_kb'])
+
+
+def main(argv):
+    global CHUNK_SIZE
+    parser = optparse.OptionParser('%prog [options]')
+    parser.add_option('-s', '--scenario', dest='scenarios', action='append',
+                      choices=sorted(SCENARIOS),
+                      help='scenario to run, repeatable (default: %s)'
+                           % ', '.join(DEFAULT_SCENARIOS))
+    parser.add_option('-c', '--converter', dest='converters', action='append',
+                      choices=[name for name, func in CONVERTERS],
+                      help='converter to run, repeatable (default: all)')
+    parser.add_option('-r', '--repeat', dest='repeat', type='int', default=1,
+                      help='runs per converter, the fastest is kept')
+    parser.add_option('--save', dest='save', help='write the results to a JSON baseline')
+    parser.add_option('--compare', dest='compare', help='compare with a JSON baseline')
+    parser.add_option('--keep', dest='workdir',
+                      help='generate the maps in this directory and keep them')
+    parser.add_option('--generate', dest='generate', metavar='FILE',
+                      help='only write the map of the (single) scenario to FILE')
+    parser.add_option('--chunk-size', dest='chunk_size', type='int', default=CHUNK_SIZE,
+                      help='bytes mapped at a time by the -mapped converters '
+                           '(default: %default)')
+    (options, args) = parser.parse_args(argv[1:])
+    CHUNK_SIZE = options.chunk_size
+
+    scenarios = options.scenarios or DEFAULT_SCENARIOS
+    if options.generate:
+        mmfile = open(options.generate, 'wb')
+        print '%d nodes' % generate(mmfile, **SCENARIOS[scenarios[0]])
+        mmfile.close()
+        return 0
+    converters = [(name, func) for name, func in CONVERTERS
+                  if not options.converters or name in options.converters]
+
+    print '%-22s %8s %9s %s %8s %13s %10s %9s' % (
+        'scenario/converter', 'nodes', 'input', ' '.join('%7s' % p for p in PHASES),
+        'total', 'throughput', '', 'peak RSS')
+    results = run(scenarios, converters, options.repeat, options.workdir)
+    if options.compare:
+        baseline = open(options.compare, 'rb')
+        compare(json.load(baseline), results)
+        baseline.close()
+    if options.save:
+        out = open(options.save, 'wb')
+        json.dump(results, out, indent=1, sort_keys=True, separators=(',', ': '))
+        out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
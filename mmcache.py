@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""A render cache of map branches, for maps that are edited one branch at
+a time.
+
+A converter asks the cache for the lines of a branch under a key made of
+the branch root's ID and MODIFIED attributes, a digest of the whole
+branch, the depth the branch is rendered at and the output format.  An
+unchanged branch has the same key from one run to the next and its lines
+are reused; an edit changes the digest of the edited node and of all its
+ancestors only, so just that path is rendered again.
+
+Only the branches of the first ``depth`` levels are cached, by default
+the top-level branches (the slides of mm2s5): deeper ones are small, and
+every cached level stores the lines of the ones below it once more.  The
+cache is a pickled dict, one file per map and format.
+"""
+
+import cPickle as pickle
+import hashlib
+import os
+from xml.etree import ElementTree
+
+DEPTH = 1
+KEEP = 10
+
+
+def digests(root):
+    """{node: sha1 of its branch} for root and every node below it: its
+    attributes, its other children (icons, richcontent...) and the digests
+    of its child nodes"""
+    result = {}
+    stack = [(root, None)]
+    while stack:
+        elem, children = stack.pop()
+        if children is None:
+            children = elem[:]
+            stack.append((elem, children))
+            stack.extend((child, None) for child in reversed(children)
+                         if child.tag == 'node')
+            continue
+        sha1 = hashlib.sha1()
+        _update(sha1, elem)
+        for child in children:
+            if child.tag == 'node':
+                sha1.update(result[child])
+            else:
+                _update_element(sha1, child)
+        result[elem] = sha1.digest()
+    return result
+
+
+def _update(sha1, elem):
+    for key, value in sorted(elem.attrib.items()):
+        sha1.update(('%s=%s\0' % (key, value)).encode('utf8'))
+
+
+def _update_element(sha1, elem):
+    """a non-node child: an icon, or richcontent HTML and the like"""
+    if len(elem) or elem.text:
+        sha1.update(ElementTree.tostring(elem, 'utf-8'))
+    else:
+        sha1.update(('<%s\0' % elem.tag).encode('utf8'))
+        _update(sha1, elem)
+
+
+class RenderCache(object):
+    """{key: lines}, loaded from and saved to path when given.
+
+    Entries not used in the last ``keep`` runs are dropped on close: they
+    are the branches of older versions of the map.  A branch found in the
+    cache does not use the entries of the branches below it, which are
+    kept that long for the day it is edited."""
+
+    def __init__(self, path=None, depth=DEPTH, keep=KEEP):
+        self.path = path
+        self.depth = depth
+        self.keep = keep
+        # key: (lines, number of the last run using them)
+        self.entries = {}
+        self.run = 0
+        self.hits = 0
+        self.misses = 0
+        self.changed = False
+        if path is not None and os.path.exists(path):
+            infile = open(path, 'rb')
+            try:
+                self.run, self.entries = pickle.load(infile)
+            except (pickle.UnpicklingError, EOFError, ValueError, TypeError):
+                self.run, self.entries = 0, {}
+            infile.close()
+        self.run += 1
+
+    def key(self, node, digest, depth, fmt):
+        return (node.get('ID'), node.get('MODIFIED'), digest, depth, fmt)
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if entry[1] != self.run:
+            self.entries[key] = (entry[0], self.run)
+            self.changed = True
+        return entry[0]
+
+    def put(self, key, lines):
+        self.entries[key] = (tuple(lines), self.run)
+        self.changed = True
+
+    def hit_rate(self):
+        if not self.hits + self.misses:
+            return 0.0
+        return float(self.hits) / (self.hits + self.misses)
+
+    def summary(self):
+        return '%d hits, %d misses (%.0f%%), %d entries' % (
+            self.hits, self.misses, 100 * self.hit_rate(), len(self.entries))
+
+    def close(self):
+        """drop the old entries and save the cache"""
+        oldest = self.run - self.keep
+        old = [key for key, entry in self.entries.items() if entry[1] <= oldest]
+        for key in old:
+            del self.entries[key]
+        if self.path is None or not (self.changed or old):
+            return
+        tmp = self.path + '.tmp'
+        outfile = open(tmp, 'wb')
+        pickle.dump((self.run, self.entries), outfile, pickle.HIGHEST_PROTOCOL)
+        outfile.close()
+        os.rename(tmp, self.path)
+        self.changed = False
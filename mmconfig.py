@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""app.yaml, compiled into an index that is cheap to open.
+
+Converting one map only needs file_dir and one post block, but loading
+app.yaml parses every block.  ConfigStore parses app.yaml once (with the
+C loader of PyYAML when it was built with libyaml) and stores each
+top-level block as JSON in a SQLite database of the cache directory
+($XDG_CACHE_HOME/FreeMindTools, ~/.cache/FreeMindTools by default), one
+per app.yaml:
+
+  source (mtime, size, sha1)      of app.yaml when it was compiled
+  blocks (key PRIMARY KEY, block)
+
+A lookup reads one row by its key, the other blocks stay on disk.  The
+index is compiled again when app.yaml changed: same mtime and size are
+trusted, otherwise the sha1 decides, and a new mtime of the same content
+is recorded so that the next run does not hash it again.  The values YAML
+has and JSON has not (dates) are stored as their text.  The strings come
+back as PyYAML gives them: str when they are ASCII, so that the paths of
+file_dir join with the byte names of os.listdir, unicode otherwise.
+"""
+
+from __future__ import unicode_literals
+import hashlib
+import json
+import os
+import sqlite3
+import mmstream
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS source (
+    mtime REAL,
+    size INTEGER,
+    sha1 TEXT);
+CREATE TABLE IF NOT EXISTS blocks (
+    key TEXT PRIMARY KEY,
+    block TEXT);
+"""
+
+
+def load_yaml(path):
+    """the whole app.yaml"""
+    # imported here: with an up to date index yaml is not needed at all
+    import yaml
+    Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    stream = open(path, 'rb')
+    try:
+        return yaml.load(stream, Loader=Loader)
+    finally:
+        stream.close()
+
+
+def cache_dir():
+    """the directory of the indexes"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'FreeMindTools')
+
+
+def index_path(path):
+    """the index of the app.yaml at path, named by its real path"""
+    real = os.path.realpath(path)
+    if isinstance(real, unicode):
+        real = real.encode('utf8')
+    name = hashlib.sha1(real).hexdigest()
+    return os.path.join(cache_dir(), 'config-%s.sqlite' % name)
+
+
+def _native(value):
+    """value loaded from JSON, its ASCII strings as str like PyYAML"""
+    if isinstance(value, unicode):
+        try:
+            return value.encode('ascii')
+        except UnicodeError:
+            return value
+    if isinstance(value, list):
+        return [_native(item) for item in value]
+    if isinstance(value, dict):
+        return dict((_native(key), _native(item)) for key, item in value.items())
+    return value
+
+
+def _key(key):
+    if isinstance(key, bytes):
+        return key.decode('utf8')
+    return key
+
+
+class ConfigStore(object):
+    """Read-only mapping of the top-level keys of app.yaml to their
+    blocks, loaded one block at a time.  Works with mm2md.getconf."""
+
+    def __init__(self, path, index=None):
+        self.path = path
+        self.index = index or index_path(path)
+        self.blocks = {}
+        self.db = None
+        self._open()
+
+    def _open(self):
+        stat = os.stat(self.path)
+        # the lookups may come from another thread, one at a time: that of
+        # the pool of mm2md's batch making the jobs of an archive as it goes
+        try:
+            if not os.path.isdir(os.path.dirname(self.index)):
+                os.makedirs(os.path.dirname(self.index))
+            self.db = sqlite3.connect(self.index, check_same_thread=False)
+            self.db.executescript(SCHEMA)
+        except (OSError, sqlite3.Error):
+            # no cache directory: compile into memory only
+            self.db = sqlite3.connect(':memory:', check_same_thread=False)
+            self.db.executescript(SCHEMA)
+        source = self.db.execute('SELECT mtime, size, sha1 FROM source').fetchone()
+        if source is not None and source[:2] == (stat.st_mtime, stat.st_size):
+            return
+        digest = mmstream.file_digest(self.path)
+        with self.db:
+            if source is None or source[2] != digest:
+                self._compile()
+            self.db.execute('DELETE FROM source')
+            self.db.execute('INSERT INTO source VALUES (?, ?, ?)',
+                            (stat.st_mtime, stat.st_size, digest))
+
+    def _compile(self):
+        config = load_yaml(self.path)
+        self.db.execute('DELETE FROM blocks')
+        self.db.executemany('INSERT INTO blocks VALUES (?, ?)',
+                            ((_key(key), json.dumps(block, default=str))
+                             for key, block in config.items()))
+
+    def __getitem__(self, key):
+        key = _key(key)
+        if key in self.blocks:
+            return self.blocks[key]
+        row = self.db.execute('SELECT block FROM blocks WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        block = self.blocks[key] = _native(json.loads(row[0]))
+        return block
+
+    def has_key(self, key):
+        key = _key(key)
+        return key in self.blocks or self.db.execute(
+            'SELECT 1 FROM blocks WHERE key = ?', (key,)).fetchone() is not None
+
+    __contains__ = has_key
+
+    def get(self, key, default=None):
+        if self.has_key(key):
+            return self[key]
+        return default
+
+    def keys(self):
+        return [key for key, in self.db.execute('SELECT key FROM blocks')]
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
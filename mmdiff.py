@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""What changed between two versions of a freemind file(.mm).
+
+  python mmdiff.py old.mm new.mm              # a markdown changelog
+  python mmdiff.py --json old.mm new.mm
+
+The nodes of the two maps are matched by their ID.  A node without one
+is matched by the digest of its branch (mmcache.digests, only computed
+for the branches without ID): an unchanged branch is found wherever it
+went.  What is left of them is matched by text under the same (matched)
+parent, then in order under that parent, as a retexted node.  Every
+step is a dict lookup: the diff takes time in proportion to the size of
+the maps.
+
+The changes are the added and removed branches (their top node and the
+number of nodes in them), the moved nodes (a new parent), the retexted
+ones and the reattributed ones (the attributes other than ID, TEXT and
+MODIFIED).  Like diff, the exit status is 1 when the maps differ.
+"""
+
+from __future__ import unicode_literals
+from collections import deque
+import json
+import optparse
+import sys
+import mmcache
+import mmstream
+
+PATH_SEP = ' > '
+
+# attributes not compared: the key, the text and the time of any change
+IGNORED = ('ID', 'TEXT', 'MODIFIED')
+
+KINDS = ('added', 'removed', 'moved', 'retexted', 'reattributed')
+
+
+class _Map(object):
+    """the nodes of a map in document order, with their parents"""
+
+    def __init__(self, root):
+        self.root = root
+        self.nodes = []
+        self.parent = {root: None}
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            self.nodes.append(node)
+            children = [child for child in node if child.tag == 'node']
+            for child in children:
+                self.parent[child] = node
+            stack.extend(reversed(children))
+        self._paths = {None: ()}
+
+    def path(self, node):
+        """the texts of the ancestors of node, the root first"""
+        # up to the nearest ancestor with a known path, then down again
+        missing = []
+        while node not in self._paths:
+            missing.append(node)
+            node = self.parent[node]
+        path = self._paths[node]
+        for node in reversed(missing):
+            parent = self.parent[node]
+            if parent is not None:
+                path = self._paths[parent] + (parent.get('TEXT', ''),)
+            self._paths[node] = path
+        return path
+
+
+def _keys(mm):
+    """{node: key} for the nodes of mm: ('id', ID), or ('digest', digest,
+    n) for the n-th node without an ID with that branch digest"""
+    keys = {}
+    seen = {}
+    digests = {}
+    for node in mm.nodes:
+        nodeid = node.get('ID')
+        if nodeid:
+            keys[node] = ('id', nodeid)
+        else:
+            if node not in digests:
+                # the top of a branch without ID: the nodes come in document order
+                digests.update(mmcache.digests(node))
+            digest = digests[node]
+            n = seen.get(digest, 0)
+            seen[digest] = n + 1
+            keys[node] = ('digest', digest, n)
+    return keys
+
+
+def match(old, new):
+    """({old node: key}, {new node: key}) where matched nodes have the
+    same key"""
+    old_keys = _keys(old)
+    new_keys = _keys(new)
+    old_nodes = dict((key, node) for node, key in old_keys.iteritems())
+    taken = set(key for key in new_keys.itervalues() if key in old_nodes)
+    # the nodes without ID left, by parent and text and by parent only
+    by_text = {}
+    by_parent = {}
+    for node in old.nodes:
+        key = old_keys[node]
+        if key[0] == 'digest' and key not in taken and node is not old.root:
+            parent = old_keys[old.parent[node]]
+            by_text.setdefault((parent, node.get('TEXT')), deque()).append(key)
+            by_parent.setdefault(parent, deque()).append(key)
+
+    def first(candidates):
+        # the keys are taken from the front, the ones taken since are dropped
+        while candidates and candidates[0] in taken:
+            candidates.popleft()
+        if candidates:
+            key = candidates.popleft()
+            taken.add(key)
+            return key
+        return None
+
+    unmatched = []
+    for node in new.nodes:
+        key = new_keys[node]
+        if key[0] != 'digest' or key in taken:
+            continue
+        parent = new.parent[node]
+        if parent is None:
+            found = first(deque([old_keys[old.root]]))
+        else:
+            found = first(by_text.get((new_keys[parent], node.get('TEXT'))))
+        if found is not None:
+            new_keys[node] = found
+        else:
+            new_keys[node] = ('new', key[1], key[2])
+            if parent is not None:
+                unmatched.append(node)
+    # in document order: the key of a parent is final when its children come
+    for node in unmatched:
+        parent = new_keys[new.parent[node]]
+        found = (first(by_text.get((parent, node.get('TEXT'))))
+                 or first(by_parent.get(parent)))
+        if found is not None:
+            new_keys[node] = found
+    return old_keys, new_keys
+
+
+def _attributes(node):
+    return dict((key, value) for key, value in node.attrib.iteritems()
+                if key not in IGNORED)
+
+
+def diff(old_root, new_root):
+    """{kind: [change]} between two parsed maps (their <map> elements),
+    for every kind of KINDS.  A change is a dict with the ID (None without
+    one), the text and the path of the node, plus what changed"""
+    old = _Map(old_root.find('node'))
+    new = _Map(new_root.find('node'))
+    old_keys, new_keys = match(old, new)
+    old_nodes = dict((key, node) for node, key in old_keys.iteritems())
+    new_nodes = dict((key, node) for node, key in new_keys.iteritems())
+    changes = dict((kind, []) for kind in KINDS)
+
+    def entry(mm, node, **info):
+        info.update(id=node.get('ID'), text=node.get('TEXT', ''),
+                    path=list(mm.path(node)))
+        return info
+
+    for node in new.nodes:
+        key = new_keys[node]
+        before = old_nodes.get(key)
+        parent = new.parent[node]
+        if before is None:
+            # the top of an added branch only
+            if parent is None or new_keys[parent] in old_nodes:
+                changes['added'].append(entry(new, node, nodes=sum(
+                    1 for n in mmstream.iternodes(node) if new_keys[n] not in old_nodes)))
+            continue
+        old_parent = old.parent[before]
+        if old_keys.get(old_parent) != new_keys.get(parent):
+            changes['moved'].append(entry(new, node, old_path=list(old.path(before))))
+        if before.get('TEXT', '') != node.get('TEXT', ''):
+            changes['retexted'].append(entry(new, node, old_text=before.get('TEXT', '')))
+        if node.attrib == before.attrib:
+            continue
+        attributes, old_attributes = _attributes(node), _attributes(before)
+        if attributes != old_attributes:
+            changes['reattributed'].append(entry(new, node, attributes=dict(
+                (name, [old_attributes.get(name), attributes.get(name)])
+                for name in set(attributes) | set(old_attributes)
+                if attributes.get(name) != old_attributes.get(name))))
+    for node in old.nodes:
+        parent = old.parent[node]
+        if old_keys[node] not in new_nodes and (
+                parent is None or old_keys[parent] in new_nodes):
+            changes['removed'].append(entry(old, node, nodes=sum(
+                1 for n in mmstream.iternodes(node) if old_keys[n] not in new_nodes)))
+    return changes
+
+
+def _where(change):
+    return PATH_SEP.join(change['path'] + [change['text']])
+
+
+def changelog(changes, title):
+    """yield the markdown lines of changes"""
+    yield '# Changes of %s' % title
+    if not any(changes.values()):
+        yield ''
+        yield 'No changes.'
+        return
+    for kind in KINDS:
+        if not changes[kind]:
+            continue
+        yield ''
+        yield '## %s' % kind.capitalize()
+        yield ''
+        for change in changes[kind]:
+            if kind in ('added', 'removed'):
+                more = change['nodes'] > 1 and ' (%d nodes)' % change['nodes'] or ''
+                yield '- %s%s' % (_where(change), more)
+            elif kind == 'moved':
+                yield '- %s, from %s' % (_where(change), PATH_SEP.join(change['old_path']))
+            elif kind == 'retexted':
+                yield '- %s, was %s' % (_where(change), change['old_text'])
+            else:
+                yield '- %s: %s' % (_where(change), ', '.join(
+                    '%s %s -> %s' % (name, old or '-', new or '-') for name, (old, new)
+                    in sorted(change['attributes'].items())))
+
+
+def main(argv):
+    parser = optparse.OptionParser('%prog [options] <old mmfile> <new mmfile>')
+    parser.add_option('-j', '--json', dest='json', action='store_true',
+                      help='write the changes as JSON instead of markdown')
+    (options, args) = parser.parse_args(argv[1:])
+    if len(args) != 2:
+        parser.print_usage()
+        return -1
+
+    changes = diff(mmstream.parse(args[0]), mmstream.parse(args[1]))
+    if options.json:
+        print json.dumps(changes, ensure_ascii=False, indent=1, sort_keys=True,
+                         separators=(',', ': ')).encode('utf8')
+    else:
+        for line in changelog(changes, args[1].decode('utf8')):
+            print line.encode('utf8')
+    return any(changes.values()) and 1 or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
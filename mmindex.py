@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""A full-text index of the maps of the file_dir mm directory of app.yaml.
+
+  python mmindex.py -c app.yaml update          # index the new and changed maps
+  python mmindex.py -c app.yaml search 选举 grammar
+
+The index is a SQLite database, .mmindex.sqlite in the mm directory by
+default.  It keeps the nodes of every map, those of the posts of mm2md
+read with its streaming walk (MMTransform.iter_nodes), with their ID and
+parent, and for every term and map the list of the nodes it appears in,
+packed in one row: a map of half a million nodes has a few hundred
+thousand rows of postings rather than ten million.
+
+Latin text is split into lower case words.  CJK text has no spaces: its
+runs are indexed as single characters and overlapping pairs of them
+(bigrams), and a query for a longer run looks for all its bigrams, then
+checks the text of the nodes found.
+
+update only reads the maps whose mtime or size changed since the last
+one, and drops the maps that were removed.
+"""
+
+from __future__ import unicode_literals
+from array import array
+import optparse
+import os
+import re
+import sqlite3
+import sys
+import time
+import mmconfig
+from mm2md import MMTransform, listMaps
+
+INDEX = '.mmindex.sqlite'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS maps (
+    id INTEGER PRIMARY KEY,
+    name TEXT UNIQUE,
+    mtime REAL,
+    size INTEGER);
+CREATE TABLE IF NOT EXISTS nodes (
+    id INTEGER PRIMARY KEY,
+    map INTEGER,
+    node TEXT,
+    parent INTEGER,
+    text TEXT);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT,
+    map INTEGER,
+    nodes BLOB);
+CREATE INDEX IF NOT EXISTS nodes_map ON nodes (map);
+CREATE INDEX IF NOT EXISTS postings_term ON postings (term);
+CREATE INDEX IF NOT EXISTS postings_map ON postings (map);
+"""
+
+# ancestors of a node in the path of the index
+PATH_SEP = ' > '
+
+# Han, kana and hangul: written without spaces between the words
+_CJK = '぀-ヿ㐀-䶿一-鿿가-힯豈-﫿'
+_TOKENS = re.compile('([%s]+)|([^\\W_%s]+)' % (_CJK, _CJK), re.UNICODE)
+
+
+def tokens(text):
+    """the terms of text: its lower case words, and the characters and
+    bigrams of its CJK runs"""
+    terms = []
+    for cjk, word in _TOKENS.findall(text.lower()):
+        if word:
+            terms.append(word)
+            continue
+        terms.extend(cjk)
+        terms.extend(cjk[i:i + 2] for i in range(len(cjk) - 1))
+    return terms
+
+
+def query_terms(text):
+    """the terms a node must have to match the query text: its words,
+    and the bigrams of its CJK runs (the character of a run of one)"""
+    terms = []
+    for cjk, word in _TOKENS.findall(text.lower()):
+        if word:
+            terms.append(word)
+        elif len(cjk) == 1:
+            terms.append(cjk)
+        else:
+            terms.extend(cjk[i:i + 2] for i in range(len(cjk) - 1))
+    return terms
+
+
+class Index(object):
+    """the index database at path, created when missing"""
+
+    def __init__(self, path):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def update(self, mmdir, names=None):
+        """index the maps of mmdir (those of names only, when given) that
+        changed since the last update and forget the removed ones.
+        Return the (indexed, unchanged, removed) counts"""
+        full = names is None
+        if full:
+            names = listMaps(mmdir)
+        known = dict((name, (mapid, mtime, size)) for mapid, name, mtime, size
+                     in self.db.execute('SELECT id, name, mtime, size FROM maps'))
+        indexed = unchanged = 0
+        seen = set()
+        for f_name in names:
+            name = f_name.decode('utf8')
+            seen.add(name)
+            path = os.path.join(mmdir, f_name)
+            stat = os.stat(path)
+            previous = known.get(name)
+            if previous is not None and previous[1:] == (stat.st_mtime, stat.st_size):
+                unchanged += 1
+                continue
+            with self.db:
+                if previous is not None:
+                    self._forget(previous[0])
+                self._add(name, path, stat)
+            indexed += 1
+        removed = 0
+        if full:
+            gone = [name for name in known if name not in seen]
+            with self.db:
+                for name in gone:
+                    self._forget(known[name][0])
+            removed = len(gone)
+        return indexed, unchanged, removed
+
+    def _forget(self, mapid):
+        self.db.execute('DELETE FROM postings WHERE map = ?', (mapid,))
+        self.db.execute('DELETE FROM nodes WHERE map = ?', (mapid,))
+        self.db.execute('DELETE FROM maps WHERE id = ?', (mapid,))
+
+    def _add(self, name, path, stat):
+        cursor = self.db.execute('INSERT INTO maps (name, mtime, size) VALUES (?, ?, ?)',
+                                 (name, stat.st_mtime, stat.st_size))
+        mapid = cursor.lastrowid
+        parents = []
+        postings = {}
+        for depth, node in MMTransform().iter_nodes(path):
+            text = node.get('TEXT')
+            del parents[depth:]
+            cursor.execute('INSERT INTO nodes (map, node, parent, text) VALUES (?, ?, ?, ?)',
+                           (mapid, node.get('ID'), parents and parents[-1] or None, text))
+            nodeid = cursor.lastrowid
+            for term in set(tokens(text)):
+                nodes = postings.get(term)
+                if nodes is None:
+                    nodes = postings[term] = array(b'l')
+                nodes.append(nodeid)
+            parents.append(nodeid)
+        self.db.executemany('INSERT INTO postings (term, map, nodes) VALUES (?, ?, ?)',
+                            ((term, mapid, buffer(nodes.tostring()))
+                             # in the order of the term index, a lot faster
+                             for term, nodes in sorted(postings.iteritems())))
+
+    def _nodes(self, term):
+        """the set of the nodes term appears in"""
+        nodes = array(b'l')
+        for packed, in self.db.execute('SELECT nodes FROM postings WHERE term = ?', (term,)):
+            nodes.fromstring(bytes(packed))
+        return set(nodes)
+
+    def ancestors(self, nodeid):
+        """the texts of the ancestors of the node nodeid, the root first"""
+        texts = []
+        parent, = self.db.execute('SELECT parent FROM nodes WHERE id = ?', (nodeid,)).fetchone()
+        while parent is not None:
+            parent, text = self.db.execute('SELECT parent, text FROM nodes WHERE id = ?',
+                                           (parent,)).fetchone()
+            texts.append(text)
+        texts.reverse()
+        return texts
+
+    def search(self, query, limit=20):
+        """[(map name, node ID, path, text)] of the nodes matching every
+        word of query, at most limit of them"""
+        terms = set(query_terms(query))
+        if not terms:
+            return []
+        found = None
+        for term in terms:
+            nodes = self._nodes(term)
+            found = nodes if found is None else found & nodes
+            if not found:
+                return []
+        # the words are terms of the nodes found, but the bigrams of a run
+        # may come from different places of the text
+        runs = [cjk for cjk, word in _TOKENS.findall(query.lower()) if len(cjk) > 2]
+        results = []
+        for nodeid in sorted(found):
+            name, node, text = self.db.execute(
+                'SELECT maps.name, nodes.node, nodes.text FROM nodes '
+                'JOIN maps ON maps.id = nodes.map WHERE nodes.id = ?', (nodeid,)).fetchone()
+            if all(run in text for run in runs):
+                results.append((name, node, PATH_SEP.join(self.ancestors(nodeid)), text))
+                if len(results) == limit:
+                    break
+        return results
+
+
+def main(argv):
+    parser = optparse.OptionParser('%prog [options] update | search <words>...')
+    parser.add_option('-c', '--config', dest='config',
+                      default='/home/rain/code/FreeMindTools/app.yaml',
+                      help='app.yaml to read the mm directory from')
+    parser.add_option('-i', '--index', dest='index',
+                      help='the index database (default: %s in the mm directory)' % INDEX)
+    parser.add_option('-n', '--limit', dest='limit', type='int', default=20,
+                      help='show at most N results')
+    (options, args) = parser.parse_args(argv[1:])
+    if not args or args[0] not in ('update', 'search') or (args[0] == 'search'
+                                                            and len(args) < 2):
+        parser.print_usage()
+        return -1
+
+    mmdir = mmconfig.ConfigStore(options.config)['file_dir']['mm']
+    index = Index(options.index or os.path.join(mmdir, INDEX))
+    start = time.time()
+    try:
+        if args[0] == 'update':
+            print '%d maps indexed, %d unchanged, %d removed in %.3fs' % (
+                index.update(mmdir) + (time.time() - start,))
+            return 0
+        query = ' '.join(arg.decode('utf8') for arg in args[1:])
+        results = index.search(query, options.limit)
+        for name, node, path, text in results:
+            line = '%s %s: %s' % (name, node, PATH_SEP.join(filter(None, [path, text])))
+            print ' '.join(line.split()).encode('utf8')
+        print '%d results in %.1fms' % (len(results), (time.time() - start) * 1000)
+    finally:
+        index.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,290 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""The action items, attendees and topics of all the meetings, in SQLite.
+
+mm2notes renders one meeting; a list of the open action items of every
+meeting, or of who came when, would mean parsing all of them again.
+ingest reads the sections of the meeting maps once, as mm2notes finds
+them (Mm2Notes.index), into a database; the queries only read that:
+
+  python mmmeetings.py ingest meetings/ old-meetings.zip 2013-04-02.mm
+  python mmmeetings.py actions --owner Sam --since 2013-01-01 --open
+  python mmmeetings.py attendees
+
+A meeting is known by the sha1 of its .mm file: ingest skips the maps
+already there and replaces the older version of a map it reads again.
+Maps may come from .mm files, directories of them and zip or tar
+archives (see mmarchive).
+
+An action item is a top level node of the action items section, "Owner:
+task" names its owner, the first date in it or below it (2013-04-02,
+2013/4/2, 2013年4月2日) is its due date and the button_ok icon marks it as
+done.  The day of the meeting is the first date of its time (时间)
+section, or the day its root node was created.
+"""
+
+from __future__ import unicode_literals
+import hashlib
+import io
+import optparse
+import os
+import re
+import sqlite3
+import sys
+import time
+import traceback
+import mmarchive
+import mmstream
+from mm2notes import Mm2Notes
+
+DATABASE = 'meetings.sqlite'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meetings (
+    id INTEGER PRIMARY KEY,
+    sha1 TEXT UNIQUE,
+    path TEXT,
+    title TEXT,
+    day TEXT,
+    location TEXT);
+CREATE TABLE IF NOT EXISTS attendees (
+    meeting INTEGER,
+    location TEXT,
+    name TEXT,
+    email TEXT);
+CREATE TABLE IF NOT EXISTS topics (
+    meeting INTEGER,
+    topic TEXT);
+CREATE TABLE IF NOT EXISTS actions (
+    meeting INTEGER,
+    owner TEXT,
+    task TEXT,
+    due TEXT,
+    done INTEGER,
+    details TEXT);
+CREATE INDEX IF NOT EXISTS meetings_path ON meetings (path);
+CREATE INDEX IF NOT EXISTS meetings_day ON meetings (day);
+CREATE INDEX IF NOT EXISTS attendees_meeting ON attendees (meeting);
+CREATE INDEX IF NOT EXISTS attendees_name ON attendees (name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS topics_meeting ON topics (meeting);
+CREATE INDEX IF NOT EXISTS actions_meeting ON actions (meeting);
+CREATE INDEX IF NOT EXISTS actions_owner ON actions (owner COLLATE NOCASE);
+"""
+
+# 2013-04-02, 2013/4/2, 2013.4.2, 2013年4月2日
+DATE = re.compile(r'(\d{4})\s*[-/.年]\s*(\d{1,2})\s*[-/.月]\s*(\d{1,2})')
+# Owner: task, with an ASCII or a full width colon.  A name has no digits
+# or slashes (not "Review at 10:30"), nor is it the scheme of a URL
+OWNER = re.compile(r'\s*([^:：\d/]{1,40}?)\s*[:：](?!//)\s*(.*)$', re.DOTALL | re.UNICODE)
+
+DONE_ICON = 'button_ok'
+
+
+def find_date(texts):
+    """the first date of texts as YYYY-MM-DD, None without one"""
+    for text in texts:
+        match = DATE.search(text)
+        if match:
+            return '%04d-%02d-%02d' % tuple(int(part) for part in match.groups())
+    return None
+
+
+def _texts(notes, node):
+    return [sub.attrib['TEXT'] for sub in notes.subnodes(node)]
+
+
+def read_meeting(mmtree):
+    """{'title', 'day', 'location', 'topics', 'attendees', 'actions'} of a
+    parsed meeting map, see Mm2Notes.index"""
+    notes = Mm2Notes()
+    presentation = mmtree.find('node')
+    notes.index(presentation)
+    sections = notes.sections
+    meeting = {'title': presentation.attrib['TEXT'], 'day': None, 'location': None,
+               'topics': [], 'attendees': [], 'actions': []}
+    if 'meetingday' in sections:
+        meeting['day'] = find_date(_texts(notes, sections['meetingday']))
+    if meeting['day'] is None and presentation.get('CREATED'):
+        created = time.localtime(int(presentation.get('CREATED')) / 1000.0)
+        meeting['day'] = '%04d-%02d-%02d' % created[:3]
+    if 'meetinglocation' in sections:
+        meeting['location'] = ' '.join(_texts(notes, sections['meetinglocation'])) or None
+    if 'topic' in sections:
+        meeting['topics'] = _texts(notes, sections['topic'])
+    if 'attendees' in sections:
+        meeting['attendees'] = notes.attendees(sections['attendees'])
+    items = 'actionitems' in sections and notes.subnodes(sections['actionitems']) or []
+    for item in items:
+        text = item.attrib['TEXT']
+        owner, task = None, text
+        match = OWNER.match(text)
+        if match:
+            owner, task = match.groups()
+        details = [node.attrib['TEXT'] for node in mmstream.iternodes(item)][1:]
+        meeting['actions'].append((owner, task, find_date([text] + details),
+                                   DONE_ICON in mmstream.icons(item), ' / '.join(details)))
+    return meeting
+
+
+def iter_maps(paths):
+    """(path, data) of the maps of paths: .mm files, directories of them
+    and archives.  data is None for the files, read later if needed.  The
+    path is the real path of the file, or that of the archive joined with
+    the name of the member, however paths name them"""
+    for path in paths:
+        path = os.path.realpath(path)
+        if mmarchive.is_archive(path):
+            for name, data in mmarchive.iter_members(path):
+                yield os.path.join(path, name), data
+        elif os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(b'.mm'):
+                    yield os.path.realpath(os.path.join(path, name)), None
+        else:
+            yield path, None
+
+
+class Store(object):
+    """the database at path, created when missing"""
+
+    def __init__(self, path):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def ingest(self, paths):
+        """add the meetings of paths (see iter_maps) not there yet.  Return
+        the (added, skipped, failed) counts: a map that cannot be read (not
+        well formed, a section without text...) is reported on stderr and
+        left out, the others are added all the same"""
+        added = skipped = failed = 0
+        for path, data in iter_maps(paths):
+            if data is None:
+                sha1 = mmstream.file_digest(path)
+            else:
+                sha1 = hashlib.sha1(data).hexdigest()
+            if self.db.execute('SELECT 1 FROM meetings WHERE sha1 = ?', (sha1,)).fetchone():
+                skipped += 1
+                continue
+            try:
+                mmtree = mmstream.parse(data is None and path or io.BytesIO(data))
+                with self.db:
+                    self._add(path.decode('utf8'), sha1, read_meeting(mmtree))
+            except Exception, e:
+                error = traceback.format_exception_only(type(e), e)[-1].strip()
+                print >> sys.stderr, ('%s: %s' % (path.decode('utf8'),
+                                                  error.decode('utf8', 'replace'))).encode('utf8')
+                failed += 1
+                continue
+            added += 1
+        return added, skipped, failed
+
+    def _add(self, path, sha1, meeting):
+        # an older version of the same map
+        for old, in self.db.execute('SELECT id FROM meetings WHERE path = ?', (path,)).fetchall():
+            for table in 'attendees', 'topics', 'actions':
+                self.db.execute('DELETE FROM %s WHERE meeting = ?' % table, (old,))
+            self.db.execute('DELETE FROM meetings WHERE id = ?', (old,))
+        cursor = self.db.execute(
+            'INSERT INTO meetings (sha1, path, title, day, location) VALUES (?, ?, ?, ?, ?)',
+            (sha1, path, meeting['title'], meeting['day'], meeting['location']))
+        meetingid = cursor.lastrowid
+        self.db.executemany('INSERT INTO attendees VALUES (?, ?, ?, ?)',
+                            [(meetingid,) + attendee for attendee in meeting['attendees']])
+        self.db.executemany('INSERT INTO topics VALUES (?, ?)',
+                            [(meetingid, topic) for topic in meeting['topics']])
+        self.db.executemany('INSERT INTO actions VALUES (?, ?, ?, ?, ?, ?)',
+                            [(meetingid,) + action for action in meeting['actions']])
+
+    def actions(self, owner=None, since=None, until=None, open_only=False):
+        """[(day, owner, task, due, done, title)] of the action items of the
+        meetings from since to until (YYYY-MM-DD, both included), by day"""
+        where, args = [], []
+        if owner is not None:
+            where.append('actions.owner = ? COLLATE NOCASE')
+            args.append(owner)
+        if since is not None:
+            where.append('meetings.day >= ?')
+            args.append(since)
+        if until is not None:
+            where.append('meetings.day <= ?')
+            args.append(until)
+        if open_only:
+            where.append('NOT actions.done')
+        return self.db.execute(
+            'SELECT meetings.day, actions.owner, actions.task, actions.due, actions.done, '
+            'meetings.title FROM actions JOIN meetings ON meetings.id = actions.meeting '
+            '%s ORDER BY meetings.day, actions.rowid'
+            % (where and 'WHERE ' + ' AND '.join(where) or ''), args).fetchall()
+
+    def attendance(self, since=None, until=None):
+        """[(name, number of meetings, last day)] of the attendees of the
+        meetings from since to until, the most present first"""
+        where, args = [], []
+        if since is not None:
+            where.append('meetings.day >= ?')
+            args.append(since)
+        if until is not None:
+            where.append('meetings.day <= ?')
+            args.append(until)
+        return self.db.execute(
+            'SELECT attendees.name, COUNT(DISTINCT meetings.id), MAX(meetings.day) '
+            'FROM attendees JOIN meetings ON meetings.id = attendees.meeting %s '
+            'GROUP BY attendees.name COLLATE NOCASE ORDER BY 2 DESC, 1'
+            % (where and 'WHERE ' + ' AND '.join(where) or ''), args).fetchall()
+
+
+def _day(option, opt, value, parser):
+    if find_date([value]) is None:
+        raise optparse.OptionValueError('%s takes a date (YYYY-MM-DD), not %s' % (opt, value))
+    setattr(parser.values, option.dest, find_date([value]))
+
+
+def main(argv):
+    parser = optparse.OptionParser(
+        '%prog [options] ingest <mmfile|directory|archive>...\n'
+        '       %prog [options] actions | attendees')
+    parser.add_option('-d', '--database', dest='database', default=DATABASE,
+                      help='the SQLite database of the meetings (default: %default)')
+    parser.add_option('-o', '--owner', dest='owner',
+                      help='actions: only those of OWNER')
+    parser.add_option('--since', dest='since', type='string', action='callback',
+                      callback=_day, metavar='DATE',
+                      help='only the meetings from DATE on')
+    parser.add_option('--until', dest='until', type='string', action='callback',
+                      callback=_day, metavar='DATE',
+                      help='only the meetings until DATE, included')
+    parser.add_option('--open', dest='open_only', action='store_true',
+                      help='actions: only those not marked as done')
+    (options, args) = parser.parse_args(argv[1:])
+    if not args or args[0] not in ('ingest', 'actions', 'attendees') or (
+            args[0] == 'ingest' and len(args) < 2):
+        parser.print_usage()
+        return -1
+
+    store = Store(options.database)
+    start = time.time()
+    try:
+        if args[0] == 'ingest':
+            print '%d meetings added, %d already there, %d unreadable in %.3fs' % (
+                store.ingest(args[1:]) + (time.time() - start,))
+        elif args[0] == 'actions':
+            owner = options.owner and options.owner.decode('utf8')
+            for day, owner, task, due, done, title in store.actions(
+                    owner, options.since, options.until, options.open_only):
+                print '\t'.join([day or '-', owner or '-', task, due or '-',
+                                 done and 'done' or 'open', title]).encode('utf8')
+        else:
+            for name, count, last in store.attendance(options.since, options.until):
+                print ('%s\t%d\t%s' % (name, count, last or '-')).encode('utf8')
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
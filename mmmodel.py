@@ -0,0 +1,302 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""A compact, array backed model of freemind's file(.mm).
+
+ElementTree keeps a Python object per node with its own attribute dict,
+child list and text/tail slots, although the converters only ever read
+TEXT, LINK, CREATED, a few icons and the children.  CompactMap keeps one
+entry per node in parallel arrays instead: parent, depth, first child and
+next sibling indexes, the TEXT as an offset into a single string, a flag
+byte for the icons that matter and CREATED as a number.  The other
+attributes (ID, MODIFIED, POSITION...) are kept as well, packed as
+"name\0value" fields into a second string, so that attrib and get answer
+as ElementTree does.
+
+CompactMap and the CompactNode views it hands out answer the small part of
+the ElementTree API the converters use (find/findall of 'node' and 'icon',
+attrib, get, len, indexing, getiterator), so MMTransform.tree2md, Mm2S5 and Mm2Notes
+run on it unchanged:
+
+  mm2s5.et_in = CompactMap('big.mm')
+"""
+
+from array import array
+from xml.etree import ElementTree
+import mmstream
+
+# icons with a meaning for the converters
+ICON_FLAGS = {
+    'button_ok': 0x01,
+    'stop': 0x02,
+    'button_cancel': 0x04,
+    'full-1': 0x08,
+}
+# any other icon, font, edge... child: only whether there is one matters
+# (mm2md formats leaves differently)
+HAS_OTHER = 0x40
+HAS_TEXT = 0x80
+
+NONE = -1
+
+# the attributes with a place of their own, see CompactNode.attrib
+OWN_ATTRIBUTES = ('TEXT', 'LINK', 'CREATED')
+
+
+class CompactMap(object):
+    """The nodes of a map, read with mmstream.iterparse so that the full
+    ElementTree never exists.  Stands for the <map> element."""
+
+    tag = 'map'
+
+    def __init__(self, source):
+        self.parent = array('i')
+        self.depth = array('i')
+        self.first_child = array('i')
+        self.next_sibling = array('i')
+        self.text_start = array('l')
+        self.text_end = array('l')
+        self.flags = array('B')
+        self.created = array('d')
+        self.attr_start = array('l')
+        self.attr_end = array('l')
+        # sparse: few nodes have these
+        self.links = {}
+        self.rich = {}
+        self._load(source)
+
+    def _load(self, source):
+        chunks = []
+        interned = {}
+        size = 0
+        attr_chunks = []
+        attr_size = 0
+        # open nodes, and the last child seen so far of each of them
+        stack = []
+        last = []
+        for event, depth, elem in mmstream.iterparse(source):
+            if elem.tag != 'node':
+                if event == mmstream.END and stack and depth == len(stack):
+                    self._child_element(stack[-1], elem)
+                continue
+            if event == mmstream.END:
+                stack.pop()
+                last.pop()
+                continue
+
+            index = len(self.parent)
+            if stack:
+                parent = stack[-1]
+            else:
+                parent = NONE
+            self.parent.append(parent)
+            self.depth.append(depth)
+            self.first_child.append(NONE)
+            self.next_sibling.append(NONE)
+            if parent != NONE:
+                if last[-1] == NONE:
+                    self.first_child[parent] = index
+                else:
+                    self.next_sibling[last[-1]] = index
+                last[-1] = index
+
+            flags = 0
+            text = elem.get('TEXT')
+            if text is not None:
+                flags = HAS_TEXT
+                start = interned.get(text)
+                if start is None:
+                    start = interned[text] = size
+                    chunks.append(text)
+                    size += len(text)
+                self.text_start.append(start)
+                self.text_end.append(start + len(text))
+            else:
+                self.text_start.append(0)
+                self.text_end.append(0)
+            self.flags.append(flags)
+            self.created.append(float(elem.get('CREATED', NONE)))
+            if 'LINK' in elem.attrib:
+                self.links[index] = elem.attrib['LINK']
+            packed = '\0'.join('%s\0%s' % (key, value) for key, value
+                                in elem.attrib.items() if key not in OWN_ATTRIBUTES)
+            self.attr_start.append(attr_size)
+            if packed:
+                attr_chunks.append(packed)
+                attr_size += len(packed)
+            self.attr_end.append(attr_size)
+
+            stack.append(index)
+            last.append(NONE)
+        self.text = u''.join(chunks)
+        self.attributes = u''.join(attr_chunks)
+
+    def _child_element(self, index, elem):
+        if elem.tag == 'icon' and elem.get('BUILTIN') in ICON_FLAGS:
+            self.flags[index] |= ICON_FLAGS[elem.get('BUILTIN')]
+        elif elem.tag == 'richcontent' and elem.get('TYPE', 'NODE') == 'NODE':
+            # FreeMind 0.9 HTML node, kept as is for mm2s5
+            self.rich[index] = elem
+        else:
+            self.flags[index] |= HAS_OTHER
+
+    def __len__(self):
+        return len(self.parent)
+
+    def node(self, index):
+        return CompactNode(self, index)
+
+    def children(self, index):
+        """indexes of the child nodes of node index"""
+        ret = []
+        child = self.first_child[index]
+        while child != NONE:
+            ret.append(child)
+            child = self.next_sibling[child]
+        return ret
+
+    def get_text(self, index):
+        if not self.flags[index] & HAS_TEXT:
+            return None
+        return self.text[self.text_start[index]:self.text_end[index]]
+
+    def icons(self, index):
+        flags = self.flags[index]
+        return [name for name, flag in sorted(ICON_FLAGS.items()) if flags & flag]
+
+    # the <map> element API
+    def find(self, path):
+        if path == 'node' and len(self.parent):
+            return self.node(0)
+        return None
+
+    def findall(self, path):
+        if path == 'node' and len(self.parent):
+            return [self.node(0)]
+        return []
+
+    def getiterator(self, tag=None):
+        found = []
+        if tag in (None, '*', self.tag):
+            found.append(self)
+        if len(self.parent):
+            found.extend(self.node(0).getiterator(tag))
+        return found
+
+    def __getitem__(self, index):
+        return self.findall('node')[index]
+
+
+class CompactNode(object):
+    """An ElementTree-like view of one node of a CompactMap.  Views are
+    made on demand and compare equal when they show the same node."""
+
+    __slots__ = ('model', 'index')
+    tag = 'node'
+
+    def __init__(self, model, index):
+        self.model = model
+        self.index = index
+
+    def __eq__(self, other):
+        return (isinstance(other, CompactNode) and other.index == self.index
+                and other.model is self.model)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return self.index
+
+    @property
+    def attrib(self):
+        model = self.model
+        index = self.index
+        attrib = {}
+        text = model.get_text(index)
+        if text is not None:
+            attrib['TEXT'] = text
+        if index in model.links:
+            attrib['LINK'] = model.links[index]
+        if model.created[index] != NONE:
+            attrib['CREATED'] = '%d' % model.created[index]
+        start, end = model.attr_start[index], model.attr_end[index]
+        if start != end:
+            fields = model.attributes[start:end].split('\0')
+            attrib.update(zip(fields[::2], fields[1::2]))
+        return attrib
+
+    def get(self, key, default=None):
+        if key == 'TEXT':
+            text = self.model.get_text(self.index)
+            if text is None:
+                return default
+            return text
+        return self.attrib.get(key, default)
+
+    def _nodes(self):
+        model = self.model
+        return [CompactNode(model, i) for i in model.children(self.index)]
+
+    def _icons(self):
+        return [ElementTree.Element('icon', BUILTIN=name)
+                for name in self.model.icons(self.index)]
+
+    def getchildren(self):
+        """richcontent, icons, a stand-in for the other elements then the
+        child nodes"""
+        children = []
+        rich = self.model.rich.get(self.index)
+        if rich is not None:
+            children.append(rich)
+        children.extend(self._icons())
+        if self.model.flags[self.index] & HAS_OTHER:
+            children.append(ElementTree.Element('other'))
+        children.extend(self._nodes())
+        return children
+
+    def __len__(self):
+        return len(self.getchildren())
+
+    def __getitem__(self, index):
+        return self.getchildren()[index]
+
+    def find(self, path):
+        found = self.findall(path)
+        if found:
+            return found[0]
+        return None
+
+    def findall(self, path):
+        if path == 'node':
+            return self._nodes()
+        if path == 'icon':
+            return self._icons()
+        if path == 'richcontent':
+            rich = self.model.rich.get(self.index)
+            return rich is not None and [rich] or []
+        return []
+
+    def getiterator(self, tag=None):
+        """this node and the elements below it with that tag, all of them
+        without one, in document order.  Only the icons of ICON_FLAGS are
+        kept, the others are part of the 'other' stand-in"""
+        if tag == 'node':
+            return list(mmstream.iternodes(self))
+        if tag == '*':
+            tag = None
+        found = []
+        stack = [self]
+        while stack:
+            elem = stack.pop()
+            if not isinstance(elem, CompactNode):
+                # richcontent and the stand-ins are plain elements
+                found.extend(elem.getiterator(tag))
+                continue
+            if tag in (None, elem.tag):
+                found.append(elem)
+            stack.extend(reversed(elem.getchildren()))
+        return found
+
+    def __repr__(self):
+        return '<CompactNode %d %r>' % (self.index, self.model.get_text(self.index))
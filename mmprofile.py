@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""Opt-in instrumentation of the converters.
+
+A Profile follows the conversion of one map.  Time is charged to one
+phase at a time, the innermost one: read (the file), parse, config
+(app.yaml lookup), walk (the passes over the tree before rendering),
+render (producing the lines) and write (to the output file).  mm2md and
+mm2wiki parse the map while they render it, their parse time is part of
+render.  Render time is also charged to the top-level branch (slide,
+section...) being rendered.  Node counts, output bytes and the peak RSS
+of the process are recorded too.
+
+The clock is only read when the phase or the branch changes and around
+the (buffered) reads and writes, not per node or per line.
+
+When a profile is finished its record, a dict, is handed to every hook
+registered with add_hook.  The --profile option of the converters
+registers a JsonLines hook, or runs them under cProfile instead when the
+file name ends with .prof:
+
+  python mm2s5.py --profile times.jsonl map.mm
+  python mm2md.py --profile mm2md.prof map.mm
+"""
+
+from contextlib import contextmanager
+import cProfile
+import json
+import resource
+import time
+
+import mmstream
+
+_hooks = []
+
+
+def add_hook(hook):
+    """call hook(record) for every finished Profile"""
+    _hooks.append(hook)
+
+
+def remove_hook(hook):
+    _hooks.remove(hook)
+
+
+class Profile(object):
+    """timings and counts of the conversion of one map"""
+
+    def __init__(self, tool, name, clock=time.time):
+        self.tool = tool
+        self.name = name
+        self.clock = clock
+        self.phases = {}
+        self.branches = []
+        self.branch = None
+        self.nodes = 0
+        self.bytes = 0
+        self.stack = []
+        self.started = self.since = clock()
+
+    def _flush(self):
+        now = self.clock()
+        if self.stack:
+            self._charge(self.stack[-1], now - self.since)
+        self.since = now
+
+    def _enter(self, name):
+        self._flush()
+        self.stack.append(name)
+
+    def _leave(self):
+        now = self.clock()
+        self._charge(self.stack.pop(), now - self.since)
+        self.since = now
+
+    def _charge(self, name, seconds):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+        if name == 'render' and self.branch is not None:
+            self.branch['seconds'] += seconds
+
+    @contextmanager
+    def phase(self, name):
+        self._enter(name)
+        try:
+            yield
+        finally:
+            self._leave()
+
+    def open(self, path, mode='rb'):
+        """path opened, its reads charged to read and its writes to write"""
+        return _TimedFile(open(path, mode), self)
+
+    def writer(self, outfile):
+        """outfile with its writes charged to write"""
+        return _TimedFile(outfile, self)
+
+    def start_branch(self, text, node=None):
+        """the following render time belongs to a new top-level branch.
+        Its nodes are counted when node (a tree) is given, streaming
+        converters add one to nodes per node instead."""
+        self._flush()
+        self._end_branch()
+        self.branch = {'text': text, 'seconds': 0.0, 'nodes': self.nodes}
+        self.branches.append(self.branch)
+        if node is not None:
+            with self.phase('profile'):
+                self.nodes += sum(1 for n in mmstream.iternodes(node))
+
+    def _end_branch(self):
+        if self.branch is not None:
+            # nodes held the count at the start of the branch
+            self.branch['nodes'] = self.nodes - self.branch['nodes']
+            self.branch = None
+
+    def finish(self, **info):
+        """the record of this conversion, with info, handed to the hooks"""
+        self._end_branch()
+        record = dict(info)
+        record.update({
+            'tool': self.tool,
+            'file': self.name,
+            'seconds': self.clock() - self.started,
+            'phases': self.phases,
+            'nodes': self.nodes,
+            'bytes': self.bytes,
+            'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            'branches': self.branches,
+        })
+        for hook in list(_hooks):
+            hook(record)
+        return record
+
+
+class _TimedFile(object):
+
+    def __init__(self, file, profile):
+        self.file = file
+        self.profile = profile
+
+    def read(self, size=-1):
+        with self.profile.phase('read'):
+            return self.file.read(size)
+
+    def write(self, data):
+        with self.profile.phase('write'):
+            self.file.write(data)
+
+    def close(self):
+        self.file.close()
+
+
+class JsonLines(object):
+    """hook appending every record to path as a line of JSON"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __call__(self, record):
+        # one write per record: processes of a batch can share the file
+        line = json.dumps(record, sort_keys=True, ensure_ascii=True) + '\n'
+        out = open(self.path, 'ab')
+        try:
+            out.write(line)
+        finally:
+            out.close()
+
+
+class Output(object):
+    """what --profile path asks for: JSON lines of Profile records, or a
+    cProfile dump of the whole run when path ends with .prof"""
+
+    def __init__(self, path):
+        self.path = path
+        self.cprofile = None
+        self.hook = None
+        if path.endswith('.prof'):
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+        else:
+            self.hook = JsonLines(path)
+            add_hook(self.hook)
+
+    def new(self, tool, name):
+        """the Profile of the conversion of name, None under cProfile"""
+        if self.cprofile is not None:
+            return None
+        return Profile(tool, name)
+
+    def close(self):
+        if self.cprofile is not None:
+            self.cprofile.disable()
+            self.cprofile.dump_stats(self.path)
+        if self.hook is not None:
+            remove_hook(self.hook)
+
+
+@contextmanager
+def _nothing():
+    yield
+
+
+def phase(profile, name):
+    """profile.phase(name), or nothing when profile is None"""
+    if profile is None:
+        return _nothing()
+    return profile.phase(name)
+
+
+def create(profile, path):
+    """path opened for writing, timed by profile when there is one"""
+    if profile is None:
+        return open(path, 'wb')
+    return profile.open(path, 'wb')
+
+
+def parse(profile, path):
+    """mmstream.parse(path), its read and parse phases timed by profile
+    when there is one.  path may also be a file object (an archive member
+    read into memory), whose reads are then part of parse"""
+    if profile is None:
+        return mmstream.parse(path)
+    if hasattr(path, 'read'):
+        with profile.phase('parse'):
+            return mmstream.parse(path)
+    infile = profile.open(path)
+    try:
+        with profile.phase('parse'):
+            return mmstream.parse(infile)
+    finally:
+        infile.close()
+
+
+def output(path):
+    """an Output for the --profile option, None without it"""
+    if not path:
+        return None
+    return Output(path)
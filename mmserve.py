@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""A local conversion server for editor hooks.
+
+Calling mm2md.py / mm2s5.py / mm2notes.py on every save pays for the
+interpreter start, the yaml import, reading app.yaml and parsing the map
+each time.  mmserve keeps running instead, with app.yaml loaded (and
+reloaded when it changes) and the last parsed maps in an LRU cache keyed by
+path, mtime and size.
+
+  python mmserve.py -c app.yaml &
+  curl 'http://127.0.0.1:8642/md?path=/home/rain/map.mm'
+  curl 'http://127.0.0.1:8642/s5?path=/home/rain/map.mm' > slides.html
+  curl 'http://127.0.0.1:8642/post?name=map.mm'     # mm2md for one file
+  curl 'http://127.0.0.1:8642/stats'
+
+/md, /textile, /s5 and /notes return the converted map (notes take
+minutes=1 to order them by time, md takes blog=1 for the front matter of
+mm2md); /post converts a map of the app.yaml mm directory into its post.
+"""
+
+from __future__ import unicode_literals
+from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from collections import OrderedDict
+import json
+import optparse
+import os
+import sys
+import time
+import traceback
+import urlparse
+import mmconfig
+import mmstream
+from mm2all import FORMATS, emit
+from mm2md import convertFile, getconf
+
+DEFAULT_PORT = 8642
+
+
+class ParseCache():
+    """The last parsed maps, keyed by (path, mtime, size) so that a saved
+    file is parsed again and an unchanged one is not"""
+
+    def __init__(self, size=32):
+        self.size = size
+        self.trees = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path):
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        key = (path, stat.st_mtime, stat.st_size)
+        tree = self.trees.pop(key, None)
+        if tree is None:
+            self.misses += 1
+            tree = mmstream.parse(path)
+            if len(self.trees) >= self.size:
+                self.trees.popitem(last=False)
+        else:
+            self.hits += 1
+        self.trees[key] = tree
+        return tree
+
+
+class Config():
+    """app.yaml, opened again only when its mtime changes"""
+
+    def __init__(self, path):
+        self.path = path
+        self.mtime = None
+        self.config = None
+
+    def get(self):
+        mtime = os.stat(self.path).st_mtime
+        if mtime != self.mtime:
+            if self.config is not None:
+                self.config.close()
+            self.config = mmconfig.ConfigStore(self.path)
+            self.mtime = mtime
+        return self.config
+
+
+class ConvertHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        start = time.time()
+        url = urlparse.urlparse(self.path)
+        query = dict((key, values[-1].decode('utf8'))
+                     for key, values in urlparse.parse_qs(url.query).items())
+        endpoint = url.path.strip('/')
+        try:
+            if endpoint in FORMATS:
+                status, body = 200, self.convert(endpoint, query)
+            elif endpoint == 'post':
+                status, body = 200, self.post(query)
+            elif endpoint == 'stats':
+                status, body = 200, self.stats()
+            else:
+                status, body = 404, 'unknown endpoint /%s\n' % endpoint
+        except Exception, e:
+            error = traceback.format_exception_only(type(e), e)[-1]
+            status, body = 500, error.decode('utf8', 'replace')
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('X-Elapsed', '%.3f' % (time.time() - start))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def convert(self, fmt, query):
+        path = query['path']
+        tree = self.server.cache.get(path)
+        conf = None
+        if fmt == 'md' and query.get('blog') == '1':
+            conf = getconf(self.server.config.get(), os.path.basename(path))
+        lines = emit(tree, fmt, conf, query.get('minutes') == '1')
+        body = FORMATS[fmt][0].join(lines)
+        if fmt == 'notes':
+            body += '\n'
+        return body
+
+    def post(self, query):
+        config = self.server.config.get()
+        name = query['name']
+        mdPath, digest, written = convertFile(
+            config['file_dir']['mm'], config['file_dir']['md'],
+            name.encode('utf8'), getconf(config, name))
+        return '%s is OK!%s\n' % (mdPath, not written and ' (unchanged)' or '')
+
+    def stats(self):
+        cache = self.server.cache
+        return json.dumps({'cached': len(cache.trees), 'size': cache.size,
+                           'hits': cache.hits, 'misses': cache.misses,
+                           'uptime': time.time() - self.server.started}) + '\n'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            BaseHTTPRequestHandler.log_message(self, format, *args)
+
+
+def serve(config, port=DEFAULT_PORT, cache_size=32, verbose=False):
+    """serve on 127.0.0.1:port until interrupted"""
+    server = HTTPServer(('127.0.0.1', port), ConvertHandler)
+    server.config = Config(config)
+    server.config.get()
+    server.cache = ParseCache(cache_size)
+    server.verbose = verbose
+    server.started = time.time()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    server.server_close()
+
+
+def main(argv):
+    parser = optparse.OptionParser('%prog [options]')
+    parser.add_option('-c', '--config', dest='config',
+                      default='/home/rain/code/FreeMindTools/app.yaml',
+                      help='app.yaml to read the directories and posts from')
+    parser.add_option('-p', '--port', dest='port', type='int', default=DEFAULT_PORT,
+                      help='port to listen to on 127.0.0.1')
+    parser.add_option('--cache', dest='cache', type='int', default=32,
+                      help='number of parsed maps to keep')
+    parser.add_option('-v', '--verbose', dest='verbose', action='store_true',
+                      help='log every request')
+    (options, args) = parser.parse_args(argv[1:])
+    print 'Serving on http://127.0.0.1:%d/' % options.port
+    serve(options.config, options.port, options.cache, options.verbose)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,352 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""Streaming access to freemind's file(.mm).
+
+The converters used to read the whole map into a string and build a full
+ElementTree before emitting anything.  ``iterparse`` walks the map with
+start/end events instead and drops every finished ``node`` subtree, so
+memory stays bounded by the depth of the map rather than its size.
+"""
+
+try:
+    from xml.etree import cElementTree as _iterElementTree
+except ImportError:
+    from xml.etree import ElementTree as _iterElementTree
+from xml.etree import ElementTree
+import hashlib
+import mmap
+import os
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+START = 'start'
+END = 'end'
+
+
+def iterparse(source):
+    """Yield ``(event, depth, elem)`` for every element below ``<map>``.
+
+    ``source`` is a filename or a file object.  The root node has depth 0,
+    its children depth 1 and so on; ``icon``, ``richcontent`` and the other
+    non-node children of a node get the depth of a child node.
+
+    On START only ``elem.tag`` and ``elem.attrib`` are reliable.  On END a
+    ``node`` still holds its non-node children (icons, richcontent...) but
+    its child nodes are already gone; it is cleared right after the END
+    event has been consumed.
+    """
+    stack = []
+    for event, elem in _iterElementTree.iterparse(source, events=(START, END)):
+        if event == START:
+            stack.append(elem)
+            if len(stack) > 1:
+                yield START, len(stack) - 2, elem
+        else:
+            stack.pop()
+            if not stack:
+                continue
+            yield END, len(stack) - 1, elem
+            if elem.tag == 'node':
+                elem.clear()
+                # a finished element is always the last child of its parent
+                del stack[-1][-1]
+
+
+def icons(elem):
+    """BUILTIN names of the icons attached to a node"""
+    return [icon.get('BUILTIN') for icon in elem.findall('icon')]
+
+
+def iternodes(elem):
+    """``elem.getiterator('node')`` without one recursion level per level
+    of the map"""
+    stack = [elem]
+    while stack:
+        elem = stack.pop()
+        if elem.tag == 'node':
+            yield elem
+        stack.extend(reversed(elem[:]))
+
+
+def parse(source):
+    """Build the whole tree straight from a filename or file object.
+
+    Same result as ``ElementTree.XML(file(name).read())`` without holding
+    the file content and the tree in memory at the same time.
+    """
+    return ElementTree.parse(source).getroot()
+
+
+BUFSIZE = 64 * 1024
+
+# bytes of a memory mapped map kept mapped at a time, see MappedFile
+CHUNK_SIZE = 64 * 1024
+
+
+class MappedFile(object):
+    """A map file read through memory mappings of chunk_size bytes.
+
+    read returns buffers over the current mapping, so the XML parser reads
+    the page cache directly instead of a string copy of it.  A mapping is
+    dropped once the reads have gone past it and the parser has let go of
+    its buffers: only about one chunk is resident at a time, whatever the
+    size of the file.  mmbench compares it with the plain reads of the
+    converters (the -mapped converters)."""
+
+    def __init__(self, path, chunk_size=CHUNK_SIZE):
+        self.granularity = mmap.ALLOCATIONGRANULARITY
+        # a mapping starts at a multiple of the allocation granularity
+        self.chunk_size = max(self.granularity,
+                              chunk_size // self.granularity * self.granularity)
+        self.name = path
+        self.file = open(path, 'rb')
+        self.size = os.fstat(self.file.fileno()).st_size
+        self.pos = 0
+        self.mapping = None
+        self.start = 0 # offset of the mapping in the file
+
+    def read(self, size=-1):
+        """the next size bytes (the rest of the file without size), fewer
+        at the end of the file and an empty string past it"""
+        end = self.size
+        if size >= 0:
+            end = min(end, self.pos + size)
+        if self.pos >= end:
+            return b''
+        if self.mapping is None or end > self.start + len(self.mapping):
+            self.start = self.pos // self.granularity * self.granularity
+            length = min(max(self.chunk_size, end - self.start), self.size - self.start)
+            self.mapping = mmap.mmap(self.file.fileno(), length,
+                                     access=mmap.ACCESS_READ, offset=self.start)
+        data = buffer(self.mapping, self.pos - self.start, end - self.pos)
+        self.pos = end
+        return data
+
+    def close(self):
+        self.mapping = None
+        self.file.close()
+
+
+def write_lines(outfile, lines, sep='\n', bufsize=BUFSIZE):
+    """Write ``lines`` joined by ``sep`` to the binary file ``outfile``.
+
+    ``lines`` may be any iterable, typically one of the converters'
+    generators; it is consumed lazily and written as UTF-8 about
+    ``bufsize`` characters at a time.  Return the number of bytes written.
+    """
+    buf = []
+    size = 0
+    written = 0
+    first = True
+    for line in lines:
+        if first:
+            first = False
+        else:
+            buf.append(sep)
+        buf.append(line)
+        size += len(line)
+        if size >= bufsize:
+            data = ''.join(buf).encode('utf-8')
+            outfile.write(data)
+            written += len(data)
+            buf = []
+            size = 0
+    if buf:
+        data = ''.join(buf).encode('utf-8')
+        outfile.write(data)
+        written += len(data)
+    return written
+
+
+class _DigestFile(object):
+    """binary file wrapper hashing everything written to it"""
+
+    def __init__(self, outfile):
+        self.outfile = outfile
+        self.sha1 = hashlib.sha1()
+
+    def write(self, data):
+        self.sha1.update(data)
+        self.outfile.write(data)
+
+    def close(self):
+        self.outfile.close()
+
+    def hexdigest(self):
+        return self.sha1.hexdigest()
+
+
+def file_digest(path):
+    """sha1 hexdigest of a file's content, read a buffer at a time"""
+    sha1 = hashlib.sha1()
+    infile = open(path, 'rb')
+    try:
+        for chunk in iter(lambda: infile.read(BUFSIZE), b''):
+            sha1.update(chunk)
+    finally:
+        infile.close()
+    return sha1.hexdigest()
+
+
+def _gzip():
+    # no name nor time in the header: the same content, the same file
+    return zlib.compressobj(zlib.Z_BEST_COMPRESSION, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+def _zstd():
+    return zstandard.ZstdCompressor(level=19).compressobj()
+
+
+# the compressed copies write_file can make of its file, by extension
+COMPRESSORS = {'gz': _gzip}
+if zstandard is not None:
+    COMPRESSORS['zst'] = _zstd
+
+# every extension of a sidecar, made here or not
+SIDECAR_EXTENSIONS = ('gz', 'zst')
+
+
+def sidecars(gzip=False, zstd=False):
+    """the sidecars argument of write_file for the --gzip and --zstd
+    options, ValueError when zstd is not there"""
+    if zstd and 'zst' not in COMPRESSORS:
+        raise ValueError('--zstd needs the zstandard module')
+    return tuple(ext for ext, wanted in (('gz', gzip), ('zst', zstd)) if wanted)
+
+
+def fresh_sidecars(path, extensions):
+    """whether path exists and has its sidecars of extensions, none of
+    them older than it: made from its content, not from an older one"""
+    if not os.path.exists(path):
+        return False
+    mtime = os.path.getmtime(path)
+    for ext in extensions:
+        sidecar = '%s.%s' % (path, ext)
+        if not os.path.exists(sidecar) or os.path.getmtime(sidecar) < mtime:
+            return False
+    return True
+
+
+def remove_sidecars(path, keep=()):
+    """remove the sidecars of path but those of the extensions of keep:
+    once path is rewritten without them they are out of date"""
+    for ext in SIDECAR_EXTENSIONS:
+        if ext not in keep and os.path.exists('%s.%s' % (path, ext)):
+            os.remove('%s.%s' % (path, ext))
+
+
+class _SidecarFile(object):
+    """binary file wrapper compressing everything written to it into the
+    sidecars of path (path.gz...) as it goes.
+
+    As long as the data is the start of the old content of path nothing is
+    compressed: the fresh sidecars of an unchanged file are left as they
+    are, unless force is set."""
+
+    def __init__(self, outfile, path, extensions, force=False):
+        self.outfile = outfile
+        self.path = path
+        self.extensions = extensions
+        self.streams = None
+        self.old = None
+        self.same = 0
+        if not force and fresh_sidecars(path, extensions):
+            self.old = open(path, 'rb')
+        else:
+            self._start()
+
+    def _start(self):
+        # one per process, as in write_file
+        self.streams = []
+        for ext in self.extensions:
+            tmp = '%s.%s.%d.tmp' % (self.path, ext, os.getpid())
+            self.streams.append((COMPRESSORS[ext](), open(tmp, 'wb'), tmp))
+        if self.old is not None:
+            # the start of the new content, from the old file
+            self.old.seek(0)
+            left = self.same
+            while left:
+                data = self.old.read(min(left, BUFSIZE))
+                self._compress(data)
+                left -= len(data)
+            self.old.close()
+            self.old = None
+
+    def _compress(self, data):
+        for compressor, out, tmp in self.streams:
+            out.write(compressor.compress(data))
+
+    def write(self, data):
+        self.outfile.write(data)
+        if self.old is not None:
+            if self.old.read(len(data)) == data:
+                self.same += len(data)
+                return
+            self._start()
+        self._compress(data)
+
+    def close(self):
+        """close the file and put the sidecars in place, unless the content
+        is the old one.  Return whether they were written"""
+        self.outfile.close()
+        if self.old is not None:
+            if not self.old.read(1):
+                self.old.close()
+                return False
+            # the new content is shorter
+            self._start()
+        for ext, (compressor, out, tmp) in zip(self.extensions, self.streams):
+            out.write(compressor.flush())
+            out.close()
+            os.rename(tmp, '%s.%s' % (self.path, ext))
+        return True
+
+    def abort(self):
+        self.outfile.close()
+        if self.old is not None:
+            self.old.close()
+        for compressor, out, tmp in self.streams or ():
+            out.close()
+            os.remove(tmp)
+
+
+def write_file(path, lines, sep='\n', opener=open, sidecars=(), force=False):
+    """Write ``lines`` to ``path`` as write_lines does, but leave ``path``
+    untouched when the new content is the same as the old one.
+
+    The lines go to a temporary file, opened with ``opener(name, 'wb')``,
+    that replaces ``path`` only if it differs.  They are also compressed
+    into ``path.gz`` (and ``path.zst``...) for every extension of sidecars
+    (see COMPRESSORS) while they are written, for static web servers;
+    unless path and its sidecars are up to date (see fresh_sidecars) and
+    force is not set.  The other sidecars of a rewritten path are removed.
+    Return ``(sha1 hexdigest, written)``.
+    """
+    # one per process: the posts of several maps can share a name
+    tmp = '%s.%d.tmp' % (path, os.getpid())
+    out = _DigestFile(opener(tmp, 'wb'))
+    target = out
+    if sidecars:
+        target = _SidecarFile(out, path, sidecars, force)
+    try:
+        write_lines(target, lines, sep)
+    except:
+        if target is out:
+            out.close()
+        else:
+            target.abort()
+        os.remove(tmp)
+        raise
+    target.close()
+    digest = out.hexdigest()
+    if os.path.exists(path) and file_digest(path) == digest:
+        os.remove(tmp)
+        return digest, False
+    os.rename(tmp, path)
+    remove_sidecars(path, sidecars)
+    return digest, True
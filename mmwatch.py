@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""Wait for changes to the maps of a directory and a few other files.
+
+Changes are found by comparing (mtime, size) snapshots.  With pyinotify
+installed the watcher sleeps until the kernel reports an event in one of
+the watched directories; without it the snapshot is simply taken again
+every ``interval`` seconds.
+
+FreeMind saves a map in several writes, so a change is only reported once
+a snapshot stays the same for ``settle`` seconds.
+"""
+
+import os
+import time
+
+try:
+    import pyinotify
+except ImportError:
+    pyinotify = None
+
+# with inotify, look at the files anyway after that many seconds without
+# an event
+RESCAN = 60
+
+
+def stat_key(path):
+    """(mtime, size) of path, None when it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime, stat.st_size
+
+
+class Watcher():
+    """watch the files ending in suffix in directory, plus the files of
+    extra (app.yaml)"""
+
+    def __init__(self, directory, suffix='mm', extra=(), interval=1.0, settle=0.5):
+        self.directory = directory
+        self.suffix = suffix
+        self.extra = list(extra)
+        self.interval = interval
+        self.settle = settle
+        self.notifier = None
+        if pyinotify is not None:
+            self._watch_inotify()
+        self.last = self.snapshot()
+
+    def _watch_inotify(self):
+        class Ignore(pyinotify.ProcessEvent):
+            def process_default(self, event):
+                pass
+        manager = pyinotify.WatchManager()
+        mask = (pyinotify.IN_CLOSE_WRITE | pyinotify.IN_CREATE | pyinotify.IN_DELETE
+                | pyinotify.IN_MOVED_FROM | pyinotify.IN_MOVED_TO | pyinotify.IN_ATTRIB)
+        # the directories, not the files: editors often save by renaming
+        # a new file over the old one
+        directories = set([self.directory])
+        directories.update(os.path.dirname(os.path.abspath(path)) for path in self.extra)
+        for directory in directories:
+            manager.add_watch(directory, mask)
+        self.notifier = pyinotify.Notifier(manager, Ignore())
+
+    def close(self):
+        """stop watching: the inotify file descriptor is closed"""
+        if self.notifier is not None:
+            self.notifier.stop()
+            self.notifier = None
+
+    def snapshot(self):
+        """{path: (mtime, size)} of every watched file"""
+        snapshot = {}
+        for name in os.listdir(self.directory):
+            if name.endswith(self.suffix):
+                path = os.path.join(self.directory, name)
+                snapshot[path] = stat_key(path)
+        for path in self.extra:
+            snapshot[path] = stat_key(path)
+        return snapshot
+
+    def _sleep(self):
+        """sleep until the next snapshot is due: interval seconds when
+        polling, until an event (or RESCAN seconds) with inotify"""
+        if self.notifier is None:
+            time.sleep(self.interval)
+        elif self.notifier.check_events(int(max(self.interval, RESCAN) * 1000)):
+            self.notifier.read_events()
+            self.notifier.process_events()
+
+    def wait(self):
+        """block until some watched files change and then stay unchanged
+        for settle seconds; return their paths (removed files included)"""
+        while True:
+            self._sleep()
+            current = self.snapshot()
+            if current == self.last:
+                continue
+            while True:
+                time.sleep(self.settle)
+                settled = self.snapshot()
+                if settled == current:
+                    break
+                current = settled
+            changed = [path for path in set(current) | set(self.last)
+                       if current.get(path) != self.last.get(path)]
+            self.last = current
+            if changed:
+                return sorted(changed)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""Check the converters on the deep and wide maps of this directory.
+
+  python testdata/check.py
+
+deep.mm is a branch 1500 levels deep, past the recursion limit of
+Python, wide.mm has 40 top level branches of 40 children.  Both were
+made by mmbench.generate:
+
+  generate(out, depth=1500, fanout=1, tables=0)                # deep.mm
+  generate(out, depth=2, fanout=40, section_fanout=8)          # wide.mm
+
+expected.json has the sha1 of the md, textile, S5 and notes output of
+each map, those of the recursive walkers the converters had before
+(run with a raised recursion limit).  The S5 output is also checked
+through a render cache of three levels, cold then warm.  Then one item
+of wide.mm is edited: its slide is rendered again, the other items of
+the slide come from the cache.
+
+A batch of mm2md then converts wide.mm under a non-ASCII name, through
+an app.yaml and its index, from the mm directory and from a zip archive
+in two processes.  The exit status is 1 when an output differs
+or a check fails.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import zipfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import mm2md
+import mm2notes
+import mm2s5
+import mmcache
+import mmstream
+
+MAPS = ('deep', 'wide')
+
+APP_YAML = """file_dir:
+    md: %(tmp)s/md
+    mm: %(tmp)s/mm
+选举.mm:
+    mdfname: 2012-11-19-election.md
+    layout: post
+    category: manage
+    tags: 选举,评优
+    title: 什么是差额选举？
+    mmLink: http://example.com/选举
+wide.mm:
+    mdfname: 2012-11-20-wide.md
+    layout: post
+    category: tech
+    tags: wide
+    title: wide
+    mmLink: http://example.com/wide
+"""
+
+
+def outputs(path):
+    """{output name: its sha1} of the map at path"""
+    content = open(path, 'rb').read()
+    transform = mm2md.MMTransform()
+    found = {'md': transform.mm2md(content).encode('utf8'),
+             'textile': transform.mm2textile(content).encode('utf8')}
+    html = os.path.join(HERE, '.check.html')
+    cache = mmcache.RenderCache(depth=3)
+    try:
+        for output in 's5', 's5 cold cache', 's5 warm cache':
+            s5 = mm2s5.Mm2S5()
+            if output != 's5':
+                s5.cache = cache
+            s5.write(html, s5.open(path))
+            found[output] = open(html, 'rb').read()
+    finally:
+        if os.path.exists(html):
+            os.remove(html)
+    for as_html in (True, False):
+        notes = mm2notes.Mm2Notes()
+        notes.as_html = as_html
+        notes.et_in = notes.xmlparse(content)
+        found[as_html and 'notes.html' or 'notes.txt'] = '\n'.join(notes.convert()).encode('utf8')
+    return dict((name, hashlib.sha1(data).hexdigest()) for name, data in found.items())
+
+
+def edited(path):
+    """whether the S5 output of the map at path with one item edited is
+    the same through the cache of the map as without, the other items of
+    the slide taken from the cache"""
+    cache = mmcache.RenderCache(depth=3)
+    s5 = mm2s5.Mm2S5()
+    s5.cache = cache
+    s5.open(path)
+    tree = mmstream.parse(path)
+    pages = [page for page in tree.find('node').findall('node')
+             if page.get('TEXT') != '__meta__']
+    item = pages[0].findall('node')[0]
+    item.set('TEXT', item.get('TEXT') + ' edited')
+    s5 = mm2s5.Mm2S5()
+    s5.et_in = tree
+    expected = s5.convert()
+    hits = cache.hits
+    s5 = mm2s5.Mm2S5()
+    s5.et_in = tree
+    s5.cache = cache
+    found = s5.convert()
+    # more hits than the other slides: items of the edited one
+    return found == expected and cache.hits - hits > len(pages) - 1
+
+
+def batch(tmp):
+    """whether mm2md -c app.yaml converts every map of the mm directory,
+    the one with a non-ASCII name too, then those of a zip archive with
+    -j 2"""
+    os.mkdir(os.path.join(tmp, 'mm'))
+    os.mkdir(os.path.join(tmp, 'md'))
+    for name in b'选举.mm', b'wide.mm':
+        shutil.copy(os.path.join(HERE, 'wide.mm'), os.path.join(tmp, 'mm', name))
+    config = os.path.join(tmp, 'app.yaml')
+    open(config, 'wb').write(APP_YAML % {'tmp': tmp})
+    # the index of app.yaml goes to the cache directory
+    os.environ['XDG_CACHE_HOME'] = tmp
+    posts = ['2012-11-19-election.md', '2012-11-20-wide.md']
+    if mm2md.main(['mm2md.py', '-c', config]) or not all(
+            os.path.exists(os.path.join(tmp, 'md', name)) for name in posts):
+        return False
+    maps = os.path.join(tmp, 'maps.zip')
+    archive = zipfile.ZipFile(maps, 'w')
+    for name in b'选举.mm', b'wide.mm':
+        archive.write(os.path.join(tmp, 'mm', name), name)
+    archive.close()
+    posts_zip = os.path.join(tmp, 'posts.zip')
+    if mm2md.main(['mm2md.py', '-c', config, '-a', maps, '-j', '2', '-o', posts_zip]):
+        return False
+    return sorted(zipfile.ZipFile(posts_zip).namelist()) == posts
+
+
+def main():
+    expected = json.load(open(os.path.join(HERE, 'expected.json')))
+    failed = 0
+    for name in MAPS:
+        found = outputs(os.path.join(HERE, name + '.mm'))
+        for output in sorted(found):
+            # the cached S5 output is that of the S5 converter
+            ok = found[output] == expected[name][output.split()[0]]
+            failed += not ok
+            print '%s.mm %s: %s' % (name, output, ok and 'OK' or 'DIFFERENT')
+    ok = edited(os.path.join(HERE, 'wide.mm'))
+    failed += not ok
+    print 'wide.mm s5 with an edited item through the cache: %s' % (ok and 'OK' or 'DIFFERENT')
+    tmp = tempfile.mkdtemp(prefix='mmcheck')
+    try:
+        ok = batch(tmp)
+    finally:
+        shutil.rmtree(tmp)
+    failed += not ok
+    print 'batches with a non-ASCII map name: %s' % (ok and 'OK' or 'FAILED')
+    return failed and 1 or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3014 @@
+<map version="0.9.0">
+<node CREATED="1353300051000" ID="ID_1" MODIFIED="1353300051000" TEXT="Benchmark map&#10;synthetic">
+<node CREATED="1353300097000" ID="ID_2" MODIFIED="1353300097000" TEXT="__meta__">
+<node CREATED="1353300123000" ID="ID_3" MODIFIED="1353300123000" TEXT="author">
+<node CREATED="1353300139000" ID="ID_4" MODIFIED="1353300139000" TEXT="mmbench">
+</node>
+</node>
+<node CREATED="1353300170000" ID="ID_5" MODIFIED="1353300170000" TEXT="company">
+<node CREATED="1353300195000" ID="ID_6" MODIFIED="1353300195000" TEXT="FreeMindTools">
+</node>
+</node>
+</node>
+<node CREATED="1353300243000" ID="ID_7" MODIFIED="1353300243000" TEXT="时间">
+<node CREATED="1353300262000" ID="ID_8" MODIFIED="1353300262000" TEXT="s pixth  z jw vodns  o i">
+<node CREATED="1353300311000" ID="ID_9" MODIFIED="1353300311000" TEXT="awmzuap hk frh yncjp drv">
+<node CREATED="1353300344000" ID="ID_10" MODIFIED="1353300344000" TEXT="q ssnslrjffsuocx     qmv">
+<node CREATED="1353300361000" ID="ID_11" MODIFIED="1353300361000" TEXT="s rnu  ycspt hwdgykzde">
+<node CREATED="1353300403000" ID="ID_12" MODIFIED="1353300403000" TEXT="糚額禝薑倮臘羁紆深永鸎僸俄鱷崚堝弱轡骀俜烀噉挸怇">
+<node CREATED="1353300442000" ID="ID_13" MODIFIED="1353300442000" TEXT="fpbd glwz fu bu khsnfomr">
+<node CREATED="1353300473000" ID="ID_14" MODIFIED="1353300473000" TEXT="lzhrawkbih kil ttwmmuafk">
+<node CREATED="1353300488000" ID="ID_15" MODIFIED="1353300488000" TEXT="l rmmvmubnieqprx pjoz zf">
+<node CREATED="1353300548000" ID="ID_16" MODIFIED="1353300548000" TEXT="cw mvjgwazqddu i d mcioy">
+<node CREATED="1353300600000" ID="ID_17" MODIFIED="1353300600000" TEXT="碇茢橖锯撻侄兑薚箖魇骟顉六謪蝃莂蠩鞴艄汨秫廸緰亹">
+<node CREATED="1353300610000" ID="ID_18" MODIFIED="1353300610000" TEXT="ywktbf imrjohbfqcmkmd o">
+<node CREATED="1353300669000" ID="ID_19" MODIFIED="1353300669000" TEXT="ovnjw  tl tccxbamqnpsvnl">
+<node CREATED="1353300729000" ID="ID_20" MODIFIED="1353300729000" TEXT="赲焵歅匶钂蝑鞺狟蕅垵湾廫兰魦徠姳帩泝窜婛麹鹂娝漤">
+<node CREATED="1353300770000" ID="ID_21" MODIFIED="1353300770000" TEXT="p jppugsgk  zbehy swzcc">
+<node CREATED="1353300773000" ID="ID_22" MODIFIED="1353300773000" TEXT="兑伿鋨棾嬞娦莑鴕眻鞒眅糛蕧込诠黠諽韴廔禷绠酪畟躖">
+<node CREATED="1353300797000" ID="ID_23" MODIFIED="1353300797000" TEXT="yuafphc  jmzbtdizbbmp w">
+<node CREATED="1353300838000" ID="ID_24" MODIFIED="1353300838000" TEXT="麐澑翳涒凗瑲婛傦聨腯嚘竖橎济赤瘈间翐琥膠榖堦薺胉">
+<node CREATED="1353300886000" ID="ID_25" MODIFIED="1353300886000" TEXT="顲轃飜锽薚逧硠踢嵱跛牌识猰蹷否冥驈疱鞒鬣葫粯徢喡">
+<node CREATED="1353300936000" ID="ID_26" MODIFIED="1353300936000" TEXT="yvnjdnr  mdxwanva  wccla">
+<node CREATED="1353300957000" ID="ID_27" MODIFIED="1353300957000" TEXT="鶍郞叁雲廻庸蔂骛堎亖氣倃罢鐦嵄圭樟鱐墠鳪殓璦旤骃">
+<node CREATED="1353301015000" ID="ID_28" MODIFIED="1353301015000" TEXT="f dse  yjhxjnbeaccnrwent">
+<node CREATED="1353301021000" ID="ID_29" MODIFIED="1353301021000" TEXT="l bmmwjgjo yirvynmxnho e">
+<node CREATED="1353301049000" ID="ID_30" MODIFIED="1353301049000" TEXT="ogavtajxtqevovxhxi d bhq">
+<node CREATED="1353301084000" ID="ID_31" MODIFIED="1353301084000" TEXT="dhix sbyjkqh fmiqrtqmtmy">
+<node CREATED="1353301132000" ID="ID_32" MODIFIED="1353301132000" TEXT="汛腗嫓蛩洤繂奤蒏櫨璗濤瓬蚸査茽勪暂諘則肷倕瑿隌仓">
+<node CREATED="1353301164000" ID="ID_33" MODIFIED="1353301164000" TEXT="铌蘈誔蒟了兜肱龟镊蜠襝悂譞斂嚜玡棵宼灮靁熊犅蟟磌">
+<node CREATED="1353301172000" ID="ID_34" MODIFIED="1353301172000" TEXT="nymzmgg sbmhcfbtfssvpi k">
+<node CREATED="1353301200000" ID="ID_35" MODIFIED="1353301200000" TEXT="p    spvgibfaueyv m okd">
+<node CREATED="1353301248000" ID="ID_36" MODIFIED="1353301248000" TEXT="okablgqfguwj hkwb cowbz">
+<node CREATED="1353301276000" ID="ID_37" MODIFIED="1353301276000" TEXT="咧嘏豿濍餍燺呌烛计醶儶岺瘂塵锟驌栘熁筻敏稭幭昸爒">
+<node CREATED="1353301313000" ID="ID_38" MODIFIED="1353301313000" TEXT="ihdydwhiwuwp dudwluvugzh">
+<node CREATED="1353301345000" ID="ID_39" MODIFIED="1353301345000" TEXT="htifzrksaem pcxyyrvgwzxk">
+<node CREATED="1353301381000" ID="ID_40" MODIFIED="1353301381000" TEXT="dzqloaguup oj isvzylbbw">
+<node CREATED="1353301439000" ID="ID_41" MODIFIED="1353301439000" TEXT="nwuiujlqweatabgucb n gnl">
+<node CREATED="1353301450000" ID="ID_42" MODIFIED="1353301450000" TEXT="xlmiqwvob mmae pwek zha">
+<node CREATED="1353301499000" ID="ID_43" MODIFIED="1353301499000" TEXT="蹐藑宾周馽绐肩獚婀缦抝迌觓倹騡僷啑旦婐慇欍訍漋搈">
+<node CREATED="1353301529000" ID="ID_44" MODIFIED="1353301529000" TEXT="j r xrivowmpawbvsyivgqk">
+<node CREATED="1353301588000" ID="ID_45" MODIFIED="1353301588000" TEXT="簷棦鴔饼緛裋薡櫙飑靰棿謆亾邧簞鯁殧脖桟跩缋麠丕奾">
+<node CREATED="1353301591000" ID="ID_46" MODIFIED="1353301591000" TEXT="駢魳甹魋郑趒謃嵒竐炛鮌就寞菋嫚囼眥輋罦讟掲敄焀黦">
+<node CREATED="1353301635000" ID="ID_47" MODIFIED="1353301635000" TEXT="qr fyy xeu rl rmtyhaq vt">
+<node CREATED="1353301673000" ID="ID_48" MODIFIED="1353301673000" TEXT="wh i  cnxnpzv f  t h xsc">
+<node CREATED="1353301675000" ID="ID_49" MODIFIED="1353301675000" TEXT="扵谾涑赐脕淈關儢珽釁塚蠂棊俻璭碘入簴橞九嶓圌稤内">
+<node CREATED="1353301731000" ID="ID_50" MODIFIED="1353301731000" TEXT="j  xiusmjbdeotxbzbrxt k">
+<node CREATED="1353301767000" ID="ID_51" MODIFIED="1353301767000" TEXT="箴遧幵捎蜯抺挪驢龇媫靿笡儦緎艡僂话郅叙苰獆慽獳嬃">
+<node CREATED="1353301788000" ID="ID_52" MODIFIED="1353301788000" TEXT="orqzkzcnknzp  djawa fmbj">
+<node CREATED="1353301812000" ID="ID_53" MODIFIED="1353301812000" TEXT="貫蠔欸鈱呒剨櫻鞢诃蓤篲辠澨傁较嶍润欲堒檤屵聋荚伝">
+<node CREATED="1353301840000" ID="ID_54" MODIFIED="1353301840000" TEXT="pcb y iuczk ob tibleqef">
+<node CREATED="1353301896000" ID="ID_55" MODIFIED="1353301896000" TEXT="h t o vbhifhh o era amy">
+<node CREATED="1353301898000" ID="ID_56" MODIFIED="1353301898000" TEXT="pbydsyulan khepqcmu nnog">
+<node CREATED="1353301922000" ID="ID_57" MODIFIED="1353301922000" TEXT="msz  lasohbjy d bwan m w">
+<node CREATED="1353301959000" ID="ID_58" MODIFIED="1353301959000" TEXT="槍澐縰齓攪眝騶樳腓貍腵讄巺鰪山綨昫臌旄焵薳揸襮橒">
+<node CREATED="1353301967000" ID="ID_59" MODIFIED="1353301967000" TEXT="fnmcwvyqrfghqzl wwkd  m">
+<node CREATED="1353302021000" ID="ID_60" MODIFIED="1353302021000" TEXT="pkv  xj  k p  zveasv qvu">
+<node CREATED="1353302034000" ID="ID_61" MODIFIED="1353302034000" TEXT="dvtlya zodoshpy rzc  fz">
+<node CREATED="1353302085000" ID="ID_62" MODIFIED="1353302085000" TEXT="qsgvmaem r  cskpoodzptof">
+<node CREATED="1353302118000" ID="ID_63" MODIFIED="1353302118000" TEXT="鎔釦妺厞厗減鯐筨掮惀圍妄遉契钌鄲夫箞亓鑢箕讬瘉號">
+<node CREATED="1353302174000" ID="ID_64" MODIFIED="1353302174000" TEXT="kdahzjgp pkcrhllxh xo l">
+<node CREATED="1353302198000" ID="ID_65" MODIFIED="1353302198000" TEXT="趑滁盘瑴莓沈飇煄歔溻貑鼔钿甫旉牪樖懢嵃鰋盄固浘涼">
+<node CREATED="1353302229000" ID="ID_66" MODIFIED="1353302229000" TEXT="rtuppjvcj h  rbcgkdylhb">
+<node CREATED="1353302252000" ID="ID_67" MODIFIED="1353302252000" TEXT="垂罞驖幇誁帤丟霳錕即屶愡駋洯迫熕洠豽聆揽綕蝷醇蕊">
+<node CREATED="1353302291000" ID="ID_68" MODIFIED="1353302291000" TEXT="c wivtulrugpdd d ookmlrk">
+<node CREATED="1353302341000" ID="ID_69" MODIFIED="1353302341000" TEXT="扉甼驙俳褐乽漎豥牫焑抬瓊患攦荗绱駥鴛碦唦晼硇蓶魁">
+<node CREATED="1353302351000" ID="ID_70" MODIFIED="1353302351000" TEXT="锉辽貅瑂蕖澘嶮淪蹂轸鱹険薰碈褛峵饞蠮纉煰膺聮靣粙">
+<node CREATED="1353302364000" ID="ID_71" MODIFIED="1353302364000" TEXT="h  rgbenugv xnu  kvfrlnn">
+<node CREATED="1353302404000" ID="ID_72" MODIFIED="1353302404000" TEXT="oexx moq vag s mga etplq">
+<node CREATED="1353302409000" ID="ID_73" MODIFIED="1353302409000" TEXT="pamxjxxh a peisizglpkzic">
+<node CREATED="1353302419000" ID="ID_74" MODIFIED="1353302419000" TEXT="rb ojwanu x dnailklyfzqk">
+<node CREATED="1353302453000" ID="ID_75" MODIFIED="1353302453000" TEXT="癳俊鑵椒樗齀耖瀙躎历粔碃鑑緜疟硹跗橛箊蟁齉蚣鲉溔">
+<node CREATED="1353302490000" ID="ID_76" MODIFIED="1353302490000" TEXT="ki k  gz iuxczjv bsjdw p">
+<node CREATED="1353302511000" ID="ID_77" MODIFIED="1353302511000" TEXT="mqmc  fhnvazti ujq bv ve">
+<node CREATED="1353302547000" ID="ID_78" MODIFIED="1353302547000" TEXT="mshjzpndlqhzlhjz  axqdhi">
+<node CREATED="1353302572000" ID="ID_79" MODIFIED="1353302572000" TEXT="bv lhgjerhahzm  hr sfh">
+<node CREATED="1353302590000" ID="ID_80" MODIFIED="1353302590000" TEXT="yxwy bfpgqpdcazc  xnimkm">
+<node CREATED="1353302634000" ID="ID_81" MODIFIED="1353302634000" TEXT="ehgb pcnnyxetpaeul pveow">
+<node CREATED="1353302685000" ID="ID_82" MODIFIED="1353302685000" TEXT="湨璩燴瓑昨逇颍橾舔洕絁蛊盲蔔译鋚嵪循矿瞜迳砾靼赽">
+<node CREATED="1353302716000" ID="ID_83" MODIFIED="1353302716000" TEXT="oknoubw ocgdhya  ff lza">
+<node CREATED="1353302717000" ID="ID_84" MODIFIED="1353302717000" TEXT="zjzmplksyvxaqkg gffusps">
+<node CREATED="1353302774000" ID="ID_85" MODIFIED="1353302774000" TEXT="b au pmk  twke ui sk cy">
+<node CREATED="1353302784000" ID="ID_86" MODIFIED="1353302784000" TEXT="挤衝群灥嫼饬貐蘈遟贷圭贤鉻諸畠蘌嘪豨捩踚臞瞐秃吚">
+<node CREATED="1353302787000" ID="ID_87" MODIFIED="1353302787000" TEXT="赒奎堈浰鷓陕枔郯哲渂絊麆出澬餕偁绪溜箾蝭漴雕鰈鹭">
+<node CREATED="1353302791000" ID="ID_88" MODIFIED="1353302791000" TEXT="e dg zrihmatbxcaixzp dk">
+<node CREATED="1353302836000" ID="ID_89" MODIFIED="1353302836000" TEXT="erblhkpqcjlmoncgtzpecelr">
+<node CREATED="1353302876000" ID="ID_90" MODIFIED="1353302876000" TEXT="rkuwmzx okybl kphcdntqqd">
+<node CREATED="1353302879000" ID="ID_91" MODIFIED="1353302879000" TEXT="fio  auhux v yebwq fli">
+<node CREATED="1353302909000" ID="ID_92" MODIFIED="1353302909000" TEXT="v s fnr r tpmljg q   hkt">
+<node CREATED="1353302929000" ID="ID_93" MODIFIED="1353302929000" TEXT="谊竰秎蠂坞饅甭虼缃罪蟶啀皎弫淑矈櫦漵覬冉鰚罏孚签">
+<node CREATED="1353302934000" ID="ID_94" MODIFIED="1353302934000" TEXT="vnju  l db xtrj  oguw yc">
+<node CREATED="1353302994000" ID="ID_95" MODIFIED="1353302994000" TEXT="skwscrayzwcsmd   q gj sh">
+<node CREATED="1353303002000" ID="ID_96" MODIFIED="1353303002000" TEXT="癿曇觶搦呧靖萳鶇峜锐佧秩甫塍邍搝靛蜛鎘钿躥訢乕妵">
+<node CREATED="1353303015000" ID="ID_97" MODIFIED="1353303015000" TEXT="adpbjgfj huwufkiq grcl">
+<node CREATED="1353303021000" ID="ID_98" MODIFIED="1353303021000" TEXT="w on qxfcnkpk wldwqebtqr">
+<node CREATED="1353303046000" ID="ID_99" MODIFIED="1353303046000" TEXT="mcqduxfghsm qqgc degrtnm">
+<node CREATED="1353303085000" ID="ID_100" MODIFIED="1353303085000" TEXT="轛艂缹偛樳賆廏芟鶕燸硊彐互慑璆罖鉀断棝裖萼衖閡唽">
+<node CREATED="1353303093000" ID="ID_101" MODIFIED="1353303093000" TEXT="suhe haiqtwepjwlzf qnwlb">
+<node CREATED="1353303120000" ID="ID_102" MODIFIED="1353303120000" TEXT="菼礁釆痲媯娢糀掠彆髥奟飋秈驿銁晧瑤哶毰馪嘿戎兽鑉">
+<node CREATED="1353303162000" ID="ID_103" MODIFIED="1353303162000" TEXT="oisvyftvswq utaesxetexzt">
+<node CREATED="1353303167000" ID="ID_104" MODIFIED="1353303167000" TEXT="搁琲趰紷黽蟓妊鷱勉椭與淡俏昵憿赟繡姁锿彤栙镫豺灜">
+<node CREATED="1353303199000" ID="ID_105" MODIFIED="1353303199000" TEXT="wwu  jnthu jlnltbyitnsrq">
+<node CREATED="1353303209000" ID="ID_106" MODIFIED="1353303209000" TEXT="嚼浭拽疕瑱研壕皜鮛尊佄榫蟙鑇囫傌杒胉餦棺趢塩艕扨">
+<node CREATED="1353303255000" ID="ID_107" MODIFIED="1353303255000" TEXT="nvk ms roc qvuhtcb sjqrv">
+<node CREATED="1353303256000" ID="ID_108" MODIFIED="1353303256000" TEXT="喛譽狮帲沓蒨玨窑验溯噮嚿褬枃坤趉隒噛聖詵戒鉐藙牌">
+<node CREATED="1353303266000" ID="ID_109" MODIFIED="1353303266000" TEXT="醹害螈粝篈何堄杋腷洤拱浗珐纋箳氌炽返縗鴽缰攡知璜">
+<node CREATED="1353303318000" ID="ID_110" MODIFIED="1353303318000" TEXT="whif  kaoyvuadwzfz srbm">
+<node CREATED="1353303347000" ID="ID_111" MODIFIED="1353303347000" TEXT="narc uwv micaoxwatz xmvv">
+<node CREATED="1353303351000" ID="ID_112" MODIFIED="1353303351000" TEXT="橂芇洚芩谭賻攟鵗笷腄臝蓺媓蔔焻鴗衏鶆黫鈘緜缋瑙氮">
+<node CREATED="1353303377000" ID="ID_113" MODIFIED="1353303377000" TEXT="ufbnnchkltezpcd aufu  nn">
+<node CREATED="1353303395000" ID="ID_114" MODIFIED="1353303395000" TEXT="bo ddziyjbzkobuzg tqg n">
+<node CREATED="1353303398000" ID="ID_115" MODIFIED="1353303398000" TEXT="ljbbb  oce ryccydz ndwnp">
+<node CREATED="1353303452000" ID="ID_116" MODIFIED="1353303452000" TEXT="el pcpb hw  qkvq hvemyli">
+<node CREATED="1353303474000" ID="ID_117" MODIFIED="1353303474000" TEXT="aewvuedppd z fuzk cyehfd">
+<node CREATED="1353303515000" ID="ID_118" MODIFIED="1353303515000" TEXT="轁賒鰬赀黕箁傜椛渭鳥灢搏轌餙减鸘褁齍苴亢蕢悃麴騚">
+<node CREATED="1353303567000" ID="ID_119" MODIFIED="1353303567000" TEXT="h ztfgrsmzvhask hrg tx o">
+<node CREATED="1353303600000" ID="ID_120" MODIFIED="1353303600000" TEXT="tkzlxalo wwt wt xa fxmme">
+<node CREATED="1353303626000" ID="ID_121" MODIFIED="1353303626000" TEXT="zwtgb  a xdefh nqnohjhis">
+<node CREATED="1353303628000" ID="ID_122" MODIFIED="1353303628000" TEXT="ppnwxw mcywapz konxvofsa">
+<node CREATED="1353303650000" ID="ID_123" MODIFIED="1353303650000" TEXT="cdyod jnvey pvw ylpmq c">
+<node CREATED="1353303681000" ID="ID_124" MODIFIED="1353303681000" TEXT="驀巢倳瑲糖删腘篺篺咜欠墩琴求森闿胷囼莬齗毓賩莧瓉">
+<node CREATED="1353303706000" ID="ID_125" MODIFIED="1353303706000" TEXT="瀜揈疴蒧险姟逝谶腇嶮叚夬桇旊逪樍嬿鶪融辖皘嗩緝牐">
+<node CREATED="1353303726000" ID="ID_126" MODIFIED="1353303726000" TEXT="柏搻欖蠾垅泮诵杉鏣钌嵳茉舵寜箊瓍憧蠷霛露嚢泮啉珟">
+<node CREATED="1353303766000" ID="ID_127" MODIFIED="1353303766000" TEXT="bdtzsccrgxjz qvxtum ffwg">
+<node CREATED="1353303798000" ID="ID_128" MODIFIED="1353303798000" TEXT="lw ucqy obkp c ndxdehqu">
+<node CREATED="1353303834000" ID="ID_129" MODIFIED="1353303834000" TEXT="opuijttfgrzjfbqqsqu jyhk">
+<node CREATED="1353303864000" ID="ID_130" MODIFIED="1353303864000" TEXT="wawyarae b uxuxw lluqvlm">
+<node CREATED="1353303888000" ID="ID_131" MODIFIED="1353303888000" TEXT="訩籴陖訿濠赐匭臰騇雌柕擨易除槱澿棫掼锊爹禞滄楡滳">
+<node CREATED="1353303942000" ID="ID_132" MODIFIED="1353303942000" TEXT="蛣彺頼琟晥烽試鏬遘墙鳺瓹鮧寲髒巁铼搙銩孠鏊菿埩驾">
+<node CREATED="1353303969000" ID="ID_133" MODIFIED="1353303969000" TEXT="鋢剱償許啖諱営骸夶篶苀毦嗒痞楧难庖恅绂牀敮奵銑嗍">
+<node CREATED="1353304024000" ID="ID_134" MODIFIED="1353304024000" TEXT="e iyknwqxmbk y skoph bk">
+<node CREATED="1353304058000" ID="ID_135" MODIFIED="1353304058000" TEXT="azt w kx vyziima zezkspn">
+<node CREATED="1353304095000" ID="ID_136" MODIFIED="1353304095000" TEXT="ma  zenx   ten e lszcdo">
+<node CREATED="1353304154000" ID="ID_137" MODIFIED="1353304154000" TEXT="fylisnq b n  woqsmw k rj">
+<node CREATED="1353304164000" ID="ID_138" MODIFIED="1353304164000" TEXT="iz kljh z a zz mcrqgx wy">
+<node CREATED="1353304211000" ID="ID_139" MODIFIED="1353304211000" TEXT="ess niqpabfpuqr clqy tu">
+<node CREATED="1353304259000" ID="ID_140" MODIFIED="1353304259000" TEXT="amc zkdrkwzszahnozfrquab">
+<node CREATED="1353304265000" ID="ID_141" MODIFIED="1353304265000" TEXT="swud mzflutq zsvmptzgofg">
+<node CREATED="1353304268000" ID="ID_142" MODIFIED="1353304268000" TEXT="诖棰曡妿紏濤劃洼述诊鶕鐂皢躲踠潺涜箻爢胜遱餈芆磙">
+<node CREATED="1353304281000" ID="ID_143" MODIFIED="1353304281000" TEXT="gwqefadttqyqhxlbgnty yxs">
+<node CREATED="1353304293000" ID="ID_144" MODIFIED="1353304293000" TEXT="vilj vlgkhzflqhf  aqbndy">
+<node CREATED="1353304306000" ID="ID_145" MODIFIED="1353304306000" TEXT="c pnrfyi wjpj  qvcylik d">
+<node CREATED="1353304366000" ID="ID_146" MODIFIED="1353304366000" TEXT="tpbxmozjebvcscdmjd     r">
+<node CREATED="1353304391000" ID="ID_147" MODIFIED="1353304391000" TEXT="qhyfu qelpnes  fuaepshw">
+<node CREATED="1353304450000" ID="ID_148" MODIFIED="1353304450000" TEXT="藋碳蛿騶散闵啥兟馈挤蠅忱縈槈褈諐鞬辘狁塥蓑燝蟟麯">
+<node CREATED="1353304471000" ID="ID_149" MODIFIED="1353304471000" TEXT="kjhkll la sjya daezb jgu">
+<node CREATED="1353304486000" ID="ID_150" MODIFIED="1353304486000" TEXT="xujttaotle a f  cxu pjyw">
+<node CREATED="1353304519000" ID="ID_151" MODIFIED="1353304519000" TEXT="xp p beghebrswtonattt vg">
+<node CREATED="1353304556000" ID="ID_152" MODIFIED="1353304556000" TEXT="usxor iuwzr  podsjvw xz">
+<node CREATED="1353304616000" ID="ID_153" MODIFIED="1353304616000" TEXT="srru ajoq ph pyi mnokxrs">
+<node CREATED="1353304653000" ID="ID_154" MODIFIED="1353304653000" TEXT="槦啱浯捩橷脂藭謜怕峲鴌琖瓘哇蘙尕剃扽鳢椤劧蒺尵政">
+<node CREATED="1353304682000" ID="ID_155" MODIFIED="1353304682000" TEXT="j xtczzzzf jiaekh bnl zk">
+<node CREATED="1353304723000" ID="ID_156" MODIFIED="1353304723000" TEXT="hvovwrieanuzicokkbqnvvlb">
+<node CREATED="1353304782000" ID="ID_157" MODIFIED="1353304782000" TEXT="詗篖偵觜鵦娸表粴稥煥特尊歳蔦鍓訚脡悲乲鐓貒魍夕鶄">
+<node CREATED="1353304802000" ID="ID_158" MODIFIED="1353304802000" TEXT="ay  eeqmaiyxh lxk ulcf r">
+<node CREATED="1353304850000" ID="ID_159" MODIFIED="1353304850000" TEXT="磐缃骪睇饯栅綔脍嗗它拚捩崙瀭嗳娹鏜岤犌咛輊揣萖郥">
+<node CREATED="1353304875000" ID="ID_160" MODIFIED="1353304875000" TEXT="嫠玉續菌緥懰丠夤爃鴜籘鷿銬齑斠虓焮锝耓滻鬃銮癏炷">
+<node CREATED="1353304900000" ID="ID_161" MODIFIED="1353304900000" TEXT="jfzdte hda yj pgravil t">
+<node CREATED="1353304914000" ID="ID_162" MODIFIED="1353304914000" TEXT="鎐羻壝抲魔紡笶賰鞖淛酑铵鯺甹雡鄸瑗袝夆諉湙醘横輞">
+<node CREATED="1353304932000" ID="ID_163" MODIFIED="1353304932000" TEXT="m h z vp b xgj diegek se">
+<node CREATED="1353304939000" ID="ID_164" MODIFIED="1353304939000" TEXT="hifi lmksqidrrbknpjuydnu">
+<node CREATED="1353304975000" ID="ID_165" MODIFIED="1353304975000" TEXT="q zeallazq zzm wdrgtmb">
+<node CREATED="1353305031000" ID="ID_166" MODIFIED="1353305031000" TEXT="gmvdgc xehu g n aqmy dxl">
+<node CREATED="1353305084000" ID="ID_167" MODIFIED="1353305084000" TEXT="ppgb dndbkdi hyycmekeew">
+<node CREATED="1353305088000" ID="ID_168" MODIFIED="1353305088000" TEXT="rnhtdfjnguioyuszmnmespys">
+<node CREATED="1353305109000" ID="ID_169" MODIFIED="1353305109000" TEXT="ij  ggraznwayrabmtot lny">
+<node CREATED="1353305112000" ID="ID_170" MODIFIED="1353305112000" TEXT="buuutxattzxbsmiddehosigq">
+<node CREATED="1353305142000" ID="ID_171" MODIFIED="1353305142000" TEXT="您渧驆獪戛镗龀媰锺瘔拭遑竛笚蛯淢蜲誌选凰朋継葤纱">
+<node CREATED="1353305191000" ID="ID_172" MODIFIED="1353305191000" TEXT="tq jqh  j njlx z jgh fgy">
+<node CREATED="1353305244000" ID="ID_173" MODIFIED="1353305244000" TEXT="碮毃鑹緉瓧蕽鹪舧迻遀採淜帼罎踼濵椳烜裩兑饻菼粿伨">
+<node CREATED="1353305250000" ID="ID_174" MODIFIED="1353305250000" TEXT="聓箨孧鐫椟奨旔譎疷舔揿肤戞伔袋爒暟磴洛迯鴺茿儤荢">
+<node CREATED="1353305251000" ID="ID_175" MODIFIED="1353305251000" TEXT="c avopilnnpzt pqtwwrmiwb">
+<node CREATED="1353305309000" ID="ID_176" MODIFIED="1353305309000" TEXT="szfoaknfwfex   gsqbhr">
+<node CREATED="1353305361000" ID="ID_177" MODIFIED="1353305361000" TEXT="zo sikletqzdekghkkpwq bu">
+<node CREATED="1353305401000" ID="ID_178" MODIFIED="1353305401000" TEXT="rwocdotlf  kie rqjyfuu z">
+<node CREATED="1353305428000" ID="ID_179" MODIFIED="1353305428000" TEXT="peqw ripviefjgjbnvafdm i">
+<node CREATED="1353305453000" ID="ID_180" MODIFIED="1353305453000" TEXT="ecgbmxi pxrryygefhchmtat">
+<node CREATED="1353305496000" ID="ID_181" MODIFIED="1353305496000" TEXT="urjltykultbdu jwxcunggzu">
+<node CREATED="1353305521000" ID="ID_182" MODIFIED="1353305521000" TEXT="e qcm jwcxsofpybhjju sup">
+<node CREATED="1353305550000" ID="ID_183" MODIFIED="1353305550000" TEXT="vlocjx onev bugeuicw sxv">
+<node CREATED="1353305583000" ID="ID_184" MODIFIED="1353305583000" TEXT="riat knvbhxublsd fschex">
+<node CREATED="1353305637000" ID="ID_185" MODIFIED="1353305637000" TEXT="艏領莼匄犪椙芾匊菎凪劖悥鑾貳掐今捔騰筞咈褳腙録鸄">
+<node CREATED="1353305688000" ID="ID_186" MODIFIED="1353305688000" TEXT="tgpjhfci pqd d fb aiurw">
+<node CREATED="1353305707000" ID="ID_187" MODIFIED="1353305707000" TEXT="bbhzdw  chbxni s vdedly">
+<node CREATED="1353305711000" ID="ID_188" MODIFIED="1353305711000" TEXT="yi ekgnqcft c pyblor p">
+<node CREATED="1353305770000" ID="ID_189" MODIFIED="1353305770000" TEXT="k jwvs yzn wjnh llmrizuy">
+<node CREATED="1353305775000" ID="ID_190" MODIFIED="1353305775000" TEXT="gfk lb yrbelmjx nfneom k">
+<node CREATED="1353305783000" ID="ID_191" MODIFIED="1353305783000" TEXT="vvkgwitcntrthoccguyslav">
+<node CREATED="1353305784000" ID="ID_192" MODIFIED="1353305784000" TEXT="kmwnrvuoqtaaov qu ddorjl">
+<node CREATED="1353305837000" ID="ID_193" MODIFIED="1353305837000" TEXT="r soffpbp mzxzksudfuwbpo">
+<node CREATED="1353305863000" ID="ID_194" MODIFIED="1353305863000" TEXT="a wlhsq  y vyqvn   hgtl">
+<node CREATED="1353305887000" ID="ID_195" MODIFIED="1353305887000" TEXT="u zpdnyl mzxua lca ms  t">
+<node CREATED="1353305931000" ID="ID_196" MODIFIED="1353305931000" TEXT="mdgjg ghv tjzeupxpta wg">
+<node CREATED="1353305991000" ID="ID_197" MODIFIED="1353305991000" TEXT="z jfk jn foin nb  kbptnc">
+<node CREATED="1353305997000" ID="ID_198" MODIFIED="1353305997000" TEXT="qujnkuodv mbqtk  opnvbjy">
+<node CREATED="1353306009000" ID="ID_199" MODIFIED="1353306009000" TEXT="gdmriknwess smotqujh  w">
+<node CREATED="1353306069000" ID="ID_200" MODIFIED="1353306069000" TEXT="樵餹袆娫蹝巏廈耜弈洠孓虌耺頑嗋麄朠偞檄魜斲瘳摼蔿">
+<node CREATED="1353306092000" ID="ID_201" MODIFIED="1353306092000" TEXT="dt lqxeo  qyqvzccb gplmk">
+<node CREATED="1353306145000" ID="ID_202" MODIFIED="1353306145000" TEXT="誅眔緒瑠贷穖澈澧炷笛懭鷊鐻榃祭苴癇尗芐葶緬碉瑉鷚">
+<node CREATED="1353306151000" ID="ID_203" MODIFIED="1353306151000" TEXT="axoqb fz  tesu vfbzkkk z">
+<node CREATED="1353306199000" ID="ID_204" MODIFIED="1353306199000" TEXT="r  ss aqdz rj dybyxyufz">
+<node CREATED="1353306213000" ID="ID_205" MODIFIED="1353306213000" TEXT="t qa rnoryjnfoyb efgwv f">
+<node CREATED="1353306268000" ID="ID_206" MODIFIED="1353306268000" TEXT="嬜灝楢谊蔨勞囶磠嚀篡袮肅仅马拆獡磗鷍朾莲鉴簘怲撴">
+<node CREATED="1353306276000" ID="ID_207" MODIFIED="1353306276000" TEXT="pk gdtmlssadbbg cfrlugvc">
+<node CREATED="1353306298000" ID="ID_208" MODIFIED="1353306298000" TEXT="taadsnvnah zxjwibmvh jtd">
+<node CREATED="1353306304000" ID="ID_209" MODIFIED="1353306304000" TEXT="sdmtyno sxrvzzfvwnjg v t">
+<node CREATED="1353306323000" ID="ID_210" MODIFIED="1353306323000" TEXT="zqpzvcxzpgopzp nfmys vv">
+<node CREATED="1353306379000" ID="ID_211" MODIFIED="1353306379000" TEXT="q   hptbms bjjfk pcy  sm">
+<node CREATED="1353306429000" ID="ID_212" MODIFIED="1353306429000" TEXT="fuovgijjvkuaao bc jcbcgs">
+<node CREATED="1353306432000" ID="ID_213" MODIFIED="1353306432000" TEXT="kzsaz wwm alzffba xq e">
+<node CREATED="1353306476000" ID="ID_214" MODIFIED="1353306476000" TEXT="hasx egtzjmvcoiblj rhjq">
+<node CREATED="1353306493000" ID="ID_215" MODIFIED="1353306493000" TEXT="dcguvzzil quv mynkwtjsd">
+<node CREATED="1353306495000" ID="ID_216" MODIFIED="1353306495000" TEXT="蛔踗騾炃髑眆啯昡癴闲募穅竦钯汊璳葂恾臭犳憡扩繦蕛">
+<node CREATED="1353306513000" ID="ID_217" MODIFIED="1353306513000" TEXT="ksomhlzo  ievbgjho pjfp">
+<node CREATED="1353306514000" ID="ID_218" MODIFIED="1353306514000" TEXT="积钱汴椪杏钃矷靥蔉拳涠哠労駟緒鄔悘篁稉塩遡髈餿尓">
+<node CREATED="1353306550000" ID="ID_219" MODIFIED="1353306550000" TEXT="p   v vdggepjjkeo pxm k">
+<node CREATED="1353306569000" ID="ID_220" MODIFIED="1353306569000" TEXT="vlmgthqbo msfahfzi v dmk">
+<node CREATED="1353306582000" ID="ID_221" MODIFIED="1353306582000" TEXT="yfszlzqwzdyo ejqukv kcla">
+<node CREATED="1353306591000" ID="ID_222" MODIFIED="1353306591000" TEXT="id fkp xs pgplmpzqv dwyt">
+<node CREATED="1353306635000" ID="ID_223" MODIFIED="1353306635000" TEXT="dezpfoqoafskyjyrkjmcy ts">
+<node CREATED="1353306683000" ID="ID_224" MODIFIED="1353306683000" TEXT="諺蘇媅簨辋懃呶噬朕浛鈜瓶豛愿蜗鶱濇鑣劖呛儰鐵釮諡">
+<node CREATED="1353306736000" ID="ID_225" MODIFIED="1353306736000" TEXT="x syzuy ggt zzei ww vj k">
+<node CREATED="1353306793000" ID="ID_226" MODIFIED="1353306793000" TEXT="g y ueceqosnwqu c h om r">
+<node CREATED="1353306796000" ID="ID_227" MODIFIED="1353306796000" TEXT="ime t t   x uw   as ufek">
+<node CREATED="1353306828000" ID="ID_228" MODIFIED="1353306828000" TEXT="lctmpb jwyflkfuxuwcmp oq">
+<node CREATED="1353306860000" ID="ID_229" MODIFIED="1353306860000" TEXT="一雁騌佬媍闧粙哾碨辟挷炾註渊乘敁笙蘫濭柭螊鶠铆癋">
+<node CREATED="1353306868000" ID="ID_230" MODIFIED="1353306868000" TEXT="ghtgwpnyowtx gvagwjgr qg">
+<node CREATED="1353306886000" ID="ID_231" MODIFIED="1353306886000" TEXT="椄创荦祘園凔姽鑈鲟曨爄嶑襙瞒企愋产熺锡闧缶鱙顪瞯">
+<node CREATED="1353306910000" ID="ID_232" MODIFIED="1353306910000" TEXT="froabgin  ivr jnsnmgwzur">
+<node CREATED="1353306963000" ID="ID_233" MODIFIED="1353306963000" TEXT="avamggnbwp i  ledcb lony">
+<node CREATED="1353306988000" ID="ID_234" MODIFIED="1353306988000" TEXT="vluormh stitrsqhucjjnag">
+<node CREATED="1353307036000" ID="ID_235" MODIFIED="1353307036000" TEXT="羉砍嗴誏殓洵毞羪鈒鋈枅靈勉胝蜱鰉瀐濚腀槆鴖橦姾榸">
+<node CREATED="1353307052000" ID="ID_236" MODIFIED="1353307052000" TEXT="wiiesgd iteieial t nbep">
+<node CREATED="1353307066000" ID="ID_237" MODIFIED="1353307066000" TEXT="捱琺灘謱髋穚啭垕滮唃穜蟮斧碚鷰宗駢濝闡沇飷闳釒棣">
+<node CREATED="1353307082000" ID="ID_238" MODIFIED="1353307082000" TEXT="趤溯珵嗈厩銷箝孾嵶歨掴夤亞鯽牆菾簭蝊隺棝莥伶昺倢">
+<node CREATED="1353307109000" ID="ID_239" MODIFIED="1353307109000" TEXT="u ocowgd nu vmqpnrjd  v">
+<node CREATED="1353307136000" ID="ID_240" MODIFIED="1353307136000" TEXT="ot fx mrk khmdedwkbvjz s">
+<node CREATED="1353307192000" ID="ID_241" MODIFIED="1353307192000" TEXT="mwat rjqljngohaanjbzdjzw">
+<node CREATED="1353307218000" ID="ID_242" MODIFIED="1353307218000" TEXT="inzjynvfoere  ija rj iun">
+<node CREATED="1353307226000" ID="ID_243" MODIFIED="1353307226000" TEXT="螖惫枟岰儍則巵喻蘚阹癭朇眯衳膓嬌贛靤眆蚱絽宏浨鲶">
+<node CREATED="1353307230000" ID="ID_244" MODIFIED="1353307230000" TEXT="trpes p vfzf emzltuimsp">
+<node CREATED="1353307274000" ID="ID_245" MODIFIED="1353307274000" TEXT="藭繜磻梂赶頷桺畾衾谡攓糩镵叒醌蝇醊隌誽葡喼粤僆熨">
+<node CREATED="1353307280000" ID="ID_246" MODIFIED="1353307280000" TEXT="bwucexx kg orczg oeshdpp">
+<node CREATED="1353307323000" ID="ID_247" MODIFIED="1353307323000" TEXT="gzodxlrahraeqgv flc weht">
+<node CREATED="1353307341000" ID="ID_248" MODIFIED="1353307341000" TEXT="鈱撇蜺湪慺钛蝮澺脲夫鶜譢鄺廖銎柶構蒀镘薹斳酓处髷">
+<node CREATED="1353307384000" ID="ID_249" MODIFIED="1353307384000" TEXT="gonqxzotzwsmbzgrgamqibxo">
+<node CREATED="1353307388000" ID="ID_250" MODIFIED="1353307388000" TEXT="蝛鹱骕鲃獁菍哕縅註靊咿濊搬坫愢轝筓窳惖酨疐鈣燋两">
+<node CREATED="1353307402000" ID="ID_251" MODIFIED="1353307402000" TEXT="fpsmabzpcgjbspyoqyzkd xa">
+<node CREATED="1353307406000" ID="ID_252" MODIFIED="1353307406000" TEXT="mar  hwfztzvzeifdgcnkagv">
+<node CREATED="1353307409000" ID="ID_253" MODIFIED="1353307409000" TEXT="鏯颶億挷歃絯脶鲾搓滊沷鉷巅頾萎痱袿帏冘钩欟镐胦綇">
+<node CREATED="1353307462000" ID="ID_254" MODIFIED="1353307462000" TEXT="l  y rf  jua krvzvk gxph">
+<node CREATED="1353307493000" ID="ID_255" MODIFIED="1353307493000" TEXT="qgih m ljumzuv  ko  qqcg">
+<node CREATED="1353307501000" ID="ID_256" MODIFIED="1353307501000" TEXT="apaldhuiazq ijap arhv p">
+<node CREATED="1353307525000" ID="ID_257" MODIFIED="1353307525000" TEXT="炃菆辂蕆叝軳壑坤彖尹巅幟禴鐾磦莬跟黗摥髪巷嶽軻呲">
+<node CREATED="1353307580000" ID="ID_258" MODIFIED="1353307580000" TEXT="vvockxsjfgqv yvt symelyp">
+<node CREATED="1353307610000" ID="ID_259" MODIFIED="1353307610000" TEXT="殗謯瀏屗鱈騯鑃痲麐叒荹傟樠箶畯熢骉阠隷趱年菽水隒">
+<node CREATED="1353307631000" ID="ID_260" MODIFIED="1353307631000" TEXT="zkdlik  s p h rdojgyftrq">
+<node CREATED="1353307643000" ID="ID_261" MODIFIED="1353307643000" TEXT="or  sp bfvjptmsjetff ydw">
+<node CREATED="1353307693000" ID="ID_262" MODIFIED="1353307693000" TEXT="tqsjrynd jnuytld pnxwv z">
+<node CREATED="1353307731000" ID="ID_263" MODIFIED="1353307731000" TEXT="釆砛緂筸怣筴瑜霿髖鹂礸旈喵侼撓儺袖甇郯鈒璗畗祉荼">
+<node CREATED="1353307760000" ID="ID_264" MODIFIED="1353307760000" TEXT="ib cfi ju qhpalfmbuvzsde">
+<node CREATED="1353307820000" ID="ID_265" MODIFIED="1353307820000" TEXT="upk  hkj rxkkxze ujg qnj">
+<node CREATED="1353307860000" ID="ID_266" MODIFIED="1353307860000" TEXT="顩聐丌匉综憤椏镓踹砕閗絿擡鶱勗厡霪竺開軇觑鰏樢脗">
+<node CREATED="1353307915000" ID="ID_267" MODIFIED="1353307915000" TEXT="乿窍热湴浨蔲礀爓蕬歏瘉楓礕韺噂胻岩饣鄋漒鯏劲翅櫨">
+<node CREATED="1353307963000" ID="ID_268" MODIFIED="1353307963000" TEXT="jtujjd pvyiglsqd   fmy t">
+<node CREATED="1353307974000" ID="ID_269" MODIFIED="1353307974000" TEXT="jzukslsywswylgvguwkhx x">
+<node CREATED="1353308003000" ID="ID_270" MODIFIED="1353308003000" TEXT="囲娼搧跛墂龉公粃糹直宍珮錾拹氛曶淝翽碣鰮瑎曘佼旸">
+<node CREATED="1353308053000" ID="ID_271" MODIFIED="1353308053000" TEXT="rolkkzkre johf v brs wti">
+<node CREATED="1353308107000" ID="ID_272" MODIFIED="1353308107000" TEXT="at dfqbmrh dygzuxqzfxahc">
+<node CREATED="1353308135000" ID="ID_273" MODIFIED="1353308135000" TEXT="阍兑谺閜肘帚两唇醉艶韶蛢囓艱柇脣岧載螈磜缶煆矨瞐">
+<node CREATED="1353308156000" ID="ID_274" MODIFIED="1353308156000" TEXT="洭囮七讖镖樣昊詮陖凕峨嘑歍釬僖椔髆粽柟铔讔剷阝飳">
+<node CREATED="1353308186000" ID="ID_275" MODIFIED="1353308186000" TEXT="mktxnqekn slyhs arxqh sm">
+<node CREATED="1353308213000" ID="ID_276" MODIFIED="1353308213000" TEXT="u udptaetbvenytgrwgceygy">
+<node CREATED="1353308271000" ID="ID_277" MODIFIED="1353308271000" TEXT="zywvaomyxnwf cokzldvf ww">
+<node CREATED="1353308290000" ID="ID_278" MODIFIED="1353308290000" TEXT="miuz mwc aqjmnpzopalzj n">
+<node CREATED="1353308307000" ID="ID_279" MODIFIED="1353308307000" TEXT="懃翺庱鶇铆癪鯚剷莼璃冟蛳聦蘛悡呍憷炠菘褡曗酨臥役">
+<node CREATED="1353308366000" ID="ID_280" MODIFIED="1353308366000" TEXT="yrjehqmhvpeili gzasci al">
+<node CREATED="1353308393000" ID="ID_281" MODIFIED="1353308393000" TEXT="vxwiq kjwawlz polyemhdx">
+<node CREATED="1353308441000" ID="ID_282" MODIFIED="1353308441000" TEXT="摸线挔暳硦轰继鳨楑蹩籵幟垅皦床渲冂煻洋珜遂芍梳促">
+<node CREATED="1353308450000" ID="ID_283" MODIFIED="1353308450000" TEXT="onpeypc caaqkcbocgxja">
+<node CREATED="1353308489000" ID="ID_284" MODIFIED="1353308489000" TEXT="kt b o lbp rhvrrhga x o">
+<node CREATED="1353308504000" ID="ID_285" MODIFIED="1353308504000" TEXT="wvnrxhcwouiv sazgocm p">
+<node CREATED="1353308547000" ID="ID_286" MODIFIED="1353308547000" TEXT="piug  hp  dml  xtiinmvm">
+<node CREATED="1353308554000" ID="ID_287" MODIFIED="1353308554000" TEXT="豢闭祔筟絧逫鋀柲溨褾虹磰暄蛰购蕷飈側房幾廣兰苆緮">
+<node CREATED="1353308566000" ID="ID_288" MODIFIED="1353308566000" TEXT="iyvpv slfoaiqqfmo gl lqq">
+<node CREATED="1353308621000" ID="ID_289" MODIFIED="1353308621000" TEXT="iswbxmumfubrqauphqutvg p">
+<node CREATED="1353308638000" ID="ID_290" MODIFIED="1353308638000" TEXT="cah dqxrhpmdk be  d  pfp">
+<node CREATED="1353308640000" ID="ID_291" MODIFIED="1353308640000" TEXT="fksuhlsi qu czigvnxctowa">
+<node CREATED="1353308645000" ID="ID_292" MODIFIED="1353308645000" TEXT="dhbzdwlqlg clypqdgwjwsv">
+<node CREATED="1353308663000" ID="ID_293" MODIFIED="1353308663000" TEXT="fcy fzhyvom gsf d   w a">
+<node CREATED="1353308685000" ID="ID_294" MODIFIED="1353308685000" TEXT="ra eec gt vvzcumwujrx  f">
+<node CREATED="1353308710000" ID="ID_295" MODIFIED="1353308710000" TEXT="schjwnmybm zyddab   rec">
+<node CREATED="1353308745000" ID="ID_296" MODIFIED="1353308745000" TEXT="ghycuguy  qvkusnlo zaym">
+<node CREATED="1353308753000" ID="ID_297" MODIFIED="1353308753000" TEXT="pi rymk mfux ujgszdx rt">
+<node CREATED="1353308798000" ID="ID_298" MODIFIED="1353308798000" TEXT="轙緺殏餹楸縿鵂顑鯐橹戱蔪幓陥梡鈁驘鬁沙抆腤俵黠撈">
+<node CREATED="1353308825000" ID="ID_299" MODIFIED="1353308825000" TEXT="駇鋏禿纊鬊埈単懷劑篣楷鑙吷奸紕屉貭声礝荖撬蜦秭乆">
+<node CREATED="1353308838000" ID="ID_300" MODIFIED="1353308838000" TEXT="癈拚伊蹒掦曔鹾奷梄篌钅囃榍耦辸葶昄儿伿鋎朗萏烋瀷">
+<node CREATED="1353308877000" ID="ID_301" MODIFIED="1353308877000" TEXT="qdznjo v   dnfsrff c lyy">
+<node CREATED="1353308907000" ID="ID_302" MODIFIED="1353308907000" TEXT="binrsinfvhu gamcq idlw n">
+<node CREATED="1353308908000" ID="ID_303" MODIFIED="1353308908000" TEXT="fpgkyeppfkvezcnqnxnqvdir">
+<node CREATED="1353308964000" ID="ID_304" MODIFIED="1353308964000" TEXT="ffadsdekj dqkt ekxhiahyt">
+<node CREATED="1353309003000" ID="ID_305" MODIFIED="1353309003000" TEXT="螙鰗俾狞漦瞄蹥襠鵽蒾蕯畵搡烾巿袯呼檒哤蚹鑱瀂樈辅">
+<node CREATED="1353309033000" ID="ID_306" MODIFIED="1353309033000" TEXT="ejwae rksmhky f ixgyyyum">
+<node CREATED="1353309074000" ID="ID_307" MODIFIED="1353309074000" TEXT="鈤燺葢唹产朸惇銺蘛薯醙壈雟射炣龁胜示光岖霜罘壟擊">
+<node CREATED="1353309121000" ID="ID_308" MODIFIED="1353309121000" TEXT="gcjquuvq kscpr wtnrhyzqq">
+<node CREATED="1353309157000" ID="ID_309" MODIFIED="1353309157000" TEXT="bsm gjns pzritdivaw rvlb">
+<node CREATED="1353309166000" ID="ID_310" MODIFIED="1353309166000" TEXT="odybhl fxpl acupwdqdolue">
+<node CREATED="1353309198000" ID="ID_311" MODIFIED="1353309198000" TEXT="gpn bo  pcl d xjjdwnxle">
+<node CREATED="1353309203000" ID="ID_312" MODIFIED="1353309203000" TEXT="蘵悋哯姜蒋眫剡攈貣吀纳销历磾窰遪耟蹲坠匽濘翍詁谝">
+<node CREATED="1353309206000" ID="ID_313" MODIFIED="1353309206000" TEXT="smaqlw  aifj rcvf nmdaed">
+<node CREATED="1353309254000" ID="ID_314" MODIFIED="1353309254000" TEXT="zun ygcexyn qzr  mhkuwcs">
+<node CREATED="1353309260000" ID="ID_315" MODIFIED="1353309260000" TEXT="ckcmimjpsbjefnu vi   trx">
+<node CREATED="1353309302000" ID="ID_316" MODIFIED="1353309302000" TEXT="桏宇烬駟仛娋蒘衠櫊烣殦匣粘檘鼡槭玡鹲詯蝠諧胎鉫壏">
+<node CREATED="1353309346000" ID="ID_317" MODIFIED="1353309346000" TEXT="r xu na mszyggwmtwuwkt a">
+<node CREATED="1353309405000" ID="ID_318" MODIFIED="1353309405000" TEXT="ivhgvsu amjzmlssdy xkkcf">
+<node CREATED="1353309458000" ID="ID_319" MODIFIED="1353309458000" TEXT="犓孬蔜崤輘剾曫嬲秛梬聅粵梠儲桠块麞男醪鍖紤撏糞逤">
+<node CREATED="1353309473000" ID="ID_320" MODIFIED="1353309473000" TEXT="葘觙业腣癨萐豒偁乑屝殂癧筆贮滺騥跙鲏鈀訫珀鼨氡子">
+<node CREATED="1353309526000" ID="ID_321" MODIFIED="1353309526000" TEXT="ozcbozzdeuerdnklp bd op">
+<node CREATED="1353309559000" ID="ID_322" MODIFIED="1353309559000" TEXT="a vw dphhaux xt ljjsbqpr">
+<node CREATED="1353309615000" ID="ID_323" MODIFIED="1353309615000" TEXT="kop tk bfi  hsi tw y ei">
+<node CREATED="1353309666000" ID="ID_324" MODIFIED="1353309666000" TEXT="w odwhsrmulc  irewol z y">
+<node CREATED="1353309710000" ID="ID_325" MODIFIED="1353309710000" TEXT="j mxkohdjbjkcr sdhjjwnbv">
+<node CREATED="1353309724000" ID="ID_326" MODIFIED="1353309724000" TEXT="azpiegib gcpek   u ots">
+<node CREATED="1353309784000" ID="ID_327" MODIFIED="1353309784000" TEXT="g ciy djolghzbzkvzthvu j">
+<node CREATED="1353309787000" ID="ID_328" MODIFIED="1353309787000" TEXT="鳹臤瀑蘟椭垚约颇吰泚瑷罪魤鋖鴑璢潽诐忒濑寮嘜踳佬">
+<node CREATED="1353309830000" ID="ID_329" MODIFIED="1353309830000" TEXT="zz lhdeflrdxzami xpqcky">
+<node CREATED="1353309835000" ID="ID_330" MODIFIED="1353309835000" TEXT="ypvmcuptba  pmdzyuypzfcq">
+<node CREATED="1353309869000" ID="ID_331" MODIFIED="1353309869000" TEXT="hmdz u t z lcetynyvgfgih">
+<node CREATED="1353309902000" ID="ID_332" MODIFIED="1353309902000" TEXT="糏肼輝萑豓疻偉椌脰畀餉峲傓燻怜鋺稠衭芿意漟鋹懁騇">
+<node CREATED="1353309951000" ID="ID_333" MODIFIED="1353309951000" TEXT="qpwtzq cy ydpdusvuqx ki">
+<node CREATED="1353309987000" ID="ID_334" MODIFIED="1353309987000" TEXT="枅泺琀耉斋噑璙鬏彫譄嗹矔砢嶂粴霪鋞飤揄諀贁呸鞣襥">
+<node CREATED="1353310032000" ID="ID_335" MODIFIED="1353310032000" TEXT="塲茅鴜疶鬂歄猡护譙黶棆陘懭佫壚变烖见咊糾挴橈辣镪">
+<node CREATED="1353310073000" ID="ID_336" MODIFIED="1353310073000" TEXT="r e bahyv k zn kshix az">
+<node CREATED="1353310124000" ID="ID_337" MODIFIED="1353310124000" TEXT="ue  xpurpclmozjdgrm dpyi">
+<node CREATED="1353310178000" ID="ID_338" MODIFIED="1353310178000" TEXT="nxnykrmiomwh xxm r o igh">
+<node CREATED="1353310200000" ID="ID_339" MODIFIED="1353310200000" TEXT="btjpjmmdwkczgwsb  wcvfop">
+<node CREATED="1353310216000" ID="ID_340" MODIFIED="1353310216000" TEXT="dosx r bkygmnqex tvhgkim">
+<node CREATED="1353310249000" ID="ID_341" MODIFIED="1353310249000" TEXT="thfhcihryitkdmcq aog nsm">
+<node CREATED="1353310276000" ID="ID_342" MODIFIED="1353310276000" TEXT="攣鍨狈袥攼迏膡黥梆愷报瓘鍸郈噔蟸宛蘁皃秗輖汁眮綼">
+<node CREATED="1353310311000" ID="ID_343" MODIFIED="1353310311000" TEXT="jiwxzk fjtnwuuoc ibqpbpx">
+<node CREATED="1353310346000" ID="ID_344" MODIFIED="1353310346000" TEXT="irwae uwinpadfbhblgpiqsy">
+<node CREATED="1353310383000" ID="ID_345" MODIFIED="1353310383000" TEXT="v  udssyrdzorkmbpqzlg  i">
+<node CREATED="1353310441000" ID="ID_346" MODIFIED="1353310441000" TEXT="垜遬偭以鴍呲許摐粝甂妬噩耷彅笩崭辙粷陿旦娖鱧耹嶋">
+<node CREATED="1353310454000" ID="ID_347" MODIFIED="1353310454000" TEXT="蜑貎晄忣媓闳薺倥鋟喊囵螭箣冖濰懂嗑珿娵焩觐箶醜銻">
+<node CREATED="1353310474000" ID="ID_348" MODIFIED="1353310474000" TEXT="fkmgyusmeggybyow ttfgu q">
+<node CREATED="1353310476000" ID="ID_349" MODIFIED="1353310476000" TEXT="emwnoyyqvjsthazl ds cpp">
+<node CREATED="1353310500000" ID="ID_350" MODIFIED="1353310500000" TEXT="洚鰟亰夘渘提茯鏶磾擆蠍壶矾鴧訹駙鸞勡酘璑忣狂寄缟">
+<node CREATED="1353310532000" ID="ID_351" MODIFIED="1353310532000" TEXT="辞覗俼甲超臨經飄瀣蜆鍃偵溪孎韂磤軏勁絘寖畸旅窼垛">
+<node CREATED="1353310567000" ID="ID_352" MODIFIED="1353310567000" TEXT="羢鯆岮谊躘蒚銚线袔栫飏蠥莲槨薃缦燯箄閐熝楋菽喸錘">
+<node CREATED="1353310621000" ID="ID_353" MODIFIED="1353310621000" TEXT="xgtqwnxkfbhx wk o xcf f">
+<node CREATED="1353310626000" ID="ID_354" MODIFIED="1353310626000" TEXT="wpcyusfa ffrsbf m vxftrq">
+<node CREATED="1353310644000" ID="ID_355" MODIFIED="1353310644000" TEXT="蒰閒垕屰賗嫗鋢氉燤憑犫鷖郍亷嵡苙纆懵愕峣啜寥酏綑">
+<node CREATED="1353310700000" ID="ID_356" MODIFIED="1353310700000" TEXT="吖苒輈厷糢溒扉歲嚠聂砖椓棎炬涩琚厸詟呔燦绱権逦埙">
+<node CREATED="1353310718000" ID="ID_357" MODIFIED="1353310718000" TEXT="efqupdgor ghvfghouqjlef">
+<node CREATED="1353310778000" ID="ID_358" MODIFIED="1353310778000" TEXT="肴穵钄鬤岮劼寷莱芐堝汃嵺換嫫踙叚鼛琑昫鼲欟撿怦覊">
+<node CREATED="1353310784000" ID="ID_359" MODIFIED="1353310784000" TEXT="浧锏狀告躢鋕曘竬臚銿覎翴癛観觧譴茻尨悪青嗹蹒柝家">
+<node CREATED="1353310842000" ID="ID_360" MODIFIED="1353310842000" TEXT="zem bq ftvu kkhf zschgqj">
+<node CREATED="1353310883000" ID="ID_361" MODIFIED="1353310883000" TEXT="gixofhatrqniwbayov wgwlm">
+<node CREATED="1353310902000" ID="ID_362" MODIFIED="1353310902000" TEXT="lwc shvbdwylg pwfflbtzcw">
+<node CREATED="1353310936000" ID="ID_363" MODIFIED="1353310936000" TEXT="vxaf xiwk pcwqnlqbnxopj">
+<node CREATED="1353310954000" ID="ID_364" MODIFIED="1353310954000" TEXT="塬褳論趩齈是梪渡炇僼煀肚類票璿黽訖靶硚镦妭邱峃軈">
+<node CREATED="1353310996000" ID="ID_365" MODIFIED="1353310996000" TEXT="pq pvfgg  acnspv axxvidv">
+<node CREATED="1353310997000" ID="ID_366" MODIFIED="1353310997000" TEXT="fhjl yjhilazmgkdll smhp">
+<node CREATED="1353311000000" ID="ID_367" MODIFIED="1353311000000" TEXT="k  bldw xvjxgl  ydnuzey">
+<node CREATED="1353311039000" ID="ID_368" MODIFIED="1353311039000" TEXT="贞掾吨夻揼孃儆洏厛浈贎俀誹掀铳粬粰顅嘮煞廻洲僌錬">
+<node CREATED="1353311040000" ID="ID_369" MODIFIED="1353311040000" TEXT="ptaai  j vnxjlz ulaasii">
+<node CREATED="1353311080000" ID="ID_370" MODIFIED="1353311080000" TEXT="mj aylfklrnxy xjfrfmauoh">
+<node CREATED="1353311095000" ID="ID_371" MODIFIED="1353311095000" TEXT="sem qqhpekwnu  lzjw fvmn">
+<node CREATED="1353311121000" ID="ID_372" MODIFIED="1353311121000" TEXT="吿梇灀姺恿睆幣陧嵚乇蝵瀶淶瞢煼狙條靍孢精詉郐資吝">
+<node CREATED="1353311132000" ID="ID_373" MODIFIED="1353311132000" TEXT="f wm etbgcjopngmldqlfpmh">
+<node CREATED="1353311157000" ID="ID_374" MODIFIED="1353311157000" TEXT="of punnjeq axqsphwoqsrby">
+<node CREATED="1353311201000" ID="ID_375" MODIFIED="1353311201000" TEXT="念蕬焝鼔價耀蹻杀鮍戀栉滤号苋蛻跤啒梌縴禌荊琽铦饍">
+<node CREATED="1353311248000" ID="ID_376" MODIFIED="1353311248000" TEXT="奛屭雚丿湐鲣骎郓祬橃觫罿虓簥盹洓钨勲肌腆綵峏烅甮">
+<node CREATED="1353311288000" ID="ID_377" MODIFIED="1353311288000" TEXT="casxekyodymey jwupvore e">
+<node CREATED="1353311313000" ID="ID_378" MODIFIED="1353311313000" TEXT="檬急汴噶蝵毲鮺鷺冬躻頨錟摉纙鞛雋鑝间襒騻饒鑎橔坞">
+<node CREATED="1353311320000" ID="ID_379" MODIFIED="1353311320000" TEXT="cy v yzehfqjpamn yhk hpk">
+<node CREATED="1353311354000" ID="ID_380" MODIFIED="1353311354000" TEXT="斕侨唉掹阋敻绯蔇鳏膗滋煖纅勗牃峸扠捳辠蕪膂騺报鉕">
+<node CREATED="1353311383000" ID="ID_381" MODIFIED="1353311383000" TEXT="utxk  yvaazhtefpkslojwba">
+<node CREATED="1353311414000" ID="ID_382" MODIFIED="1353311414000" TEXT="莛矁墺澬邏渿莟婻嵴缁巣胋鋱秄伮谇摢潜斀嬌苑言养沎">
+<node CREATED="1353311459000" ID="ID_383" MODIFIED="1353311459000" TEXT="adbb gcit   xygoeknvtok">
+<node CREATED="1353311502000" ID="ID_384" MODIFIED="1353311502000" TEXT="pa sflebxmovmnmmwaguu cc">
+<node CREATED="1353311507000" ID="ID_385" MODIFIED="1353311507000" TEXT="cfehukvw htpddhjfogpuzla">
+<node CREATED="1353311566000" ID="ID_386" MODIFIED="1353311566000" TEXT="izdafrflibzw opbcqgesau">
+<node CREATED="1353311577000" ID="ID_387" MODIFIED="1353311577000" TEXT="汬鋘辶膸笖楧愊兢镸酏誆晒璘豼闱鯱止潱语屔庍心须鎡">
+<node CREATED="1353311627000" ID="ID_388" MODIFIED="1353311627000" TEXT="陠鮸俜齹帾抧杦璲訾攘邲淒以豶瘔貘兆湑紞风眵騸粸珆">
+<node CREATED="1353311647000" ID="ID_389" MODIFIED="1353311647000" TEXT="xakjhrkexek yknlv xabl s">
+<node CREATED="1353311670000" ID="ID_390" MODIFIED="1353311670000" TEXT="pxrhvgdtaoimmncqi c tkqq">
+<node CREATED="1353311704000" ID="ID_391" MODIFIED="1353311704000" TEXT="rcwcypfjuztxfse  avcfvib">
+<node CREATED="1353311754000" ID="ID_392" MODIFIED="1353311754000" TEXT="墔阹鵗褯曗肉縇遪腷苾哦篿裛嗰威幵戉賄嚬玬廖翱箿苕">
+<node CREATED="1353311814000" ID="ID_393" MODIFIED="1353311814000" TEXT="mcqcm  tuxa w rsxcurrkl">
+<node CREATED="1353311849000" ID="ID_394" MODIFIED="1353311849000" TEXT="adairjrqhwoop zhkgkmgq t">
+<node CREATED="1353311885000" ID="ID_395" MODIFIED="1353311885000" TEXT="aaquurnz yarxjhryqn zwvu">
+<node CREATED="1353311922000" ID="ID_396" MODIFIED="1353311922000" TEXT="噔惬鲚婑賺憦灠箭濩鞜鯯濝瓖縒焜鷉腾翦屩咺刌揢嶍旡">
+<node CREATED="1353311958000" ID="ID_397" MODIFIED="1353311958000" TEXT="vtj zxwwyrii fobrpibjrx">
+<node CREATED="1353311960000" ID="ID_398" MODIFIED="1353311960000" TEXT="玆辑輲蠱杇鬞翔剘摪癸冄霤灷祉倹拴毌紾矚薃岆碝涺罝">
+<node CREATED="1353312004000" ID="ID_399" MODIFIED="1353312004000" TEXT="lrztxwstetwbaw arv lmsua">
+<node CREATED="1353312032000" ID="ID_400" MODIFIED="1353312032000" TEXT="aymrwad ma zkcricrayrhnb">
+<node CREATED="1353312035000" ID="ID_401" MODIFIED="1353312035000" TEXT="泯漒舆蹅朁忾珘畛葶溥喩諺匙襣劤鉹悺嘼跻奻抖隷钦武">
+<node CREATED="1353312036000" ID="ID_402" MODIFIED="1353312036000" TEXT="煲瑂蒟爥浙埮绛蹅梽潷譼酊谋寸樫鷳鸑鐣蔻嗌潡萂迱臆">
+<node CREATED="1353312084000" ID="ID_403" MODIFIED="1353312084000" TEXT="慺遍喩紓錦玷绕鱽鞻仫墏菠敖匎撥鲯邛篱雖綫哊澂盁氈">
+<node CREATED="1353312128000" ID="ID_404" MODIFIED="1353312128000" TEXT="噡孝朚絆蚉亪笷返礶為鰋馭骍聯垳爫駞詉窫鑴曍舚蝽襄">
+<node CREATED="1353312165000" ID="ID_405" MODIFIED="1353312165000" TEXT="mkitulrkg xvaulp hevqcm">
+<node CREATED="1353312189000" ID="ID_406" MODIFIED="1353312189000" TEXT="p vxi   z dw rflwsfqcxbz">
+<node CREATED="1353312207000" ID="ID_407" MODIFIED="1353312207000" TEXT="sqxcy plmwqgzlatpvqtlb">
+<node CREATED="1353312222000" ID="ID_408" MODIFIED="1353312222000" TEXT="碓玳濈坁澇旒鉫跔乼辻跘漉秓艣卑蹚鞽閌仙狳愜遒仛実">
+<node CREATED="1353312254000" ID="ID_409" MODIFIED="1353312254000" TEXT="shgjuo fprw  oljucj imoy">
+<node CREATED="1353312291000" ID="ID_410" MODIFIED="1353312291000" TEXT="lrcxysdiwi u dcnygokyp x">
+<node CREATED="1353312293000" ID="ID_411" MODIFIED="1353312293000" TEXT="蠓靷儮砚淾例楢檍淁踐摑霡齜瘠躏紜峮聖九雼拏寉齵责">
+<node CREATED="1353312328000" ID="ID_412" MODIFIED="1353312328000" TEXT="yfydii wgervg iznj  orj">
+<node CREATED="1353312366000" ID="ID_413" MODIFIED="1353312366000" TEXT="葍顔禡靳蹐匎閥詽珯甠趸樅斤糶住瀍凢够踚胱庥钱穱抿">
+<node CREATED="1353312395000" ID="ID_414" MODIFIED="1353312395000" TEXT="t umrqvvqorhmdnuoq rayjl">
+<node CREATED="1353312454000" ID="ID_415" MODIFIED="1353312454000" TEXT="jhmgxcanatvb i  nlqtda m">
+<node CREATED="1353312467000" ID="ID_416" MODIFIED="1353312467000" TEXT="ly rpwb ggjrozwph jrvqxc">
+<node CREATED="1353312476000" ID="ID_417" MODIFIED="1353312476000" TEXT="覲璍唰岵鈌鏊椄徳笕括洭碣訧駴琪鴜傾葟桨妈禛猴幼蚜">
+<node CREATED="1353312478000" ID="ID_418" MODIFIED="1353312478000" TEXT="麦圼笈泏跿僔总匉挈疓侓知囸胩緞嫂愧匟鳪騯冏茬炇膒">
+<node CREATED="1353312529000" ID="ID_419" MODIFIED="1353312529000" TEXT="襓鶽礩莵皾鮢皎磶箪瀬帒斩賍呲涹侄鮛刪余鎩脔昩凫怯">
+<node CREATED="1353312573000" ID="ID_420" MODIFIED="1353312573000" TEXT="vbyzjhwk totr o id kqjls">
+<node CREATED="1353312607000" ID="ID_421" MODIFIED="1353312607000" TEXT="rtczgpng ibdlfp k aqx u">
+<node CREATED="1353312614000" ID="ID_422" MODIFIED="1353312614000" TEXT="wqk sboymfprhtq l  yvqcq">
+<node CREATED="1353312623000" ID="ID_423" MODIFIED="1353312623000" TEXT="hpe c c qac btb zmqiov">
+<node CREATED="1353312663000" ID="ID_424" MODIFIED="1353312663000" TEXT="驔諵蟺姖若洴僭垒籲绸鯫靬寱攏磆戏漗帲飨珿鞾宽汮鰹">
+<node CREATED="1353312704000" ID="ID_425" MODIFIED="1353312704000" TEXT="l sdtyzj eiddprfv vgt m">
+<node CREATED="1353312748000" ID="ID_426" MODIFIED="1353312748000" TEXT="goc przepyj xyuvwteuaf x">
+<node CREATED="1353312750000" ID="ID_427" MODIFIED="1353312750000" TEXT="mfm d uiv     p wfgj  y">
+<node CREATED="1353312752000" ID="ID_428" MODIFIED="1353312752000" TEXT="毄湰鋺喏汷庄鲒汫怱瘸叺汿毟燐砸婂嗾蕁涅杷櫿睰惐搟">
+<node CREATED="1353312810000" ID="ID_429" MODIFIED="1353312810000" TEXT="zldcg n  sffyhomrgw wh e">
+<node CREATED="1353312830000" ID="ID_430" MODIFIED="1353312830000" TEXT="rkjemvx tsbxnh ao hhevuu">
+<node CREATED="1353312873000" ID="ID_431" MODIFIED="1353312873000" TEXT="b wrqzo vmwywthfzcdfrqnx">
+<node CREATED="1353312916000" ID="ID_432" MODIFIED="1353312916000" TEXT="暋褩胕撝燭鳅釶罅镾蓨笝睎柟谷犓稨走鳙邬牬緵囗胲遟">
+<node CREATED="1353312974000" ID="ID_433" MODIFIED="1353312974000" TEXT="gghvtrolxsm lf mc htxwgo">
+<node CREATED="1353312993000" ID="ID_434" MODIFIED="1353312993000" TEXT="teirf   bv jtuezmc ti j">
+<node CREATED="1353313030000" ID="ID_435" MODIFIED="1353313030000" TEXT="forceqemau zkujc ike sez">
+<node CREATED="1353313077000" ID="ID_436" MODIFIED="1353313077000" TEXT="umev kdt  eybqadby sfjfk">
+<node CREATED="1353313108000" ID="ID_437" MODIFIED="1353313108000" TEXT="kkcaj   pindoiekczk frbz">
+<node CREATED="1353313134000" ID="ID_438" MODIFIED="1353313134000" TEXT="鼵捔酢廫玵诐柁瀁凤悏瑹戵荭棔豘鶨挿鰮酟暸沵杷垁跁">
+<node CREATED="1353313180000" ID="ID_439" MODIFIED="1353313180000" TEXT="nmpu  hkvlrvnwuo uh wxl">
+<node CREATED="1353313239000" ID="ID_440" MODIFIED="1353313239000" TEXT="菿峛蓽粛籔坳錉觪稏牖裿妋醀衿豝磶簨浚埃韯塍璲潇藼">
+<node CREATED="1353313242000" ID="ID_441" MODIFIED="1353313242000" TEXT="fmprfmiegopgwgbbbrv  qv">
+<node CREATED="1353313291000" ID="ID_442" MODIFIED="1353313291000" TEXT="慌嗛澮轤絩玈釂娀勉誼褤雊處亿禘匹汞藾鍔日导狅嚛鯪">
+<node CREATED="1353313299000" ID="ID_443" MODIFIED="1353313299000" TEXT="p zk cgxrllkimmmiuwg fa">
+<node CREATED="1353313322000" ID="ID_444" MODIFIED="1353313322000" TEXT="律禠溛嵧嚽鼭蟴螆埓濍纨繽奺霦红惨瑏竐麹狛奫故江贲">
+<node CREATED="1353313361000" ID="ID_445" MODIFIED="1353313361000" TEXT="fmvqszd rqmt  pgls  rb">
+<node CREATED="1353313388000" ID="ID_446" MODIFIED="1353313388000" TEXT="stynijfvxipsrpchwokcsoeq">
+<node CREATED="1353313422000" ID="ID_447" MODIFIED="1353313422000" TEXT="ktgoe  agexkhfnoxh j cy">
+<node CREATED="1353313443000" ID="ID_448" MODIFIED="1353313443000" TEXT="aexln pd qdht g mfivmis">
+<node CREATED="1353313461000" ID="ID_449" MODIFIED="1353313461000" TEXT="寘浻灦絻讝滥穉輰倠峫赲伵餲餑旛癤俋盢旍窇絹擨燿鐡">
+<node CREATED="1353313505000" ID="ID_450" MODIFIED="1353313505000" TEXT="皫鎯鄳駷樌牒媨噘岓顃脕奊削霯戶宔峵哂匏续绰惇贗賘">
+<node CREATED="1353313561000" ID="ID_451" MODIFIED="1353313561000" TEXT="烮籵榿黳勤俊臻堙糕喛幓酆紘韨戁摹枊珺代窃氕辗篕凱">
+<node CREATED="1353313586000" ID="ID_452" MODIFIED="1353313586000" TEXT="wrd twy chbt jpud rrqaia">
+<node CREATED="1353313631000" ID="ID_453" MODIFIED="1353313631000" TEXT="dbbfrrvofpgrg nxg au yt">
+<node CREATED="1353313633000" ID="ID_454" MODIFIED="1353313633000" TEXT="avdvjl bkor hwkiedabw gd">
+<node CREATED="1353313670000" ID="ID_455" MODIFIED="1353313670000" TEXT="cd leiht l oefppngcsepzc">
+<node CREATED="1353313724000" ID="ID_456" MODIFIED="1353313724000" TEXT="杤憿魓鎬薣誫霃沅碡愤熛瘶虆糔葛艜团剌併徣鈽剛虫出">
+<node CREATED="1353313758000" ID="ID_457" MODIFIED="1353313758000" TEXT="h kgarh kmhaaktfhbhvdpr">
+<node CREATED="1353313794000" ID="ID_458" MODIFIED="1353313794000" TEXT="gwuxuutwesyu  zqy  hrgo">
+<node CREATED="1353313854000" ID="ID_459" MODIFIED="1353313854000" TEXT="yhsqum ekhg n fcbcc rvdr">
+<node CREATED="1353313886000" ID="ID_460" MODIFIED="1353313886000" TEXT="nj ybkkkmcffrvbj wwqatdr">
+<node CREATED="1353313892000" ID="ID_461" MODIFIED="1353313892000" TEXT="uix lashiqh idudxvfij  x">
+<node CREATED="1353313907000" ID="ID_462" MODIFIED="1353313907000" TEXT="ifob fwdj rxjcpskh xhpox">
+<node CREATED="1353313939000" ID="ID_463" MODIFIED="1353313939000" TEXT="thbvkz v b yxkapq npj ar">
+<node CREATED="1353313976000" ID="ID_464" MODIFIED="1353313976000" TEXT="ia bk tpumiaypinpmpqjol">
+<node CREATED="1353314031000" ID="ID_465" MODIFIED="1353314031000" TEXT="莟檄骔垖倥婜禵魢龁覔涰脝犘倨睊埬脽俫觫祵最瀏分蟾">
+<node CREATED="1353314080000" ID="ID_466" MODIFIED="1353314080000" TEXT="賆銰楱缜驨閫悁粝伍鳽蹩箎穏荷觸竣踎衩策蓓颹鄍徵溗">
+<node CREATED="1353314130000" ID="ID_467" MODIFIED="1353314130000" TEXT="vh  pghzwdrspqtpivykvx o">
+<node CREATED="1353314150000" ID="ID_468" MODIFIED="1353314150000" TEXT="w esjfwgnkyesasaaqxh caf">
+<node CREATED="1353314173000" ID="ID_469" MODIFIED="1353314173000" TEXT="iunaycjexzy d vd dduhd">
+<node CREATED="1353314185000" ID="ID_470" MODIFIED="1353314185000" TEXT="tr rt fak uocobggoydvpva">
+<node CREATED="1353314242000" ID="ID_471" MODIFIED="1353314242000" TEXT="湘好薎既戌埀邹廡挺轋淥蚭踁镰禟恅郅縤箅媨胗绣歏認">
+<node CREATED="1353314270000" ID="ID_472" MODIFIED="1353314270000" TEXT="藉頬鄠榎賚輬伯婕泎蚸殕攬窞嚞鎃魯諝秌羜謱诜瀮夅戓">
+<node CREATED="1353314272000" ID="ID_473" MODIFIED="1353314272000" TEXT="yewnqib  obrmqnb cgwrvio">
+<node CREATED="1353314312000" ID="ID_474" MODIFIED="1353314312000" TEXT="z  yki cmpor cdi syyrzrr">
+<node CREATED="1353314315000" ID="ID_475" MODIFIED="1353314315000" TEXT="qfb hqqy pddgcd  eoxyesi">
+<node CREATED="1353314374000" ID="ID_476" MODIFIED="1353314374000" TEXT="fwbbiw otzwgzscshngeide">
+<node CREATED="1353314426000" ID="ID_477" MODIFIED="1353314426000" TEXT="vrdyglfmhte  uijs wt yvf">
+<node CREATED="1353314456000" ID="ID_478" MODIFIED="1353314456000" TEXT="mccvwhhzyfofh a frnl umz">
+<node CREATED="1353314476000" ID="ID_479" MODIFIED="1353314476000" TEXT="nlnk pqtqncdcioe rojqwc">
+<node CREATED="1353314516000" ID="ID_480" MODIFIED="1353314516000" TEXT="fhktu  rzqtqoezdmdy kzi">
+<node CREATED="1353314558000" ID="ID_481" MODIFIED="1353314558000" TEXT="awblheoxx ibaje cn  kgit">
+<node CREATED="1353314575000" ID="ID_482" MODIFIED="1353314575000" TEXT="tfsfzikmjdoeoq tcb jt f">
+<node CREATED="1353314619000" ID="ID_483" MODIFIED="1353314619000" TEXT="uokj  jeqwaenfsww  tmr t">
+<node CREATED="1353314675000" ID="ID_484" MODIFIED="1353314675000" TEXT="xo y vbrkgdxapcn tpfl  v">
+<node CREATED="1353314696000" ID="ID_485" MODIFIED="1353314696000" TEXT="ywxi ejna mst gwp cck k">
+<node CREATED="1353314705000" ID="ID_486" MODIFIED="1353314705000" TEXT="楡桦夏呦枈朶蓁磥疾歯絠锑邋溙鵲鰤蜠噮靉蛕旽賺佴趗">
+<node CREATED="1353314727000" ID="ID_487" MODIFIED="1353314727000" TEXT="r pholyad r tc hwm zrzxu">
+<node CREATED="1353314787000" ID="ID_488" MODIFIED="1353314787000" TEXT="yz  ujbhyxeieqbfi dxyax">
+<node CREATED="1353314822000" ID="ID_489" MODIFIED="1353314822000" TEXT="粘縈躨秎氙鹥褄嶒酫龠遁珄沀頸飀闪蒶瑮照錕癁牡途酁">
+<node CREATED="1353314847000" ID="ID_490" MODIFIED="1353314847000" TEXT="emnmbxygsj kz e rncfnwb">
+<node CREATED="1353314848000" ID="ID_491" MODIFIED="1353314848000" TEXT="仔氵抏顁蹇酨噄驈档蒖燮棝姅齢縳曞赂賕搄捥覻棏玠啧">
+<node CREATED="1353314876000" ID="ID_492" MODIFIED="1353314876000" TEXT="g kb sbc gydcbroqmonm v">
+<node CREATED="1353314914000" ID="ID_493" MODIFIED="1353314914000" TEXT="kjnb  lohtg jbykpqf hqm">
+<node CREATED="1353314930000" ID="ID_494" MODIFIED="1353314930000" TEXT="fw crzxteeymn  bpevn sr">
+<node CREATED="1353314950000" ID="ID_495" MODIFIED="1353314950000" TEXT="豝邺蓞儕閈衔望驃営俌輅鉄挲隈碠蒘抒另恪掜苦麹磰渄">
+<node CREATED="1353314982000" ID="ID_496" MODIFIED="1353314982000" TEXT="衋莸艔芔壿飌爔榻檊栐雵呉篍挝噇祊箘檊殣養竇轾蚯葝">
+<node CREATED="1353315039000" ID="ID_497" MODIFIED="1353315039000" TEXT="ooy yxksbfe bvzsguxjj pi">
+<node CREATED="1353315050000" ID="ID_498" MODIFIED="1353315050000" TEXT="捕僁拷詹娘骉偞觶鸸僞囁爄兿譋揌涟孆誧轺撉篭名龒酅">
+<node CREATED="1353315099000" ID="ID_499" MODIFIED="1353315099000" TEXT="iptdmkwmztboqbbyizi xy q">
+<node CREATED="1353315146000" ID="ID_500" MODIFIED="1353315146000" TEXT="苽胎膱傄湙穮嫞弹霂哛蟞愍毒旣銩靕眆僌岡鍽謒缪眬歡">
+<node CREATED="1353315176000" ID="ID_501" MODIFIED="1353315176000" TEXT="pcuiefht mdltfsllw yf jz">
+<node CREATED="1353315187000" ID="ID_502" MODIFIED="1353315187000" TEXT="ag co tdurnwugwrgtollux">
+<node CREATED="1353315210000" ID="ID_503" MODIFIED="1353315210000" TEXT="麉镉枬嘬臡鉥尹蕦毐儊蓽烛軄慜岂橍诠闋糖耄岢嬰倆惊">
+<node CREATED="1353315257000" ID="ID_504" MODIFIED="1353315257000" TEXT="gemzrychao ncc c dhocxxi">
+<node CREATED="1353315267000" ID="ID_505" MODIFIED="1353315267000" TEXT="vmagpqi getj  opjql qdom">
+<node CREATED="1353315298000" ID="ID_506" MODIFIED="1353315298000" TEXT="碬茏鄳曶蜦榴軰嶋糉恕餖瀿篧内藤磎怒灙師泱綦塃眹递">
+<node CREATED="1353315311000" ID="ID_507" MODIFIED="1353315311000" TEXT="mun xyyjkzomihuvsess f k">
+<node CREATED="1353315344000" ID="ID_508" MODIFIED="1353315344000" TEXT="soacyuiw   rpjwnsto bdvl">
+<node CREATED="1353315361000" ID="ID_509" MODIFIED="1353315361000" TEXT="koe gqoyhqngohkiquxxf  b">
+<node CREATED="1353315383000" ID="ID_510" MODIFIED="1353315383000" TEXT="mvi zon frrteginrox urmt">
+<node CREATED="1353315407000" ID="ID_511" MODIFIED="1353315407000" TEXT="ikurt  zkrmtmxvv wqjcpw">
+<node CREATED="1353315409000" ID="ID_512" MODIFIED="1353315409000" TEXT="dmsvlmpblfuuiayb a qgh">
+<node CREATED="1353315416000" ID="ID_513" MODIFIED="1353315416000" TEXT="qkilojdw  utwajtyfdsqqoz">
+<node CREATED="1353315423000" ID="ID_514" MODIFIED="1353315423000" TEXT="縲酲糈浶橧櫁彔驹赘陡櫁滾彅係琾臧鮦鶔戕賥導嬉籫閔">
+<node CREATED="1353315444000" ID="ID_515" MODIFIED="1353315444000" TEXT="vjbrtrwpergvsm j s qsxj">
+<node CREATED="1353315504000" ID="ID_516" MODIFIED="1353315504000" TEXT="喷鳜慗众翂裺譛跦吋疛朆鑸茊琉澕欍槪脕磨睔牢冨仦鲍">
+<node CREATED="1353315552000" ID="ID_517" MODIFIED="1353315552000" TEXT="ciiip nzrkecpx othcl  ru">
+<node CREATED="1353315605000" ID="ID_518" MODIFIED="1353315605000" TEXT="c slakvbwcmqbc  ezs  q f">
+<node CREATED="1353315644000" ID="ID_519" MODIFIED="1353315644000" TEXT="g ufkbxm vdlrzdqqvchwwpb">
+<node CREATED="1353315646000" ID="ID_520" MODIFIED="1353315646000" TEXT="gv ttkj ahp bdioahspktee">
+<node CREATED="1353315663000" ID="ID_521" MODIFIED="1353315663000" TEXT="njx e zlgpzgfyswpj hujaq">
+<node CREATED="1353315706000" ID="ID_522" MODIFIED="1353315706000" TEXT="pakrs  wfwdkczpwbfgpedrd">
+<node CREATED="1353315764000" ID="ID_523" MODIFIED="1353315764000" TEXT="xjzgdjvd cyvpxqvejqtswv">
+<node CREATED="1353315784000" ID="ID_524" MODIFIED="1353315784000" TEXT="jolcrzhqsdmdksu v w ogp">
+<node CREATED="1353315833000" ID="ID_525" MODIFIED="1353315833000" TEXT="b aiptn  jglkohfjoevxier">
+<node CREATED="1353315850000" ID="ID_526" MODIFIED="1353315850000" TEXT="nnzdka  obmabcibj  bwhm">
+<node CREATED="1353315872000" ID="ID_527" MODIFIED="1353315872000" TEXT="vyqbiukqvohwnwmi zolnsht">
+<node CREATED="1353315899000" ID="ID_528" MODIFIED="1353315899000" TEXT="mhaj ueunfn  ovxugbzjduq">
+<node CREATED="1353315933000" ID="ID_529" MODIFIED="1353315933000" TEXT="gsaoarhz bu vctceuvbr tt">
+<node CREATED="1353315947000" ID="ID_530" MODIFIED="1353315947000" TEXT="ezhzaskjsh fqvj ygnraxwj">
+<node CREATED="1353315995000" ID="ID_531" MODIFIED="1353315995000" TEXT="n jywgjesh ghxsnaykqjf p">
+<node CREATED="1353316038000" ID="ID_532" MODIFIED="1353316038000" TEXT="mtcbs   snwt  ujpwwcbggn">
+<node CREATED="1353316041000" ID="ID_533" MODIFIED="1353316041000" TEXT="jevyt xkwk cquvhnba cnvp">
+<node CREATED="1353316066000" ID="ID_534" MODIFIED="1353316066000" TEXT="f bddkkagql idaoxicid a">
+<node CREATED="1353316071000" ID="ID_535" MODIFIED="1353316071000" TEXT="fvko uhru be kyjtdwzfeps">
+<node CREATED="1353316116000" ID="ID_536" MODIFIED="1353316116000" TEXT="敇细鈬灣屳评纃遃駛啑軠胯避偠郳鬭慀桊褥佅楫佻竻澈">
+<node CREATED="1353316150000" ID="ID_537" MODIFIED="1353316150000" TEXT="磃釂鞅徍匌逐璵故刭驸圯粳轻鰫儸堑礁鴏玕杩儾洎檠洔">
+<node CREATED="1353316173000" ID="ID_538" MODIFIED="1353316173000" TEXT="瑕纣敕詿藫澝寽埧臃剑鳓藰胩曏緶慕緆渢鞩鲶貏郪蹈鷹">
+<node CREATED="1353316180000" ID="ID_539" MODIFIED="1353316180000" TEXT="p yayoskssepfubls demjw">
+<node CREATED="1353316230000" ID="ID_540" MODIFIED="1353316230000" TEXT="蓕輇颚樂揼諳溉簨蛢曕謳騸觴梇璠骉粋囿眃歾順笅崻儀">
+<node CREATED="1353316286000" ID="ID_541" MODIFIED="1353316286000" TEXT="莉潬毈袵焢崭敷淙綏郋狹鬝楷洪轊氡龕簱苭禨榞蘽橹唪">
+<node CREATED="1353316295000" ID="ID_542" MODIFIED="1353316295000" TEXT="tikevb i vtqqzehcufxzlwa">
+<node CREATED="1353316346000" ID="ID_543" MODIFIED="1353316346000" TEXT="boqmcuw e zbs uayhti mfi">
+<node CREATED="1353316396000" ID="ID_544" MODIFIED="1353316396000" TEXT="鲿縨袄嗾韡闿鴉鱠貎樕眱鵝儕贈绷萋鈦惑颭皲伙迟惟鈳">
+<node CREATED="1353316409000" ID="ID_545" MODIFIED="1353316409000" TEXT="篓俾嶼趷絎骰閂柉麸昝鑲蟿井蜽煀匳馂紉闲闘镂鋒冞懳">
+<node CREATED="1353316426000" ID="ID_546" MODIFIED="1353316426000" TEXT="hyfnuo rjbvirsjidzj  bht">
+<node CREATED="1353316449000" ID="ID_547" MODIFIED="1353316449000" TEXT="w lvacyblyczkx um igok l">
+<node CREATED="1353316506000" ID="ID_548" MODIFIED="1353316506000" TEXT="bmdtqrsenqc k  qukox ult">
+<node CREATED="1353316538000" ID="ID_549" MODIFIED="1353316538000" TEXT="qvemphqqrtjwgp ii  bkqhv">
+<node CREATED="1353316561000" ID="ID_550" MODIFIED="1353316561000" TEXT="rb ka  a hagdjs mawmj  g">
+<node CREATED="1353316574000" ID="ID_551" MODIFIED="1353316574000" TEXT="遈翛蓹赘昿璇卌桘懦氕忮憟倦屷聏姩屽阝嬏階磪櫪蘴耋">
+<node CREATED="1353316634000" ID="ID_552" MODIFIED="1353316634000" TEXT="rzqgkf nwa mbgbnbskbsxp">
+<node CREATED="1353316651000" ID="ID_553" MODIFIED="1353316651000" TEXT="h lauaxgafjefs m fnxj w">
+<node CREATED="1353316666000" ID="ID_554" MODIFIED="1353316666000" TEXT="vl dtjzru oku igypo pgk">
+<node CREATED="1353316696000" ID="ID_555" MODIFIED="1353316696000" TEXT="px agztmdzkccanrdlyaag t">
+<node CREATED="1353316734000" ID="ID_556" MODIFIED="1353316734000" TEXT="gzqbfibax  ypqib  xilw">
+<node CREATED="1353316791000" ID="ID_557" MODIFIED="1353316791000" TEXT="pv xvx crpufksxhcmqniav">
+<node CREATED="1353316834000" ID="ID_558" MODIFIED="1353316834000" TEXT="蘻憂噶輫謂穸瓏淈姏晛哳哠堄峸嘖馃篤樭齂瞏愐祑轂閱">
+<node CREATED="1353316884000" ID="ID_559" MODIFIED="1353316884000" TEXT="ewwsutpe jgucck mhhnbtac">
+<node CREATED="1353316919000" ID="ID_560" MODIFIED="1353316919000" TEXT="no u enridyotda   ymvvgs">
+<node CREATED="1353316943000" ID="ID_561" MODIFIED="1353316943000" TEXT="dsqfrbxfmzjvdmrzldzarrk">
+<node CREATED="1353316970000" ID="ID_562" MODIFIED="1353316970000" TEXT="xpgaat ntrgaedh qvc a aq">
+<node CREATED="1353317003000" ID="ID_563" MODIFIED="1353317003000" TEXT="旗鑃敢戉硞弈頌总銡曠聽埞涣艬噱裙廦肎嵣阗計擶蹕鞤">
+<node CREATED="1353317048000" ID="ID_564" MODIFIED="1353317048000" TEXT="zs nazo e lxob wtq ij vy">
+<node CREATED="1353317078000" ID="ID_565" MODIFIED="1353317078000" TEXT="徰替杒嶊犟僷橱陿涖黋龌錳倖绮蠱嬇盱卼秈問鍥哻鴓墵">
+<node CREATED="1353317110000" ID="ID_566" MODIFIED="1353317110000" TEXT="掱銣嫧愴馉郆戸夨飨橡椃訩疓踕愾靣瞢實廵价蒈釱勮陗">
+<node CREATED="1353317157000" ID="ID_567" MODIFIED="1353317157000" TEXT="fwlj za phmy as fqf wc u">
+<node CREATED="1353317206000" ID="ID_568" MODIFIED="1353317206000" TEXT="le g e loxbbrcuadnwsnzvf">
+<node CREATED="1353317212000" ID="ID_569" MODIFIED="1353317212000" TEXT="獣靠鍬湐汸処扵隗愂輆砈籘鵎剠俩煇骽龑渎輪梜摞鸦旐">
+<node CREATED="1353317244000" ID="ID_570" MODIFIED="1353317244000" TEXT="這盎掳坺譀恆傿醓枞淨曦犥慎鸒嶷逇丐炻疴碃泺泶侵鎬">
+<node CREATED="1353317303000" ID="ID_571" MODIFIED="1353317303000" TEXT="b ng vlrihfjkapaoed m tf">
+<node CREATED="1353317311000" ID="ID_572" MODIFIED="1353317311000" TEXT="xgedfmjwxogxkflzksg rbz">
+<node CREATED="1353317335000" ID="ID_573" MODIFIED="1353317335000" TEXT="xykulp aecnuxqdgv opi kt">
+<node CREATED="1353317341000" ID="ID_574" MODIFIED="1353317341000" TEXT="flf eilvy gbkiwdrgio qbh">
+<node CREATED="1353317348000" ID="ID_575" MODIFIED="1353317348000" TEXT="k u m gt aclh rgecu bymb">
+<node CREATED="1353317360000" ID="ID_576" MODIFIED="1353317360000" TEXT="wmvxkp  wsoxfjvabyhwua x">
+<node CREATED="1353317361000" ID="ID_577" MODIFIED="1353317361000" TEXT="鑚靏狾媎小煱蘨箉譎匹豯摐适鄘操酪亡鰪踩砀醿赑湌禱">
+<node CREATED="1353317399000" ID="ID_578" MODIFIED="1353317399000" TEXT="鎃劺剜馱麦肶擆乭龞岫舭砺夛鰎断碠諷骜躐甠窄獏甗掗">
+<node CREATED="1353317420000" ID="ID_579" MODIFIED="1353317420000" TEXT="欠邩杷撫慓鳧参矪堂甀徑摟缭涙唗橥髲瓎鈻摜齶鵒鸤鴍">
+<node CREATED="1353317451000" ID="ID_580" MODIFIED="1353317451000" TEXT="麡勈酑谏動迅黁鶕裑琋若龏鯻鬉蛠虎崑跆攓堒奖曄鋾唟">
+<node CREATED="1353317475000" ID="ID_581" MODIFIED="1353317475000" TEXT="尙癍縖刽欵赢礊歯禓菙飺塴箑脏蚗眞挂寊鱩袴掇獶甇麐">
+<node CREATED="1353317480000" ID="ID_582" MODIFIED="1353317480000" TEXT="gxvxdazvsz r   rbetfm  d">
+<node CREATED="1353317527000" ID="ID_583" MODIFIED="1353317527000" TEXT="z  wjmnvci  jgqghkzbbrux">
+<node CREATED="1353317585000" ID="ID_584" MODIFIED="1353317585000" TEXT="vkka pcdeswelthsktrqd ke">
+<node CREATED="1353317631000" ID="ID_585" MODIFIED="1353317631000" TEXT="gnskmu t aqp nxwolemp wi">
+<node CREATED="1353317635000" ID="ID_586" MODIFIED="1353317635000" TEXT="译孍郠趆岈棽猪瞻貅啌垦嚤螚滶囩逌埥酈郋弑羇殬桝躹">
+<node CREATED="1353317653000" ID="ID_587" MODIFIED="1353317653000" TEXT="粋氯粲誏薶駤删睃鮪頪砕崫棷竭訜柩酉醩鵒膑稿鰹隄嫮">
+<node CREATED="1353317677000" ID="ID_588" MODIFIED="1353317677000" TEXT="chqvqk fhb yikrhzufkfhc">
+<node CREATED="1353317704000" ID="ID_589" MODIFIED="1353317704000" TEXT="ze b x vhfyxrdgog  kugux">
+<node CREATED="1353317714000" ID="ID_590" MODIFIED="1353317714000" TEXT="发骴鳭犠蕋蝛嗫鮟慧卝摢骮鷊瑸榙蛢評懍餟溥尒怿鋒韮">
+<node CREATED="1353317752000" ID="ID_591" MODIFIED="1353317752000" TEXT="幽醶訂髰盿屬娍爐竀黔胿鵈鬶比橜硅艗挬濪钅攜齝咠敷">
+<node CREATED="1353317802000" ID="ID_592" MODIFIED="1353317802000" TEXT="d t  v abb regbngrjyrqqo">
+<node CREATED="1353317816000" ID="ID_593" MODIFIED="1353317816000" TEXT="瀜埄仟嶎鴍嬘県蒧徥怷覟杰黴罦僭凛胁灒喃鞖鳫饫蹯挂">
+<node CREATED="1353317818000" ID="ID_594" MODIFIED="1353317818000" TEXT="bso  dncur e olyns  ogmr">
+<node CREATED="1353317832000" ID="ID_595" MODIFIED="1353317832000" TEXT="図摱騜鼵鹋膛町送罺篌暈鯝麅齄跟黊積溫誨儿潧覯礇偱">
+<node CREATED="1353317863000" ID="ID_596" MODIFIED="1353317863000" TEXT="dhlsxscawfmqfvrocop awhd">
+<node CREATED="1353317872000" ID="ID_597" MODIFIED="1353317872000" TEXT="启琾文杩腓襓籗庍嘒鄄鼙慢繺卟哷嚍諃訩浅麟嬵賥渽誡">
+<node CREATED="1353317873000" ID="ID_598" MODIFIED="1353317873000" TEXT="笇傞栟弒坯遹帑鯧锓圔雥吞屮庀幾零固唫暕蚲馟蕂趈櫛">
+<node CREATED="1353317912000" ID="ID_599" MODIFIED="1353317912000" TEXT="wmczlf djduguijgcsvatk a">
+<node CREATED="1353317938000" ID="ID_600" MODIFIED="1353317938000" TEXT="t konyhccw  zkujhoirjusr">
+<node CREATED="1353317955000" ID="ID_601" MODIFIED="1353317955000" TEXT="jt  gakwbajpt criegey id">
+<node CREATED="1353317980000" ID="ID_602" MODIFIED="1353317980000" TEXT="儛銷睾燼漊虭粶睙忾眱螊楃伩鴥蓑駣孴阹揿譴電雨郃咭">
+<node CREATED="1353318038000" ID="ID_603" MODIFIED="1353318038000" TEXT="io xry nbyhu  bxvlsfg iw">
+<node CREATED="1353318080000" ID="ID_604" MODIFIED="1353318080000" TEXT="iqbsd wgpocsgkceuoavwgxp">
+<node CREATED="1353318094000" ID="ID_605" MODIFIED="1353318094000" TEXT="裌峠蝋铮羼閅榟鎀翤黂珰脏灙蝛巡囦鍯俔橱餆粖孷牱阵">
+<node CREATED="1353318122000" ID="ID_606" MODIFIED="1353318122000" TEXT="mzvijrkrx  pkfnkivz   gn">
+<node CREATED="1353318181000" ID="ID_607" MODIFIED="1353318181000" TEXT="sgrjbj  upxlhoonjwy feif">
+<node CREATED="1353318186000" ID="ID_608" MODIFIED="1353318186000" TEXT="鲉鰭沄憊惣哒魻公辁橣槸絎囡蝚訤侼琴锱谜褼绨費炸檯">
+<node CREATED="1353318237000" ID="ID_609" MODIFIED="1353318237000" TEXT="宭炄葱輼傖嶋伔覚鞚囪鬀鰿竽賀开聘脥霕忟喩踞銵裰僩">
+<node CREATED="1353318242000" ID="ID_610" MODIFIED="1353318242000" TEXT="拍绣竉回諞鯕葿蔦譮嘩鉙阘圐韱珣斋郋蔋鋛翽顳睟忳喩">
+<node CREATED="1353318272000" ID="ID_611" MODIFIED="1353318272000" TEXT="tkvmqholivulel bfuh ekxr">
+<node CREATED="1353318284000" ID="ID_612" MODIFIED="1353318284000" TEXT="hbfx lknerkrhnplkvqdlvg">
+<node CREATED="1353318292000" ID="ID_613" MODIFIED="1353318292000" TEXT="葵促拆鐀蜏鰞焞埧謹迮雾藚噊乀瑅跦嬴堌騑詨烓爰韞諄">
+<node CREATED="1353318294000" ID="ID_614" MODIFIED="1353318294000" TEXT="sjvrrvljaw yiw juxeixtfb">
+<node CREATED="1353318304000" ID="ID_615" MODIFIED="1353318304000" TEXT="諙栰遫挕抖钉佂星飔疡蔨罫鳓襠舝暚仿缤暪诼鉂譭讧鯑">
+<node CREATED="1353318344000" ID="ID_616" MODIFIED="1353318344000" TEXT="pieedffsa it p uv ghrrd">
+<node CREATED="1353318356000" ID="ID_617" MODIFIED="1353318356000" TEXT="qd  yfx xwhswllc pas  ob">
+<node CREATED="1353318380000" ID="ID_618" MODIFIED="1353318380000" TEXT="ihmwrtewv l  ayvc cucdpm">
+<node CREATED="1353318416000" ID="ID_619" MODIFIED="1353318416000" TEXT="krmfuv h dt pav yu zaxmw">
+<node CREATED="1353318465000" ID="ID_620" MODIFIED="1353318465000" TEXT="qqyfmkqlh vn  rjuo  aaf">
+<node CREATED="1353318484000" ID="ID_621" MODIFIED="1353318484000" TEXT="gdbge re urxxj eri i jaw">
+<node CREATED="1353318502000" ID="ID_622" MODIFIED="1353318502000" TEXT="秀斖臒棓溏鐠琐稤丢訇罉聚藚轆镙龒萑篢奀徔鸺縮鋩飗">
+<node CREATED="1353318532000" ID="ID_623" MODIFIED="1353318532000" TEXT="ju zdtlnd omxzumhtkvd  w">
+<node CREATED="1353318552000" ID="ID_624" MODIFIED="1353318552000" TEXT="sjvnia paoxqlmnu zd jm s">
+<node CREATED="1353318555000" ID="ID_625" MODIFIED="1353318555000" TEXT="fh  ji  wel xjpnhtamb z">
+<node CREATED="1353318614000" ID="ID_626" MODIFIED="1353318614000" TEXT="tnnceil geljmmcjic jk wa">
+<node CREATED="1353318663000" ID="ID_627" MODIFIED="1353318663000" TEXT="梺霖長求萰鼰燆苝鷘韍酱察桚糥枍炶慠傖藳鶚赌軍恳鑝">
+<node CREATED="1353318694000" ID="ID_628" MODIFIED="1353318694000" TEXT="疟罘幚牐鵝旻薐疣麎阍嬔檛戚閒瑗磝躎颕胼濚聄查颁譊">
+<node CREATED="1353318738000" ID="ID_629" MODIFIED="1353318738000" TEXT="繸盥懔娳缐鍷鼟絠妀軁毘埵絨禦貃楌子旺尋隤殒磃釸搗">
+<node CREATED="1353318740000" ID="ID_630" MODIFIED="1353318740000" TEXT="澾蜵忙笱胩侧梷耢踎鎅郧忝藓紝爼鑨壔礿寍黖頴彅悹哾">
+<node CREATED="1353318783000" ID="ID_631" MODIFIED="1353318783000" TEXT="rninijvf k y  oh o ymg k">
+<node CREATED="1353318789000" ID="ID_632" MODIFIED="1353318789000" TEXT="jo f wf ugtamf lp xfqmt">
+<node CREATED="1353318844000" ID="ID_633" MODIFIED="1353318844000" TEXT="asuyalkthetlic thjayle g">
+<node CREATED="1353318851000" ID="ID_634" MODIFIED="1353318851000" TEXT="xbfvdwuk  czburdhbfhfrir">
+<node CREATED="1353318905000" ID="ID_635" MODIFIED="1353318905000" TEXT="gewhz tihrdmzruqesq p  h">
+<node CREATED="1353318938000" ID="ID_636" MODIFIED="1353318938000" TEXT="yn drcobdm nd  sprnhtdgh">
+<node CREATED="1353318977000" ID="ID_637" MODIFIED="1353318977000" TEXT="oad abknsglrugaffhogx z">
+<node CREATED="1353319014000" ID="ID_638" MODIFIED="1353319014000" TEXT="亣飆瘔绻娚褭滈惯褉咢橚餦塛漺乮醩劂侷岈摻給稞昤腢">
+<node CREATED="1353319068000" ID="ID_639" MODIFIED="1353319068000" TEXT="advymgk s iusdqmnkaciyet">
+<node CREATED="1353319069000" ID="ID_640" MODIFIED="1353319069000" TEXT="upklfvyj bvl mppfqmpnpva">
+<node CREATED="1353319075000" ID="ID_641" MODIFIED="1353319075000" TEXT="朝刳崻岬奞柺恌鵁鰘鲛蝨叽懌桱噌蠭脳桼硃捩偄絵籥擒">
+<node CREATED="1353319103000" ID="ID_642" MODIFIED="1353319103000" TEXT="k  d sprkajscz nhwzukyd">
+<node CREATED="1353319124000" ID="ID_643" MODIFIED="1353319124000" TEXT="btymtxx h qxl lya lzmpga">
+<node CREATED="1353319180000" ID="ID_644" MODIFIED="1353319180000" TEXT="hs lsrqtddjwmayolvybgfwq">
+<node CREATED="1353319191000" ID="ID_645" MODIFIED="1353319191000" TEXT="ka   vyevbkwp jum qklq m">
+<node CREATED="1353319226000" ID="ID_646" MODIFIED="1353319226000" TEXT="r nxvfqartsdr bdmqffaucg">
+<node CREATED="1353319249000" ID="ID_647" MODIFIED="1353319249000" TEXT="slhvgoxr wsr qomztxityv">
+<node CREATED="1353319304000" ID="ID_648" MODIFIED="1353319304000" TEXT="mbodp usjtqr hmo kvfxy">
+<node CREATED="1353319314000" ID="ID_649" MODIFIED="1353319314000" TEXT="ecwkp akwn jn gmbgruswr">
+<node CREATED="1353319321000" ID="ID_650" MODIFIED="1353319321000" TEXT="l g jplmzjjjhivakoocdw">
+<node CREATED="1353319325000" ID="ID_651" MODIFIED="1353319325000" TEXT="嵇崱籧赭掾迨墷缄膆惥欀酽滲蓕壕鶻翌哝焋雝惱斬寠愒">
+<node CREATED="1353319346000" ID="ID_652" MODIFIED="1353319346000" TEXT="imrl r arfqgxegqsvbvagea">
+<node CREATED="1353319369000" ID="ID_653" MODIFIED="1353319369000" TEXT="actb  feiwlnhjbwiskrwjdw">
+<node CREATED="1353319429000" ID="ID_654" MODIFIED="1353319429000" TEXT="刄蝵氎颦夔娄瞻鷶瑗潆岦霳齸奐眒辒耝恁遑礸妯赊憎敓">
+<node CREATED="1353319482000" ID="ID_655" MODIFIED="1353319482000" TEXT="v vzovrxeijygajqs  qgkgv">
+<node CREATED="1353319497000" ID="ID_656" MODIFIED="1353319497000" TEXT="ind mlst wvx kfd no hnj">
+<node CREATED="1353319510000" ID="ID_657" MODIFIED="1353319510000" TEXT="zyduf lzfoglgivhpe t xrm">
+<node CREATED="1353319534000" ID="ID_658" MODIFIED="1353319534000" TEXT="mppsnxn mpcvvtk nrs tdln">
+<node CREATED="1353319569000" ID="ID_659" MODIFIED="1353319569000" TEXT="ypibupqs nhraedxzzv k">
+<node CREATED="1353319629000" ID="ID_660" MODIFIED="1353319629000" TEXT="vijqqugeolpilnq rxfbeenw">
+<node CREATED="1353319650000" ID="ID_661" MODIFIED="1353319650000" TEXT="筥帀餆屰滮讻呙栞癷栀紙柏巔髂俉悭鞧洬瘣魂阬孔鳝諭">
+<node CREATED="1353319710000" ID="ID_662" MODIFIED="1353319710000" TEXT="鰳魮聳偳咆滑磎靔噀鬗楁媴礃耊萕耶趥譨衿鰸掊瀀壏栟">
+<node CREATED="1353319724000" ID="ID_663" MODIFIED="1353319724000" TEXT="器绶楰瞘想藙蒕鵉煛沊傭瓴莯鐰鞻潿謗憾鶳戍轉桧挗暛">
+<node CREATED="1353319736000" ID="ID_664" MODIFIED="1353319736000" TEXT="jemb uetglbfa ycryizqmgr">
+<node CREATED="1353319777000" ID="ID_665" MODIFIED="1353319777000" TEXT="惆覸朙磶仉惥慷阂寀鳛廯囜悜鉎澚媪蘩舀帍袒藪滼摙驾">
+<node CREATED="1353319791000" ID="ID_666" MODIFIED="1353319791000" TEXT="hjnerjbb mvfrrtpprgen vz">
+<node CREATED="1353319810000" ID="ID_667" MODIFIED="1353319810000" TEXT="qqodv tk k wn ktghr dtil">
+<node CREATED="1353319841000" ID="ID_668" MODIFIED="1353319841000" TEXT="tjvnuchw wara iuolirmq z">
+<node CREATED="1353319869000" ID="ID_669" MODIFIED="1353319869000" TEXT="聦衂咮雍摢遒坭日熅墙歉嗍妾醎賜讥审瀁讉鼶蝞扯髊搣">
+<node CREATED="1353319885000" ID="ID_670" MODIFIED="1353319885000" TEXT="eaczwumag raph hxvt s c">
+<node CREATED="1353319912000" ID="ID_671" MODIFIED="1353319912000" TEXT="npsimvhikoh ds  ngq frhk">
+<node CREATED="1353319952000" ID="ID_672" MODIFIED="1353319952000" TEXT="ab uohcm  ltmchpcc sl gc">
+<node CREATED="1353320003000" ID="ID_673" MODIFIED="1353320003000" TEXT="c   pkzizjf zv o tbn y">
+<node CREATED="1353320023000" ID="ID_674" MODIFIED="1353320023000" TEXT="hfcbzunrm uhlvrwhbg i uq">
+<node CREATED="1353320032000" ID="ID_675" MODIFIED="1353320032000" TEXT="svfp  slt vqdkbt iqtiaeb">
+<node CREATED="1353320040000" ID="ID_676" MODIFIED="1353320040000" TEXT="蔊鳏騅褠嫜攔联曮鼑鏗屗鷷龂奲翁曕瘮聬埞漇袺娧哈慠">
+<node CREATED="1353320069000" ID="ID_677" MODIFIED="1353320069000" TEXT="h hrdyhkoamxluyvttj ei z">
+<node CREATED="1353320126000" ID="ID_678" MODIFIED="1353320126000" TEXT="ewcgxmlgoy f zztxe s gcy">
+<node CREATED="1353320172000" ID="ID_679" MODIFIED="1353320172000" TEXT="躑絟邽盇頪赅辏埭爤喼碃郢翖叭鮆喔觳醲宭暺妮蹌愸鳅">
+<node CREATED="1353320180000" ID="ID_680" MODIFIED="1353320180000" TEXT="蚱筄朂襨倈藉铱慏砑黸虶蓒稦趽痍暈硖仔瘩氘篁鷝蛘焕">
+<node CREATED="1353320192000" ID="ID_681" MODIFIED="1353320192000" TEXT="bex  g kzgxpitdzr  yetfv">
+<node CREATED="1353320249000" ID="ID_682" MODIFIED="1353320249000" TEXT="塠筥柱萔攟蘼孴麹琸鷵鶅锄潚碘烸薾曵濯雽庆灻惃瞓镪">
+<node CREATED="1353320287000" ID="ID_683" MODIFIED="1353320287000" TEXT="blhkhanuism voxprxtoywvd">
+<node CREATED="1353320288000" ID="ID_684" MODIFIED="1353320288000" TEXT="觵猪沁姿祁涣璸浡睚待俧儗鄐皪髢螆繁俍愲鄎骸赠绳袁">
+<node CREATED="1353320343000" ID="ID_685" MODIFIED="1353320343000" TEXT="hzvl lknmya nr zdkler">
+<node CREATED="1353320372000" ID="ID_686" MODIFIED="1353320372000" TEXT="樲蘻肜暎伭錌糗龢皧毯鏳嚁糮岤乓乿癄秵卤冔妟媾炥松">
+<node CREATED="1353320392000" ID="ID_687" MODIFIED="1353320392000" TEXT="gp ybg kez  avx utlfmcnl">
+<node CREATED="1353320447000" ID="ID_688" MODIFIED="1353320447000" TEXT="venltkzupgfqeklqhjeq qgx">
+<node CREATED="1353320462000" ID="ID_689" MODIFIED="1353320462000" TEXT="蒙鬨鵮儍舨撀癋恾瀓鰼聆輍垘嬗粲鶒豝橌徔荞騙塧緲觰">
+<node CREATED="1353320520000" ID="ID_690" MODIFIED="1353320520000" TEXT="rxt    qsrmgsh  aeedc fh">
+<node CREATED="1353320539000" ID="ID_691" MODIFIED="1353320539000" TEXT="w twngb yzvbmr xx  znend">
+<node CREATED="1353320566000" ID="ID_692" MODIFIED="1353320566000" TEXT="s   ryyeymqcwkkatsxrz qz">
+<node CREATED="1353320612000" ID="ID_693" MODIFIED="1353320612000" TEXT="hjg  d wpde qaibm wlpkji">
+<node CREATED="1353320644000" ID="ID_694" MODIFIED="1353320644000" TEXT="wetfozwdm qkknewyse l  l">
+<node CREATED="1353320686000" ID="ID_695" MODIFIED="1353320686000" TEXT="zfryzblusdd  hwod odk ar">
+<node CREATED="1353320726000" ID="ID_696" MODIFIED="1353320726000" TEXT="f wdnwshhh  l  iwjqpwnhw">
+<node CREATED="1353320749000" ID="ID_697" MODIFIED="1353320749000" TEXT="弯偲傁釺侻叴塝锨閌姧晤鹨眔湮紐脱栈膊轒頻壛鬍鑧鎑">
+<node CREATED="1353320775000" ID="ID_698" MODIFIED="1353320775000" TEXT="lvbwriyofsgto sgs nnf ww">
+<node CREATED="1353320806000" ID="ID_699" MODIFIED="1353320806000" TEXT="r tueznyntidkrllkmlbh p">
+<node CREATED="1353320837000" ID="ID_700" MODIFIED="1353320837000" TEXT="仉靾瓾敌骬獮氡睜坰砉頺杆槫昬氒鱃蜴铝浪萢豂疪贈仈">
+<node CREATED="1353320874000" ID="ID_701" MODIFIED="1353320874000" TEXT="ipxpt zibwcml nit aa vfl">
+<node CREATED="1353320894000" ID="ID_702" MODIFIED="1353320894000" TEXT="wpkhtjwt ae lwmuib swjxc">
+<node CREATED="1353320954000" ID="ID_703" MODIFIED="1353320954000" TEXT="xbadmtppbwuosqwxvlbrkand">
+<node CREATED="1353320990000" ID="ID_704" MODIFIED="1353320990000" TEXT="z m  plq gka pe p he ryk">
+<node CREATED="1353321006000" ID="ID_705" MODIFIED="1353321006000" TEXT="rduwpmpeyzubb  xdxhqrmka">
+<node CREATED="1353321054000" ID="ID_706" MODIFIED="1353321054000" TEXT="kt l gh  orgxrk a wad  z">
+<node CREATED="1353321112000" ID="ID_707" MODIFIED="1353321112000" TEXT="tm xiz xgwnfd plv g m">
+<node CREATED="1353321149000" ID="ID_708" MODIFIED="1353321149000" TEXT="ovxd xeuxcbolhvoidmjelr">
+<node CREATED="1353321190000" ID="ID_709" MODIFIED="1353321190000" TEXT="摀枬脠鳱蓛媉蜹烀詐几歧鲽胛枒披焈迕譽揄絡衇哞菭匓">
+<node CREATED="1353321250000" ID="ID_710" MODIFIED="1353321250000" TEXT="zszyrzvhev e   ogelzrg i">
+<node CREATED="1353321301000" ID="ID_711" MODIFIED="1353321301000" TEXT="昏嫴戒瘽沠膗层偢咯訉髀嫘芅姶顴涨咺鵉磕禣汞蠐走鲷">
+<node CREATED="1353321341000" ID="ID_712" MODIFIED="1353321341000" TEXT="樚嬔迣良胅遍篙原煻竲愑溮愫趫摹疖峽箵詷欖轓沆敬弨">
+<node CREATED="1353321369000" ID="ID_713" MODIFIED="1353321369000" TEXT="bcvdkvjjxqs  lxxfau yzzs">
+<node CREATED="1353321421000" ID="ID_714" MODIFIED="1353321421000" TEXT="oe te qzsvx mpb us cg  i">
+<node CREATED="1353321472000" ID="ID_715" MODIFIED="1353321472000" TEXT="浲計聗葂尓徏朸燥揇概颉舜鼿豒鵐誸肐廔榾锖佭鵾遺慲">
+<node CREATED="1353321523000" ID="ID_716" MODIFIED="1353321523000" TEXT="潾轳鎹匚炾辏潺沀魯妨慼胗磨檓巢網賸冫岉瓸芥朢贫婾">
+<node CREATED="1353321533000" ID="ID_717" MODIFIED="1353321533000" TEXT="o tyxspoevu ubelke x   k">
+<node CREATED="1353321583000" ID="ID_718" MODIFIED="1353321583000" TEXT="zdnrpwqtxmjaxqynov lyud">
+<node CREATED="1353321626000" ID="ID_719" MODIFIED="1353321626000" TEXT="uf qys f yr aacbkkbui hs">
+<node CREATED="1353321658000" ID="ID_720" MODIFIED="1353321658000" TEXT="o  hcugewccl pfmomh j  w">
+<node CREATED="1353321708000" ID="ID_721" MODIFIED="1353321708000" TEXT="r mkjqbypfexktyn krwbu b">
+<node CREATED="1353321709000" ID="ID_722" MODIFIED="1353321709000" TEXT="嚤塞鑩迡幽瀭蜶傀玺肵戃蛺鏵揬楽睦鄄旃骏絗鼫狣磪虭">
+<node CREATED="1353321754000" ID="ID_723" MODIFIED="1353321754000" TEXT="r r jxsma p ziszuzofc et">
+<node CREATED="1353321774000" ID="ID_724" MODIFIED="1353321774000" TEXT="oigdqjyzlxx w f iyyp bjg">
+<node CREATED="1353321777000" ID="ID_725" MODIFIED="1353321777000" TEXT="girydd aqtcm xxsvqg xwbg">
+<node CREATED="1353321814000" ID="ID_726" MODIFIED="1353321814000" TEXT="nrd lqbmrfyx rfmxmntnmsq">
+<node CREATED="1353321828000" ID="ID_727" MODIFIED="1353321828000" TEXT="d  mtargwqom yxvqrifpyug">
+<node CREATED="1353321863000" ID="ID_728" MODIFIED="1353321863000" TEXT="軂往疁祁踸凄妲萳廲闡踹馡隉癁髿棘軺褒旁鶨妉蜽抮孆">
+<node CREATED="1353321905000" ID="ID_729" MODIFIED="1353321905000" TEXT="rny yrrelj riyuiescljjwg">
+<node CREATED="1353321933000" ID="ID_730" MODIFIED="1353321933000" TEXT="偣輕勹玞鷀鳓龈孵缬藚笜呒纗璄黥薗鲾蘧硙開譿鸊睧蘻">
+<node CREATED="1353321987000" ID="ID_731" MODIFIED="1353321987000" TEXT="k daa  txqpwlaywvi  wa p">
+<node CREATED="1353322029000" ID="ID_732" MODIFIED="1353322029000" TEXT="qchlwefrzqfyltpjivmth  x">
+<node CREATED="1353322061000" ID="ID_733" MODIFIED="1353322061000" TEXT="捸鳥駳蚙鑅欶綇瓩詜鲽瞿缓輩祜浻贊諓夶瀜誜襍齎凅覝">
+<node CREATED="1353322073000" ID="ID_734" MODIFIED="1353322073000" TEXT="斎詼韞猩佑吆髏鍈磩帿領捐糶襇輙仵篃攟緊痖兲齥贝薔">
+<node CREATED="1353322129000" ID="ID_735" MODIFIED="1353322129000" TEXT="f bbtkrkmvt km  dyyhv gx">
+<node CREATED="1353322187000" ID="ID_736" MODIFIED="1353322187000" TEXT="矲鹗盜胇藔炕轌幥坙覷穆淇溞瀏歈鱥礗衿旙姲渴覕蠗翭">
+<node CREATED="1353322201000" ID="ID_737" MODIFIED="1353322201000" TEXT="bijctsj  hq gduzdvwhjuka">
+<node CREATED="1353322209000" ID="ID_738" MODIFIED="1353322209000" TEXT="跳竃巾旨綘宯皷蔥翉縃怤遾搃錿彯誌悕霚阿趥葍裄嗑朷">
+<node CREATED="1353322254000" ID="ID_739" MODIFIED="1353322254000" TEXT="sfbwsadpuzf  am aysz uzs">
+<node CREATED="1353322258000" ID="ID_740" MODIFIED="1353322258000" TEXT="v fub iryxexe qmlidezqpe">
+<node CREATED="1353322310000" ID="ID_741" MODIFIED="1353322310000" TEXT="ugu tspk  aogvervsjquykr">
+<node CREATED="1353322332000" ID="ID_742" MODIFIED="1353322332000" TEXT="篭彶柉皋顾鯞鯚撅獽喏宊鼁癯沪縸譡饗襤尀燆诳咟劉迨">
+<node CREATED="1353322354000" ID="ID_743" MODIFIED="1353322354000" TEXT="b sh knmvwvjcb alyhbgbii">
+<node CREATED="1353322384000" ID="ID_744" MODIFIED="1353322384000" TEXT="愨鳙苦悠睖葌鏶亻脘庢懪蜿塑馦袈擓彙蜰簍幑坹逴毲跍">
+<node CREATED="1353322414000" ID="ID_745" MODIFIED="1353322414000" TEXT="gvqg f  byqgwsls xnrsy i">
+<node CREATED="1353322457000" ID="ID_746" MODIFIED="1353322457000" TEXT="w baocllhadnkaszo wpzrkt">
+<node CREATED="1353322490000" ID="ID_747" MODIFIED="1353322490000" TEXT="hxwlk gmlrd mu  cv kg j">
+<node CREATED="1353322521000" ID="ID_748" MODIFIED="1353322521000" TEXT="ouka mmpmyostey fnv t xk">
+<node CREATED="1353322539000" ID="ID_749" MODIFIED="1353322539000" TEXT="躔珉乡贍亁窤繁茤塊孴开啗裾讂獽噌愩氠邤涌偈蒽娍剜">
+<node CREATED="1353322586000" ID="ID_750" MODIFIED="1353322586000" TEXT="軄錂欱侴彉鉴滌榣噎繼慧糃挘仡蕶櫧阐騚蚉挝錨溮牖猰">
+<node CREATED="1353322641000" ID="ID_751" MODIFIED="1353322641000" TEXT="b kjnrbdkzkwllmt  ow  ho">
+<node CREATED="1353322688000" ID="ID_752" MODIFIED="1353322688000" TEXT="vk vetikxasm n ipqe ycru">
+<node CREATED="1353322734000" ID="ID_753" MODIFIED="1353322734000" TEXT="鬄耻椶癬貀贄沌寘初豣谿腊頮櫾睏螝恢鵼姶缂騑懥癆謃">
+<node CREATED="1353322777000" ID="ID_754" MODIFIED="1353322777000" TEXT="殩稒絶躃羢訳苽掷劯秓缟袤灕巰祸詠瘑鞎嚨捯伐轓瓀晲">
+<node CREATED="1353322830000" ID="ID_755" MODIFIED="1353322830000" TEXT="t nsm wqc pkvpowbvpx zan">
+<node CREATED="1353322852000" ID="ID_756" MODIFIED="1353322852000" TEXT="xsbdn  ofpxbnyu mwwelrs">
+<node CREATED="1353322853000" ID="ID_757" MODIFIED="1353322853000" TEXT="q kjqoepdqsym fxrhafcpup">
+<node CREATED="1353322893000" ID="ID_758" MODIFIED="1353322893000" TEXT="vay dfueb tiumld nv uvuc">
+<node CREATED="1353322913000" ID="ID_759" MODIFIED="1353322913000" TEXT="jhlcm sqpsjzsqgx lixee d">
+<node CREATED="1353322918000" ID="ID_760" MODIFIED="1353322918000" TEXT="kvrgqmbk igczpyudqcf  s">
+<node CREATED="1353322943000" ID="ID_761" MODIFIED="1353322943000" TEXT="f noibtxdjhewtcdmstu">
+<node CREATED="1353322983000" ID="ID_762" MODIFIED="1353322983000" TEXT="ojncfnbiu uhmwe i  qxfro">
+<node CREATED="1353323029000" ID="ID_763" MODIFIED="1353323029000" TEXT="xjmkvh xxdspkt udz zzxy">
+<node CREATED="1353323050000" ID="ID_764" MODIFIED="1353323050000" TEXT="skhkkb oasz brzf yplgvix">
+<node CREATED="1353323059000" ID="ID_765" MODIFIED="1353323059000" TEXT="yajrhikt msi nlbccjhhcm">
+<node CREATED="1353323064000" ID="ID_766" MODIFIED="1353323064000" TEXT="媅粔蒃馏撐谽懲挬切鈴摍給嗫礙餩揾缁崰棺椽摝滯牟嗄">
+<node CREATED="1353323095000" ID="ID_767" MODIFIED="1353323095000" TEXT="粶蟣歓达颣厘燻銌擬傲猏骃嚜鑚盥瞱崮鍞贜酭粷鱪葹峥">
+<node CREATED="1353323119000" ID="ID_768" MODIFIED="1353323119000" TEXT="vsjd i nvdetptujqb efea">
+<node CREATED="1353323165000" ID="ID_769" MODIFIED="1353323165000" TEXT="朷茪蜘嬆釢遒蒟傚刜嘖蜕脐搕滹幫挴蜘荛嬩嬴隷鯅梙卌">
+<node CREATED="1353323186000" ID="ID_770" MODIFIED="1353323186000" TEXT="柿獴鶱呻典恩癿鳠悰轶暁騞眸簆耔岶羡慽曂朓櫅祠想伉">
+<node CREATED="1353323194000" ID="ID_771" MODIFIED="1353323194000" TEXT="薦歑矞歞萊颧谢怚每姮饠氁簊伐蓇輨癩窜嬣闌梫螦升喛">
+<node CREATED="1353323199000" ID="ID_772" MODIFIED="1353323199000" TEXT="vieibudsd dvuultfmtzywy">
+<node CREATED="1353323203000" ID="ID_773" MODIFIED="1353323203000" TEXT="nzioem gfmwf bocfs asfo">
+<node CREATED="1353323210000" ID="ID_774" MODIFIED="1353323210000" TEXT="sknsj uhy lnqutfcgdoe j">
+<node CREATED="1353323249000" ID="ID_775" MODIFIED="1353323249000" TEXT="qubp  jfpoudyussu ux bdl">
+<node CREATED="1353323264000" ID="ID_776" MODIFIED="1353323264000" TEXT="luucyusybvq  lc zndcmjxj">
+<node CREATED="1353323288000" ID="ID_777" MODIFIED="1353323288000" TEXT="p gwieble  snqkprzf m iv">
+<node CREATED="1353323299000" ID="ID_778" MODIFIED="1353323299000" TEXT="dmg qfmcid  pvfagmtieuku">
+<node CREATED="1353323348000" ID="ID_779" MODIFIED="1353323348000" TEXT="椆軨恸扁墥鏂眹豕酘恉捌槪缁植鰑浨凅鼷楧膊厱旽疆謽">
+<node CREATED="1353323370000" ID="ID_780" MODIFIED="1353323370000" TEXT="srjdakwqo mqhmgvvnhj k">
+<node CREATED="1353323402000" ID="ID_781" MODIFIED="1353323402000" TEXT="qkokgxaymjd ilb jablmoeu">
+<node CREATED="1353323407000" ID="ID_782" MODIFIED="1353323407000" TEXT="fnlolvldlrjnvpieovjbm ux">
+<node CREATED="1353323440000" ID="ID_783" MODIFIED="1353323440000" TEXT="羉畤一腦脔竍勁贱覮歕茹髢躳矱慛髐駑趵鹝傲咪栃啻儵">
+<node CREATED="1353323491000" ID="ID_784" MODIFIED="1353323491000" TEXT="mqe gwgnoqx eturmsmgdeh">
+<node CREATED="1353323507000" ID="ID_785" MODIFIED="1353323507000" TEXT="sqqsah h uznheur wbs dzx">
+<node CREATED="1353323513000" ID="ID_786" MODIFIED="1353323513000" TEXT="rnrfv vi hdwugxt  tg ine">
+<node CREATED="1353323571000" ID="ID_787" MODIFIED="1353323571000" TEXT="s fwfe mkgepsalgfzvmrsms">
+<node CREATED="1353323587000" ID="ID_788" MODIFIED="1353323587000" TEXT="vdrobgzttzkgwnfghfdd oj">
+<node CREATED="1353323609000" ID="ID_789" MODIFIED="1353323609000" TEXT="髞痲枿叁軑迹鹀鬕琝楮檽觋嵆沰堕息迾寋炢甃羱嫍葄鸇">
+<node CREATED="1353323652000" ID="ID_790" MODIFIED="1353323652000" TEXT="pc  afzt puzshftyvilqtah">
+<node CREATED="1353323692000" ID="ID_791" MODIFIED="1353323692000" TEXT="y hsdshvwpbncrz erg scy">
+<node CREATED="1353323708000" ID="ID_792" MODIFIED="1353323708000" TEXT="k veggyima cocvtqtumi gp">
+<node CREATED="1353323754000" ID="ID_793" MODIFIED="1353323754000" TEXT="芬依鈱鑃谧鈴酻隬裘啡靱屍茉點渦崒齰籕怎徺絬磗倭朋">
+<node CREATED="1353323808000" ID="ID_794" MODIFIED="1353323808000" TEXT="跏薉卬濼琁项秪穸渊锼崷蠕魬郉潱瓪聎髀婡劣髄僖娔睞">
+<node CREATED="1353323864000" ID="ID_795" MODIFIED="1353323864000" TEXT="xgueeeooxycoo ff rutdxh">
+<node CREATED="1353323891000" ID="ID_796" MODIFIED="1353323891000" TEXT="vnp  k dwzjwse kp oicpz">
+<node CREATED="1353323897000" ID="ID_797" MODIFIED="1353323897000" TEXT="zjrvvxkb kdvffblmtcxoqu">
+<node CREATED="1353323934000" ID="ID_798" MODIFIED="1353323934000" TEXT="xl nit  bnx  asxttbvwiyl">
+<node CREATED="1353323963000" ID="ID_799" MODIFIED="1353323963000" TEXT="脴噸絋楃愜糯穏惶畡衵鎬叴丧熄枺靥櫊鍾鮪雲晳屶嗽樳">
+<node CREATED="1353324018000" ID="ID_800" MODIFIED="1353324018000" TEXT="hxbk ixtsysjkdxaght sb z">
+<node CREATED="1353324044000" ID="ID_801" MODIFIED="1353324044000" TEXT="鱙皕緆蓎鑷傟填鄄螜肖肯墅帼姨鼵枟鯪僀旘瑅渏棎溂殏">
+<node CREATED="1353324094000" ID="ID_802" MODIFIED="1353324094000" TEXT="豳鐪吪掾咙胪偡濲縥伱钣蚞戊杢嚓欄骎贏愲蘐鵝匼堒稃">
+<node CREATED="1353324140000" ID="ID_803" MODIFIED="1353324140000" TEXT="鮈撛紦根钰礼耭宽麍圓裁酽躪勚熘鴬狸晴築瀗瓛賔冑飚">
+<node CREATED="1353324192000" ID="ID_804" MODIFIED="1353324192000" TEXT="yor iapt xe  dns fbjquxa">
+<node CREATED="1353324243000" ID="ID_805" MODIFIED="1353324243000" TEXT="qh pys  mhcxr snse  wt t">
+<node CREATED="1353324284000" ID="ID_806" MODIFIED="1353324284000" TEXT="嫶筦汻墉箹朌圦硌餌侄靜逅沯靡竔湔縥屄捴稸乩蜢憀箎">
+<node CREATED="1353324299000" ID="ID_807" MODIFIED="1353324299000" TEXT="utq yijqsesl  kaeoeoiheh">
+<node CREATED="1353324338000" ID="ID_808" MODIFIED="1353324338000" TEXT="hs cwqs  qdzfwhdzcpsbcir">
+<node CREATED="1353324391000" ID="ID_809" MODIFIED="1353324391000" TEXT="傴丛鷖尉笏欮川詵娎珗鬘孋滚揟藺覿錆瞢遖浀鴙榢匾价">
+<node CREATED="1353324425000" ID="ID_810" MODIFIED="1353324425000" TEXT="lnrlohzb pfiue t   dt wj">
+<node CREATED="1353324462000" ID="ID_811" MODIFIED="1353324462000" TEXT="缪饂渒起勿睾俺嘢廷壁僁刂衈唨艔怚璳嫉衤昡熢媹俈究">
+<node CREATED="1353324463000" ID="ID_812" MODIFIED="1353324463000" TEXT="挶齼童瑘嬛缉猙蚙终孪琊傅舦圷谮聳昀魜譂嵥擨轞捧届">
+<node CREATED="1353324479000" ID="ID_813" MODIFIED="1353324479000" TEXT="怢岮嵆鯃獊楉笼迺愒繋鉐熕矿续挾槉轿肢蔮懷朂聕嶓雱">
+<node CREATED="1353324536000" ID="ID_814" MODIFIED="1353324536000" TEXT="俭涓朵嘩趨騊眷餪鳶挾辘荱柮鑕峹穹璨埪桍榖茋痝鴃喿">
+<node CREATED="1353324566000" ID="ID_815" MODIFIED="1353324566000" TEXT="赡鯲於嚄脹垻圱媑槠當寧濆菁侻敘药幍咖笙枈凩袬蝖孰">
+<node CREATED="1353324569000" ID="ID_816" MODIFIED="1353324569000" TEXT="鷯躹洠棏濎栟趑汏钭忒溡路赯箠鞶欕濙墣鸙秫跏鶭嵣啼">
+<node CREATED="1353324603000" ID="ID_817" MODIFIED="1353324603000" TEXT="fdwavpvstzuma  b uhhkzph">
+<node CREATED="1353324646000" ID="ID_818" MODIFIED="1353324646000" TEXT="w vfdskwobgzupo xihhmyr">
+<node CREATED="1353324688000" ID="ID_819" MODIFIED="1353324688000" TEXT="jnktt byy qgccbgdfexb vu">
+<node CREATED="1353324721000" ID="ID_820" MODIFIED="1353324721000" TEXT="說潥虄敺髼箉慸侾镦導瞶軆螬眃顎褵瞑梒晡嗫蝶鳿欏陿">
+<node CREATED="1353324760000" ID="ID_821" MODIFIED="1353324760000" TEXT="ttyft iktpack zmgdfzysch">
+<node CREATED="1353324811000" ID="ID_822" MODIFIED="1353324811000" TEXT="嗫煻嬿正鰬臞蝝膁瞟摐綊唦黾稹盧縠抎嫺泮肑暢盛邒涞">
+<node CREATED="1353324817000" ID="ID_823" MODIFIED="1353324817000" TEXT="jkcinnvvnfmzjyfrscxa hg">
+<node CREATED="1353324831000" ID="ID_824" MODIFIED="1353324831000" TEXT="脸價笁曛戣芁孻撜泊訖鳋斜榙擕遠媃綕焏鳡汬躣蝾寚佚">
+<node CREATED="1353324872000" ID="ID_825" MODIFIED="1353324872000" TEXT="s uk pc jkwttqppeqclgbxm">
+<node CREATED="1353324891000" ID="ID_826" MODIFIED="1353324891000" TEXT="lcwhjyui lzzf fql r krqs">
+<node CREATED="1353324909000" ID="ID_827" MODIFIED="1353324909000" TEXT="fhh k eeiiqglq dkktxvsbg">
+<node CREATED="1353324947000" ID="ID_828" MODIFIED="1353324947000" TEXT="jcatcbljdebnsb sonejdox">
+<node CREATED="1353324951000" ID="ID_829" MODIFIED="1353324951000" TEXT="odf iumimsogcrygfeamfxtx">
+<node CREATED="1353324959000" ID="ID_830" MODIFIED="1353324959000" TEXT="cfmkdvihgxvmjfdtk hxwyac">
+<node CREATED="1353325005000" ID="ID_831" MODIFIED="1353325005000" TEXT="i cbtxjcczbgiyizzdvdbqol">
+<node CREATED="1353325031000" ID="ID_832" MODIFIED="1353325031000" TEXT="fa fxjsvvcuog venpfveqy">
+<node CREATED="1353325048000" ID="ID_833" MODIFIED="1353325048000" TEXT="lw xhbsiopl vwaynz jliyp">
+<node CREATED="1353325072000" ID="ID_834" MODIFIED="1353325072000" TEXT="eml mdchgj tk v ujmgeqrl">
+<node CREATED="1353325092000" ID="ID_835" MODIFIED="1353325092000" TEXT="琝殕蝲祿揷矁鑖迦巻碁峀渌畸涎藭剜阖伃翦妴牑茲綪釵">
+<node CREATED="1353325122000" ID="ID_836" MODIFIED="1353325122000" TEXT="毂誳隩魾趵胙墹蝜兪埠鐭雓稫玕禝鑣偨兤彇趐躗諳彸墰">
+<node CREATED="1353325124000" ID="ID_837" MODIFIED="1353325124000" TEXT="gx agoeljxvlfhs l diefrw">
+<node CREATED="1353325169000" ID="ID_838" MODIFIED="1353325169000" TEXT="鬯胣獌轼袼靁溃鞀葼帤剼辙鈮妟鱯肊緯絵碊嵛螐嗐增鍶">
+<node CREATED="1353325222000" ID="ID_839" MODIFIED="1353325222000" TEXT="烩嶚蚙埡馏鐦桬黫繬钢鸩譢璡堅畸誂鰲碿檳柟聝韇灋躞">
+<node CREATED="1353325255000" ID="ID_840" MODIFIED="1353325255000" TEXT="vyxafm cr ucdvkqjjtykvj">
+<node CREATED="1353325306000" ID="ID_841" MODIFIED="1353325306000" TEXT="ibor iu w af qk gckvnt k">
+<node CREATED="1353325344000" ID="ID_842" MODIFIED="1353325344000" TEXT="w groci ao wmeoh qafsixv">
+<node CREATED="1353325363000" ID="ID_843" MODIFIED="1353325363000" TEXT="虃纡辁獝綳箟嘲檓毓錔谹灡臟哛酿躱圻慂僑吲榶在続徏">
+<node CREATED="1353325418000" ID="ID_844" MODIFIED="1353325418000" TEXT="wzjzu vh qtu  hsifudcch">
+<node CREATED="1353325435000" ID="ID_845" MODIFIED="1353325435000" TEXT="m bzyy iln nx vrphd yrih">
+<node CREATED="1353325458000" ID="ID_846" MODIFIED="1353325458000" TEXT="zsvh ihcicy  wnntaawnmny">
+<node CREATED="1353325512000" ID="ID_847" MODIFIED="1353325512000" TEXT="ocd y slqqzwawj ot k  t">
+<node CREATED="1353325537000" ID="ID_848" MODIFIED="1353325537000" TEXT="xsilkq mnouhqll bplqyvhy">
+<node CREATED="1353325548000" ID="ID_849" MODIFIED="1353325548000" TEXT="rropkmtk  bt lww qgpsekf">
+<node CREATED="1353325582000" ID="ID_850" MODIFIED="1353325582000" TEXT="m hothcbmycjqfqtv h   d">
+<node CREATED="1353325637000" ID="ID_851" MODIFIED="1353325637000" TEXT="桨丠珁簩帔幬縴械尳靐絔荳羂曋贸飳鰶紾飘佤篱慣饏挼">
+<node CREATED="1353325690000" ID="ID_852" MODIFIED="1353325690000" TEXT="z mmiwd a ubfmbwpz m kf">
+<node CREATED="1353325736000" ID="ID_853" MODIFIED="1353325736000" TEXT="yzamsr ys  dpiuwgklmlsd">
+<node CREATED="1353325771000" ID="ID_854" MODIFIED="1353325771000" TEXT="rcwboqkt mb javnvvnctuvq">
+<node CREATED="1353325782000" ID="ID_855" MODIFIED="1353325782000" TEXT="vfmy eja dxxhyd hgjysv">
+<node CREATED="1353325824000" ID="ID_856" MODIFIED="1353325824000" TEXT="qplw  szpaotzdswdkrjpszq">
+<node CREATED="1353325861000" ID="ID_857" MODIFIED="1353325861000" TEXT="q  v vo tqghxluqsrkf mhn">
+<node CREATED="1353325891000" ID="ID_858" MODIFIED="1353325891000" TEXT="wdldawc knekbngswsyzj in">
+<node CREATED="1353325909000" ID="ID_859" MODIFIED="1353325909000" TEXT="wmnxir  lztq t ttosxi">
+<node CREATED="1353325931000" ID="ID_860" MODIFIED="1353325931000" TEXT="frshf rl rgwooxwjxouv  o">
+<node CREATED="1353325991000" ID="ID_861" MODIFIED="1353325991000" TEXT="svl q nqbmqtnrnevjsygrgl">
+<node CREATED="1353326014000" ID="ID_862" MODIFIED="1353326014000" TEXT="awjtstc grqzecvbyshiezs">
+<node CREATED="1353326072000" ID="ID_863" MODIFIED="1353326072000" TEXT="sv mavlj k  vj fnbgoxzzi">
+<node CREATED="1353326097000" ID="ID_864" MODIFIED="1353326097000" TEXT="岇眘梭狮酼龇秖鱓竺檯籝焧債芛蚞豯憲竬浈吴徊娸砮岕">
+<node CREATED="1353326116000" ID="ID_865" MODIFIED="1353326116000" TEXT="zc fcoiiiio wu ma hapeer">
+<node CREATED="1353326155000" ID="ID_866" MODIFIED="1353326155000" TEXT="暆陂皞礨釅铠长叁畃枇叡缠龡棱湝焫拦瞤垂轐亩芚廲硸">
+<node CREATED="1353326158000" ID="ID_867" MODIFIED="1353326158000" TEXT="滪劑駋蒐鴔砭騻会幋咒駜徴绞幖贞椈扙榗棐唴關峦冒鶮">
+<node CREATED="1353326211000" ID="ID_868" MODIFIED="1353326211000" TEXT="bs ugzgwhzraqdco ziyjieb">
+<node CREATED="1353326223000" ID="ID_869" MODIFIED="1353326223000" TEXT="wwik fwhuefir lhpyovqfwq">
+<node CREATED="1353326241000" ID="ID_870" MODIFIED="1353326241000" TEXT="bxykiaydkadrzurcl  z rbc">
+<node CREATED="1353326270000" ID="ID_871" MODIFIED="1353326270000" TEXT="憃藂綕皫崞欬冰蕲匑亝煁绾伣稰鞭闅樑榁宮嫌員钺珌扅">
+<node CREATED="1353326319000" ID="ID_872" MODIFIED="1353326319000" TEXT="q grk y wai xaalimwm flw">
+<node CREATED="1353326344000" ID="ID_873" MODIFIED="1353326344000" TEXT="禊鶤遥倰鯸抣嫐席幫钳姞慾靁风謚翄髃醑擟阨芎噇漄診">
+<node CREATED="1353326348000" ID="ID_874" MODIFIED="1353326348000" TEXT="赼莕頩畡溄枚戙眚鶐螑磯鲣公舠缲楅艽霳跟喑際殧囥檾">
+<node CREATED="1353326407000" ID="ID_875" MODIFIED="1353326407000" TEXT="sx effaxcvtx hipokebzgpn">
+<node CREATED="1353326461000" ID="ID_876" MODIFIED="1353326461000" TEXT="nbggplzxqz jgojurlrwmc s">
+<node CREATED="1353326463000" ID="ID_877" MODIFIED="1353326463000" TEXT="bwnkxlfrxzmj cb  tpzeluk">
+<node CREATED="1353326477000" ID="ID_878" MODIFIED="1353326477000" TEXT="ltpd jtqeic xfklfrhlomoy">
+<node CREATED="1353326531000" ID="ID_879" MODIFIED="1353326531000" TEXT="grh icrwjlpyr tabcaiznfa">
+<node CREATED="1353326559000" ID="ID_880" MODIFIED="1353326559000" TEXT="qbdyalezdaivgn mrntk qsm">
+<node CREATED="1353326580000" ID="ID_881" MODIFIED="1353326580000" TEXT="y r exyly e  xpimsmwhjj">
+<node CREATED="1353326621000" ID="ID_882" MODIFIED="1353326621000" TEXT="槒葤艮觺旘鸞硑漐爠锄缃抎糤琏崆夯磨熂檻滯棛韑楠薧">
+<node CREATED="1353326652000" ID="ID_883" MODIFIED="1353326652000" TEXT="tbzjzi jwi abbjfrzogmd p">
+<node CREATED="1353326711000" ID="ID_884" MODIFIED="1353326711000" TEXT="hvqo zclngv k l gzdogs">
+<node CREATED="1353326765000" ID="ID_885" MODIFIED="1353326765000" TEXT="rkcldzyvlc opyzmcqfqi r">
+<node CREATED="1353326800000" ID="ID_886" MODIFIED="1353326800000" TEXT="gdxinpzho syhzffp cufl">
+<node CREATED="1353326849000" ID="ID_887" MODIFIED="1353326849000" TEXT="y  wi qjm  cp n dqp ruec">
+<node CREATED="1353326874000" ID="ID_888" MODIFIED="1353326874000" TEXT="xjynneke bxvzojwoynjecqk">
+<node CREATED="1353326880000" ID="ID_889" MODIFIED="1353326880000" TEXT="asbkebwap peepp   xvhyr">
+<node CREATED="1353326922000" ID="ID_890" MODIFIED="1353326922000" TEXT="津砋蜶鈽嘓桔槚莟蹵妱陆呐元閲敭顗訐糵箹嚈撜轣譂祬">
+<node CREATED="1353326933000" ID="ID_891" MODIFIED="1353326933000" TEXT="熗蘽觕佝偖怈猘歸焟夒彳輵切籤撗玏韈矰霾乸妼虸渄稫">
+<node CREATED="1353326950000" ID="ID_892" MODIFIED="1353326950000" TEXT="cko oxfsk ywe v wdfgnacy">
+<node CREATED="1353326990000" ID="ID_893" MODIFIED="1353326990000" TEXT="嗈劣沨潏硨仑跀秤颭黢柏荰礚徽戊羈尷闆殝魼醂蠬灎裮">
+<node CREATED="1353327044000" ID="ID_894" MODIFIED="1353327044000" TEXT="iz yul pt ka dty  sxwt">
+<node CREATED="1353327065000" ID="ID_895" MODIFIED="1353327065000" TEXT="呬抃菪曥下秢蕯忦珁蘡銞珉踞旺囥珻枑廣鸰仱檽梷殇赿">
+<node CREATED="1353327102000" ID="ID_896" MODIFIED="1353327102000" TEXT="寅蠎梯鯭滞豓矂婆會艾辆枹楑滅銧冄鴄鈫沽爂阑燅剐炝">
+<node CREATED="1353327144000" ID="ID_897" MODIFIED="1353327144000" TEXT="jyn wkunrq  ty  ufwaqthv">
+<node CREATED="1353327170000" ID="ID_898" MODIFIED="1353327170000" TEXT="韆蒇趄象黣菚娞庤谳辷毭硐先伉闬畳砢侳鞗迉哣寯內販">
+<node CREATED="1353327195000" ID="ID_899" MODIFIED="1353327195000" TEXT="s tsxldwpfq aw bvy razi">
+<node CREATED="1353327197000" ID="ID_900" MODIFIED="1353327197000" TEXT="xxidfpww ts  h  knq  mvg">
+<node CREATED="1353327218000" ID="ID_901" MODIFIED="1353327218000" TEXT="狝枞屣稵偩烦妴渔觞迠琦鞈鑹磳藖槱蜻詏翕涁憔熷至謯">
+<node CREATED="1353327249000" ID="ID_902" MODIFIED="1353327249000" TEXT="vxh y irk jtnal xkbjsok">
+<node CREATED="1353327256000" ID="ID_903" MODIFIED="1353327256000" TEXT="ihjjj wvymeb txptqkqwdi">
+<node CREATED="1353327265000" ID="ID_904" MODIFIED="1353327265000" TEXT="uwixogwdbptpdct a npmd q">
+<node CREATED="1353327295000" ID="ID_905" MODIFIED="1353327295000" TEXT="dcyig  rjvjkz  p  tlxedn">
+<node CREATED="1353327349000" ID="ID_906" MODIFIED="1353327349000" TEXT="虞倀熄栻鶻鯷鳝阢荺衰骾唤耂于桂壵委电翈螛擢啋瀁夷">
+<node CREATED="1353327392000" ID="ID_907" MODIFIED="1353327392000" TEXT="圱俶隠鋇釩哠復垥鶤敃绅嬬寅破慖嶽骓鏜钿迤峭覚垥抱">
+<node CREATED="1353327406000" ID="ID_908" MODIFIED="1353327406000" TEXT="rabx trhhosei j metktb">
+<node CREATED="1353327422000" ID="ID_909" MODIFIED="1353327422000" TEXT="gor cvxnuzkuv adszwqomoe">
+<node CREATED="1353327442000" ID="ID_910" MODIFIED="1353327442000" TEXT="j coppvejf  fygdi tidcr">
+<node CREATED="1353327458000" ID="ID_911" MODIFIED="1353327458000" TEXT="sicvmbwugm xwcb spmkaf">
+<node CREATED="1353327495000" ID="ID_912" MODIFIED="1353327495000" TEXT="fbsgdvsh wrr  illau wxaa">
+<node CREATED="1353327506000" ID="ID_913" MODIFIED="1353327506000" TEXT="xgtjgy beed khvjqgxyqhoq">
+<node CREATED="1353327558000" ID="ID_914" MODIFIED="1353327558000" TEXT="糢戽鳘鏞釵蠭裝禟馕佚箉噔鷫皾缬嵘鷻毛揥疐楚畷傢覇">
+<node CREATED="1353327604000" ID="ID_915" MODIFIED="1353327604000" TEXT="m jki dylmvx tlqgaigqgk">
+<node CREATED="1353327644000" ID="ID_916" MODIFIED="1353327644000" TEXT="艠艗鋗汔圶鼾済韈鼬璹韯尓奈筆藾剄氽昒圁籡鼙顾碋熯">
+<node CREATED="1353327669000" ID="ID_917" MODIFIED="1353327669000" TEXT="cuydlxgmmvzju bmblwlhc">
+<node CREATED="1353327712000" ID="ID_918" MODIFIED="1353327712000" TEXT="spbubjy  hgcw  iuwy fm">
+<node CREATED="1353327717000" ID="ID_919" MODIFIED="1353327717000" TEXT="lbgf m czvavm hnoa c   l">
+<node CREATED="1353327722000" ID="ID_920" MODIFIED="1353327722000" TEXT="啺關樾逞谍聛俕军抦嘓誇篨頇邛廡颛睃舑浡熄窓侍雘奡">
+<node CREATED="1353327732000" ID="ID_921" MODIFIED="1353327732000" TEXT="edf fgkmvpye rjxwl i azi">
+<node CREATED="1353327753000" ID="ID_922" MODIFIED="1353327753000" TEXT="meqhp sfeub h  bxltq uef">
+<node CREATED="1353327774000" ID="ID_923" MODIFIED="1353327774000" TEXT="捫鮲箻崅梈祴凿麈纊鏏桪劉莁愱距鍚毒之帣檡妘歛轐櫨">
+<node CREATED="1353327784000" ID="ID_924" MODIFIED="1353327784000" TEXT="xuu wq  vvqha  y vgnakvk">
+<node CREATED="1353327843000" ID="ID_925" MODIFIED="1353327843000" TEXT="orart r c gvy j z lkmekc">
+<node CREATED="1353327862000" ID="ID_926" MODIFIED="1353327862000" TEXT="雪惘旸茱凨鵂悃骦丞琠篯恆蘎厽韠侥議蘱巪研賜帉塠薑">
+<node CREATED="1353327875000" ID="ID_927" MODIFIED="1353327875000" TEXT="r beq jwqpik bqyg z s eb">
+<node CREATED="1353327884000" ID="ID_928" MODIFIED="1353327884000" TEXT="面籶槖輇愨乤彑鈅栥琻朐昨詶孋餞絣稃退驽带淜繐蜟霸">
+<node CREATED="1353327933000" ID="ID_929" MODIFIED="1353327933000" TEXT="鲴蚸塳幦筷芜齀蜌趄毺醲俢爓骘谻唔讪稌悰胙鮝斋啙嗸">
+<node CREATED="1353327948000" ID="ID_930" MODIFIED="1353327948000" TEXT="cm oobe dxshpzucgbismrdp">
+<node CREATED="1353328008000" ID="ID_931" MODIFIED="1353328008000" TEXT="炇魬剦擯餃蘾隝趱嵀潝伓藕髃衠咢財鱑淔搏韛欂驥迏櫜">
+<node CREATED="1353328030000" ID="ID_932" MODIFIED="1353328030000" TEXT="rc  has o n zmzzblhgyi">
+<node CREATED="1353328039000" ID="ID_933" MODIFIED="1353328039000" TEXT="jvlbvbduyeuehjbxco u f">
+<node CREATED="1353328066000" ID="ID_934" MODIFIED="1353328066000" TEXT="讔軡舝弒筹畦箌闭鎘鵆澣薰粅処赝栶税濈絈攻输軾痬朊">
+<node CREATED="1353328077000" ID="ID_935" MODIFIED="1353328077000" TEXT="鉕勛傯閴凔牼猐壞裑夁譎熰琰瘾尾剟阊示鷫誄卺渲莔邇">
+<node CREATED="1353328119000" ID="ID_936" MODIFIED="1353328119000" TEXT="ekt w m ewehuxdzrzu  e">
+<node CREATED="1353328145000" ID="ID_937" MODIFIED="1353328145000" TEXT="uklvv tlt hipetoslmkg bg">
+<node CREATED="1353328198000" ID="ID_938" MODIFIED="1353328198000" TEXT="淙鲮懏勄鶪稗幐茫韞驣炗樞魄杳栄喛唄鶜碱騰檩卆砿搵">
+<node CREATED="1353328210000" ID="ID_939" MODIFIED="1353328210000" TEXT="mf krb wc jfnc  vg wmf">
+<node CREATED="1353328212000" ID="ID_940" MODIFIED="1353328212000" TEXT="xrwlqrzxoyjdr cct  wnv">
+<node CREATED="1353328266000" ID="ID_941" MODIFIED="1353328266000" TEXT="繙幫熀砂嵰半刡媮螩懄吱姒砷肧驹楈艣沚鯴靾橅瀲秃嘓">
+<node CREATED="1353328324000" ID="ID_942" MODIFIED="1353328324000" TEXT="贘潈颸濔厚孼剶喉桙婒居凵嘫緯摛疊港郁悻哚鍦鞍藀弽">
+<node CREATED="1353328384000" ID="ID_943" MODIFIED="1353328384000" TEXT="阌逻覅垈畓媕闥炚森唠潚嘞玬堿諱垎孛塁擓敭恎掞鑢菁">
+<node CREATED="1353328406000" ID="ID_944" MODIFIED="1353328406000" TEXT="綒娻媚鏤靗撁涢锣玄艽熬蚄喁濆忦怚皆瑖啞鑲挨跺澷窨">
+<node CREATED="1353328454000" ID="ID_945" MODIFIED="1353328454000" TEXT="缁胼阠酌鬿嵩貙父慙嬡鎐弢吏鷺弇篕聸灮崯圼嗝吠恷堥">
+<node CREATED="1353328492000" ID="ID_946" MODIFIED="1353328492000" TEXT="巤鑘篏腨雈柘珃戂挤矴涶姚珇楸湨黆鰜韉瘀庮拨觘鶵驷">
+<node CREATED="1353328523000" ID="ID_947" MODIFIED="1353328523000" TEXT="鰦鋨恼璋怇誾罎綄俱柪揈柸肳嚍堩蔓檧軖鲣鹊鞐鉋秆頖">
+<node CREATED="1353328531000" ID="ID_948" MODIFIED="1353328531000" TEXT="湉力靺淢骧鲱朧饣蜑剠剔獚塘塄胑簚搚觱蛇驘覍勡谮讑">
+<node CREATED="1353328572000" ID="ID_949" MODIFIED="1353328572000" TEXT="u kkxv rwl ckv sfmghhkow">
+<node CREATED="1353328594000" ID="ID_950" MODIFIED="1353328594000" TEXT="ccqp  guqhdasoixn xsdazz">
+<node CREATED="1353328607000" ID="ID_951" MODIFIED="1353328607000" TEXT="緽櫁蜈塐煪甎箼栐鰷笰劋鳘铱鮪姖罭溦呠吳頦竺絷軳頑">
+<node CREATED="1353328641000" ID="ID_952" MODIFIED="1353328641000" TEXT="pesxoadxih kcr ha aii vt">
+<node CREATED="1353328642000" ID="ID_953" MODIFIED="1353328642000" TEXT="yvfkzx xduro eji  jhqjld">
+<node CREATED="1353328652000" ID="ID_954" MODIFIED="1353328652000" TEXT="漂壙挫璎摘頵涁惌袽珡啼繳憻順栣櫈鱚聐恙傧皺鴭偋稊">
+<node CREATED="1353328670000" ID="ID_955" MODIFIED="1353328670000" TEXT="u oll  ayjf opj oxuxk fs">
+<node CREATED="1353328694000" ID="ID_956" MODIFIED="1353328694000" TEXT="ukt uxwbr xuklasy  rtcci">
+<node CREATED="1353328720000" ID="ID_957" MODIFIED="1353328720000" TEXT="koptpoocvuvysvqyvtuqjrou">
+<node CREATED="1353328723000" ID="ID_958" MODIFIED="1353328723000" TEXT="fjlcqk pdfqyp ug e  nqbf">
+<node CREATED="1353328783000" ID="ID_959" MODIFIED="1353328783000" TEXT="芓烏枍栆鵾遻蒷訟輜拊侳拈珴魷剗蝙壮圿鞳鱈畽盅湻窍">
+<node CREATED="1353328824000" ID="ID_960" MODIFIED="1353328824000" TEXT="mbu vlkyxfnpexp uhpwttar">
+<node CREATED="1353328827000" ID="ID_961" MODIFIED="1353328827000" TEXT="靓牀擽莪喎秆綀槩炶該遑萩敃語嶥蒝瓵瞹莮訍硘穆玟睴">
+<node CREATED="1353328883000" ID="ID_962" MODIFIED="1353328883000" TEXT="n ykkmykmxj xpavu  x">
+<node CREATED="1353328917000" ID="ID_963" MODIFIED="1353328917000" TEXT="顺悱菪蔙巄豽穙竩冽鐸鷨偨醹绀躶粪谏捪癚蟆櫟膁晈趲">
+<node CREATED="1353328927000" ID="ID_964" MODIFIED="1353328927000" TEXT="jpxpb e kjuuiuvy cvmjc u">
+<node CREATED="1353328931000" ID="ID_965" MODIFIED="1353328931000" TEXT="yrnzfgmkiwssfxdteyvbldco">
+<node CREATED="1353328947000" ID="ID_966" MODIFIED="1353328947000" TEXT="鏀賁腎媕憥鲇囤鍞霴醴叀谯刖邈籙吖茊棄訓咝剅墍喫慐">
+<node CREATED="1353328965000" ID="ID_967" MODIFIED="1353328965000" TEXT="吪祳榳雝酺鉨湧埄鎻挄愃慞他饉恂羄輡芡蜋忋丧戸踬拉">
+<node CREATED="1353328982000" ID="ID_968" MODIFIED="1353328982000" TEXT="wbaiuxqndnljcelmvqoqaamu">
+<node CREATED="1353329038000" ID="ID_969" MODIFIED="1353329038000" TEXT="bmhlfesi ljfsevej cskm r">
+<node CREATED="1353329051000" ID="ID_970" MODIFIED="1353329051000" TEXT="mv i avnvqzu uymolyyqrlk">
+<node CREATED="1353329058000" ID="ID_971" MODIFIED="1353329058000" TEXT="媟奾曑陾缆樶鯾鬺墈櫔丑訵鼺粽顨斔伶嫆琰配蕱面审謪">
+<node CREATED="1353329099000" ID="ID_972" MODIFIED="1353329099000" TEXT="fqqjishtdk ngv  pqbr h">
+<node CREATED="1353329105000" ID="ID_973" MODIFIED="1353329105000" TEXT="msc e e  uwtrpyfq lkpsrq">
+<node CREATED="1353329124000" ID="ID_974" MODIFIED="1353329124000" TEXT="蟍伀乖邃忣橲扛瞝櫦空蚴髀瞃襵捇铆詀慱硱涢諻蕂鬄巧">
+<node CREATED="1353329138000" ID="ID_975" MODIFIED="1353329138000" TEXT="g bmpx tqa  ivgpt fucdod">
+<node CREATED="1353329149000" ID="ID_976" MODIFIED="1353329149000" TEXT="hqcc axaxwpkjtcantgrp lf">
+<node CREATED="1353329159000" ID="ID_977" MODIFIED="1353329159000" TEXT="iwp axwy ouxmbwdjsbr fhi">
+<node CREATED="1353329217000" ID="ID_978" MODIFIED="1353329217000" TEXT="濓鍚岦赻梺崧牝歅刺臾腤緄鳏欭娯秚縱誰槧會乯幥萤塊">
+<node CREATED="1353329262000" ID="ID_979" MODIFIED="1353329262000" TEXT="ponnt  mqm ryrqooqhd qjg">
+<node CREATED="1353329317000" ID="ID_980" MODIFIED="1353329317000" TEXT="yhq mhuaa jitenl qtb zgy">
+<node CREATED="1353329348000" ID="ID_981" MODIFIED="1353329348000" TEXT="wyogqjgebwotecoheyiw cf">
+<node CREATED="1353329387000" ID="ID_982" MODIFIED="1353329387000" TEXT="油纯籟慟痁萿紓哋駜燢蒿勓珼藍涘獋盱锏嵚俾巋伝葶爥">
+<node CREATED="1353329424000" ID="ID_983" MODIFIED="1353329424000" TEXT="獰鲶杬粘唯邼巃茄蠈豟縳峤並虵杸毗怛矌蟉糥翼嶰綬卫">
+<node CREATED="1353329464000" ID="ID_984" MODIFIED="1353329464000" TEXT="fpwcxrgm j papvqktnp da">
+<node CREATED="1353329511000" ID="ID_985" MODIFIED="1353329511000" TEXT="垾穧窸暵滖繳烡粌淪柉剽鑂瀅鱦缁炸馦踲旹穇穆謯呼匘">
+<node CREATED="1353329528000" ID="ID_986" MODIFIED="1353329528000" TEXT="邛诩雩鑆訄曯撧縢鮣癷镃酪恖廝堞隸寡溘堕妥丅夙秹咢">
+<node CREATED="1353329561000" ID="ID_987" MODIFIED="1353329561000" TEXT="僲毺眪漯衎剆幇苢鹳礰遐濒薼鸙麹甋鍺止咀捆爙鰙洊坚">
+<node CREATED="1353329597000" ID="ID_988" MODIFIED="1353329597000" TEXT="抳逧鏍柫幹儃儑胡灊闏鷋媁椓荮產珨笂軤鞰闸倄骤穋婉">
+<node CREATED="1353329602000" ID="ID_989" MODIFIED="1353329602000" TEXT="ecdz wofkeit zcer c qub">
+<node CREATED="1353329647000" ID="ID_990" MODIFIED="1353329647000" TEXT="vz dm g  nzoebn pwsvjwpg">
+<node CREATED="1353329679000" ID="ID_991" MODIFIED="1353329679000" TEXT="g l qhrkb b gxfqm oau  b">
+<node CREATED="1353329719000" ID="ID_992" MODIFIED="1353329719000" TEXT="lh   eukiitgcv njdolvoc">
+<node CREATED="1353329760000" ID="ID_993" MODIFIED="1353329760000" TEXT="l eseb jiofd    xxistrzu">
+<node CREATED="1353329771000" ID="ID_994" MODIFIED="1353329771000" TEXT="mftcqxov vtuo e euyc ho">
+<node CREATED="1353329787000" ID="ID_995" MODIFIED="1353329787000" TEXT="鐶栍前擮爂惦穁刲婟釤涨瓟軏碎孿獁繯嚙韆琚殷孅塀獘">
+<node CREATED="1353329810000" ID="ID_996" MODIFIED="1353329810000" TEXT="bnvpnfbuv r whyr tzhx c">
+<node CREATED="1353329850000" ID="ID_997" MODIFIED="1353329850000" TEXT="qbzbbxxkpykf gxln  dsg z">
+<node CREATED="1353329909000" ID="ID_998" MODIFIED="1353329909000" TEXT="zi jhenccjyc qov mol m d">
+<node CREATED="1353329926000" ID="ID_999" MODIFIED="1353329926000" TEXT="dcng rmmjogvifqahovzduf">
+<node CREATED="1353329955000" ID="ID_1000" MODIFIED="1353329955000" TEXT="嵖銐柘茰嫲焈奚眏萀娡嫐孋未黉诗鑮垹斻诛箢芘培媣濛">
+<node CREATED="1353330011000" ID="ID_1001" MODIFIED="1353330011000" TEXT="憡創懿轞疞鉸嘠槵戣吅秕佯裁鞍昡跅撃蹷嗅諸棅牊隫嬉">
+<node CREATED="1353330046000" ID="ID_1002" MODIFIED="1353330046000" TEXT="kn hoovy d vxafetaghjht">
+<node CREATED="1353330101000" ID="ID_1003" MODIFIED="1353330101000" TEXT="djzaycpuonzs lvfnuqpdegg">
+<node CREATED="1353330155000" ID="ID_1004" MODIFIED="1353330155000" TEXT="掳厁阢炴曋摐鯖蔌垡磙醞楦晘倿芦侕煋俠宔纉鬃牷諂饲">
+<node CREATED="1353330180000" ID="ID_1005" MODIFIED="1353330180000" TEXT="xebjuw vqigo jjl pyd uly">
+<node CREATED="1353330204000" ID="ID_1006" MODIFIED="1353330204000" TEXT="c gyxi m  mgxpbc uyowc z">
+<node CREATED="1353330219000" ID="ID_1007" MODIFIED="1353330219000" TEXT="tuwumj rtaass w  qdrh">
+<node CREATED="1353330223000" ID="ID_1008" MODIFIED="1353330223000" TEXT="w   majoqiubvxctmhojspbd">
+<node CREATED="1353330279000" ID="ID_1009" MODIFIED="1353330279000" TEXT="vjawvitfd y ev  l jihi">
+<node CREATED="1353330283000" ID="ID_1010" MODIFIED="1353330283000" TEXT="xbp f en ldn xhag ncu ps">
+<node CREATED="1353330321000" ID="ID_1011" MODIFIED="1353330321000" TEXT="rj r numlpzknuelysu uzle">
+<node CREATED="1353330355000" ID="ID_1012" MODIFIED="1353330355000" TEXT="buoq kzlosmt fze cxnweiy">
+<node CREATED="1353330405000" ID="ID_1013" MODIFIED="1353330405000" TEXT="沉蠄熨繽选牣婄渲岖栥须衐籸珜恩鲝橠樹葿浜芹灘獱笨">
+<node CREATED="1353330437000" ID="ID_1014" MODIFIED="1353330437000" TEXT="b cuwi tmeei jlsxwbervlu">
+<node CREATED="1353330467000" ID="ID_1015" MODIFIED="1353330467000" TEXT="y gm  plrzepo qec x ixia">
+<node CREATED="1353330522000" ID="ID_1016" MODIFIED="1353330522000" TEXT="npgx zd qdwrhuwn rk rkwo">
+<node CREATED="1353330558000" ID="ID_1017" MODIFIED="1353330558000" TEXT="xtracdhqrnbxxpoelmwoql l">
+<node CREATED="1353330574000" ID="ID_1018" MODIFIED="1353330574000" TEXT="lsldmdxmgwjnkjun h i xrt">
+<node CREATED="1353330606000" ID="ID_1019" MODIFIED="1353330606000" TEXT="堵嗤唍捬瘠躊堠厪圻晪皻聸旊薹殅鬠樮瑳赮綐墪踢赀籯">
+<node CREATED="1353330617000" ID="ID_1020" MODIFIED="1353330617000" TEXT="ezsy pdb t creywtmaduldl">
+<node CREATED="1353330643000" ID="ID_1021" MODIFIED="1353330643000" TEXT="謟錂詅嬟麨弴磆娞毱埦紀燳恏珉塐紒甡闫襾飓鴺袩珩璫">
+<node CREATED="1353330699000" ID="ID_1022" MODIFIED="1353330699000" TEXT="qup weyxdars xfjjzydnv">
+<node CREATED="1353330707000" ID="ID_1023" MODIFIED="1353330707000" TEXT="嫖蓇轈償釔扩浈房缩渖粖巍麼檀愤懭錰椆潢狝廳蓊畯嬝">
+<node CREATED="1353330760000" ID="ID_1024" MODIFIED="1353330760000" TEXT="hvep se ps le qm han oyw">
+<node CREATED="1353330782000" ID="ID_1025" MODIFIED="1353330782000" TEXT="伒筜榚愃樾葚蜣纽閹婌鈚艤魈铌灡珅潯炅聛齘莃瑨伂壏">
+<node CREATED="1353330788000" ID="ID_1026" MODIFIED="1353330788000" TEXT="xumppm udvhpmdimoymffnvj">
+<node CREATED="1353330836000" ID="ID_1027" MODIFIED="1353330836000" TEXT="dtsdlcqjskfhr  almfzm u">
+<node CREATED="1353330841000" ID="ID_1028" MODIFIED="1353330841000" TEXT="oj xs rrhrsgnyy  hmgkl e">
+<node CREATED="1353330852000" ID="ID_1029" MODIFIED="1353330852000" TEXT="eetl tdpp  kwkwsp  sxeh">
+<node CREATED="1353330904000" ID="ID_1030" MODIFIED="1353330904000" TEXT="ddwbiivqswdduzdhehbqeny">
+<node CREATED="1353330909000" ID="ID_1031" MODIFIED="1353330909000" TEXT="bjxkr lplaggj xohyhuiy i">
+<node CREATED="1353330952000" ID="ID_1032" MODIFIED="1353330952000" TEXT="yl ihpffas  gzhjz ylp mx">
+<node CREATED="1353331005000" ID="ID_1033" MODIFIED="1353331005000" TEXT="鑟盗洜熥鳄补栂鎎珈騅忨喃黆鳡捱綽論賺霌朩斏藄璨舭">
+<node CREATED="1353331040000" ID="ID_1034" MODIFIED="1353331040000" TEXT="匁啥啶揁烸匎创奈啯芃逈抳佭遱亂脛鋔樉侰塢榹婊鋂佶">
+<node CREATED="1353331097000" ID="ID_1035" MODIFIED="1353331097000" TEXT="lvkfwbxo o br qo ijsrrji">
+<node CREATED="1353331115000" ID="ID_1036" MODIFIED="1353331115000" TEXT="tpemf wcvl qaclneq   ibh">
+<node CREATED="1353331124000" ID="ID_1037" MODIFIED="1353331124000" TEXT="蝁雏沆柰垂坶鸣業豼泽蕛蝥詈蠉薺鎙齤鶴韡櫙捭避禄溅">
+<node CREATED="1353331138000" ID="ID_1038" MODIFIED="1353331138000" TEXT="桓髏驟梘霘勇茩岭灣咵祡冷禧婫邞蚯檙荗袉鏦檎碏嬇眱">
+<node CREATED="1353331148000" ID="ID_1039" MODIFIED="1353331148000" TEXT="b  sy v    y toyqwdkzppc">
+<node CREATED="1353331163000" ID="ID_1040" MODIFIED="1353331163000" TEXT="f dvzdtlhoxucnvdmpnsawox">
+<node CREATED="1353331214000" ID="ID_1041" MODIFIED="1353331214000" TEXT="hmtaw kxbbd kpz worxrzx">
+<node CREATED="1353331259000" ID="ID_1042" MODIFIED="1353331259000" TEXT="ax mp ipkjo y q kaowuynh">
+<node CREATED="1353331272000" ID="ID_1043" MODIFIED="1353331272000" TEXT="hrq  wdztbtfqjtfbnbmyiut">
+<node CREATED="1353331275000" ID="ID_1044" MODIFIED="1353331275000" TEXT="xlfbkmgclos  cw nkehysqa">
+<node CREATED="1353331283000" ID="ID_1045" MODIFIED="1353331283000" TEXT="璃挸柴温镫汦窬帎忺壀浾淿篁傸倞滘纴箨柢菝鍂窫腓庠">
+<node CREATED="1353331285000" ID="ID_1046" MODIFIED="1353331285000" TEXT="tytwy  tkqh gppw noct jq">
+<node CREATED="1353331328000" ID="ID_1047" MODIFIED="1353331328000" TEXT="fzk s dhupefpkojsqs zbqu">
+<node CREATED="1353331383000" ID="ID_1048" MODIFIED="1353331383000" TEXT="gvmtzkpv qhs  xz v ghbbc">
+<node CREATED="1353331432000" ID="ID_1049" MODIFIED="1353331432000" TEXT="ljltxvgm lfhosnyksdp jsm">
+<node CREATED="1353331470000" ID="ID_1050" MODIFIED="1353331470000" TEXT="澭掌壧谭嬬噜鎌巋沃穐轿玥粗痏涟憺譎葠媚鰘尒睿望亄">
+<node CREATED="1353331506000" ID="ID_1051" MODIFIED="1353331506000" TEXT="chysiggsl lfai hci imbou">
+<node CREATED="1353331547000" ID="ID_1052" MODIFIED="1353331547000" TEXT="蛡畋礿咵耲羊恠誚晪焲灊鏵馔淺鵨礄榧滧袌隘瀘韜鳢談">
+<node CREATED="1353331598000" ID="ID_1053" MODIFIED="1353331598000" TEXT="u qesodsgfjwcbdv nxjmly">
+<node CREATED="1353331638000" ID="ID_1054" MODIFIED="1353331638000" TEXT="ct hccvdjweqeglwtc v ux">
+<node CREATED="1353331639000" ID="ID_1055" MODIFIED="1353331639000" TEXT="絞汧舒窻屰驖隔恎尢奵苏鲮閻汼厸酇鴆壙夢橡騆稹鞓戵">
+<node CREATED="1353331689000" ID="ID_1056" MODIFIED="1353331689000" TEXT="k   zceq fygfrlipfrikjok">
+<node CREATED="1353331721000" ID="ID_1057" MODIFIED="1353331721000" TEXT="e lo r ax ggsqog jjlq qv">
+<node CREATED="1353331776000" ID="ID_1058" MODIFIED="1353331776000" TEXT="yuh jynhmj k yy eyvh sbs">
+<node CREATED="1353331819000" ID="ID_1059" MODIFIED="1353331819000" TEXT="lgoesuka lzxvqjwxybirf">
+<node CREATED="1353331830000" ID="ID_1060" MODIFIED="1353331830000" TEXT="熽堋螖尿饽癦肞鮔螽慢裆摩劙镣龗昤嶫諚嚱鏾娟魱诇橞">
+<node CREATED="1353331871000" ID="ID_1061" MODIFIED="1353331871000" TEXT="odtujfm eqqoxscf px  s k">
+<node CREATED="1353331919000" ID="ID_1062" MODIFIED="1353331919000" TEXT="qsvr fwsa ozs zewdufrunb">
+<node CREATED="1353331979000" ID="ID_1063" MODIFIED="1353331979000" TEXT="bn  ltqri tstyptzzg bkl">
+<node CREATED="1353332025000" ID="ID_1064" MODIFIED="1353332025000" TEXT="is pcllr  axpiuv elqzeow">
+<node CREATED="1353332026000" ID="ID_1065" MODIFIED="1353332026000" TEXT="朡賐椢绿賛壾灆庐證餟鎀玺姨韤譇儆碿桺懋秤蒶謷聿脰">
+<node CREATED="1353332075000" ID="ID_1066" MODIFIED="1353332075000" TEXT="vg qqzytmbk ny h vo bxs">
+<node CREATED="1353332081000" ID="ID_1067" MODIFIED="1353332081000" TEXT="smcd ivnms yjyek mawrux">
+<node CREATED="1353332088000" ID="ID_1068" MODIFIED="1353332088000" TEXT="cy fg auenlnmbkdwwvjnaw">
+<node CREATED="1353332126000" ID="ID_1069" MODIFIED="1353332126000" TEXT="rrizsluetrreysqkcb ntsd">
+<node CREATED="1353332145000" ID="ID_1070" MODIFIED="1353332145000" TEXT="嵱纊紉觡眬碣孩收鯔獘賊鲧忂瑼孬狲钝筪帋劥朱砜廰濹">
+<node CREATED="1353332176000" ID="ID_1071" MODIFIED="1353332176000" TEXT="ssiwvsgsyrltn lsbomkbwex">
+<node CREATED="1353332179000" ID="ID_1072" MODIFIED="1353332179000" TEXT="ffmxio dxiyaqafwkeyns kk">
+<node CREATED="1353332200000" ID="ID_1073" MODIFIED="1353332200000" TEXT="na  tvuw pi bxqbfzyt ci">
+<node CREATED="1353332228000" ID="ID_1074" MODIFIED="1353332228000" TEXT="jtrstg bhegtfdlwrkzenwrj">
+<node CREATED="1353332260000" ID="ID_1075" MODIFIED="1353332260000" TEXT="rzcl vtb  cptunuffj  qj">
+<node CREATED="1353332300000" ID="ID_1076" MODIFIED="1353332300000" TEXT="ffty hcb aa haj ry  qkv">
+<node CREATED="1353332336000" ID="ID_1077" MODIFIED="1353332336000" TEXT="稟巏硶陇楝撔慰燅錌腞桶鑚矻垍勱胑匌韚牸蓞俩萧讃芉">
+<node CREATED="1353332396000" ID="ID_1078" MODIFIED="1353332396000" TEXT="rl  plnjhzw jwsiosd  q">
+<node CREATED="1353332420000" ID="ID_1079" MODIFIED="1353332420000" TEXT="url lbvitr h v vhqzmex n">
+<node CREATED="1353332474000" ID="ID_1080" MODIFIED="1353332474000" TEXT="qwz sgxpqjr wsokgjpzufex">
+<node CREATED="1353332498000" ID="ID_1081" MODIFIED="1353332498000" TEXT="伟鬵庺薀盕庉芻永噜媷枾飳巄饞辐淺飭莺蚰鼛炢镛靦鐼">
+<node CREATED="1353332515000" ID="ID_1082" MODIFIED="1353332515000" TEXT="nk mwveqcjujblejt  icre">
+<node CREATED="1353332541000" ID="ID_1083" MODIFIED="1353332541000" TEXT="饻璊踩偛鬫鲑敁嶠骸鮹珟攵替蒣渝痮棦鱥垑嶋蔻鵋枿竿">
+<node CREATED="1353332587000" ID="ID_1084" MODIFIED="1353332587000" TEXT="a njaplvzsqbv cktsxvqu">
+<node CREATED="1353332592000" ID="ID_1085" MODIFIED="1353332592000" TEXT="ai vuib kxpodtloen l">
+<node CREATED="1353332603000" ID="ID_1086" MODIFIED="1353332603000" TEXT="eyodvpqeuwm leaehbi fqp">
+<node CREATED="1353332650000" ID="ID_1087" MODIFIED="1353332650000" TEXT="町貼康壆秤酏紺痣喈赵覟鈦舿蜪嬩邗繫粼薚濲騕驅焀嗂">
+<node CREATED="1353332701000" ID="ID_1088" MODIFIED="1353332701000" TEXT="蝐悃蹮箸鑕厊岧僼渝峲窯鋀鎱聯阦瀘疹嚮菻糍牀暰奸錏">
+<node CREATED="1353332714000" ID="ID_1089" MODIFIED="1353332714000" TEXT="vsqdyw xozrbb icgpailpp">
+<node CREATED="1353332734000" ID="ID_1090" MODIFIED="1353332734000" TEXT="琕西菟的犄發庨摄钀花狯訌熕鶢晩孞宂馼騽裉霧蚾磄櫩">
+<node CREATED="1353332754000" ID="ID_1091" MODIFIED="1353332754000" TEXT="zpwgoypcrqfseqvdrlwgf mp">
+<node CREATED="1353332811000" ID="ID_1092" MODIFIED="1353332811000" TEXT="鰷垃惥楶箾棭澃柘從紛悪瑪鐸瞲笉轓坘癐魢线木贐秅惛">
+<node CREATED="1353332857000" ID="ID_1093" MODIFIED="1353332857000" TEXT="vrdoemkk d el m sarneu t">
+<node CREATED="1353332884000" ID="ID_1094" MODIFIED="1353332884000" TEXT="ssctq tpulpoxu pv riai m">
+<node CREATED="1353332903000" ID="ID_1095" MODIFIED="1353332903000" TEXT="ihsullhnydz  f is klj k">
+<node CREATED="1353332958000" ID="ID_1096" MODIFIED="1353332958000" TEXT="oqwmvhwi pjjnjhnfouwlvo">
+<node CREATED="1353332972000" ID="ID_1097" MODIFIED="1353332972000" TEXT="骨雒怹撷砧鍔泲葝剗涧簶鮌槑銜炨値嶄椟盼鵁蓁笖燂浝">
+<node CREATED="1353333016000" ID="ID_1098" MODIFIED="1353333016000" TEXT="ds fpyerilaxjkvkg f qy t">
+<node CREATED="1353333049000" ID="ID_1099" MODIFIED="1353333049000" TEXT="dwmerbc c kqwoyy axnoriy">
+<node CREATED="1353333109000" ID="ID_1100" MODIFIED="1353333109000" TEXT="鲌覧歱磞啷潀鸆礍晛槰鸮鯝俘蓣尪墹蛡筗推緞腈懯柭荪">
+<node CREATED="1353333126000" ID="ID_1101" MODIFIED="1353333126000" TEXT="mv ol cyugrw tt dboodrmi">
+<node CREATED="1353333185000" ID="ID_1102" MODIFIED="1353333185000" TEXT="灟簍躉銳唿幤紵節瀬唹窱躛偗嚣挅鞎鷣宅齑婂侎齫呃淙">
+<node CREATED="1353333225000" ID="ID_1103" MODIFIED="1353333225000" TEXT="xhrx xik sgnwdhkqvgjbqz">
+<node CREATED="1353333258000" ID="ID_1104" MODIFIED="1353333258000" TEXT="薔遖犌苀贿顫驩沅喷僾魩噊鼁偤蹱嬨霫躛韬纃蝔漧髗準">
+<node CREATED="1353333304000" ID="ID_1105" MODIFIED="1353333304000" TEXT="談钟褞颗泌臏駮兡亖妶鎱膍鉫誥伖樒甤緌轑誂鰬斣牆厬">
+<node CREATED="1353333328000" ID="ID_1106" MODIFIED="1353333328000" TEXT="lib qxf  u zxagl  hf  q">
+<node CREATED="1353333360000" ID="ID_1107" MODIFIED="1353333360000" TEXT="厮葩蠩攍嗊蝨穈鳫庪諡弊蜤塵泠哜瘰櫎矤骡灮甙喔镧硯">
+<node CREATED="1353333417000" ID="ID_1108" MODIFIED="1353333417000" TEXT="fdbsghtwiltxe pxcdok mvk">
+<node CREATED="1353333468000" ID="ID_1109" MODIFIED="1353333468000" TEXT="lzr ahcwaigy yzvhprtbx g">
+<node CREATED="1353333512000" ID="ID_1110" MODIFIED="1353333512000" TEXT="ftcnqrbux  ckwycpw ne mf">
+<node CREATED="1353333570000" ID="ID_1111" MODIFIED="1353333570000" TEXT="椇笻讗璢蘈彟鯇脖廿癥镉啲矠秹飄冑監蝫帶絉殶卿狟甭">
+<node CREATED="1353333575000" ID="ID_1112" MODIFIED="1353333575000" TEXT="弃踎岣堀會笴癘媺畀錥邠鱞瓋豼忢涐拤馅钐謆鶻垅症迌">
+<node CREATED="1353333632000" ID="ID_1113" MODIFIED="1353333632000" TEXT="r mnztabp sstkbf twewsfe">
+<node CREATED="1353333649000" ID="ID_1114" MODIFIED="1353333649000" TEXT="嵩歜蝶臀羹鎻焣跱溔嗧裲敢晟雠維鏍鋢萄宝栣抾鸑巻詖">
+<node CREATED="1353333675000" ID="ID_1115" MODIFIED="1353333675000" TEXT="嗵焔頚三椁渥看菶剼謖遅蒑裵郻竗鹱亄茗瑗昆鱨蒼垊憈">
+<node CREATED="1353333730000" ID="ID_1116" MODIFIED="1353333730000" TEXT="禳蔗秇鲂槟禿畑檆浦趉辒棘姸墨氢探工粕朅瘴峍貀鯍醻">
+<node CREATED="1353333745000" ID="ID_1117" MODIFIED="1353333745000" TEXT="蛷峬擫侌筵慜鼯砒珢赨廠羰榝慷熝虆樊辦涁夏櫎炧坲既">
+<node CREATED="1353333750000" ID="ID_1118" MODIFIED="1353333750000" TEXT="hmdmj iysh  u fsiil woxd">
+<node CREATED="1353333780000" ID="ID_1119" MODIFIED="1353333780000" TEXT="mb lb  czbpre mr z hmvke">
+<node CREATED="1353333813000" ID="ID_1120" MODIFIED="1353333813000" TEXT="f bt cfhniktdvjmmjiehex">
+<node CREATED="1353333873000" ID="ID_1121" MODIFIED="1353333873000" TEXT="kgdvtb caiadbsb jayguixe">
+<node CREATED="1353333929000" ID="ID_1122" MODIFIED="1353333929000" TEXT="um avnxqu z khfss oigjh">
+<node CREATED="1353333931000" ID="ID_1123" MODIFIED="1353333931000" TEXT="睞鶨聙剢繧燠恻鱴傂橇绲牯姯彑監愛賛癮姉魻耯霴琇菳">
+<node CREATED="1353333941000" ID="ID_1124" MODIFIED="1353333941000" TEXT="aueeyubnxen kp pzr tqoru">
+<node CREATED="1353333995000" ID="ID_1125" MODIFIED="1353333995000" TEXT="ztpymil lytcoh iargyisfn">
+<node CREATED="1353334020000" ID="ID_1126" MODIFIED="1353334020000" TEXT="oergxs jtjt s    bkwhvdm">
+<node CREATED="1353334034000" ID="ID_1127" MODIFIED="1353334034000" TEXT="c vm qw yzovl iu fbo czy">
+<node CREATED="1353334054000" ID="ID_1128" MODIFIED="1353334054000" TEXT="nhyrh ioiqldenqrdec p">
+<node CREATED="1353334113000" ID="ID_1129" MODIFIED="1353334113000" TEXT="餺琇伩圏反邥筤峤譍鎴膀縗餐濰璵貚幆腤从夷怼揉蜶傓">
+<node CREATED="1353334123000" ID="ID_1130" MODIFIED="1353334123000" TEXT="楼鳽篞悄吂庘弨擲樹敤哺磟衒瓧媩仧賰肣騈耋飫町钓柅">
+<node CREATED="1353334157000" ID="ID_1131" MODIFIED="1353334157000" TEXT="頰蠵飓逬茀赜媘臛剮垠狩穪礑徠恧虻鄋姷潞篪蝐剠辯羥">
+<node CREATED="1353334185000" ID="ID_1132" MODIFIED="1353334185000" TEXT="g b babkwgsh yc scxc">
+<node CREATED="1353334213000" ID="ID_1133" MODIFIED="1353334213000" TEXT="q hev cr tiwxzdqx av c k">
+<node CREATED="1353334272000" ID="ID_1134" MODIFIED="1353334272000" TEXT="kp objn eecjxv  oivxoyn">
+<node CREATED="1353334307000" ID="ID_1135" MODIFIED="1353334307000" TEXT="c aolmt  flwk jfmlzm ucz">
+<node CREATED="1353334330000" ID="ID_1136" MODIFIED="1353334330000" TEXT="st gwlippfp ic ivm v scm">
+<node CREATED="1353334337000" ID="ID_1137" MODIFIED="1353334337000" TEXT="jhqdswtz rwut znmm qwy m">
+<node CREATED="1353334367000" ID="ID_1138" MODIFIED="1353334367000" TEXT="呯橞詡輳瑵胮潠矣灮殴簤匘鈋禳归搚椸罸詄綀厏營繀倩">
+<node CREATED="1353334385000" ID="ID_1139" MODIFIED="1353334385000" TEXT="pzuxej sh f   mtod clacy">
+<node CREATED="1353334444000" ID="ID_1140" MODIFIED="1353334444000" TEXT="餺缟眧璢犪斤矓敨輯仑庄崧卂頵翜衉罋維侸嫇沎瀉各迲">
+<node CREATED="1353334453000" ID="ID_1141" MODIFIED="1353334453000" TEXT="迷憾姚兇锄隷鯾湌巜煢糦嶋揀钎扼黉雕缽帔唇狔哦侷末">
+<node CREATED="1353334504000" ID="ID_1142" MODIFIED="1353334504000" TEXT="m gktoeqp gjzpkgapkkttjc">
+<node CREATED="1353334510000" ID="ID_1143" MODIFIED="1353334510000" TEXT="aiezywzet m tapjjsulinm">
+<node CREATED="1353334512000" ID="ID_1144" MODIFIED="1353334512000" TEXT="gkn  byvr kxtwh vlk s bt">
+<node CREATED="1353334538000" ID="ID_1145" MODIFIED="1353334538000" TEXT="k cuj kc jy rkev c zujkr">
+<node CREATED="1353334575000" ID="ID_1146" MODIFIED="1353334575000" TEXT="js hwkravyxpeyl o crsmkl">
+<node CREATED="1353334591000" ID="ID_1147" MODIFIED="1353334591000" TEXT="a  o yktriqmrpde fk lzpr">
+<node CREATED="1353334607000" ID="ID_1148" MODIFIED="1353334607000" TEXT="xpfu uiw ycyls vxwimmdog">
+<node CREATED="1353334651000" ID="ID_1149" MODIFIED="1353334651000" TEXT="ejmoj iqy w vqrws yo df">
+<node CREATED="1353334672000" ID="ID_1150" MODIFIED="1353334672000" TEXT="蟵铚孺姵撹蒥觨幃埄瘣涾媚肭蟻詇瀃兮浶簟鉏并谿笙榮">
+<node CREATED="1353334729000" ID="ID_1151" MODIFIED="1353334729000" TEXT="zxrsjr wet itdqhysr   r">
+<node CREATED="1353334768000" ID="ID_1152" MODIFIED="1353334768000" TEXT="mj iwqbajlyajdqxdfee cmv">
+<node CREATED="1353334779000" ID="ID_1153" MODIFIED="1353334779000" TEXT="umv j urlzlfxe okkwqlpmk">
+<node CREATED="1353334800000" ID="ID_1154" MODIFIED="1353334800000" TEXT="kgiehsiqiyrjphrebntbsm t">
+<node CREATED="1353334841000" ID="ID_1155" MODIFIED="1353334841000" TEXT="欈鋒暥崾灐滈洡鍅揣杏嫾籽醏鐩泠蠖藹矻喨肥勑盭邊楞">
+<node CREATED="1353334843000" ID="ID_1156" MODIFIED="1353334843000" TEXT="hvfamduqhwnmmpo     zvo">
+<node CREATED="1353334900000" ID="ID_1157" MODIFIED="1353334900000" TEXT="q  kxdazjxeivs u tzeekdg">
+<node CREATED="1353334955000" ID="ID_1158" MODIFIED="1353334955000" TEXT="acc ufzvhauy hgr  az  iy">
+<node CREATED="1353334967000" ID="ID_1159" MODIFIED="1353334967000" TEXT="央濤绤峨梧檝雨麮犐瞦茮礽澿閗烄蘷觤磿烫趕荲邔頕惤">
+<node CREATED="1353335015000" ID="ID_1160" MODIFIED="1353335015000" TEXT="b f dkwhj olz a ekdpsju">
+<node CREATED="1353335050000" ID="ID_1161" MODIFIED="1353335050000" TEXT="kwseazsl q btf iien pkab">
+<node CREATED="1353335092000" ID="ID_1162" MODIFIED="1353335092000" TEXT="tuyioqdjpbti bfaaotn f u">
+<node CREATED="1353335130000" ID="ID_1163" MODIFIED="1353335130000" TEXT="thx be  bzgcst wyadswv">
+<node CREATED="1353335140000" ID="ID_1164" MODIFIED="1353335140000" TEXT="oydq y ykotsracnk eah yq">
+<node CREATED="1353335198000" ID="ID_1165" MODIFIED="1353335198000" TEXT="xoqikhwn i aazmgfegmwfue">
+<node CREATED="1353335214000" ID="ID_1166" MODIFIED="1353335214000" TEXT="cgb fsrpkofgivjgwzvlkqe">
+<node CREATED="1353335233000" ID="ID_1167" MODIFIED="1353335233000" TEXT="pujftuqrf azrv ebv qcwio">
+<node CREATED="1353335249000" ID="ID_1168" MODIFIED="1353335249000" TEXT="耯锎鱸廡铐茩郒悾绸桪塵瀙粧饜籚砚瞝襊賰鰢赹銶矍撸">
+<node CREATED="1353335302000" ID="ID_1169" MODIFIED="1353335302000" TEXT="in  lgqaniarwvuocemhfqw">
+<node CREATED="1353335350000" ID="ID_1170" MODIFIED="1353335350000" TEXT="瞸矮嘵丄低犗馌販幋蓟笒缤帣睚騻曼锋嫽靎贺秾達虀艴">
+<node CREATED="1353335387000" ID="ID_1171" MODIFIED="1353335387000" TEXT="vjpvcdgnhmdnxbdkcpvxugr">
+<node CREATED="1353335417000" ID="ID_1172" MODIFIED="1353335417000" TEXT="絎郫楤湈釵弦鲾虠鱥籯粣匱寸鮂爘彶帥鎻訄访瞙逪褒覧">
+<node CREATED="1353335456000" ID="ID_1173" MODIFIED="1353335456000" TEXT="rb  l lu abfr ur  ojshd">
+<node CREATED="1353335512000" ID="ID_1174" MODIFIED="1353335512000" TEXT="jkgeajk goi blq ppaizboh">
+<node CREATED="1353335545000" ID="ID_1175" MODIFIED="1353335545000" TEXT="ubn ggr chwwclen wfmncqt">
+<node CREATED="1353335605000" ID="ID_1176" MODIFIED="1353335605000" TEXT="xuetb purbyva qlg xxcqcu">
+<node CREATED="1353335611000" ID="ID_1177" MODIFIED="1353335611000" TEXT="ze   eurcoinll  gi xtqoq">
+<node CREATED="1353335624000" ID="ID_1178" MODIFIED="1353335624000" TEXT="mwoihnp ivnkt jwymkasgkf">
+<node CREATED="1353335683000" ID="ID_1179" MODIFIED="1353335683000" TEXT="鏙拊糃嫂蜖娳璨库俶鍛昲菌骴絜鱖蘻俛絗嗂眴耾黺烥魫">
+<node CREATED="1353335697000" ID="ID_1180" MODIFIED="1353335697000" TEXT="vbi ijikqtdfwj uz  ekbrw">
+<node CREATED="1353335711000" ID="ID_1181" MODIFIED="1353335711000" TEXT="瑈瑯燗煱埡鷽聖呯溟騧凩諉鏸瀆杨孛喢刹妐詓霊斤甔鴆">
+<node CREATED="1353335730000" ID="ID_1182" MODIFIED="1353335730000" TEXT="gmzeh ycehn kacj m trkdz">
+<node CREATED="1353335772000" ID="ID_1183" MODIFIED="1353335772000" TEXT="枭孢際藻郓銃狃矑提鶖履鱂乘鉼瑐徦肷她隖濇趺蝛縕髛">
+<node CREATED="1353335793000" ID="ID_1184" MODIFIED="1353335793000" TEXT="h  baf ibnd sdzdqp fhi r">
+<node CREATED="1353335844000" ID="ID_1185" MODIFIED="1353335844000" TEXT="o  eg ggknsoebmkwzs hvm">
+<node CREATED="1353335849000" ID="ID_1186" MODIFIED="1353335849000" TEXT="婀睒鼠秋漋竇贜狶襲錌玒偨勴喕飬哶蛼醦樒瓽煉痸餇疷">
+<node CREATED="1353335905000" ID="ID_1187" MODIFIED="1353335905000" TEXT="jdyllcacaj avhyriecqle y">
+<node CREATED="1353335933000" ID="ID_1188" MODIFIED="1353335933000" TEXT="wwb   o m bl f p d humfa">
+<node CREATED="1353335973000" ID="ID_1189" MODIFIED="1353335973000" TEXT="nvcpoxatcqcuvob  kdy cfk">
+<node CREATED="1353335996000" ID="ID_1190" MODIFIED="1353335996000" TEXT="tgzh dqx nufxkemwphpfl x">
+<node CREATED="1353335997000" ID="ID_1191" MODIFIED="1353335997000" TEXT="my  etkxpysgyehd xjeezz">
+<node CREATED="1353336021000" ID="ID_1192" MODIFIED="1353336021000" TEXT="銦煀橖鉲塐誣助龌仴繴籟秛攻赡焌苟颀髛綅鮵铻衾埛玟">
+<node CREATED="1353336044000" ID="ID_1193" MODIFIED="1353336044000" TEXT="s jarfafgik nvni  zshct">
+<node CREATED="1353336093000" ID="ID_1194" MODIFIED="1353336093000" TEXT="bkm xnqcoozxjqjzb suiqx">
+<node CREATED="1353336116000" ID="ID_1195" MODIFIED="1353336116000" TEXT="xz b vwuv  mjufeao rh">
+<node CREATED="1353336157000" ID="ID_1196" MODIFIED="1353336157000" TEXT="kmhrukyaostbhsc kyauu vd">
+<node CREATED="1353336200000" ID="ID_1197" MODIFIED="1353336200000" TEXT="artg ydhrjtfqvgcovi  j u">
+<node CREATED="1353336229000" ID="ID_1198" MODIFIED="1353336229000" TEXT="xs dh lat cipmha bthsq k">
+<node CREATED="1353336288000" ID="ID_1199" MODIFIED="1353336288000" TEXT="倴釩晟貭顭脺讴庩君跺韗牥鰵葹磠跧陣櫃簨复楍蟝怨銇">
+<node CREATED="1353336347000" ID="ID_1200" MODIFIED="1353336347000" TEXT="充穉蚥涮枻戠琂溳抍蓢籴侉爆衙雎镋蠶逬嘒躃醹懅箖羰">
+<node CREATED="1353336355000" ID="ID_1201" MODIFIED="1353336355000" TEXT="tlgyd fejj dluls tm xcuj">
+<node CREATED="1353336359000" ID="ID_1202" MODIFIED="1353336359000" TEXT="igzwfyi a uppnf m rpsln">
+<node CREATED="1353336394000" ID="ID_1203" MODIFIED="1353336394000" TEXT="ahx  pesq bxk xk ikpuoh">
+<node CREATED="1353336416000" ID="ID_1204" MODIFIED="1353336416000" TEXT="晷嵀楹窕衔鍗眍屽訌蜨涀禹鶜篎毺戝堅囦畳畇颾餻啽筂">
+<node CREATED="1353336475000" ID="ID_1205" MODIFIED="1353336475000" TEXT="冠嬀嵄眰崸铬歉啪霴蔘鬧糁釽缆砐弈甫廵廸矧鉐葕夀绑">
+<node CREATED="1353336535000" ID="ID_1206" MODIFIED="1353336535000" TEXT="ekkdxwhtt arbvukw    pny">
+<node CREATED="1353336574000" ID="ID_1207" MODIFIED="1353336574000" TEXT="ydx paep bstp w  dmncwu">
+<node CREATED="1353336629000" ID="ID_1208" MODIFIED="1353336629000" TEXT="y qlbafqrcxkckfhh mcr nu">
+<node CREATED="1353336643000" ID="ID_1209" MODIFIED="1353336643000" TEXT="vlurlbrfdtn ieltkjxwxq v">
+<node CREATED="1353336656000" ID="ID_1210" MODIFIED="1353336656000" TEXT="ejxy pws gntryo nq  aydh">
+<node CREATED="1353336704000" ID="ID_1211" MODIFIED="1353336704000" TEXT="b  ox npmqib uwihpbr  js">
+<node CREATED="1353336734000" ID="ID_1212" MODIFIED="1353336734000" TEXT="拀臀摙異糲嚒鳊伙邱鑊龤窖陳鍘欳歆籡厅稬肥汏敀銏拄">
+<node CREATED="1353336773000" ID="ID_1213" MODIFIED="1353336773000" TEXT="创筡綉哂颜鋬鐃颉糮櫓旳蒡脻郜熸囚鹋琗硛逷劢憲歊佲">
+<node CREATED="1353336787000" ID="ID_1214" MODIFIED="1353336787000" TEXT="闹淈褢鳷煟咶蚥櫩餒拡詪燦蟓鎎练筜檇偖茡跉分攌掃匃">
+<node CREATED="1353336833000" ID="ID_1215" MODIFIED="1353336833000" TEXT="ppe vz ssm t   xa onzfkc">
+<node CREATED="1353336846000" ID="ID_1216" MODIFIED="1353336846000" TEXT="zbhznjza ekvyvxpq pb  g">
+<node CREATED="1353336892000" ID="ID_1217" MODIFIED="1353336892000" TEXT="fi as isqb  fvtpavktpk">
+<node CREATED="1353336924000" ID="ID_1218" MODIFIED="1353336924000" TEXT="t teymvbrw  aasoweh it">
+<node CREATED="1353336944000" ID="ID_1219" MODIFIED="1353336944000" TEXT="嚊餣曓碸暎脐麇詃啲孴揔佡埤瞍姛鼯嫋售誖鏹楶讱嚨摁">
+<node CREATED="1353336954000" ID="ID_1220" MODIFIED="1353336954000" TEXT="mekcmtnwz hvvz y h  bqi">
+<node CREATED="1353336965000" ID="ID_1221" MODIFIED="1353336965000" TEXT="lkk c dz ohpja shhvsaus">
+<node CREATED="1353336979000" ID="ID_1222" MODIFIED="1353336979000" TEXT="qqasulrezwi q rnx bhxgvp">
+<node CREATED="1353336987000" ID="ID_1223" MODIFIED="1353336987000" TEXT="ihhd ktdki  q tbj ihmigl">
+<node CREATED="1353337015000" ID="ID_1224" MODIFIED="1353337015000" TEXT="vrhru cunxpjcuhrmaek kn">
+<node CREATED="1353337074000" ID="ID_1225" MODIFIED="1353337074000" TEXT="nzew  du nkg htqpnqcnpu">
+<node CREATED="1353337132000" ID="ID_1226" MODIFIED="1353337132000" TEXT="嚵朦窌竝傃瓨坊鵠漙抒靘澥璓爂譄頽欜妿蕪軺茖橲爟赝">
+<node CREATED="1353337167000" ID="ID_1227" MODIFIED="1353337167000" TEXT="彤憋麡丼荌瞉鑸晹砗囄媵醘橒庮啾注帑鼐浧款计姿訿嘭">
+<node CREATED="1353337222000" ID="ID_1228" MODIFIED="1353337222000" TEXT="欇臸粹螟傉崉务篚饞襼怿鰾赽繢窒霺揉犥渳鍲雄蝚讈鉪">
+<node CREATED="1353337271000" ID="ID_1229" MODIFIED="1353337271000" TEXT="mvxuudwry  cfmad zlbavwb">
+<node CREATED="1353337302000" ID="ID_1230" MODIFIED="1353337302000" TEXT="璺稛嬔譹邔鵍殏友寍捂篂赩洷灄詰杳頌蘏薴孼揷楻胑测">
+<node CREATED="1353337306000" ID="ID_1231" MODIFIED="1353337306000" TEXT="券丆堘穻齳俤喼嚞亜啌蝬峫闛呧速榚吖職妥茨由厫淮芔">
+<node CREATED="1353337335000" ID="ID_1232" MODIFIED="1353337335000" TEXT="fuzwfvxbjxutgyxrmr kk k">
+<node CREATED="1353337372000" ID="ID_1233" MODIFIED="1353337372000" TEXT="ijdnedznoggb fdvzt fhu">
+<node CREATED="1353337377000" ID="ID_1234" MODIFIED="1353337377000" TEXT="htxt  xkknzfcxbjemwrjn x">
+<node CREATED="1353337400000" ID="ID_1235" MODIFIED="1353337400000" TEXT="援愙蹯瓀厐刽鴏脪蜔迁扲霉鶃躇腆乫藎慥蝼痲瀖侐揨膫">
+<node CREATED="1353337434000" ID="ID_1236" MODIFIED="1353337434000" TEXT="秳傦车蟗驩鲷鉗澫揇媃坍傡謼溙詴籺碷礬憐憨当鵨淰弻">
+<node CREATED="1353337475000" ID="ID_1237" MODIFIED="1353337475000" TEXT="爊纃薪悖觚譸贪勧宻蜛児奵傫缿叹龁訫绂微奐勇癵羊牀">
+<node CREATED="1353337525000" ID="ID_1238" MODIFIED="1353337525000" TEXT="鋬犨鄵产种燲淭茈聖迄羋覔耈虡娚蓒犜楥觭祣郙知锁罕">
+<node CREATED="1353337534000" ID="ID_1239" MODIFIED="1353337534000" TEXT="guv rjlnmvcdjrshnxt q s">
+<node CREATED="1353337562000" ID="ID_1240" MODIFIED="1353337562000" TEXT="硔閒钃渇俷翛苒赇碱褓憚硔粻垘皘緗冷枲曉殛躴嶑姱噜">
+<node CREATED="1353337564000" ID="ID_1241" MODIFIED="1353337564000" TEXT="lc  uzrwrpvfsevvarbgzrgq">
+<node CREATED="1353337604000" ID="ID_1242" MODIFIED="1353337604000" TEXT="zcpbp  qqagillmyopdntvn">
+<node CREATED="1353337651000" ID="ID_1243" MODIFIED="1353337651000" TEXT="tgdb ufu axf wkzbmgfjve">
+<node CREATED="1353337666000" ID="ID_1244" MODIFIED="1353337666000" TEXT="闉瑟闻鎨痀赅窟耉翏眗幉麥駚籑鷤螷犹釧坼筅鲒埝旹伜">
+<node CREATED="1353337667000" ID="ID_1245" MODIFIED="1353337667000" TEXT="鵇乾湴蝰泌屙忪卝廠秿谁鸀踰魪鵩垜糦躏齠嬭牘浻巨楏">
+<node CREATED="1353337720000" ID="ID_1246" MODIFIED="1353337720000" TEXT="k tzr gagi lgeteshqxewkq">
+<node CREATED="1353337745000" ID="ID_1247" MODIFIED="1353337745000" TEXT="mgsxov ov   wdhmnjnadpue">
+<node CREATED="1353337774000" ID="ID_1248" MODIFIED="1353337774000" TEXT="wjkpf fhm kpf gz lz ucdh">
+<node CREATED="1353337815000" ID="ID_1249" MODIFIED="1353337815000" TEXT="psne x ngos a ir hru ubn">
+<node CREATED="1353337823000" ID="ID_1250" MODIFIED="1353337823000" TEXT="鮞婝柕蘺靔遷交識氂儧沦奫厜茸鄏渕狇穌衬钙侢槾鉵綰">
+<node CREATED="1353337827000" ID="ID_1251" MODIFIED="1353337827000" TEXT="l tmvlyfhdqnmnwaosevtb s">
+<node CREATED="1353337865000" ID="ID_1252" MODIFIED="1353337865000" TEXT="柰姉頞衟笩絷鋋媄颀堡爲罥唖璚糄關鯙萗囇懸蓈芦懦笅">
+<node CREATED="1353337916000" ID="ID_1253" MODIFIED="1353337916000" TEXT="痆蟩徎锹憻穭逆覾腧姝洯驻脷鏸敲搚酽蠌倹嘖癎刓纜挜">
+<node CREATED="1353337942000" ID="ID_1254" MODIFIED="1353337942000" TEXT="犃歐茽冔驐鄓突螵玔佟霧冉弑苟飢阨諃緬鎈鳯鎊甶踕圴">
+<node CREATED="1353337950000" ID="ID_1255" MODIFIED="1353337950000" TEXT="tsw sp  d sx twxlkkuktqj">
+<node CREATED="1353337967000" ID="ID_1256" MODIFIED="1353337967000" TEXT="depaqeovekpsjgkonfz ttaa">
+<node CREATED="1353337971000" ID="ID_1257" MODIFIED="1353337971000" TEXT="frqi jksqqpfscuzz f nkvw">
+<node CREATED="1353338003000" ID="ID_1258" MODIFIED="1353338003000" TEXT="weyj cjiersfkk ssegr g i">
+<node CREATED="1353338026000" ID="ID_1259" MODIFIED="1353338026000" TEXT="wvqy pktbww tcx ik c ivv">
+<node CREATED="1353338082000" ID="ID_1260" MODIFIED="1353338082000" TEXT="oouae  mz pjbunhdrm yob">
+<node CREATED="1353338097000" ID="ID_1261" MODIFIED="1353338097000" TEXT="ypj hhckeidt lnshl xfdv">
+<node CREATED="1353338152000" ID="ID_1262" MODIFIED="1353338152000" TEXT="hfroxwj nyv rcjfyfgk g a">
+<node CREATED="1353338159000" ID="ID_1263" MODIFIED="1353338159000" TEXT="顡虮黓艌湕畗繆雸兲艡冖歜烚髐瑛芠鰎岇娈铸騽逸诪騣">
+<node CREATED="1353338171000" ID="ID_1264" MODIFIED="1353338171000" TEXT="珃生纏飉翉寒趷嘂俞嘐鬞斌枮颫蘫恀歜桫剭埾礳凯陈烪">
+<node CREATED="1353338209000" ID="ID_1265" MODIFIED="1353338209000" TEXT="崽狰芝寫獚溳拌駠氳羌鎦兢茧晩灥褬趩寃愨诀窟伀襗咵">
+<node CREATED="1353338263000" ID="ID_1266" MODIFIED="1353338263000" TEXT="寥焖跺鵹殌鱽噣楳枋薠糟猍罶甌袵筟丱閔碕蒐郼鵼癱蒜">
+<node CREATED="1353338316000" ID="ID_1267" MODIFIED="1353338316000" TEXT="猳绱莻鱛湒瀘飢絧燋颇玟他亯聇絆巕枈徧堽谔抆酨筦庻">
+<node CREATED="1353338358000" ID="ID_1268" MODIFIED="1353338358000" TEXT="pzvhwl ksidtdmmp   jsjmz">
+<node CREATED="1353338397000" ID="ID_1269" MODIFIED="1353338397000" TEXT="c k  mhr sgx poni  ycvsy">
+<node CREATED="1353338422000" ID="ID_1270" MODIFIED="1353338422000" TEXT="dyobqrlxy eou ze uz jul">
+<node CREATED="1353338469000" ID="ID_1271" MODIFIED="1353338469000" TEXT="qqasie qmymaoexvpzjhbc x">
+<node CREATED="1353338512000" ID="ID_1272" MODIFIED="1353338512000" TEXT="幭旓驿諧媙躩鴂逕叠锫齡魈飥侦汬葰惮骬芕沮唼柧郚殎">
+<node CREATED="1353338525000" ID="ID_1273" MODIFIED="1353338525000" TEXT="zjvyhz tmfgcqao jhlbroj">
+<node CREATED="1353338574000" ID="ID_1274" MODIFIED="1353338574000" TEXT="niq ku m  uqnppjby zfpuv">
+<node CREATED="1353338605000" ID="ID_1275" MODIFIED="1353338605000" TEXT="鄒坸譻缭鑮活軤赿穭塢倜橈渌溃螟懣竣揥懄愨迣馄攒眏">
+<node CREATED="1353338612000" ID="ID_1276" MODIFIED="1353338612000" TEXT="pphsqbymn twh zoynasefqw">
+<node CREATED="1353338660000" ID="ID_1277" MODIFIED="1353338660000" TEXT="uuy bqi gsyzb i eijjpapp">
+<node CREATED="1353338711000" ID="ID_1278" MODIFIED="1353338711000" TEXT="etnle tnvwz svfspferp vk">
+<node CREATED="1353338742000" ID="ID_1279" MODIFIED="1353338742000" TEXT="乮僿蘋啖爪偤訂舘嬛刞彈譴观印鴛鱭氛剂鼋磓虀箦斏摋">
+<node CREATED="1353338768000" ID="ID_1280" MODIFIED="1353338768000" TEXT="h eruyrhrggpagpttwdyvzl">
+<node CREATED="1353338783000" ID="ID_1281" MODIFIED="1353338783000" TEXT="kmcqwxppxvf znfjcd cwvqb">
+<node CREATED="1353338837000" ID="ID_1282" MODIFIED="1353338837000" TEXT="鏣滋蘦勪筠劮閄臰尾梮茤鱕攧蘩竰苩渰吁銓卋巭醖褈菤">
+<node CREATED="1353338849000" ID="ID_1283" MODIFIED="1353338849000" TEXT="刕岃椾骫叞熖鮒潗郤皸璧背庢聑箧寜訃央蒊聋斗氏歰聳">
+<node CREATED="1353338865000" ID="ID_1284" MODIFIED="1353338865000" TEXT="qhyjgo bgszmlmbg o  ndq">
+<node CREATED="1353338866000" ID="ID_1285" MODIFIED="1353338866000" TEXT="rn ortwnaarfcfrria jexny">
+<node CREATED="1353338895000" ID="ID_1286" MODIFIED="1353338895000" TEXT="strqxlnap ichapi ghptcdc">
+<node CREATED="1353338933000" ID="ID_1287" MODIFIED="1353338933000" TEXT="nqnsmbyqzeo feu  yiltlc">
+<node CREATED="1353338963000" ID="ID_1288" MODIFIED="1353338963000" TEXT="玏钌匧蟶歹蟔棶绢鷫铴楼房抶惺巪奜阁蓻苷鴅嵨頢码曭">
+<node CREATED="1353339005000" ID="ID_1289" MODIFIED="1353339005000" TEXT="odu  pvq s nkvjbnanubzgd">
+<node CREATED="1353339054000" ID="ID_1290" MODIFIED="1353339054000" TEXT="uq drmzdbrraqme kwmpmrwz">
+<node CREATED="1353339072000" ID="ID_1291" MODIFIED="1353339072000" TEXT="chbd xjmxob c qovy vlbmd">
+<node CREATED="1353339107000" ID="ID_1292" MODIFIED="1353339107000" TEXT="錐糇潏蔥麕哣笸醥蜶螾鵆韓那蘇寢睱勻硋必墉伫覈郂藽">
+<node CREATED="1353339157000" ID="ID_1293" MODIFIED="1353339157000" TEXT="vgxbzqkaofzn qjlhpygdamg">
+<node CREATED="1353339205000" ID="ID_1294" MODIFIED="1353339205000" TEXT="zhxy  och gxxes srhjiox">
+<node CREATED="1353339215000" ID="ID_1295" MODIFIED="1353339215000" TEXT="jqzeghsofzhc rpkaaxmb">
+<node CREATED="1353339226000" ID="ID_1296" MODIFIED="1353339226000" TEXT="鹨瘕爨薱髑黖碼坻亣筲西邰俸琘鋯形錒塜憂瑸蘔辀俛媱">
+<node CREATED="1353339269000" ID="ID_1297" MODIFIED="1353339269000" TEXT="bhojqg   dgrwtf e gbo l">
+<node CREATED="1353339277000" ID="ID_1298" MODIFIED="1353339277000" TEXT="矫锘篒擾薽妇譝閿圷鄣蔍緀燌粢駛精滄夊譏霐呣淙錠萡">
+<node CREATED="1353339315000" ID="ID_1299" MODIFIED="1353339315000" TEXT="g paqalpx htrtfb jlebnv">
+<node CREATED="1353339322000" ID="ID_1300" MODIFIED="1353339322000" TEXT="iudtrzi krflelqqnvgjezts">
+<node CREATED="1353339380000" ID="ID_1301" MODIFIED="1353339380000" TEXT="ghc demag s xgibm ahv mc">
+<node CREATED="1353339440000" ID="ID_1302" MODIFIED="1353339440000" TEXT="cbhgme uihuwll gjnkgxgzg">
+<node CREATED="1353339496000" ID="ID_1303" MODIFIED="1353339496000" TEXT="t ysxci cwl r kllxzj cdj">
+<node CREATED="1353339501000" ID="ID_1304" MODIFIED="1353339501000" TEXT="钱沥鈬隓腜弔厐膇枻緊蕴峯舺久臙勤瀧軺協檒絼吋帊飹">
+<node CREATED="1353339535000" ID="ID_1305" MODIFIED="1353339535000" TEXT="wpevqiyr yfeod wcru musz">
+<node CREATED="1353339590000" ID="ID_1306" MODIFIED="1353339590000" TEXT="ylknocgeiydewfnew m z">
+<node CREATED="1353339606000" ID="ID_1307" MODIFIED="1353339606000" TEXT="lgnhtvnnlo pnvktlm pj">
+<node CREATED="1353339660000" ID="ID_1308" MODIFIED="1353339660000" TEXT="eryejn fblgsjybseb ueckf">
+<node CREATED="1353339676000" ID="ID_1309" MODIFIED="1353339676000" TEXT="af wwf ez hwxbpduitcwxxj">
+<node CREATED="1353339728000" ID="ID_1310" MODIFIED="1353339728000" TEXT="zfvqdbji duzdhhrg ofgjtb">
+<node CREATED="1353339730000" ID="ID_1311" MODIFIED="1353339730000" TEXT="dtzrmfibmpc m vwnwftzcad">
+<node CREATED="1353339779000" ID="ID_1312" MODIFIED="1353339779000" TEXT="賗篠娋縌鞔钇手梟蔁嬆斝謠崚螶杽药疖岤祈漣挗罭誠壿">
+<node CREATED="1353339822000" ID="ID_1313" MODIFIED="1353339822000" TEXT="hokzym p bvpaaelrjd jc">
+<node CREATED="1353339828000" ID="ID_1314" MODIFIED="1353339828000" TEXT="kvzes   rmtc gev  dhbkx">
+<node CREATED="1353339859000" ID="ID_1315" MODIFIED="1353339859000" TEXT="邷廲烓鲩炧錒钧暟翿墭鯠烘咉嶟樦薛邘栆鴹瑑卓禛歲嚐">
+<node CREATED="1353339894000" ID="ID_1316" MODIFIED="1353339894000" TEXT="x es mdhclr jf f blif oy">
+<node CREATED="1353339946000" ID="ID_1317" MODIFIED="1353339946000" TEXT="x r e  gvpq yszjpbjkc hs">
+<node CREATED="1353339952000" ID="ID_1318" MODIFIED="1353339952000" TEXT="aalbc  ekizulzz d nkcmql">
+<node CREATED="1353339971000" ID="ID_1319" MODIFIED="1353339971000" TEXT="窸痂屋攜圈皉翱冘柦亄諗蓨賂呐膨关础叇蹟拋瓻資绵烠">
+<node CREATED="1353340001000" ID="ID_1320" MODIFIED="1353340001000" TEXT="bdryvbswrcf pqnqwoas yke">
+<node CREATED="1353340008000" ID="ID_1321" MODIFIED="1353340008000" TEXT="zvilr l  md k ycxa qx va">
+<node CREATED="1353340053000" ID="ID_1322" MODIFIED="1353340053000" TEXT="xs drfk neyj ihnehql kpb">
+<node CREATED="1353340108000" ID="ID_1323" MODIFIED="1353340108000" TEXT="韝堜啧辢臱錗野溳寲亶鲞咟脑誤鸬坝銺貜谒鲳雙鼍驯粫">
+<node CREATED="1353340150000" ID="ID_1324" MODIFIED="1353340150000" TEXT="fgyllyjpchurwebg dsmvoa">
+<node CREATED="1353340188000" ID="ID_1325" MODIFIED="1353340188000" TEXT="朓谔夛妌鵍奭荒謧禛睘摱犕媉跻廇罋蛜遶鹻趌稩桑艚玉">
+<node CREATED="1353340239000" ID="ID_1326" MODIFIED="1353340239000" TEXT="帀籣邘酼肚瓥覌懧雤萮璭痥銟櫃蓺癇襽付劸弸顸捵瑏偡">
+<node CREATED="1353340265000" ID="ID_1327" MODIFIED="1353340265000" TEXT="桢鬟璂聐鰰瓤覇褕侽铚搫騇蝔陜谘閨腞坑儇蘛箻婱紗鳾">
+<node CREATED="1353340296000" ID="ID_1328" MODIFIED="1353340296000" TEXT="xngdbbv yuhszwqu mjsjvua">
+<node CREATED="1353340335000" ID="ID_1329" MODIFIED="1353340335000" TEXT="羑向鄳昗礧塛沙雧箶锁蜲欉蓴绥侂啪砹蚙椒旡僒蝽杳旷">
+<node CREATED="1353340368000" ID="ID_1330" MODIFIED="1353340368000" TEXT="wcligiafyzxslewquyckg du">
+<node CREATED="1353340376000" ID="ID_1331" MODIFIED="1353340376000" TEXT="yeo pvtfpablhcy ctqrctua">
+<node CREATED="1353340428000" ID="ID_1332" MODIFIED="1353340428000" TEXT="lgnmdglzrzmq  wz dimhh">
+<node CREATED="1353340448000" ID="ID_1333" MODIFIED="1353340448000" TEXT="衂饀鮣诏烎沬鸡鵛饗磊讪緲炧悾裹耉窾憁敱娜闅砑紛侃">
+<node CREATED="1353340488000" ID="ID_1334" MODIFIED="1353340488000" TEXT="ppov tfh y krjxet ft qma">
+<node CREATED="1353340513000" ID="ID_1335" MODIFIED="1353340513000" TEXT="w ofmodxklwpckdwcglc ukk">
+<node CREATED="1353340536000" ID="ID_1336" MODIFIED="1353340536000" TEXT="zhqcer hxa dqjnfrhkamb u">
+<node CREATED="1353340538000" ID="ID_1337" MODIFIED="1353340538000" TEXT="k ozorhmaig rzmvwkneu kr">
+<node CREATED="1353340576000" ID="ID_1338" MODIFIED="1353340576000" TEXT="ggosenjfcggzfcqtateqypw">
+<node CREATED="1353340593000" ID="ID_1339" MODIFIED="1353340593000" TEXT="嚧恀騑歬貔塛鐬閷揓媖糣屢髟兌膙晉俅聹椢鵯遈樝俳儢">
+<node CREATED="1353340598000" ID="ID_1340" MODIFIED="1353340598000" TEXT="hckxsj jc eo fadff a  kb">
+<node CREATED="1353340650000" ID="ID_1341" MODIFIED="1353340650000" TEXT="qtqaxoiyjcfcwtmalnknxekn">
+<node CREATED="1353340701000" ID="ID_1342" MODIFIED="1353340701000" TEXT="韷覢淋讳暵亇黌燖醚鈪烉鶍張鄰峴龔鹦虂跈瓳懙虵恍桿">
+<node CREATED="1353340755000" ID="ID_1343" MODIFIED="1353340755000" TEXT="l w ocyxw lprrcfhupcgsfx">
+<node CREATED="1353340774000" ID="ID_1344" MODIFIED="1353340774000" TEXT="vovbolsutchj ehdducgevq">
+<node CREATED="1353340802000" ID="ID_1345" MODIFIED="1353340802000" TEXT="sfp dtx dyxk tykntshuskt">
+<node CREATED="1353340822000" ID="ID_1346" MODIFIED="1353340822000" TEXT="xmjtwdjfzion f olgllfypi">
+<node CREATED="1353340879000" ID="ID_1347" MODIFIED="1353340879000" TEXT="kkbsrqlnd ycut myu ykt b">
+<node CREATED="1353340937000" ID="ID_1348" MODIFIED="1353340937000" TEXT="sw c y b tuvhipcjh  ypjr">
+<node CREATED="1353340975000" ID="ID_1349" MODIFIED="1353340975000" TEXT="az olbyskr ymbmoygmc ilw">
+<node CREATED="1353341020000" ID="ID_1350" MODIFIED="1353341020000" TEXT="znav  tblaajvp ihoidnxqf">
+<node CREATED="1353341023000" ID="ID_1351" MODIFIED="1353341023000" TEXT="lark jkprsatc hnjxaqutxa">
+<node CREATED="1353341080000" ID="ID_1352" MODIFIED="1353341080000" TEXT="s hciqiqlwzi  gqb pjjeg">
+<node CREATED="1353341094000" ID="ID_1353" MODIFIED="1353341094000" TEXT="hifrleeyyog t hypdwdd k">
+<node CREATED="1353341115000" ID="ID_1354" MODIFIED="1353341115000" TEXT="pprzg l ohk kiifaz pvbsi">
+<node CREATED="1353341152000" ID="ID_1355" MODIFIED="1353341152000" TEXT="璡矤蔸鑆翐哻爊潒迪靿贰枊溏隰痗暅栞瀰藈歬鞯峲賢榄">
+<node CREATED="1353341163000" ID="ID_1356" MODIFIED="1353341163000" TEXT="og tmqtnsfqb cm tcwyd">
+<node CREATED="1353341171000" ID="ID_1357" MODIFIED="1353341171000" TEXT="bnd ivpurw toqtvenz npfp">
+<node CREATED="1353341203000" ID="ID_1358" MODIFIED="1353341203000" TEXT="ouwfqf u ln  btiforgyppn">
+<node CREATED="1353341233000" ID="ID_1359" MODIFIED="1353341233000" TEXT="gruwhnonq ecltk v al n i">
+<node CREATED="1353341267000" ID="ID_1360" MODIFIED="1353341267000" TEXT="溩砾醔氳噑亳糩燀疫趚鱶穿梶檳眹骜陜壁砝諠粉庬鯎蓁">
+<node CREATED="1353341316000" ID="ID_1361" MODIFIED="1353341316000" TEXT="pwcbvnmfvqbo iiu jjtjczh">
+<node CREATED="1353341371000" ID="ID_1362" MODIFIED="1353341371000" TEXT="遟頻钮拶洘癣炽憉卡趨正定槓踆瑄飖旆岢嫣撐櫤蟸繲凌">
+<node CREATED="1353341426000" ID="ID_1363" MODIFIED="1353341426000" TEXT="iznqmnobll  nkok uphz">
+<node CREATED="1353341474000" ID="ID_1364" MODIFIED="1353341474000" TEXT="tzsxfqau przywxzesemcf o">
+<node CREATED="1353341521000" ID="ID_1365" MODIFIED="1353341521000" TEXT="mmdlvpp xdjzb tokagxt qa">
+<node CREATED="1353341581000" ID="ID_1366" MODIFIED="1353341581000" TEXT="pct mo afy p bd qrbxopjf">
+<node CREATED="1353341636000" ID="ID_1367" MODIFIED="1353341636000" TEXT="ccisrjhej  m o aya dauu">
+<node CREATED="1353341665000" ID="ID_1368" MODIFIED="1353341665000" TEXT="xwupdh  kxbxhzh wl xoboj">
+<node CREATED="1353341670000" ID="ID_1369" MODIFIED="1353341670000" TEXT="xctkacrptahz tyrhejifyjo">
+<node CREATED="1353341684000" ID="ID_1370" MODIFIED="1353341684000" TEXT="q pysez p dug qikulcrp">
+<node CREATED="1353341734000" ID="ID_1371" MODIFIED="1353341734000" TEXT="pmwla  rxqdncij gdgchqmu">
+<node CREATED="1353341748000" ID="ID_1372" MODIFIED="1353341748000" TEXT="btqe rxmkd q fabbnnqtun">
+<node CREATED="1353341753000" ID="ID_1373" MODIFIED="1353341753000" TEXT="瀥珼糢倣绐伬櫐琲駖迶澱鑨狿矀發瞎躒戟噖厏客鹈岸坪">
+<node CREATED="1353341808000" ID="ID_1374" MODIFIED="1353341808000" TEXT="qbfbqxpbneadrf nkeqjlwqa">
+<node CREATED="1353341835000" ID="ID_1375" MODIFIED="1353341835000" TEXT="溭膍舊潙貞匋紳划鍻跆輆恕干墹襫説涧纝禶怄嘯棿湽劖">
+<node CREATED="1353341875000" ID="ID_1376" MODIFIED="1353341875000" TEXT="狛溇搪才世嗏窂漬暬濶崳檎攴鄩呠魻菻塞顿敉瀴稪月妙">
+<node CREATED="1353341910000" ID="ID_1377" MODIFIED="1353341910000" TEXT="jgrwzvcvqoqfugohizgv  gm">
+<node CREATED="1353341963000" ID="ID_1378" MODIFIED="1353341963000" TEXT="naob ohhecchd   ruftjxv">
+<node CREATED="1353341994000" ID="ID_1379" MODIFIED="1353341994000" TEXT="ilbbiphbe mao km djinba">
+<node CREATED="1353342008000" ID="ID_1380" MODIFIED="1353342008000" TEXT="z hjhgzkqxlfhtidz mumzjo">
+<node CREATED="1353342021000" ID="ID_1381" MODIFIED="1353342021000" TEXT="郋瑧赆薠徇絾厑曶萞睸商鸔茊菢敧欩菷姎蚤彚蛂剙嵬簱">
+<node CREATED="1353342067000" ID="ID_1382" MODIFIED="1353342067000" TEXT="於濵舖篒忯潴哆驨軙觤狓醖鸗蠙萢膛佩甼熾喧总吣葪惰">
+<node CREATED="1353342077000" ID="ID_1383" MODIFIED="1353342077000" TEXT="bby kilokp chbv swkuzxa">
+<node CREATED="1353342080000" ID="ID_1384" MODIFIED="1353342080000" TEXT="邜惸擺求熷緧鯂峛韃筨叡宄湌侵戯嗆游襀嫂锻钶髪氢炴">
+<node CREATED="1353342091000" ID="ID_1385" MODIFIED="1353342091000" TEXT="轋姡邾蘟螾矊双竖孖貱妸喤戄楨噿邚瑅禝忚洆薅韨脿銅">
+<node CREATED="1353342109000" ID="ID_1386" MODIFIED="1353342109000" TEXT="siffsnsyz y uqdihxvuw  e">
+<node CREATED="1353342146000" ID="ID_1387" MODIFIED="1353342146000" TEXT="x pgsxln  de k kvcnmihlb">
+<node CREATED="1353342167000" ID="ID_1388" MODIFIED="1353342167000" TEXT="chr fzo  pm bo qkxagw  l">
+<node CREATED="1353342213000" ID="ID_1389" MODIFIED="1353342213000" TEXT="okg   o  josho iaesoc a">
+<node CREATED="1353342252000" ID="ID_1390" MODIFIED="1353342252000" TEXT="uewo tnfwqkzxwgcflxkouhb">
+<node CREATED="1353342266000" ID="ID_1391" MODIFIED="1353342266000" TEXT="觓臽灓觏卢攼糴脔聚朼跱舓羶湕畦猘懲蔴茘旔芨枟眓麯">
+<node CREATED="1353342313000" ID="ID_1392" MODIFIED="1353342313000" TEXT="ibmalrqrep  mzhrsveabqaz">
+<node CREATED="1353342358000" ID="ID_1393" MODIFIED="1353342358000" TEXT="轞梶壇跊墣綺體俑埲婕賱鬏櫈姤榏伦忦儲盁桬銪榚髬禕">
+<node CREATED="1353342403000" ID="ID_1394" MODIFIED="1353342403000" TEXT="旮羃邅败账焴瘷蜋阱掅坙椁臷鏫採扚甙轎溎獎畞艬伟媼">
+<node CREATED="1353342420000" ID="ID_1395" MODIFIED="1353342420000" TEXT="榅莤蘲鸅幃癏譇攥鹞槉豮联薵暀諑蒄鏽異堈庫晡签礉偤">
+<node CREATED="1353342440000" ID="ID_1396" MODIFIED="1353342440000" TEXT="皷鸹鴹蘱巕鈓髌詭盺弔孟峆扁鷧釆笞訸鱬禾苰俨翝眸昲">
+<node CREATED="1353342493000" ID="ID_1397" MODIFIED="1353342493000" TEXT="yjisv swsr bqfv gmt r kd">
+<node CREATED="1353342508000" ID="ID_1398" MODIFIED="1353342508000" TEXT="tx kdzewcracs pfgeags lx">
+<node CREATED="1353342519000" ID="ID_1399" MODIFIED="1353342519000" TEXT="ed amaygkx wsgswvuvu  vl">
+<node CREATED="1353342547000" ID="ID_1400" MODIFIED="1353342547000" TEXT="pvzbrgrltp rkwue sa az x">
+<node CREATED="1353342551000" ID="ID_1401" MODIFIED="1353342551000" TEXT="鮶鋠頞崗禵蓳咅爜嬙芣趶淅騴甉錐玼儤泲镡魎绅孁邾焽">
+<node CREATED="1353342575000" ID="ID_1402" MODIFIED="1353342575000" TEXT="onupp  n dvq drmqkhtd vd">
+<node CREATED="1353342580000" ID="ID_1403" MODIFIED="1353342580000" TEXT="惷吖峂嚛蓎殶乓辒矈璹酊馓腰媮醫哢輅艶抗媟隘僵椀榖">
+<node CREATED="1353342622000" ID="ID_1404" MODIFIED="1353342622000" TEXT="vlk cakr  ueomklvjrzorcj">
+<node CREATED="1353342676000" ID="ID_1405" MODIFIED="1353342676000" TEXT="腃惨縹奱密卓鴥略蛼葨勁帑奔饯厴郩蹎溆軑弸雈络恣纯">
+<node CREATED="1353342691000" ID="ID_1406" MODIFIED="1353342691000" TEXT="g bwfb t qhu  jvsnsi rm">
+<node CREATED="1353342693000" ID="ID_1407" MODIFIED="1353342693000" TEXT="锣泟涽藡羐繬豯艌鄔挙啒眻蜁齛銳秛曣梥说跎貹儶募鴂">
+<node CREATED="1353342722000" ID="ID_1408" MODIFIED="1353342722000" TEXT="bbdvqiwoxksnhv ywml kkfu">
+<node CREATED="1353342736000" ID="ID_1409" MODIFIED="1353342736000" TEXT="zp nwdtd eqa setnlbeadcd">
+<node CREATED="1353342749000" ID="ID_1410" MODIFIED="1353342749000" TEXT="isdfaph kwvy nehznyl d">
+<node CREATED="1353342753000" ID="ID_1411" MODIFIED="1353342753000" TEXT="瀞辋愶餍芟蓟玏宓酤鍣谦隸醻释槾幰琔敲去臍蜭摌朅馼">
+<node CREATED="1353342811000" ID="ID_1412" MODIFIED="1353342811000" TEXT="r lhmvhhjq azzhzlk slnpc">
+<node CREATED="1353342850000" ID="ID_1413" MODIFIED="1353342850000" TEXT="kf tjjxi r ybapmlc b mti">
+<node CREATED="1353342861000" ID="ID_1414" MODIFIED="1353342861000" TEXT="鰨勗郗釫佒稸歂僿蹳槚籆墥見撺纳宴剨姿栽焳漿俿倷朅">
+<node CREATED="1353342865000" ID="ID_1415" MODIFIED="1353342865000" TEXT="糖圐倀侽杝琅毦唛刘愖铬牾衆裱踰褵墚喓郴臽烴叽睴燊">
+<node CREATED="1353342896000" ID="ID_1416" MODIFIED="1353342896000" TEXT="諏寔惷鷬鋓奐刏騴觯儆燾湦噮恡蔁獮挏剪惟譣剆岇炌綀">
+<node CREATED="1353342931000" ID="ID_1417" MODIFIED="1353342931000" TEXT="v eoyk ale   zvv bsskxl">
+<node CREATED="1353342963000" ID="ID_1418" MODIFIED="1353342963000" TEXT="糴餾彯蒕突衡弥妃愗舯崏嶣栰椩忎芀鮧釆孠赅晆补湲臟">
+<node CREATED="1353342976000" ID="ID_1419" MODIFIED="1353342976000" TEXT="q oxmdwxsr chhatcrvjhn h">
+<node CREATED="1353342998000" ID="ID_1420" MODIFIED="1353342998000" TEXT="kvp cz usn oc kczxujtvcc">
+<node CREATED="1353343015000" ID="ID_1421" MODIFIED="1353343015000" TEXT="kjzzbexxdun lbx zgkzlwbb">
+<node CREATED="1353343017000" ID="ID_1422" MODIFIED="1353343017000" TEXT="vhh onr agv mtvglfpqodb">
+<node CREATED="1353343065000" ID="ID_1423" MODIFIED="1353343065000" TEXT="hduwqbbsa bn iuzfpmp k">
+<node CREATED="1353343116000" ID="ID_1424" MODIFIED="1353343116000" TEXT="rwpui hdijldijzv ahheuqj">
+<node CREATED="1353343161000" ID="ID_1425" MODIFIED="1353343161000" TEXT="搩颉琷窕爂搰钂毈縍蔓粄黢夤忛螳臭爏輆兖裥忪挳鼹奁">
+<node CREATED="1353343196000" ID="ID_1426" MODIFIED="1353343196000" TEXT="浔焧室紀傖粡檪薜輣穲怃緄魏譐褪藈馪靹馧暖遏軃曐坌">
+<node CREATED="1353343253000" ID="ID_1427" MODIFIED="1353343253000" TEXT="di ap dhjtp frxqeroglyqa">
+<node CREATED="1353343276000" ID="ID_1428" MODIFIED="1353343276000" TEXT="als  f  krrxf lnhgmjdsxe">
+<node CREATED="1353343315000" ID="ID_1429" MODIFIED="1353343315000" TEXT="sjlbtwtg m cnmqbzooba x">
+<node CREATED="1353343359000" ID="ID_1430" MODIFIED="1353343359000" TEXT="eci wv e kwi  uxrblyojmb">
+<node CREATED="1353343417000" ID="ID_1431" MODIFIED="1353343417000" TEXT="dxupl ocifstbxa mqacw ke">
+<node CREATED="1353343455000" ID="ID_1432" MODIFIED="1353343455000" TEXT="qnbbwl  ex us rdwlqhsjzr">
+<node CREATED="1353343481000" ID="ID_1433" MODIFIED="1353343481000" TEXT="mta zko ke iquoatae c la">
+<node CREATED="1353343535000" ID="ID_1434" MODIFIED="1353343535000" TEXT="lkdnpgt ue fcgwy  gp  ex">
+<node CREATED="1353343538000" ID="ID_1435" MODIFIED="1353343538000" TEXT="eg txxlvgnurnzeapvpzqhrz">
+<node CREATED="1353343547000" ID="ID_1436" MODIFIED="1353343547000" TEXT="nnkqs  fecxmmr m powx p">
+<node CREATED="1353343563000" ID="ID_1437" MODIFIED="1353343563000" TEXT="velhkgnbzavawpdqyuadbdao">
+<node CREATED="1353343606000" ID="ID_1438" MODIFIED="1353343606000" TEXT="hohbst s  pgqanzsz  ra">
+<node CREATED="1353343611000" ID="ID_1439" MODIFIED="1353343611000" TEXT="rv otjvpyspunt irznqrotk">
+<node CREATED="1353343623000" ID="ID_1440" MODIFIED="1353343623000" TEXT="cvtp  aa qzehszyqvwluue">
+<node CREATED="1353343667000" ID="ID_1441" MODIFIED="1353343667000" TEXT="yrcg  shkgltgof woklcqk">
+<node CREATED="1353343698000" ID="ID_1442" MODIFIED="1353343698000" TEXT="dycuwr  e xxrhosiua  oc">
+<node CREATED="1353343728000" ID="ID_1443" MODIFIED="1353343728000" TEXT="ia nm q bqsmznnanfuvgdru">
+<node CREATED="1353343788000" ID="ID_1444" MODIFIED="1353343788000" TEXT="mhjppu s nscgdnymiwtpbl">
+<node CREATED="1353343792000" ID="ID_1445" MODIFIED="1353343792000" TEXT="僷碲肟蹧歷巉苇黁乹邰慅飤酥淮髩沗绸玕躿澶捖孉掚踖">
+<node CREATED="1353343808000" ID="ID_1446" MODIFIED="1353343808000" TEXT="繠砤凃滶驩馒壽竆器娠弈儾跳栆霑栾揮落季铒雖婶筬漴">
+<node CREATED="1353343842000" ID="ID_1447" MODIFIED="1353343842000" TEXT="e ipk wjmavihrw m epmxbq">
+<node CREATED="1353343884000" ID="ID_1448" MODIFIED="1353343884000" TEXT="隲劅粒彖嘉兣沱柶蔋烛諰寲朶桘噜麑馃姗燧腆庱氜觽诬">
+<node CREATED="1353343897000" ID="ID_1449" MODIFIED="1353343897000" TEXT="nuzzmahcmhcvuiclhz  plgu">
+<node CREATED="1353343934000" ID="ID_1450" MODIFIED="1353343934000" TEXT="vtnm immknyc zuk xcklmz">
+<node CREATED="1353343964000" ID="ID_1451" MODIFIED="1353343964000" TEXT="je upo dvnsqxs y  dkhcjk">
+<node CREATED="1353343990000" ID="ID_1452" MODIFIED="1353343990000" TEXT="cxmqjiwhciacgi fq ko rnz">
+<node CREATED="1353344037000" ID="ID_1453" MODIFIED="1353344037000" TEXT="瀩镌鄑泀踩沶輐萆鍕匔词仺羈犥骟粯谤唽釫皪绀娩瀼罯">
+<node CREATED="1353344071000" ID="ID_1454" MODIFIED="1353344071000" TEXT="宔詿捍鈄唕譿鱡髀鹐丕筽堷莸茚靅胎霋腅犆屈俍溈岺筳">
+<node CREATED="1353344117000" ID="ID_1455" MODIFIED="1353344117000" TEXT="ji u wouv   scyhh p wd c">
+<node CREATED="1353344133000" ID="ID_1456" MODIFIED="1353344133000" TEXT="miznniuk  p n x ovbyaqam">
+<node CREATED="1353344137000" ID="ID_1457" MODIFIED="1353344137000" TEXT="ifmvfyak izbsherssvv  nq">
+<node CREATED="1353344191000" ID="ID_1458" MODIFIED="1353344191000" TEXT="烳捈忶謳鼗阳撳籑訊浟猕瞳嚀婦麗帣淘蕫倞鄀嘼鞀蜆犲">
+<node CREATED="1353344227000" ID="ID_1459" MODIFIED="1353344227000" TEXT="pieszvtszcaipijf egt esy">
+<node CREATED="1353344236000" ID="ID_1460" MODIFIED="1353344236000" TEXT="蹆齢逫鶞瞃激橏瑿熤唥乛蕔陵板莱甘嗌厂鋕看鐺穐杽玻">
+<node CREATED="1353344243000" ID="ID_1461" MODIFIED="1353344243000" TEXT="憕圤畋鞊刐躸别邵蜢黅燔鰡冂遌湖殍裠涁寧沛匸詮烚昣">
+<node CREATED="1353344293000" ID="ID_1462" MODIFIED="1353344293000" TEXT="闹旲浣鼔屳駱忑鄪膝鷏扨鄮祝敘忑傝骍蝰倅傮濓鱛祆錑">
+<node CREATED="1353344332000" ID="ID_1463" MODIFIED="1353344332000" TEXT="atswvmmyzlwubbss rpojdbt">
+<node CREATED="1353344362000" ID="ID_1464" MODIFIED="1353344362000" TEXT="燁筈順烴叱謼膨薡蹯連値瞿鍶鍮嫇劶竍萨罾腰蟇鯈樯饋">
+<node CREATED="1353344384000" ID="ID_1465" MODIFIED="1353344384000" TEXT="c s vuudnoeeqgn w vjsdhp">
+<node CREATED="1353344407000" ID="ID_1466" MODIFIED="1353344407000" TEXT="郾嚨誺拙蘥褠籣颻脦臞膞尒骳启褩胟埢愲嗶岮聘屦蓨昲">
+<node CREATED="1353344436000" ID="ID_1467" MODIFIED="1353344436000" TEXT="v hufytf smtyosa mbv oqp">
+<node CREATED="1353344495000" ID="ID_1468" MODIFIED="1353344495000" TEXT="jql c p  rq vnovfkdjdgo">
+<node CREATED="1353344498000" ID="ID_1469" MODIFIED="1353344498000" TEXT="vrcoatjefyqhqy  fflxpisg">
+<node CREATED="1353344527000" ID="ID_1470" MODIFIED="1353344527000" TEXT="umkptpvl jj zcfi e tgmfh">
+<node CREATED="1353344567000" ID="ID_1471" MODIFIED="1353344567000" TEXT="qma efoqpivjnekp j mobgf">
+<node CREATED="1353344590000" ID="ID_1472" MODIFIED="1353344590000" TEXT="矑髯劸溑犀薡汗蠇躓磁魫艤趠孵蠂淤掁飮泝鳦孷屝搚讓">
+<node CREATED="1353344606000" ID="ID_1473" MODIFIED="1353344606000" TEXT="惭舡魤犇讜繁嬄櫅彾捭啫慈延穒濶瑯搄饮异榆逖潡柾蓨">
+<node CREATED="1353344642000" ID="ID_1474" MODIFIED="1353344642000" TEXT="xpqktchjtytep  qlclhgcob">
+<node CREATED="1353344671000" ID="ID_1475" MODIFIED="1353344671000" TEXT="xrcdwbxzq tejx eshud kok">
+<node CREATED="1353344719000" ID="ID_1476" MODIFIED="1353344719000" TEXT="zpog hfhuwivdui uqt  mow">
+<node CREATED="1353344768000" ID="ID_1477" MODIFIED="1353344768000" TEXT="潟倜溭穹艑赃籔媁棶琡祶犥擥裋猠穂窙噽瞾璴椺麀挵灎">
+<node CREATED="1353344785000" ID="ID_1478" MODIFIED="1353344785000" TEXT="awewggna eapdfrcffm sizi">
+<node CREATED="1353344831000" ID="ID_1479" MODIFIED="1353344831000" TEXT="utwjtjzf aeeqduwzptndsll">
+<node CREATED="1353344888000" ID="ID_1480" MODIFIED="1353344888000" TEXT="ycnevdmjx arkjtww uypehg">
+<node CREATED="1353344927000" ID="ID_1481" MODIFIED="1353344927000" TEXT="lvz pfzjgyfypuvmipauydko">
+<node CREATED="1353344963000" ID="ID_1482" MODIFIED="1353344963000" TEXT="yc wuvqcxzwwz v lu as ns">
+<node CREATED="1353345016000" ID="ID_1483" MODIFIED="1353345016000" TEXT="cthioperryeoem aijcpc u">
+<node CREATED="1353345020000" ID="ID_1484" MODIFIED="1353345020000" TEXT="aieeiurtek v gaxifpjicvr">
+<node CREATED="1353345044000" ID="ID_1485" MODIFIED="1353345044000" TEXT="izitszp cocesbpvqcpnrvll">
+<node CREATED="1353345047000" ID="ID_1486" MODIFIED="1353345047000" TEXT="sejcpybjvxraujtnvvdaaoql">
+<node CREATED="1353345060000" ID="ID_1487" MODIFIED="1353345060000" TEXT="nxy axqpq ctav iohzousqy">
+<node CREATED="1353345115000" ID="ID_1488" MODIFIED="1353345115000" TEXT="yivoz trleiem pfpoqxxaub">
+<node CREATED="1353345159000" ID="ID_1489" MODIFIED="1353345159000" TEXT="漒塝潁暵笣檉谫榈艱駌昖峦僤瞾麆礌褑曊姁郳铤澡矋划">
+<node CREATED="1353345182000" ID="ID_1490" MODIFIED="1353345182000" TEXT="wt daf tqvuqc eld hajek">
+<node CREATED="1353345225000" ID="ID_1491" MODIFIED="1353345225000" TEXT="荇哗淝錧缞彇倵帄撓檐疟嵙擓貇郻赇絊毿廜缩瘗椤脗賠">
+<node CREATED="1353345282000" ID="ID_1492" MODIFIED="1353345282000" TEXT="pytiqvd afobthwkir  f ep">
+<node CREATED="1353345288000" ID="ID_1493" MODIFIED="1353345288000" TEXT="煰耮魹貆斠弔筊閳丛矁犫認羮掵隈盇暺緺琒虲醵骭讟追">
+<node CREATED="1353345344000" ID="ID_1494" MODIFIED="1353345344000" TEXT="tmlzg  pkwcgjcqukj deb w">
+<node CREATED="1353345403000" ID="ID_1495" MODIFIED="1353345403000" TEXT="hrjklwpyobxdgmyhcwkrq  j">
+<node CREATED="1353345408000" ID="ID_1496" MODIFIED="1353345408000" TEXT="gfmiapyrfutmbsq qjllrp l">
+<node CREATED="1353345445000" ID="ID_1497" MODIFIED="1353345445000" TEXT="vdgbmi zjvjgqnpnzudnsoov">
+<node CREATED="1353345474000" ID="ID_1498" MODIFIED="1353345474000" TEXT="bxtihu xzmx eambkogjxenl">
+<node CREATED="1353345529000" ID="ID_1499" MODIFIED="1353345529000" TEXT="涨鍊人汴菇芰詧妅牾馂霖继圓鮒呟聨意习謠珀佅眿麷鑽">
+<node CREATED="1353345533000" ID="ID_1500" MODIFIED="1353345533000" TEXT="dj g nzhhfadnju k ajtpnn">
+<node CREATED="1353345562000" ID="ID_1501" MODIFIED="1353345562000" TEXT="ggx qtflaos ruqvxktickbd">
+<node CREATED="1353345605000" ID="ID_1502" MODIFIED="1353345605000" TEXT="rbwgsdli h ifgsc reh fgl">
+<node CREATED="1353345650000" ID="ID_1503" MODIFIED="1353345650000" TEXT="gr  dsjp daafpajwjtcsi u">
+<node CREATED="1353345662000" ID="ID_1504" MODIFIED="1353345662000" TEXT="q e h myjwgpd gamdnaf g">
+<node CREATED="1353345675000" ID="ID_1505" MODIFIED="1353345675000" TEXT="bjmctrdhxfwmehrcx  n dfg">
+<node CREATED="1353345723000" ID="ID_1506" MODIFIED="1353345723000" TEXT="lsxa bhajsmfhfult  d   l">
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</node>
+</map>
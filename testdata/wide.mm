@@ -0,0 +1,4128 @@
+<map version="0.9.0">
+<node CREATED="1353300051000" ID="ID_1" MODIFIED="1353300051000" TEXT="Benchmark map&#10;synthetic">
+<node CREATED="1353300097000" ID="ID_2" MODIFIED="1353300097000" TEXT="__meta__">
+<node CREATED="1353300123000" ID="ID_3" MODIFIED="1353300123000" TEXT="author">
+<node CREATED="1353300139000" ID="ID_4" MODIFIED="1353300139000" TEXT="mmbench">
+</node>
+</node>
+<node CREATED="1353300170000" ID="ID_5" MODIFIED="1353300170000" TEXT="company">
+<node CREATED="1353300195000" ID="ID_6" MODIFIED="1353300195000" TEXT="FreeMindTools">
+</node>
+</node>
+</node>
+<node CREATED="1353300243000" ID="ID_7" MODIFIED="1353300243000" TEXT="时间">
+<node CREATED="1353300262000" ID="ID_8" MODIFIED="1353300262000" TEXT="s pixth  z jw vodns  o i">
+<node CREATED="1353300311000" ID="ID_9" MODIFIED="1353300311000" TEXT="awmzuap hk frh yncjp drv">
+</node>
+<node CREATED="1353300344000" ID="ID_10" MODIFIED="1353300344000" TEXT="q ssnslrjffsuocx     qmv">
+</node>
+<node CREATED="1353300361000" ID="ID_11" MODIFIED="1353300361000" TEXT="s rnu  ycspt hwdgykzde">
+</node>
+<node CREATED="1353300403000" ID="ID_12" MODIFIED="1353300403000" TEXT="糚額禝薑倮臘羁紆深永鸎僸俄鱷崚堝弱轡骀俜烀噉挸怇">
+</node>
+<node CREATED="1353300442000" ID="ID_13" MODIFIED="1353300442000" TEXT="fpbd glwz fu bu khsnfomr">
+</node>
+<node CREATED="1353300473000" ID="ID_14" MODIFIED="1353300473000" TEXT="lzhrawkbih kil ttwmmuafk">
+</node>
+<node CREATED="1353300488000" ID="ID_15" MODIFIED="1353300488000" TEXT="l rmmvmubnieqprx pjoz zf">
+</node>
+<node CREATED="1353300548000" ID="ID_16" MODIFIED="1353300548000" TEXT="cw mvjgwazqddu i d mcioy">
+</node>
+</node>
+<node CREATED="1353300600000" ID="ID_17" MODIFIED="1353300600000" TEXT="碇茢橖锯撻侄兑薚箖魇骟顉六謪蝃莂蠩鞴艄汨秫廸緰亹">
+<node CREATED="1353300610000" ID="ID_18" MODIFIED="1353300610000" TEXT="ywktbf imrjohbfqcmkmd o">
+</node>
+<node CREATED="1353300669000" ID="ID_19" MODIFIED="1353300669000" TEXT="ovnjw  tl tccxbamqnpsvnl">
+</node>
+<node CREATED="1353300729000" ID="ID_20" MODIFIED="1353300729000" TEXT="赲焵歅匶钂蝑鞺狟蕅垵湾廫兰魦徠姳帩泝窜婛麹鹂娝漤">
+</node>
+<node CREATED="1353300770000" ID="ID_21" MODIFIED="1353300770000" TEXT="p jppugsgk  zbehy swzcc">
+</node>
+<node CREATED="1353300773000" ID="ID_22" MODIFIED="1353300773000" TEXT="兑伿鋨棾嬞娦莑鴕眻鞒眅糛蕧込诠黠諽韴廔禷绠酪畟躖">
+</node>
+<node CREATED="1353300797000" ID="ID_23" MODIFIED="1353300797000" TEXT="yuafphc  jmzbtdizbbmp w">
+</node>
+<node CREATED="1353300838000" ID="ID_24" MODIFIED="1353300838000" TEXT="麐澑翳涒凗瑲婛傦聨腯嚘竖橎济赤瘈间翐琥膠榖堦薺胉">
+</node>
+<node CREATED="1353300886000" ID="ID_25" MODIFIED="1353300886000" TEXT="顲轃飜锽薚逧硠踢嵱跛牌识猰蹷否冥驈疱鞒鬣葫粯徢喡">
+</node>
+</node>
+<node CREATED="1353300936000" ID="ID_26" MODIFIED="1353300936000" TEXT="yvnjdnr  mdxwanva  wccla">
+<node CREATED="1353300957000" ID="ID_27" MODIFIED="1353300957000" TEXT="鶍郞叁雲廻庸蔂骛堎亖氣倃罢鐦嵄圭樟鱐墠鳪殓璦旤骃">
+</node>
+<node CREATED="1353301015000" ID="ID_28" MODIFIED="1353301015000" TEXT="f dse  yjhxjnbeaccnrwent">
+</node>
+<node CREATED="1353301021000" ID="ID_29" MODIFIED="1353301021000" TEXT="l bmmwjgjo yirvynmxnho e">
+</node>
+<node CREATED="1353301049000" ID="ID_30" MODIFIED="1353301049000" TEXT="ogavtajxtqevovxhxi d bhq">
+</node>
+<node CREATED="1353301084000" ID="ID_31" MODIFIED="1353301084000" TEXT="dhix sbyjkqh fmiqrtqmtmy">
+</node>
+<node CREATED="1353301132000" ID="ID_32" MODIFIED="1353301132000" TEXT="汛腗嫓蛩洤繂奤蒏櫨璗濤瓬蚸査茽勪暂諘則肷倕瑿隌仓">
+</node>
+<node CREATED="1353301164000" ID="ID_33" MODIFIED="1353301164000" TEXT="铌蘈誔蒟了兜肱龟镊蜠襝悂譞斂嚜玡棵宼灮靁熊犅蟟磌">
+</node>
+<node CREATED="1353301172000" ID="ID_34" MODIFIED="1353301172000" TEXT="nymzmgg sbmhcfbtfssvpi k">
+</node>
+</node>
+<node CREATED="1353301200000" ID="ID_35" MODIFIED="1353301200000" TEXT="p    spvgibfaueyv m okd">
+<node CREATED="1353301248000" ID="ID_36" MODIFIED="1353301248000" TEXT="okablgqfguwj hkwb cowbz">
+</node>
+<node CREATED="1353301276000" ID="ID_37" MODIFIED="1353301276000" TEXT="咧嘏豿濍餍燺呌烛计醶儶岺瘂塵锟驌栘熁筻敏稭幭昸爒">
+</node>
+<node CREATED="1353301313000" ID="ID_38" MODIFIED="1353301313000" TEXT="ihdydwhiwuwp dudwluvugzh">
+</node>
+<node CREATED="1353301345000" ID="ID_39" MODIFIED="1353301345000" TEXT="htifzrksaem pcxyyrvgwzxk">
+</node>
+<node CREATED="1353301381000" ID="ID_40" MODIFIED="1353301381000" TEXT="dzqloaguup oj isvzylbbw">
+</node>
+<node CREATED="1353301439000" ID="ID_41" MODIFIED="1353301439000" TEXT="nwuiujlqweatabgucb n gnl">
+</node>
+<node CREATED="1353301450000" ID="ID_42" MODIFIED="1353301450000" TEXT="xlmiqwvob mmae pwek zha">
+</node>
+<node CREATED="1353301499000" ID="ID_43" MODIFIED="1353301499000" TEXT="蹐藑宾周馽绐肩獚婀缦抝迌觓倹騡僷啑旦婐慇欍訍漋搈">
+</node>
+</node>
+<node CREATED="1353301529000" ID="ID_44" MODIFIED="1353301529000" TEXT="j r xrivowmpawbvsyivgqk">
+<node CREATED="1353301588000" ID="ID_45" MODIFIED="1353301588000" TEXT="簷棦鴔饼緛裋薡櫙飑靰棿謆亾邧簞鯁殧脖桟跩缋麠丕奾">
+</node>
+<node CREATED="1353301591000" ID="ID_46" MODIFIED="1353301591000" TEXT="駢魳甹魋郑趒謃嵒竐炛鮌就寞菋嫚囼眥輋罦讟掲敄焀黦">
+</node>
+<node CREATED="1353301635000" ID="ID_47" MODIFIED="1353301635000" TEXT="qr fyy xeu rl rmtyhaq vt">
+</node>
+<node CREATED="1353301673000" ID="ID_48" MODIFIED="1353301673000" TEXT="wh i  cnxnpzv f  t h xsc">
+</node>
+<node CREATED="1353301675000" ID="ID_49" MODIFIED="1353301675000" TEXT="扵谾涑赐脕淈關儢珽釁塚蠂棊俻璭碘入簴橞九嶓圌稤内">
+</node>
+<node CREATED="1353301731000" ID="ID_50" MODIFIED="1353301731000" TEXT="j  xiusmjbdeotxbzbrxt k">
+</node>
+<node CREATED="1353301767000" ID="ID_51" MODIFIED="1353301767000" TEXT="箴遧幵捎蜯抺挪驢龇媫靿笡儦緎艡僂话郅叙苰獆慽獳嬃">
+</node>
+<node CREATED="1353301788000" ID="ID_52" MODIFIED="1353301788000" TEXT="orqzkzcnknzp  djawa fmbj">
+</node>
+</node>
+<node CREATED="1353301812000" ID="ID_53" MODIFIED="1353301812000" TEXT="貫蠔欸鈱呒剨櫻鞢诃蓤篲辠澨傁较嶍润欲堒檤屵聋荚伝">
+<node CREATED="1353301840000" ID="ID_54" MODIFIED="1353301840000" TEXT="pcb y iuczk ob tibleqef">
+</node>
+<node CREATED="1353301896000" ID="ID_55" MODIFIED="1353301896000" TEXT="h t o vbhifhh o era amy">
+</node>
+<node CREATED="1353301898000" ID="ID_56" MODIFIED="1353301898000" TEXT="pbydsyulan khepqcmu nnog">
+</node>
+<node CREATED="1353301922000" ID="ID_57" MODIFIED="1353301922000" TEXT="msz  lasohbjy d bwan m w">
+</node>
+<node CREATED="1353301959000" ID="ID_58" MODIFIED="1353301959000" TEXT="槍澐縰齓攪眝騶樳腓貍腵讄巺鰪山綨昫臌旄焵薳揸襮橒">
+</node>
+<node CREATED="1353301967000" ID="ID_59" MODIFIED="1353301967000" TEXT="fnmcwvyqrfghqzl wwkd  m">
+</node>
+<node CREATED="1353302021000" ID="ID_60" MODIFIED="1353302021000" TEXT="pkv  xj  k p  zveasv qvu">
+</node>
+<node CREATED="1353302034000" ID="ID_61" MODIFIED="1353302034000" TEXT="dvtlya zodoshpy rzc  fz">
+</node>
+</node>
+<node CREATED="1353302085000" ID="ID_62" MODIFIED="1353302085000" TEXT="qsgvmaem r  cskpoodzptof">
+<node CREATED="1353302118000" ID="ID_63" MODIFIED="1353302118000" TEXT="鎔釦妺厞厗減鯐筨掮惀圍妄遉契钌鄲夫箞亓鑢箕讬瘉號">
+</node>
+<node CREATED="1353302174000" ID="ID_64" MODIFIED="1353302174000" TEXT="kdahzjgp pkcrhllxh xo l">
+</node>
+<node CREATED="1353302198000" ID="ID_65" MODIFIED="1353302198000" TEXT="趑滁盘瑴莓沈飇煄歔溻貑鼔钿甫旉牪樖懢嵃鰋盄固浘涼">
+</node>
+<node CREATED="1353302229000" ID="ID_66" MODIFIED="1353302229000" TEXT="rtuppjvcj h  rbcgkdylhb">
+</node>
+<node CREATED="1353302252000" ID="ID_67" MODIFIED="1353302252000" TEXT="垂罞驖幇誁帤丟霳錕即屶愡駋洯迫熕洠豽聆揽綕蝷醇蕊">
+</node>
+<node CREATED="1353302291000" ID="ID_68" MODIFIED="1353302291000" TEXT="c wivtulrugpdd d ookmlrk">
+</node>
+<node CREATED="1353302341000" ID="ID_69" MODIFIED="1353302341000" TEXT="扉甼驙俳褐乽漎豥牫焑抬瓊患攦荗绱駥鴛碦唦晼硇蓶魁">
+</node>
+<node CREATED="1353302351000" ID="ID_70" MODIFIED="1353302351000" TEXT="锉辽貅瑂蕖澘嶮淪蹂轸鱹険薰碈褛峵饞蠮纉煰膺聮靣粙">
+</node>
+</node>
+<node CREATED="1353302364000" ID="ID_71" MODIFIED="1353302364000" TEXT="h  rgbenugv xnu  kvfrlnn">
+<node CREATED="1353302404000" ID="ID_72" MODIFIED="1353302404000" TEXT="oexx moq vag s mga etplq">
+</node>
+<node CREATED="1353302409000" ID="ID_73" MODIFIED="1353302409000" TEXT="pamxjxxh a peisizglpkzic">
+</node>
+<node CREATED="1353302419000" ID="ID_74" MODIFIED="1353302419000" TEXT="rb ojwanu x dnailklyfzqk">
+</node>
+<node CREATED="1353302453000" ID="ID_75" MODIFIED="1353302453000" TEXT="癳俊鑵椒樗齀耖瀙躎历粔碃鑑緜疟硹跗橛箊蟁齉蚣鲉溔">
+</node>
+<node CREATED="1353302490000" ID="ID_76" MODIFIED="1353302490000" TEXT="ki k  gz iuxczjv bsjdw p">
+</node>
+<node CREATED="1353302511000" ID="ID_77" MODIFIED="1353302511000" TEXT="mqmc  fhnvazti ujq bv ve">
+</node>
+<node CREATED="1353302547000" ID="ID_78" MODIFIED="1353302547000" TEXT="mshjzpndlqhzlhjz  axqdhi">
+</node>
+<node CREATED="1353302572000" ID="ID_79" MODIFIED="1353302572000" TEXT="bv lhgjerhahzm  hr sfh">
+</node>
+</node>
+</node>
+<node CREATED="1353302590000" ID="ID_80" MODIFIED="1353302590000" TEXT="地点">
+<node CREATED="1353302643000" ID="ID_81" MODIFIED="1353302643000" TEXT="xwy bfpgqpdcazc  xnimkmw">
+<node CREATED="1353302697000" ID="ID_82" MODIFIED="1353302697000" TEXT="懐弣决鎾瞾卹牯狊趄谪壻脮瞝会娏葲毷鲮盷蘲壨甥觰鈍">
+</node>
+<node CREATED="1353302709000" ID="ID_83" MODIFIED="1353302709000" TEXT="onojz ktlrvpux fgppzq yp">
+</node>
+<node CREATED="1353302759000" ID="ID_84" MODIFIED="1353302759000" TEXT="knoubw ocgdhya  ff lza a">
+</node>
+<node CREATED="1353302796000" ID="ID_85" MODIFIED="1353302796000" TEXT="zjzmplksyvxaqkg gffusps">
+</node>
+<node CREATED="1353302848000" ID="ID_86" MODIFIED="1353302848000" TEXT="b au pmk  twke ui sk cye">
+</node>
+<node CREATED="1353302855000" ID="ID_87" MODIFIED="1353302855000" TEXT="衝群灥嫼饬貐蘈遟贷圭贤鉻諸畠蘌嘪豨捩踚臞瞐秃吚兖">
+</node>
+<node CREATED="1353302856000" ID="ID_88" MODIFIED="1353302856000" TEXT="edl  jzcmr bm asmrvm   b">
+</node>
+<node CREATED="1353302907000" ID="ID_89" MODIFIED="1353302907000" TEXT="e dg zrihmatbxcaixzp dkw">
+</node>
+</node>
+<node CREATED="1353302927000" ID="ID_90" MODIFIED="1353302927000" TEXT="紸匛汴抺椗疝禽哣柃浔滭由烅吋忨芚醪矂娙叀媺浛簥萼">
+<node CREATED="1353302959000" ID="ID_91" MODIFIED="1353302959000" TEXT="kuwmzx okybl kphcdntqqdb">
+</node>
+<node CREATED="1353302981000" ID="ID_92" MODIFIED="1353302981000" TEXT="fio  auhux v yebwq fli o">
+</node>
+<node CREATED="1353303036000" ID="ID_93" MODIFIED="1353303036000" TEXT="s fnr r tpmljg q   hktj">
+</node>
+<node CREATED="1353303045000" ID="ID_94" MODIFIED="1353303045000" TEXT="rqwd ovsswcpgmpkmwb sfrc">
+</node>
+<node CREATED="1353303076000" ID="ID_95" MODIFIED="1353303076000" TEXT="nju  l db xtrj  oguw yc">
+</node>
+<node CREATED="1353303128000" ID="ID_96" MODIFIED="1353303128000" TEXT="kwscrayzwcsmd   q gj she">
+</node>
+<node CREATED="1353303142000" ID="ID_97" MODIFIED="1353303142000" TEXT="jwic u f aqodzi v  ywaeg">
+</node>
+<node CREATED="1353303177000" ID="ID_98" MODIFIED="1353303177000" TEXT="塡疘党栆忶尽柙闳惥茀觮蔢嵩檏搸秺鴞忉笙単沪鯨頬嗅">
+</node>
+</node>
+<node CREATED="1353303229000" ID="ID_99" MODIFIED="1353303229000" TEXT="on qxfcnkpk wldwqebtqrm">
+<node CREATED="1353303258000" ID="ID_100" MODIFIED="1353303258000" TEXT="cqduxfghsm qqgc degrtnmt">
+</node>
+<node CREATED="1353303274000" ID="ID_101" MODIFIED="1353303274000" TEXT="tsakxgt nqgahoszikwuw cd">
+</node>
+<node CREATED="1353303304000" ID="ID_102" MODIFIED="1353303304000" TEXT="uhe haiqtwepjwlzf qnwlbn">
+</node>
+<node CREATED="1353303322000" ID="ID_103" MODIFIED="1353303322000" TEXT="qzpeerig e q  jocl dhb v">
+</node>
+<node CREATED="1353303358000" ID="ID_104" MODIFIED="1353303358000" TEXT="isvyftvswq utaesxetexztc">
+</node>
+<node CREATED="1353303375000" ID="ID_105" MODIFIED="1353303375000" TEXT="琲趰紷黽蟓妊鷱勉椭與淡俏昵憿赟繡姁锿彤栙镫豺灜硥">
+</node>
+<node CREATED="1353303434000" ID="ID_106" MODIFIED="1353303434000" TEXT="wu  jnthu jlnltbyitnsrqe">
+</node>
+<node CREATED="1353303435000" ID="ID_107" MODIFIED="1353303435000" TEXT="浭拽疕瑱研壕皜鮛尊佄榫蟙鑇囫傌杒胉餦棺趢塩艕扨谦">
+</node>
+</node>
+<node CREATED="1353303490000" ID="ID_108" MODIFIED="1353303490000" TEXT="vk ms roc qvuhtcb sjqrva">
+<node CREATED="1353303499000" ID="ID_109" MODIFIED="1353303499000" TEXT="譽狮帲沓蒨玨窑验溯噮嚿褬枃坤趉隒噛聖詵戒鉐藙牌宇">
+</node>
+<node CREATED="1353303515000" ID="ID_110" MODIFIED="1353303515000" TEXT="fvrradjtlhlosrlnys sipo">
+</node>
+<node CREATED="1353303560000" ID="ID_111" MODIFIED="1353303560000" TEXT="whif  kaoyvuadwzfz srbmo">
+</node>
+<node CREATED="1353303618000" ID="ID_112" MODIFIED="1353303618000" TEXT="arc uwv micaoxwatz xmvvb">
+</node>
+<node CREATED="1353303621000" ID="ID_113" MODIFIED="1353303621000" TEXT="tltxxi rttueun w  zssolm">
+</node>
+<node CREATED="1353303676000" ID="ID_114" MODIFIED="1353303676000" TEXT="fbnnchkltezpcd aufu  nni">
+</node>
+<node CREATED="1353303703000" ID="ID_115" MODIFIED="1353303703000" TEXT="bo ddziyjbzkobuzg tqg nb">
+</node>
+<node CREATED="1353303759000" ID="ID_116" MODIFIED="1353303759000" TEXT="jbbb  oce ryccydz ndwnp">
+</node>
+</node>
+<node CREATED="1353303792000" ID="ID_117" MODIFIED="1353303792000" TEXT="汪鍟矂咗睛僝闋扂覉鼶霯礩桷蜍窡頳懅蚞婳漓赹殿攨櫐">
+<node CREATED="1353303815000" ID="ID_118" MODIFIED="1353303815000" TEXT="妯詷蚐荆夬坵痸疂塅鳛邼锷小莚遦桪鹳嗃軄姎抄嵹坳蓆">
+</node>
+<node CREATED="1353303830000" ID="ID_119" MODIFIED="1353303830000" TEXT="x y rakm niy b w uavh">
+</node>
+<node CREATED="1353303873000" ID="ID_120" MODIFIED="1353303873000" TEXT="馨鄪臂寵幄籉繱潐遬蕣挑偳羋棥隧感立帩鳮艾譼隼猏窣">
+</node>
+<node CREATED="1353303900000" ID="ID_121" MODIFIED="1353303900000" TEXT="kzlxalo wwt wt xa fxmmen">
+</node>
+<node CREATED="1353303960000" ID="ID_122" MODIFIED="1353303960000" TEXT="wtgb  a xdefh nqnohjhisa">
+</node>
+<node CREATED="1353304017000" ID="ID_123" MODIFIED="1353304017000" TEXT="pnwxw mcywapz konxvofsal">
+</node>
+<node CREATED="1353304036000" ID="ID_124" MODIFIED="1353304036000" TEXT="嗳蹝狿墂驂柅燱蚻媞跣錄瘜蟭褐黼赌歴瞲渨禰霣嗚霂眤">
+</node>
+<node CREATED="1353304045000" ID="ID_125" MODIFIED="1353304045000" TEXT="gaorbtrrcleolk tdu lxuom">
+</node>
+</node>
+<node CREATED="1353304058000" ID="ID_126" MODIFIED="1353304058000" TEXT="ipu ezxtfcejjzkf vypdsnj">
+<node CREATED="1353304064000" ID="ID_127" MODIFIED="1353304064000" TEXT="ilwdlxj  futfrohw  dlcou">
+</node>
+<node CREATED="1353304107000" ID="ID_128" MODIFIED="1353304107000" TEXT="场膝鈫羚喪咮絧徵謊暫酯鞧祜蝟豢脪苏滵雥屷嬶褥彃硷">
+</node>
+<node CREATED="1353304162000" ID="ID_129" MODIFIED="1353304162000" TEXT="w ucqy obkp c ndxdehqu s">
+</node>
+<node CREATED="1353304201000" ID="ID_130" MODIFIED="1353304201000" TEXT="puijttfgrzjfbqqsqu jyhkp">
+</node>
+<node CREATED="1353304233000" ID="ID_131" MODIFIED="1353304233000" TEXT="awyarae b uxuxw lluqvlmm">
+</node>
+<node CREATED="1353304236000" ID="ID_132" MODIFIED="1353304236000" TEXT="r wmybt  jij kmki nqmkm">
+</node>
+<node CREATED="1353304253000" ID="ID_133" MODIFIED="1353304253000" TEXT="g ojnw ze o f f i f ud n">
+</node>
+<node CREATED="1353304265000" ID="ID_134" MODIFIED="1353304265000" TEXT="bbwcxc erulcpk ggsnie c">
+</node>
+</node>
+<node CREATED="1353304322000" ID="ID_135" MODIFIED="1353304322000" TEXT="饾掱躴梂牡蠂窙讜湛化樋阺辂馟縛棌畔癄戁锣勒椒鷝節">
+<node CREATED="1353304379000" ID="ID_136" MODIFIED="1353304379000" TEXT="遅脒鏬觺龣榓誾鋶蚛躛郢搰攠漆俰韥逸壃郖棨羋痱牎羹">
+</node>
+<node CREATED="1353304434000" ID="ID_137" MODIFIED="1353304434000" TEXT="a  zenx   ten e lszcdo">
+</node>
+<node CREATED="1353304474000" ID="ID_138" MODIFIED="1353304474000" TEXT="軈沷掔縪爪硤鴼儢镒煤錍閇訩璮碙纫湋衂鏊概鯯篱旹孉">
+</node>
+<node CREATED="1353304518000" ID="ID_139" MODIFIED="1353304518000" TEXT="逋魑櫇泜暤拟龊醔钡偂鯂酄鄷馨澝呆籾禽御誝鹰衻軗贗">
+</node>
+<node CREATED="1353304567000" ID="ID_140" MODIFIED="1353304567000" TEXT="署羫镝燁挾秐癍佟击嵛瘷菄碉糰黾唧汮窇躎阧肤莆霅躪">
+</node>
+<node CREATED="1353304602000" ID="ID_141" MODIFIED="1353304602000" TEXT="澰叉鲠酾樿嘳簎檿褍鉝纾郐亱意焩珷遛屔糆秫苦伞冒啫">
+</node>
+<node CREATED="1353304626000" ID="ID_142" MODIFIED="1353304626000" TEXT="wud mzflutq zsvmptzgofgb">
+</node>
+<node CREATED="1353304634000" ID="ID_143" MODIFIED="1353304634000" TEXT="kjermblzx  pyymmrntz tqg">
+</node>
+</node>
+<node CREATED="1353304658000" ID="ID_144" MODIFIED="1353304658000" TEXT="覂稝媃孽偌坊肍舐礡蹴窞拯貁毫冡徦牐耏趥鑖贸譚縞巆">
+<node CREATED="1353304698000" ID="ID_145" MODIFIED="1353304698000" TEXT="ilj vlgkhzflqhf  aqbndyg">
+</node>
+<node CREATED="1353304717000" ID="ID_146" MODIFIED="1353304717000" TEXT="鴍盕灸笣岧輝敱錦詚昏疯昊髃鍑稁虐呗轠歁揭棁隚噯麋">
+</node>
+<node CREATED="1353304745000" ID="ID_147" MODIFIED="1353304745000" TEXT="pbxmozjebvcscdmjd     rm">
+</node>
+<node CREATED="1353304790000" ID="ID_148" MODIFIED="1353304790000" TEXT="hyfu qelpnes  fuaepshw">
+</node>
+<node CREATED="1353304797000" ID="ID_149" MODIFIED="1353304797000" TEXT="qv i cb iwgskwx yndunv k">
+</node>
+<node CREATED="1353304824000" ID="ID_150" MODIFIED="1353304824000" TEXT="jhkll la sjya daezb jguh">
+</node>
+<node CREATED="1353304858000" ID="ID_151" MODIFIED="1353304858000" TEXT="ujttaotle a f  cxu pjywq">
+</node>
+<node CREATED="1353304918000" ID="ID_152" MODIFIED="1353304918000" TEXT="p p beghebrswtonattt vgs">
+</node>
+</node>
+</node>
+<node CREATED="1353304952000" ID="ID_153" MODIFIED="1353304952000" TEXT="Attendees">
+<node CREATED="1353304993000" ID="ID_154" MODIFIED="1353304993000" TEXT="xor iuwzr  podsjvw xz  k">
+<node CREATED="1353305029000" ID="ID_155" MODIFIED="1353305029000" TEXT="ru ajoq ph pyi mnokxrssj">
+</node>
+<node CREATED="1353305050000" ID="ID_156" MODIFIED="1353305050000" TEXT="浯捩橷脂藭謜怕峲鴌琖瓘哇蘙尕剃扽鳢椤劧蒺尵政瓟稣">
+</node>
+<node CREATED="1353305069000" ID="ID_157" MODIFIED="1353305069000" TEXT="xtczzzzf jiaekh bnl zkvo">
+</node>
+<node CREATED="1353305085000" ID="ID_158" MODIFIED="1353305085000" TEXT="ovwrieanuzicokkbqnvvlb g">
+</node>
+<node CREATED="1353305130000" ID="ID_159" MODIFIED="1353305130000" TEXT="aw ewrqnnflu wtha x e kr">
+</node>
+<node CREATED="1353305132000" ID="ID_160" MODIFIED="1353305132000" TEXT="eeqmaiyxh lxk ulcf ryg">
+</node>
+<node CREATED="1353305164000" ID="ID_161" MODIFIED="1353305164000" TEXT="p jstcfhifmde fncyiuzmg">
+</node>
+<node CREATED="1353305174000" ID="ID_162" MODIFIED="1353305174000" TEXT="sushaen r   ivn tm  pnmm">
+</node>
+</node>
+<node CREATED="1353305193000" ID="ID_163" MODIFIED="1353305193000" TEXT="里埳胛嫾铛悙塄佳韞蹤枛钕睺忢籗偕蛍搥沅鑱胥鱒悀事">
+<node CREATED="1353305245000" ID="ID_164" MODIFIED="1353305245000" TEXT="eh rrx mz  o zowexmzkyip">
+</node>
+<node CREATED="1353305269000" ID="ID_165" MODIFIED="1353305269000" TEXT="h z vp b xgj diegek sed">
+</node>
+<node CREATED="1353305285000" ID="ID_166" MODIFIED="1353305285000" TEXT="崩擈鬠汌濆楌纤磕捈囊筊箂办槡炡疂柮蒧转垾灱蒂繢锻">
+</node>
+<node CREATED="1353305338000" ID="ID_167" MODIFIED="1353305338000" TEXT="zeallazq zzm wdrgtmb  t">
+</node>
+<node CREATED="1353305351000" ID="ID_168" MODIFIED="1353305351000" TEXT="vdgc xehu g n aqmy dxl">
+</node>
+<node CREATED="1353305411000" ID="ID_169" MODIFIED="1353305411000" TEXT="pgb dndbkdi hyycmekeewbo">
+</node>
+<node CREATED="1353305445000" ID="ID_170" MODIFIED="1353305445000" TEXT="htdfjnguioyuszmnmespysk">
+</node>
+<node CREATED="1353305462000" ID="ID_171" MODIFIED="1353305462000" TEXT="ggraznwayrabmtot lnybk">
+</node>
+</node>
+<node CREATED="1353305466000" ID="ID_172" MODIFIED="1353305466000" TEXT="uutxattzxbsmiddehosigqpc">
+<node CREATED="1353305480000" ID="ID_173" MODIFIED="1353305480000" TEXT="oh  e phzrrvmvwzbjsusyk">
+</node>
+<node CREATED="1353305519000" ID="ID_174" MODIFIED="1353305519000" TEXT="jqh  j njlx z jgh fgy h">
+</node>
+<node CREATED="1353305551000" ID="ID_175" MODIFIED="1353305551000" TEXT="sov tzzimgsymknwb urace">
+</node>
+<node CREATED="1353305588000" ID="ID_176" MODIFIED="1353305588000" TEXT="f kejxptithawnjqlz ubuam">
+</node>
+<node CREATED="1353305594000" ID="ID_177" MODIFIED="1353305594000" TEXT="avopilnnpzt pqtwwrmiwb">
+</node>
+<node CREATED="1353305648000" ID="ID_178" MODIFIED="1353305648000" TEXT="szfoaknfwfex   gsqbhr x">
+</node>
+<node CREATED="1353305697000" ID="ID_179" MODIFIED="1353305697000" TEXT="sikletqzdekghkkpwq buu">
+</node>
+<node CREATED="1353305732000" ID="ID_180" MODIFIED="1353305732000" TEXT="ocdotlf  kie rqjyfuu znw">
+</node>
+</node>
+<node CREATED="1353305763000" ID="ID_181" MODIFIED="1353305763000" TEXT="稔袼馶筡控矬蛁攺墺巀暈廧昉共熠虲付官噮瀶镤揲滉櫪">
+<node CREATED="1353305773000" ID="ID_182" MODIFIED="1353305773000" TEXT="徍公渞谈撼黃眨证籠籛跐踌廃嬞崉惧呦惫湱腳偀耯蟺雊">
+</node>
+<node CREATED="1353305813000" ID="ID_183" MODIFIED="1353305813000" TEXT="jltykultbdu jwxcunggzumo">
+</node>
+<node CREATED="1353305823000" ID="ID_184" MODIFIED="1353305823000" TEXT="qcm jwcxsofpybhjju supow">
+</node>
+<node CREATED="1353305865000" ID="ID_185" MODIFIED="1353305865000" TEXT="ocjx onev bugeuicw sxvqo">
+</node>
+<node CREATED="1353305899000" ID="ID_186" MODIFIED="1353305899000" TEXT="乬艨鞈檼熲蝆催才賧茺减沧纽垎髊就罷卸抈姢谸鷸雓徸">
+</node>
+<node CREATED="1353305938000" ID="ID_187" MODIFIED="1353305938000" TEXT="ubnkububbh xiai rcwt   v">
+</node>
+<node CREATED="1353305991000" ID="ID_188" MODIFIED="1353305991000" TEXT="gpjhfci pqd d fb aiurwjx">
+</node>
+<node CREATED="1353305995000" ID="ID_189" MODIFIED="1353305995000" TEXT="意醌圦訄髴鵆啴拣労谸炐掟鞟繀鶰薘圊夅垡殊蹞飬剨潞">
+</node>
+</node>
+<node CREATED="1353306052000" ID="ID_190" MODIFIED="1353306052000" TEXT="i ekgnqcft c pyblor p">
+<node CREATED="1353306074000" ID="ID_191" MODIFIED="1353306074000" TEXT="jwvs yzn wjnh llmrizuycl">
+</node>
+<node CREATED="1353306087000" ID="ID_192" MODIFIED="1353306087000" TEXT="榄鎞泖匥錷踵竊凊婺欳濧晿販鳼烩寴狟奃珡潩鸲櫅埴騂">
+</node>
+<node CREATED="1353306130000" ID="ID_193" MODIFIED="1353306130000" TEXT="kgwitcntrthoccguyslav at">
+</node>
+<node CREATED="1353306151000" ID="ID_194" MODIFIED="1353306151000" TEXT="wnrvuoqtaaov qu ddorjl q">
+</node>
+<node CREATED="1353306186000" ID="ID_195" MODIFIED="1353306186000" TEXT="soffpbp mzxzksudfuwbponx">
+</node>
+<node CREATED="1353306245000" ID="ID_196" MODIFIED="1353306245000" TEXT="駦訠洵愸緺禭魳鶑趕閯虾踡禐蜺熬饀飁齟括徸聖氭湤贎">
+</node>
+<node CREATED="1353306286000" ID="ID_197" MODIFIED="1353306286000" TEXT="zpdnyl mzxua lca ms  twt">
+</node>
+<node CREATED="1353306312000" ID="ID_198" MODIFIED="1353306312000" TEXT="廧晓彺騒庽愸蛑鵂舎旮邏嫃苽癗譥疬肻丿鋠褪帠魄黏腍">
+</node>
+</node>
+<node CREATED="1353306363000" ID="ID_199" MODIFIED="1353306363000" TEXT="jfk jn foin nb  kbptnccx">
+<node CREATED="1353306396000" ID="ID_200" MODIFIED="1353306396000" TEXT="jnkuodv mbqtk  opnvbjygq">
+</node>
+<node CREATED="1353306410000" ID="ID_201" MODIFIED="1353306410000" TEXT="漏竘捫榽狝見娲縉经鶄罯漰畞耖祷蔉旻戡鷞髠詞鸤鼛搛">
+</node>
+<node CREATED="1353306431000" ID="ID_202" MODIFIED="1353306431000" TEXT="weyggtglfvt c jak ipiul">
+</node>
+<node CREATED="1353306438000" ID="ID_203" MODIFIED="1353306438000" TEXT="lqxeo  qyqvzccb gplmk d">
+</node>
+<node CREATED="1353306483000" ID="ID_204" MODIFIED="1353306483000" TEXT="soyqmmnrh  kqupftusqo d">
+</node>
+<node CREATED="1353306484000" ID="ID_205" MODIFIED="1353306484000" TEXT="oqb fz  tesu vfbzkkk zyp">
+</node>
+<node CREATED="1353306544000" ID="ID_206" MODIFIED="1353306544000" TEXT="ss aqdz rj dybyxyufzgz">
+</node>
+<node CREATED="1353306582000" ID="ID_207" MODIFIED="1353306582000" TEXT="qa rnoryjnfoyb efgwv f e">
+</node>
+</node>
+<node CREATED="1353306592000" ID="ID_208" MODIFIED="1353306592000" TEXT="kxubdqdrwta hoq juzrgiew">
+<node CREATED="1353306622000" ID="ID_209" MODIFIED="1353306622000" TEXT="gdtmlssadbbg cfrlugvckn">
+</node>
+<node CREATED="1353306659000" ID="ID_210" MODIFIED="1353306659000" TEXT="傟坥缝燥蚙犋亜成騗釼譚柒裨撕傴淬蚐懤麲柊脀嚘唹轨">
+</node>
+<node CREATED="1353306695000" ID="ID_211" MODIFIED="1353306695000" TEXT="淸腈辤燊獯閃縁賽竈蚆迢鈓崊螈衅煝曋廣髚藽饗舰杊跞">
+</node>
+<node CREATED="1353306747000" ID="ID_212" MODIFIED="1353306747000" TEXT="qpzvcxzpgopzp nfmys vv w">
+</node>
+<node CREATED="1353306780000" ID="ID_213" MODIFIED="1353306780000" TEXT="hptbms bjjfk pcy  smzr">
+</node>
+<node CREATED="1353306791000" ID="ID_214" MODIFIED="1353306791000" TEXT="ovgijjvkuaao bc jcbcgsb">
+</node>
+<node CREATED="1353306848000" ID="ID_215" MODIFIED="1353306848000" TEXT="zsaz wwm alzffba xq e wz">
+</node>
+<node CREATED="1353306864000" ID="ID_216" MODIFIED="1353306864000" TEXT="翿謺駅娫恍耎邈昿淳蛡呞瓩握傽毞晐霋簨愎朒磕麷摝泙">
+</node>
+</node>
+<node CREATED="1353306871000" ID="ID_217" MODIFIED="1353306871000" TEXT="帘茆藦鄷酿摣汕鬬磍苀蝓饙潼赉牌槭訬耡杍緻嚙颷傓叒">
+<node CREATED="1353306913000" ID="ID_218" MODIFIED="1353306913000" TEXT="n pcjp bqr louhtnhhsvil">
+</node>
+<node CREATED="1353306971000" ID="ID_219" MODIFIED="1353306971000" TEXT="somhlzo  ievbgjho pjfpag">
+</node>
+<node CREATED="1353307004000" ID="ID_220" MODIFIED="1353307004000" TEXT="lkj p uhmcb szhrqdz  fs">
+</node>
+<node CREATED="1353307064000" ID="ID_221" MODIFIED="1353307064000" TEXT="v vdggepjjkeo pxm kjv">
+</node>
+<node CREATED="1353307106000" ID="ID_222" MODIFIED="1353307106000" TEXT="mgthqbo msfahfzi v dmkg">
+</node>
+<node CREATED="1353307154000" ID="ID_223" MODIFIED="1353307154000" TEXT="缳鄺浪酅禬訫遚嗶超狴鋲夦曋禨荒槖蕶騊楢厅殩伯娅葂">
+</node>
+<node CREATED="1353307171000" ID="ID_224" MODIFIED="1353307171000" TEXT="顸嬷槚目鑯讫縬鷨码巪痦汲渹癶鄑窛蝠骵域襬躛肶觌柎">
+</node>
+<node CREATED="1353307177000" ID="ID_225" MODIFIED="1353307177000" TEXT="鈨癪岰玈磸甿借崿缃槍赥杈蹡簠桠暳漐吇趸飺舿縘踠喰">
+</node>
+</node>
+</node>
+<node CREATED="1353307222000" ID="ID_226" MODIFIED="1353307222000" TEXT="Topic">
+<node CREATED="1353307264000" ID="ID_227" MODIFIED="1353307264000" TEXT="簨辋懃呶噬朕浛鈜瓶豛愿蜗鶱濇鑣劖呛儰鐵釮諡闩暬质">
+<node CREATED="1353307317000" ID="ID_228" MODIFIED="1353307317000" TEXT="yzuy ggt zzei ww vj k ug">
+</node>
+<node CREATED="1353307369000" ID="ID_229" MODIFIED="1353307369000" TEXT="ueceqosnwqu c h om rb i">
+</node>
+<node CREATED="1353307394000" ID="ID_230" MODIFIED="1353307394000" TEXT="鼻艧韖肛鑼镐鰯谍鯊葯話馕髶鷥乔緀鱪苿嶭媐楳礖潗氤">
+</node>
+<node CREATED="1353307400000" ID="ID_231" MODIFIED="1353307400000" TEXT="mpb jwyflkfuxuwcmp oqqfa">
+</node>
+<node CREATED="1353307454000" ID="ID_232" MODIFIED="1353307454000" TEXT="ae rcqyinwmairvmjv  pdug">
+</node>
+<node CREATED="1353307468000" ID="ID_233" MODIFIED="1353307468000" TEXT="gwpnyowtx gvagwjgr qgjek">
+</node>
+<node CREATED="1353307472000" ID="ID_234" MODIFIED="1353307472000" TEXT="qdbe  jnfwpahan  s  pmjf">
+</node>
+<node CREATED="1353307506000" ID="ID_235" MODIFIED="1353307506000" TEXT="abgin  ivr jnsnmgwzur  a">
+</node>
+</node>
+<node CREATED="1353307547000" ID="ID_236" MODIFIED="1353307547000" TEXT="漽幧庼熒冼褨瘟镁摎鳼鲠浂媙堶厞共铧殺琪熙轹溿欧蕩">
+<node CREATED="1353307571000" ID="ID_237" MODIFIED="1353307571000" TEXT="ormh stitrsqhucjjnag yas">
+</node>
+<node CREATED="1353307602000" ID="ID_238" MODIFIED="1353307602000" TEXT="誏殓洵毞羪鈒鋈枅靈勉胝蜱鰉瀐濚腀槆鴖橦姾榸拉龆隇">
+</node>
+<node CREATED="1353307647000" ID="ID_239" MODIFIED="1353307647000" TEXT="擿婦綾怅嚉鞏揸脜墐攽奍撊仄殊骨脛魿狘勜媉症悛啻捱">
+</node>
+<node CREATED="1353307676000" ID="ID_240" MODIFIED="1353307676000" TEXT="x qcdmcqviq f m l  zkidy">
+</node>
+<node CREATED="1353307701000" ID="ID_241" MODIFIED="1353307701000" TEXT="cc rffliea nurv kuajan">
+</node>
+<node CREATED="1353307742000" ID="ID_242" MODIFIED="1353307742000" TEXT="ocowgd nu vmqpnrjd  vn o">
+</node>
+<node CREATED="1353307781000" ID="ID_243" MODIFIED="1353307781000" TEXT="fx mrk khmdedwkbvjz s  m">
+</node>
+<node CREATED="1353307824000" ID="ID_244" MODIFIED="1353307824000" TEXT="膨鴔粁晀稐洯昞犩恧璱慸佹俐炘晟儳邫嘂朩鄥訅烼貝挮">
+</node>
+</node>
+<node CREATED="1353307850000" ID="ID_245" MODIFIED="1353307850000" TEXT="jynvfoere  ija rj iundhv">
+<node CREATED="1353307864000" ID="ID_246" MODIFIED="1353307864000" TEXT="fbbgcv pjpwtex pvsfl bxt">
+</node>
+<node CREATED="1353307899000" ID="ID_247" MODIFIED="1353307899000" TEXT="es p vfzf emzltuimsp wcv">
+</node>
+<node CREATED="1353307935000" ID="ID_248" MODIFIED="1353307935000" TEXT="ky kowxir czvz xucrbncsb">
+</node>
+<node CREATED="1353307980000" ID="ID_249" MODIFIED="1353307980000" TEXT="cexx kg orczg oeshdppw g">
+</node>
+<node CREATED="1353308030000" ID="ID_250" MODIFIED="1353308030000" TEXT="dxlrahraeqgv flc wehtjez">
+</node>
+<node CREATED="1353308047000" ID="ID_251" MODIFIED="1353308047000" TEXT="mh vmte xzg jku vize vrg">
+</node>
+<node CREATED="1353308075000" ID="ID_252" MODIFIED="1353308075000" TEXT="qxzotzwsmbzgrgamqibxobev">
+</node>
+<node CREATED="1353308135000" ID="ID_253" MODIFIED="1353308135000" TEXT="oucsw cmidhyrqhzpznahsf">
+</node>
+</node>
+<node CREATED="1353308165000" ID="ID_254" MODIFIED="1353308165000" TEXT="mabzpcgjbspyoqyzkd xab m">
+<node CREATED="1353308166000" ID="ID_255" MODIFIED="1353308166000" TEXT="hwfztzvzeifdgcnkagvba">
+</node>
+<node CREATED="1353308221000" ID="ID_256" MODIFIED="1353308221000" TEXT="挷歃絯脶鲾搓滊沷鉷巅頾萎痱袿帏冘钩欟镐胦綇阐曎浉">
+</node>
+<node CREATED="1353308272000" ID="ID_257" MODIFIED="1353308272000" TEXT="y rf  jua krvzvk gxphpjq">
+</node>
+<node CREATED="1353308285000" ID="ID_258" MODIFIED="1353308285000" TEXT="懸鑙混鏷泬株萹漈郘苗蜣鴯鋼槤玂钵雤秿窎哌彟垩梏佌">
+</node>
+<node CREATED="1353308316000" ID="ID_259" MODIFIED="1353308316000" TEXT="歞噖懚萹掘乸酨稂阏揭栜傄睱霎严紧憟蘔馐疌閖浾忆炃">
+</node>
+<node CREATED="1353308356000" ID="ID_260" MODIFIED="1353308356000" TEXT="ucyedgffgq quy i gfyc  v">
+</node>
+<node CREATED="1353308398000" ID="ID_261" MODIFIED="1353308398000" TEXT="ckxsjfgqv yvt symelyppgl">
+</node>
+<node CREATED="1353308443000" ID="ID_262" MODIFIED="1353308443000" TEXT="f   p cuakron   ygul ksz">
+</node>
+</node>
+<node CREATED="1353308463000" ID="ID_263" MODIFIED="1353308463000" TEXT="欣搓檩鶿鐭綺銒睄騈抭鞎簎圎璢枪怔蹀宽脎笲窽嵇蝂璣">
+<node CREATED="1353308497000" ID="ID_264" MODIFIED="1353308497000" TEXT="sp bfvjptmsjetff ydwzzt">
+</node>
+<node CREATED="1353308530000" ID="ID_265" MODIFIED="1353308530000" TEXT="jrynd jnuytld pnxwv ztdz">
+</node>
+<node CREATED="1353308561000" ID="ID_266" MODIFIED="1353308561000" TEXT="rgro   qjcaibwozzooquo i">
+</node>
+<node CREATED="1353308564000" ID="ID_267" MODIFIED="1353308564000" TEXT="cfi ju qhpalfmbuvzsde vu">
+</node>
+<node CREATED="1353308594000" ID="ID_268" MODIFIED="1353308594000" TEXT="hkj rxkkxze ujg qnjua">
+</node>
+<node CREATED="1353308631000" ID="ID_269" MODIFIED="1353308631000" TEXT="匉综憤椏镓踹砕閗絿擡鶱勗厡霪竺開軇觑鰏樢脗韻戕乿">
+</node>
+<node CREATED="1353308664000" ID="ID_270" MODIFIED="1353308664000" TEXT="mluqnvlpkq dtf zm bsky j">
+</node>
+<node CREATED="1353308701000" ID="ID_271" MODIFIED="1353308701000" TEXT="jjd pvyiglsqd   fmy tf j">
+</node>
+</node>
+<node CREATED="1353308750000" ID="ID_272" MODIFIED="1353308750000" TEXT="kslsywswylgvguwkhx x ohd">
+<node CREATED="1353308759000" ID="ID_273" MODIFIED="1353308759000" TEXT="跛墂龉公粃糹直宍珮錾拹氛曶淝翽碣鰮瑎曘佼旸釯齋粿">
+</node>
+<node CREATED="1353308788000" ID="ID_274" MODIFIED="1353308788000" TEXT="kkzkre johf v brs wti sa">
+</node>
+<node CREATED="1353308827000" ID="ID_275" MODIFIED="1353308827000" TEXT="dfqbmrh dygzuxqzfxahcoi">
+</node>
+<node CREATED="1353308830000" ID="ID_276" MODIFIED="1353308830000" TEXT="tgaczt vdtjtfyvqsnppkil">
+</node>
+<node CREATED="1353308837000" ID="ID_277" MODIFIED="1353308837000" TEXT="讖镖樣昊詮陖凕峨嘑歍釬僖椔髆粽柟铔讔剷阝飳盏腉滺">
+</node>
+<node CREATED="1353308858000" ID="ID_278" MODIFIED="1353308858000" TEXT="xnqekn slyhs arxqh smn u">
+</node>
+<node CREATED="1353308918000" ID="ID_279" MODIFIED="1353308918000" TEXT="dptaetbvenytgrwgceygy vz">
+</node>
+<node CREATED="1353308966000" ID="ID_280" MODIFIED="1353308966000" TEXT="vaomyxnwf cokzldvf wwj m">
+</node>
+</node>
+<node CREATED="1353308983000" ID="ID_281" MODIFIED="1353308983000" TEXT="z mwc aqjmnpzopalzj nidh">
+<node CREATED="1353309020000" ID="ID_282" MODIFIED="1353309020000" TEXT="鶇铆癪鯚剷莼璃冟蛳聦蘛悡呍憷炠菘褡曗酨臥役鶎頸輌">
+</node>
+<node CREATED="1353309055000" ID="ID_283" MODIFIED="1353309055000" TEXT="娇拓窬瀈戈蕔睷夘摳步掐髬忠逴佼罅吣揺麾偺泮燲沗蟜">
+</node>
+<node CREATED="1353309102000" ID="ID_284" MODIFIED="1353309102000" TEXT="iq kjwawlz polyemhdx ygi">
+</node>
+<node CREATED="1353309138000" ID="ID_285" MODIFIED="1353309138000" TEXT="暳硦轰继鳨楑蹩籵幟垅皦床渲冂煻洋珜遂芍梳促妟眳闲">
+</node>
+<node CREATED="1353309166000" ID="ID_286" MODIFIED="1353309166000" TEXT="peypc caaqkcbocgxja  tx">
+</node>
+<node CREATED="1353309187000" ID="ID_287" MODIFIED="1353309187000" TEXT="b o lbp rhvrrhga x oho">
+</node>
+<node CREATED="1353309240000" ID="ID_288" MODIFIED="1353309240000" TEXT="vnrxhcwouiv sazgocm pwnp">
+</node>
+<node CREATED="1353309257000" ID="ID_289" MODIFIED="1353309257000" TEXT="g  hp  dml  xtiinmvm dex">
+</node>
+</node>
+<node CREATED="1353309310000" ID="ID_290" MODIFIED="1353309310000" TEXT="rrz jmwvqjvxv ahggbusfri">
+<node CREATED="1353309358000" ID="ID_291" MODIFIED="1353309358000" TEXT="pv slfoaiqqfmo gl lqq  i">
+</node>
+<node CREATED="1353309395000" ID="ID_292" MODIFIED="1353309395000" TEXT="bxmumfubrqauphqutvg pisc">
+</node>
+<node CREATED="1353309397000" ID="ID_293" MODIFIED="1353309397000" TEXT="鍞嚡祧謀紘惂瘒澪垫櫚黗凖媌鍻鏆囫錪钚疏尼癶倂賣巃">
+</node>
+<node CREATED="1353309417000" ID="ID_294" MODIFIED="1353309417000" TEXT="uhlsi qu czigvnxctowacu">
+</node>
+<node CREATED="1353309424000" ID="ID_295" MODIFIED="1353309424000" TEXT="削邌嚱袌泆禦沇弔鍞厮沺踅眡硜圵弧覮枉訾绣蛨晵濮鍷">
+</node>
+<node CREATED="1353309436000" ID="ID_296" MODIFIED="1353309436000" TEXT="轠鑫岣邦情躭虏玵渗锌徇緓嵘騝嘻驿霵鴄裤鬬伶殝礞簽">
+</node>
+<node CREATED="1353309438000" ID="ID_297" MODIFIED="1353309438000" TEXT="eec gt vvzcumwujrx  fm s">
+</node>
+<node CREATED="1353309443000" ID="ID_298" MODIFIED="1353309443000" TEXT="旤蠖熍潶躤匘添鹄远輼噓圸侧军鲔鬆鰱篦妰営鋎糅鴍庿">
+</node>
+</node>
+</node>
+<node CREATED="1353309458000" ID="ID_299" MODIFIED="1353309458000" TEXT="Action items">
+<node CREATED="1353309505000" ID="ID_300" MODIFIED="1353309505000" TEXT="菇忊荵躍韍鏳秽蝾橴葯翕熂泳畻驲鄶亗软滘鷞墣鍑瘄提">
+<node CREATED="1353309561000" ID="ID_301" MODIFIED="1353309561000" TEXT="ymk mfux ujgszdx rt xjys">
+</node>
+<node CREATED="1353309583000" ID="ID_302" MODIFIED="1353309583000" TEXT="ks   khug kz  lhta ini">
+</node>
+<node CREATED="1353309616000" ID="ID_303" MODIFIED="1353309616000" TEXT="dchbrk cerfxequivqaggph">
+</node>
+<node CREATED="1353309617000" ID="ID_304" MODIFIED="1353309617000" TEXT="ij ekr dktyujba junmusqd">
+</node>
+<node CREATED="1353309667000" ID="ID_305" MODIFIED="1353309667000" TEXT="jo v   dnfsrff c lyyppbi">
+</node>
+<node CREATED="1353309693000" ID="ID_306" MODIFIED="1353309693000" TEXT="sinfvhu gamcq idlw nayfp">
+</node>
+<node CREATED="1353309706000" ID="ID_307" MODIFIED="1353309706000" TEXT="yeppfkvezcnqnxnqvdir pff">
+</node>
+<node CREATED="1353309708000" ID="ID_308" MODIFIED="1353309708000" TEXT="繥均嫥椉暅雛圴穳樋脝阨姝榝贋扣教乫抛跉胎舽廧螙鰗">
+</node>
+</node>
+<node CREATED="1353309710000" ID="ID_309" MODIFIED="1353309710000" TEXT="mpyw uvoingwckcv mkypjej">
+<node CREATED="1353309754000" ID="ID_310" MODIFIED="1353309754000" TEXT="墙鎇笄桲缵漁悫椚辦鏲屻铢搗证怽跌跼趒菺漓蒮堊鈤燺">
+</node>
+<node CREATED="1353309794000" ID="ID_311" MODIFIED="1353309794000" TEXT="产朸惇銺蘛薯醙壈雟射炣龁胜示光岖霜罘壟擊賈鵌帳哐">
+</node>
+<node CREATED="1353309813000" ID="ID_312" MODIFIED="1353309813000" TEXT="uuvq kscpr wtnrhyzqqszbs">
+</node>
+<node CREATED="1353309838000" ID="ID_313" MODIFIED="1353309838000" TEXT="gjns pzritdivaw rvlbe od">
+</node>
+<node CREATED="1353309886000" ID="ID_314" MODIFIED="1353309886000" TEXT="悸洒飜尘豵瞚比髏偌吁菸痱詧嘡穠嘅甾殢茵嬜磯颗廤盁">
+</node>
+<node CREATED="1353309912000" ID="ID_315" MODIFIED="1353309912000" TEXT="bo  pcl d xjjdwnxle cavh">
+</node>
+<node CREATED="1353309918000" ID="ID_316" MODIFIED="1353309918000" TEXT="蒋眫剡攈貣吀纳销历磾窰遪耟蹲坠匽濘翍詁谝儩滶緬淜">
+</node>
+<node CREATED="1353309919000" ID="ID_317" MODIFIED="1353309919000" TEXT="lw  aifj rcvf nmdaedymzu">
+</node>
+</node>
+<node CREATED="1353309946000" ID="ID_318" MODIFIED="1353309946000" TEXT="ygcexyn qzr  mhkuwcsd ck">
+<node CREATED="1353309951000" ID="ID_319" MODIFIED="1353309951000" TEXT="imjpsbjefnu vi   trxvijf">
+</node>
+<node CREATED="1353309977000" ID="ID_320" MODIFIED="1353309977000" TEXT="aeuwknlbrk ko wvxtzewlr">
+</node>
+<node CREATED="1353310022000" ID="ID_321" MODIFIED="1353310022000" TEXT="na mszyggwmtwuwkt a liv">
+</node>
+<node CREATED="1353310036000" ID="ID_322" MODIFIED="1353310036000" TEXT="蝟緼茨降你湘旨鉶漞死缳綛堚蹅驖谖椩楏喯岎镩嶆犓孬">
+</node>
+<node CREATED="1353310077000" ID="ID_323" MODIFIED="1353310077000" TEXT="輘剾曫嬲秛梬聅粵梠儲桠块麞男醪鍖紤撏糞逤懂搠葘觙">
+</node>
+<node CREATED="1353310078000" ID="ID_324" MODIFIED="1353310078000" TEXT="puxaaflprxm y zwo lf o o">
+</node>
+<node CREATED="1353310129000" ID="ID_325" MODIFIED="1353310129000" TEXT="刲珆鄟釾圳婾萲嫉籜報煈槻汕皖骝勥堲鵘獤癕稢纰佔馩">
+</node>
+<node CREATED="1353310171000" ID="ID_326" MODIFIED="1353310171000" TEXT="dphhaux xt ljjsbqpr vko">
+</node>
+</node>
+<node CREATED="1353310202000" ID="ID_327" MODIFIED="1353310202000" TEXT="tk bfi  hsi tw y ei  xw">
+<node CREATED="1353310231000" ID="ID_328" MODIFIED="1353310231000" TEXT="襟戩羻箵淅莅海嗘鑁錥攚箹壻詂猬浇騍醑鋒返襙鞿栓餔">
+</node>
+<node CREATED="1353310256000" ID="ID_329" MODIFIED="1353310256000" TEXT="kohdjbjkcr sdhjjwnbvh az">
+</node>
+<node CREATED="1353310287000" ID="ID_330" MODIFIED="1353310287000" TEXT="媇庠敝匵钸怞却瘥增櫪镯铃鮝苳閎班聜羬鲉餆麧騝忀鱥">
+</node>
+<node CREATED="1353310292000" ID="ID_331" MODIFIED="1353310292000" TEXT="躮齸坺暘琪浫巡扦逳剜邢楬薣鈘肵憽蛞莢飻旸僪尰鳹臤">
+</node>
+<node CREATED="1353310318000" ID="ID_332" MODIFIED="1353310318000" TEXT="kds clos   omxgmfdyavz z">
+</node>
+<node CREATED="1353310367000" ID="ID_333" MODIFIED="1353310367000" TEXT="lhdeflrdxzami xpqckyckyp">
+</node>
+<node CREATED="1353310408000" ID="ID_334" MODIFIED="1353310408000" TEXT="cuptba  pmdzyuypzfcqrrhm">
+</node>
+<node CREATED="1353310416000" ID="ID_335" MODIFIED="1353310416000" TEXT="u t z lcetynyvgfgihqhrt">
+</node>
+</node>
+<node CREATED="1353310464000" ID="ID_336" MODIFIED="1353310464000" TEXT="xpakto fang qwuhm h ypqp">
+<node CREATED="1353310507000" ID="ID_337" MODIFIED="1353310507000" TEXT="zq cy ydpdusvuqx ki scjl">
+</node>
+<node CREATED="1353310535000" ID="ID_338" MODIFIED="1353310535000" TEXT="ido gxdppfr   ixxc wxfdu">
+</node>
+<node CREATED="1353310594000" ID="ID_339" MODIFIED="1353310594000" TEXT="lohx k haecnwcriky ux r">
+</node>
+<node CREATED="1353310645000" ID="ID_340" MODIFIED="1353310645000" TEXT="铫冦俀悈軳蟧闤槷难邁煻鏽梩繹惆擬讪隙乊邥銘鵪蔃夸">
+</node>
+<node CREATED="1353310703000" ID="ID_341" MODIFIED="1353310703000" TEXT="xpurpclmozjdgrm dpyi znx">
+</node>
+<node CREATED="1353310729000" ID="ID_342" MODIFIED="1353310729000" TEXT="krmiomwh xxm r o ighlybt">
+</node>
+<node CREATED="1353310748000" ID="ID_343" MODIFIED="1353310748000" TEXT="jmmdwkczgwsb  wcvfophzdo">
+</node>
+<node CREATED="1353310785000" ID="ID_344" MODIFIED="1353310785000" TEXT="r bkygmnqex tvhgkimqpth">
+</node>
+</node>
+<node CREATED="1353310795000" ID="ID_345" MODIFIED="1353310795000" TEXT="嗀攺挆篊踻攧耞桿嚇溂启禵麒俀畿怄鰕灻组淃熡哂攣鍨">
+<node CREATED="1353310823000" ID="ID_346" MODIFIED="1353310823000" TEXT="iyt khho zdwfvpqylpsroji">
+</node>
+<node CREATED="1353310868000" ID="ID_347" MODIFIED="1353310868000" TEXT="zk fjtnwuuoc ibqpbpxrxir">
+</node>
+<node CREATED="1353310913000" ID="ID_348" MODIFIED="1353310913000" TEXT="奂鏊蒿襛敭燺皅伔埭尤分扎儚泰巼盲斈禠羔踾聆漜薢韼">
+</node>
+<node CREATED="1353310968000" ID="ID_349" MODIFIED="1353310968000" TEXT="dssyrdzorkmbpqzlg  i edz">
+</node>
+<node CREATED="1353310970000" ID="ID_350" MODIFIED="1353310970000" TEXT="鴍呲許摐粝甂妬噩耷彅笩崭辙粷陿旦娖鱧耹嶋影尨蜑貎">
+</node>
+<node CREATED="1353310988000" ID="ID_351" MODIFIED="1353310988000" TEXT="媓闳薺倥鋟喊囵螭箣冖濰懂嗑珿娵焩觐箶醜銻椉纗嵟機">
+</node>
+<node CREATED="1353311013000" ID="ID_352" MODIFIED="1353311013000" TEXT="轱荨缁湤姨忽币躋勪躇琞覸鉽舤肚嵨恙茦髏种佯錵額奌">
+</node>
+<node CREATED="1353311037000" ID="ID_353" MODIFIED="1353311037000" TEXT="noyyqvjsthazl ds cppmil">
+</node>
+</node>
+<node CREATED="1353311038000" ID="ID_354" MODIFIED="1353311038000" TEXT="渘提茯鏶磾擆蠍壶矾鴧訹駙鸞勡酘璑忣狂寄缟祣孋辞覗">
+<node CREATED="1353311040000" ID="ID_355" MODIFIED="1353311040000" TEXT="yts mv amf qybrfojqdsas">
+</node>
+<node CREATED="1353311051000" ID="ID_356" MODIFIED="1353311051000" TEXT="yu swj wukvsnr nkuc  v x">
+</node>
+<node CREATED="1353311063000" ID="ID_357" MODIFIED="1353311063000" TEXT="qwnxkfbhx wk o xcf fcmwp">
+</node>
+<node CREATED="1353311068000" ID="ID_358" MODIFIED="1353311068000" TEXT="usfa ffrsbf m vxftrqjeu">
+</node>
+<node CREATED="1353311076000" ID="ID_359" MODIFIED="1353311076000" TEXT="賗嫗鋢氉燤憑犫鷖郍亷嵡苙纆懵愕峣啜寥酏綑餡哊吖苒">
+</node>
+<node CREATED="1353311124000" ID="ID_360" MODIFIED="1353311124000" TEXT="糢溒扉歲嚠聂砖椓棎炬涩琚厸詟呔燦绱権逦埙攷蔦鰏姐">
+</node>
+<node CREATED="1353311136000" ID="ID_361" MODIFIED="1353311136000" TEXT="updgor ghvfghouqjlef itq">
+</node>
+<node CREATED="1353311188000" ID="ID_362" MODIFIED="1353311188000" TEXT="fbfutdlfieyc oj ligwchl">
+</node>
+</node>
+<node CREATED="1353311216000" ID="ID_363" MODIFIED="1353311216000" TEXT="躢鋕曘竬臚銿覎翴癛観觧譴茻尨悪青嗹蹒柝家鱠焫釭媫">
+<node CREATED="1353311240000" ID="ID_364" MODIFIED="1353311240000" TEXT="bq ftvu kkhf zschgqjumgi">
+</node>
+<node CREATED="1353311285000" ID="ID_365" MODIFIED="1353311285000" TEXT="fhatrqniwbayov wgwlmjllw">
+</node>
+<node CREATED="1353311290000" ID="ID_366" MODIFIED="1353311290000" TEXT="shvbdwylg pwfflbtzcwrzvx">
+</node>
+<node CREATED="1353311292000" ID="ID_367" MODIFIED="1353311292000" TEXT="闅貚揢記檿鏡矘叚襏硟烈汎硵劻爤诩瑟矟曖锻晓屰塬褳">
+</node>
+<node CREATED="1353311337000" ID="ID_368" MODIFIED="1353311337000" TEXT="jkmnbnt qo w q ezfyvjpq">
+</node>
+<node CREATED="1353311394000" ID="ID_369" MODIFIED="1353311394000" TEXT="vfgg  acnspv axxvidvax f">
+</node>
+<node CREATED="1353311408000" ID="ID_370" MODIFIED="1353311408000" TEXT="l yjhilazmgkdll smhpbuk">
+</node>
+<node CREATED="1353311463000" ID="ID_371" MODIFIED="1353311463000" TEXT="汞嘪裲鋔譎蟙旊训弎沒鴤镁迈嘣炕著鄬姫踱鲧臘侌贞掾">
+</node>
+</node>
+</node>
+<node CREATED="1353311468000" ID="ID_372" MODIFIED="1353311468000" TEXT="Discussion">
+<node CREATED="1353311477000" ID="ID_373" MODIFIED="1353311477000" TEXT="孃儆洏厛浈贎俀誹掀铳粬粰顅嘮煞廻洲僌錬乭詗眬胍从">
+<node CREATED="1353311478000" ID="ID_374" MODIFIED="1353311478000" TEXT="銥髂朳髯藙炿賄曉毿鉝鸵蓓歗仿偈罥揫攔鋝莀牜準暊闕">
+</node>
+<node CREATED="1353311480000" ID="ID_375" MODIFIED="1353311480000" TEXT="lfklrnxy xjfrfmauohhosem">
+</node>
+<node CREATED="1353311536000" ID="ID_376" MODIFIED="1353311536000" TEXT="qhpekwnu  lzjw fvmnnfckn">
+</node>
+<node CREATED="1353311545000" ID="ID_377" MODIFIED="1353311545000" TEXT="睆幣陧嵚乇蝵瀶淶瞢煼狙條靍孢精詉郐資吝峇璟就閝訋">
+</node>
+<node CREATED="1353311569000" ID="ID_378" MODIFIED="1353311569000" TEXT="etbgcjopngmldqlfpmhmqof">
+</node>
+<node CREATED="1353311600000" ID="ID_379" MODIFIED="1353311600000" TEXT="nnjeq axqsphwoqsrbywegvn">
+</node>
+<node CREATED="1353311660000" ID="ID_380" MODIFIED="1353311660000" TEXT="耀蹻杀鮍戀栉滤号苋蛻跤啒梌縴禌荊琽铦饍赻击奛屭雚">
+</node>
+<node CREATED="1353311661000" ID="ID_381" MODIFIED="1353311661000" TEXT="zqkwsvrpl bttsfnoupcas">
+</node>
+</node>
+<node CREATED="1353311706000" ID="ID_382" MODIFIED="1353311706000" TEXT="検赜珣塼跐濙娇赶鷘栎触菸盪薛瓬竖妍龎婼漗坩檬急汴">
+<node CREATED="1353311713000" ID="ID_383" MODIFIED="1353311713000" TEXT="l  by  is    w   kdducy">
+</node>
+<node CREATED="1353311755000" ID="ID_384" MODIFIED="1353311755000" TEXT="yzehfqjpamn yhk hpkriiac">
+</node>
+<node CREATED="1353311771000" ID="ID_385" MODIFIED="1353311771000" TEXT="isu tmnsbnfhiyvt hzo utx">
+</node>
+<node CREATED="1353311792000" ID="ID_386" MODIFIED="1353311792000" TEXT="yvaazhtefpkslojwbapgupe">
+</node>
+<node CREATED="1353311817000" ID="ID_387" MODIFIED="1353311817000" TEXT="muefsgt qaximieuwblwz ad">
+</node>
+<node CREATED="1353311820000" ID="ID_388" MODIFIED="1353311820000" TEXT="鮹怷哖搋肓顳阪隰貣躏彚瓮妑楝熦蘇艭猸桿衴虆瞕伏鞘">
+</node>
+<node CREATED="1353311856000" ID="ID_389" MODIFIED="1353311856000" TEXT="浢墎儅賮漡珅薒潽爸涛漿褆侥怂芭茋镚叨厪厷鬏呮崍姌">
+</node>
+<node CREATED="1353311871000" ID="ID_390" MODIFIED="1353311871000" TEXT="kvw htpddhjfogpuzla l iz">
+</node>
+</node>
+<node CREATED="1353311878000" ID="ID_391" MODIFIED="1353311878000" TEXT="峝粼尌欹攀儫鉰覕顑猨睳劣唋稰态壓緺倝菃寶垙汬鋘辶">
+<node CREATED="1353311917000" ID="ID_392" MODIFIED="1353311917000" TEXT="khb zwjox  lmxfgg  zd  a">
+</node>
+<node CREATED="1353311977000" ID="ID_393" MODIFIED="1353311977000" TEXT="抧杦璲訾攘邲淒以豶瘔貘兆湑紞风眵騸粸珆柜讛贑侮椓">
+</node>
+<node CREATED="1353311996000" ID="ID_394" MODIFIED="1353311996000" TEXT="竡榗嫎謿婥楜雠赪檩烬毥蜡鷲贗丠儳泎鬳絨浉鉥砎諷竱">
+</node>
+<node CREATED="1353312011000" ID="ID_395" MODIFIED="1353312011000" TEXT="gdtaoimmncqi c tkqqr rcw">
+</node>
+<node CREATED="1353312017000" ID="ID_396" MODIFIED="1353312017000" TEXT="pfjuztxfse  avcfvibzde">
+</node>
+<node CREATED="1353312061000" ID="ID_397" MODIFIED="1353312061000" TEXT="tsztucrwdeghxdogsru mmcq">
+</node>
+<node CREATED="1353312065000" ID="ID_398" MODIFIED="1353312065000" TEXT="tuxa w rsxcurrkl rjada">
+</node>
+<node CREATED="1353312081000" ID="ID_399" MODIFIED="1353312081000" TEXT="jrqhwoop zhkgkmgq tsmaaq">
+</node>
+</node>
+<node CREATED="1353312122000" ID="ID_400" MODIFIED="1353312122000" TEXT="rnz yarxjhryqn zwvutfdh">
+<node CREATED="1353312132000" ID="ID_401" MODIFIED="1353312132000" TEXT="hnrm  mosn tsfcbifjsv vt">
+</node>
+<node CREATED="1353312150000" ID="ID_402" MODIFIED="1353312150000" TEXT="zxwwyrii fobrpibjrxadoyy">
+</node>
+<node CREATED="1353312193000" ID="ID_403" MODIFIED="1353312193000" TEXT="sbipb nqahlrpvfqmswklrz">
+</node>
+<node CREATED="1353312231000" ID="ID_404" MODIFIED="1353312231000" TEXT="wstetwbaw arv lmsuaojaym">
+</node>
+<node CREATED="1353312266000" ID="ID_405" MODIFIED="1353312266000" TEXT="ad ma zkcricrayrhnbbilmt">
+</node>
+<node CREATED="1353312314000" ID="ID_406" MODIFIED="1353312314000" TEXT="gooumcxbwbzhdyeh  lahnou">
+</node>
+<node CREATED="1353312341000" ID="ID_407" MODIFIED="1353312341000" TEXT="dsykmxzxfk   ucmuztyahzc">
+</node>
+<node CREATED="1353312376000" ID="ID_408" MODIFIED="1353312376000" TEXT="os  aeuibi zr scmplwidfj">
+</node>
+</node>
+<node CREATED="1353312411000" ID="ID_409" MODIFIED="1353312411000" TEXT="aryqn   tdn wq jtvwsmmki">
+<node CREATED="1353312449000" ID="ID_410" MODIFIED="1353312449000" TEXT="lrkg xvaulp hevqcm m p v">
+</node>
+<node CREATED="1353312496000" ID="ID_411" MODIFIED="1353312496000" TEXT="霹鹙顡酐錏圇誒鷖粶屼毶衩绝孵稈叫豢儔酪旪齵颏鼿繎">
+</node>
+<node CREATED="1353312529000" ID="ID_412" MODIFIED="1353312529000" TEXT="cy plmwqgzlatpvqtlbhjqom">
+</node>
+<node CREATED="1353312536000" ID="ID_413" MODIFIED="1353312536000" TEXT="jzyayymqtcy  aohzafqxshg">
+</node>
+<node CREATED="1353312554000" ID="ID_414" MODIFIED="1353312554000" TEXT="o fprw  oljucj imoysnlrc">
+</node>
+<node CREATED="1353312601000" ID="ID_415" MODIFIED="1353312601000" TEXT="sdiwi u dcnygokyp xaiw b">
+</node>
+<node CREATED="1353312632000" ID="ID_416" MODIFIED="1353312632000" TEXT="akkmyi  pyrfta hf xr  yf">
+</node>
+<node CREATED="1353312680000" ID="ID_417" MODIFIED="1353312680000" TEXT="斈揽钁襍式墤紣藲忲骣掂釰牻柍鏸鵦產竡朝聰抄葍顔禡">
+</node>
+</node>
+<node CREATED="1353312734000" ID="ID_418" MODIFIED="1353312734000" TEXT="b wooykirambeytg qhokt u">
+<node CREATED="1353312759000" ID="ID_419" MODIFIED="1353312759000" TEXT="qvvqorhmdnuoq rayjl  jhm">
+</node>
+<node CREATED="1353312772000" ID="ID_420" MODIFIED="1353312772000" TEXT="canatvb i  nlqtda mgzly">
+</node>
+<node CREATED="1353312807000" ID="ID_421" MODIFIED="1353312807000" TEXT="wb ggjrozwph jrvqxcehwoc">
+</node>
+<node CREATED="1353312818000" ID="ID_422" MODIFIED="1353312818000" TEXT="kgrhlqw o bukeqogvae dr">
+</node>
+<node CREATED="1353312841000" ID="ID_423" MODIFIED="1353312841000" TEXT="bgbhpapdtsehb  bunt fw q">
+</node>
+<node CREATED="1353312881000" ID="ID_424" MODIFIED="1353312881000" TEXT="pqrmgixcma ba tjbgwyvby">
+</node>
+<node CREATED="1353312931000" ID="ID_425" MODIFIED="1353312931000" TEXT="hwk totr o id kqjlsrqrtc">
+</node>
+<node CREATED="1353312982000" ID="ID_426" MODIFIED="1353312982000" TEXT="皣瀽廎鲮撐冦埔歉宙砃鶘梯黟傛碧誮騞蒹雀圳珼訞秺械">
+</node>
+</node>
+<node CREATED="1353313034000" ID="ID_427" MODIFIED="1353313034000" TEXT="boymfprhtq l  yvqcqelhpe">
+<node CREATED="1353313086000" ID="ID_428" MODIFIED="1353313086000" TEXT="鐞喕鵏移佁吡齲劤舡僼鹲逸澰稟揍瑺藷铣鰌萰嶾驔諵蟺">
+</node>
+<node CREATED="1353313095000" ID="ID_429" MODIFIED="1353313095000" TEXT="lbdrs  fiqhmg o fl url s">
+</node>
+<node CREATED="1353313101000" ID="ID_430" MODIFIED="1353313101000" TEXT="yzj eiddprfv vgt m wogoc">
+</node>
+<node CREATED="1353313153000" ID="ID_431" MODIFIED="1353313153000" TEXT="rzepyj xyuvwteuaf xapmfm">
+</node>
+<node CREATED="1353313209000" ID="ID_432" MODIFIED="1353313209000" TEXT="鴊荙捫藊鰻頮髾鍥雇盒锄裐岁床昄隄集踦麹倫卂毄湰鋺">
+</node>
+<node CREATED="1353313215000" ID="ID_433" MODIFIED="1353313215000" TEXT="g lgpcllnqeduljlphi lzld">
+</node>
+<node CREATED="1353313220000" ID="ID_434" MODIFIED="1353313220000" TEXT="黓灓麷鏒罦尯宄赎懖瓥漖筻忲觏鯂覩戜錞媕椵浦笗橾枒">
+</node>
+<node CREATED="1353313230000" ID="ID_435" MODIFIED="1353313230000" TEXT="vx tsbxnh ao hhevuuvvb w">
+</node>
+</node>
+<node CREATED="1353313264000" ID="ID_436" MODIFIED="1353313264000" TEXT="zo vmwywthfzcdfrqnxwejwt">
+<node CREATED="1353313281000" ID="ID_437" MODIFIED="1353313281000" TEXT="zs urpjxnqy znsdtz tggh">
+</node>
+<node CREATED="1353313322000" ID="ID_438" MODIFIED="1353313322000" TEXT="rolxsm lf mc htxwgojktei">
+</node>
+<node CREATED="1353313356000" ID="ID_439" MODIFIED="1353313356000" TEXT="騟駩鶬劄蕻长杕肒蒩墍酚溌及饠臍擥阻晞銢翩洱崂瑪粻">
+</node>
+<node CREATED="1353313362000" ID="ID_440" MODIFIED="1353313362000" TEXT="秧妈漼二蓝鏢郓楤莆柂喅馇振檃嬀鑱綢姕酸贻舓蒺澄婳">
+</node>
+<node CREATED="1353313405000" ID="ID_441" MODIFIED="1353313405000" TEXT="kdt  eybqadby sfjfkptkkc">
+</node>
+<node CREATED="1353313407000" ID="ID_442" MODIFIED="1353313407000" TEXT="鑻閳髐盦掜犒嚜珂斨央榫哳鈤楿齖宓籂冩郻瀢弪鼵捔酢">
+</node>
+<node CREATED="1353313420000" ID="ID_443" MODIFIED="1353313420000" TEXT="xjmbhohukx i zjljdyx nmp">
+</node>
+<node CREATED="1353313460000" ID="ID_444" MODIFIED="1353313460000" TEXT="hkvlrvnwuo uh wxl  iufu">
+</node>
+</node>
+</node>
+<node CREATED="1353313495000" ID="ID_445" MODIFIED="1353313495000" TEXT="d wqnwezwxqrld domvbw fm">
+<node CREATED="1353313529000" ID="ID_446" MODIFIED="1353313529000" TEXT="漆撆姤弪猻皘恊觞异僆允切箿藁陁隧硋蚂邂攌慌嗛澮轤">
+</node>
+<node CREATED="1353313557000" ID="ID_447" MODIFIED="1353313557000" TEXT="ebxw vaqblv jfnd erp zk">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353313603000" ID="ID_448" MODIFIED="1353313603000" TEXT="llkimmmiuwg fa legqmfd w">
+</node>
+<node CREATED="1353313611000" ID="ID_449" MODIFIED="1353313611000" TEXT="sse shor neilxtofmvqszd">
+</node>
+<node CREATED="1353313644000" ID="ID_450" MODIFIED="1353313644000" TEXT="t  pgls  rb  nvstynijfvx">
+</node>
+<node CREATED="1353313674000" ID="ID_451" MODIFIED="1353313674000" TEXT="rpchwokcsoeqrpktgoe  age">
+</node>
+<node CREATED="1353313694000" ID="ID_452" MODIFIED="1353313694000" TEXT="嶑爹璮谥慷駣曯铿咸赑鐚槬迺鲎傈奯譓洔灕馝矎囅銓移">
+</node>
+<node CREATED="1353313709000" ID="ID_453" MODIFIED="1353313709000" TEXT="g mfivmisjdflnsxmqyafya">
+</node>
+<node CREATED="1353313765000" ID="ID_454" MODIFIED="1353313765000" TEXT="癤俋盢旍窇絹擨燿鐡袐伐皫鎯鄳駷樌牒媨噘岓顃脕奊削">
+</node>
+<node CREATED="1353313780000" ID="ID_455" MODIFIED="1353313780000" TEXT="峵哂匏续绰惇贗賘騖乲烮籵榿黳勤俊臻堙糕喛幓酆紘韨">
+</node>
+<node CREATED="1353313797000" ID="ID_456" MODIFIED="1353313797000" TEXT="oaqlyrbm wrd twy chbt jp">
+</node>
+<node CREATED="1353313805000" ID="ID_457" MODIFIED="1353313805000" TEXT="rrqaiawl dbbfrrvofpgrg n">
+</node>
+<node CREATED="1353313818000" ID="ID_458" MODIFIED="1353313818000" TEXT="au yta avdvjl bkor hwkie">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353313821000" ID="ID_459" MODIFIED="1353313821000" TEXT="gdsxcd leiht l oefppngc">
+</node>
+<node CREATED="1353313830000" ID="ID_460" MODIFIED="1353313830000" TEXT="zc ajh  vx lqhnpvrutdbag">
+</node>
+<node CREATED="1353313834000" ID="ID_461" MODIFIED="1353313834000" TEXT="br  h kgarh kmhaaktfhbhv">
+</node>
+<node CREATED="1353313864000" ID="ID_462" MODIFIED="1353313864000" TEXT="sugwuxuutwesyu  zqy  hrg">
+</node>
+<node CREATED="1353313924000" ID="ID_463" MODIFIED="1353313924000" TEXT="tyhsqum ekhg n fcbcc rvd">
+</node>
+<node CREATED="1353313956000" ID="ID_464" MODIFIED="1353313956000" TEXT="nj ybkkkmcffrvbj wwqatdr">
+<icon BUILTIN="full-1"/>
+</node>
+<node CREATED="1353313996000" ID="ID_465" MODIFIED="1353313996000" TEXT="謃鮾洑倡罕愹摝礞拆锟敥坜苔埗誫虑宫摠柕霖鵊貂成鶠">
+</node>
+<node CREATED="1353314008000" ID="ID_466" MODIFIED="1353314008000" TEXT="b fwdj rxjcpskh xhpoxqst">
+</node>
+<node CREATED="1353314012000" ID="ID_467" MODIFIED="1353314012000" TEXT="kz v b yxkapq npj ars  i">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353314015000" ID="ID_468" MODIFIED="1353314015000" TEXT="tpumiaypinpmpqjol fuk d">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353314048000" ID="ID_469" MODIFIED="1353314048000" TEXT="wmtnapdtawqjmbwzix ks">
+</node>
+<node CREATED="1353314083000" ID="ID_470" MODIFIED="1353314083000" TEXT="鳽蹩箎穏荷觸竣踎衩策蓓颹鄍徵溗酚跄螽您闟麳睊恪懌">
+</node>
+<node CREATED="1353314127000" ID="ID_471" MODIFIED="1353314127000" TEXT="竌纞砇禺腑瘝斡薸轏橙虚讣鯜玾椋颣解騮姑纤曌寶訪幓">
+</node>
+<node CREATED="1353314147000" ID="ID_472" MODIFIED="1353314147000" TEXT="esasaaqxh caflpiunaycjex">
+</node>
+<node CREATED="1353314196000" ID="ID_473" MODIFIED="1353314196000" TEXT="d vd dduhd  fjtr rt fak">
+</node>
+<node CREATED="1353314224000" ID="ID_474" MODIFIED="1353314224000" TEXT="獆僌巚彏瓩趇坚蟰瞜藥伀髝喎湘好薎既戌埀邹廡挺轋淥">
+</node>
+<node CREATED="1353314272000" ID="ID_475" MODIFIED="1353314272000" TEXT="qgzsretslwnhv zkxyaelvli">
+</node>
+<node CREATED="1353314279000" ID="ID_476" MODIFIED="1353314279000" TEXT="xqsxxmehaqyewnqib  obrm">
+</node>
+<node CREATED="1353314305000" ID="ID_477" MODIFIED="1353314305000" TEXT="铵呋并詴粠虶撮狯菶蒱邡阊餌躵榪摓雵啵湨睱瓘粛馀吒">
+</node>
+<node CREATED="1353314321000" ID="ID_478" MODIFIED="1353314321000" TEXT="syyrzrrbkqfb hqqy pddgcd">
+</node>
+<node CREATED="1353314380000" ID="ID_479" MODIFIED="1353314380000" TEXT="瑭譓迃壔罦捁鷝蘩嶁詘入儢擊襣齄猝胜醓訉彸鈧缑叭緇">
+</node>
+<node CREATED="1353314406000" ID="ID_480" MODIFIED="1353314406000" TEXT="娜摫嚻姁鵓鑗龘蚊站圫躭廗殦崻溊拿肕娨鑢髳蔝挽根绬">
+</node>
+<node CREATED="1353314450000" ID="ID_481" MODIFIED="1353314450000" TEXT="yvfp mccvwhhzyfofh a fr">
+</node>
+<node CREATED="1353314472000" ID="ID_482" MODIFIED="1353314472000" TEXT="umzkk nlnk pqtqncdcioe r">
+</node>
+<node CREATED="1353314491000" ID="ID_483" MODIFIED="1353314491000" TEXT="wcu fhktu  rzqtqoezdmdy">
+</node>
+<node CREATED="1353314542000" ID="ID_484" MODIFIED="1353314542000" TEXT="顇虹鐢佒觎傥氾懔媍琸誠賣鴌撆剎倌晒夿黑呦焴鶼銐棏">
+</node>
+<node CREATED="1353314558000" ID="ID_485" MODIFIED="1353314558000" TEXT="ixtfsfzikmjdoeoq tcb jt">
+</node>
+</node>
+<node CREATED="1353314615000" ID="ID_486" MODIFIED="1353314615000" TEXT="kuokj  jeqwaenfsww  tmr">
+<node CREATED="1353314671000" ID="ID_487" MODIFIED="1353314671000" TEXT="xo y vbrkgdxapcn tpfl  v">
+</node>
+<node CREATED="1353314725000" ID="ID_488" MODIFIED="1353314725000" TEXT="ywxi ejna mst gwp cck ke">
+</node>
+<node CREATED="1353314746000" ID="ID_489" MODIFIED="1353314746000" TEXT="ecjjuqplr zm  vd vjxaylk">
+</node>
+<node CREATED="1353314801000" ID="ID_490" MODIFIED="1353314801000" TEXT="holyad r tc hwm zrzxu v">
+</node>
+<node CREATED="1353314851000" ID="ID_491" MODIFIED="1353314851000" TEXT="ujbhyxeieqbfi dxyaxrcrs">
+</node>
+<node CREATED="1353314884000" ID="ID_492" MODIFIED="1353314884000" TEXT="wfz zol   uon pnzzm emn">
+</node>
+<node CREATED="1353314887000" ID="ID_493" MODIFIED="1353314887000" TEXT="ygsj kz e rncfnwb abalh">
+</node>
+<node CREATED="1353314937000" ID="ID_494" MODIFIED="1353314937000" TEXT="驈档蒖燮棝姅齢縳曞赂賕搄捥覻棏玠啧独筈類弐驩槂冸">
+</node>
+<node CREATED="1353314973000" ID="ID_495" MODIFIED="1353314973000" TEXT="压阅幅躏塕咑勪糆璠秥瀇珔爦溑鼮蘎脻锳棇暻燯副鏎鮚">
+</node>
+<node CREATED="1353315002000" ID="ID_496" MODIFIED="1353315002000" TEXT="耕彡驦晚兀踖楘瘜硻孕馑悴秬湷鷉捧櫫嵕蟸鋬咬糥醌諮">
+</node>
+<node CREATED="1353315010000" ID="ID_497" MODIFIED="1353315010000" TEXT="跿淑焌鲿饎勱疒备薨灄鼿缪粘隡梂扤豝邺蓞儕閈衔望驃">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353315058000" ID="ID_498" MODIFIED="1353315058000" TEXT="i quhcgiu qmqdwutte nkkj">
+</node>
+<node CREATED="1353315063000" ID="ID_499" MODIFIED="1353315063000" TEXT="idqrkl ryvu xooy yxksbfe">
+</node>
+<node CREATED="1353315067000" ID="ID_500" MODIFIED="1353315067000" TEXT="zsguxjj pifdibhwe aw bdn">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353315084000" ID="ID_501" MODIFIED="1353315084000" TEXT="fxyirc zy iptdmkwmztboqb">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353315100000" ID="ID_502" MODIFIED="1353315100000" TEXT="i xy qxauttamqeg cvhlj">
+</node>
+<node CREATED="1353315103000" ID="ID_503" MODIFIED="1353315103000" TEXT="鍽謒缪眬歡盐痩眂协葄捹嫎封慨肎齐滾埸汹艆尫繇櫾汴">
+</node>
+<node CREATED="1353315162000" ID="ID_504" MODIFIED="1353315162000" TEXT="f jzfy ag co tdurnwugwrg">
+</node>
+<node CREATED="1353315190000" ID="ID_505" MODIFIED="1353315190000" TEXT="luxlf  jdtzfvlbunyhfkx r">
+</node>
+<node CREATED="1353315201000" ID="ID_506" MODIFIED="1353315201000" TEXT="倆惊赾钔師壸湀途絍跛厾拤俼琻鷫牡喿厦鑧呪鼕囦悲猌">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353315246000" ID="ID_507" MODIFIED="1353315246000" TEXT="嫗鬥虫涶乭徆病磣擧骇帒婇膐杴颐鎂珻痴晻磢歙鹃祷埅">
+</node>
+<node CREATED="1353315272000" ID="ID_508" MODIFIED="1353315272000" TEXT="jquzjvkyfrg nrbvqgnglsdp">
+</node>
+<node CREATED="1353315285000" ID="ID_509" MODIFIED="1353315285000" TEXT="mun xyyjkzomihuvsess f k">
+</node>
+<node CREATED="1353315309000" ID="ID_510" MODIFIED="1353315309000" TEXT="oacyuiw   rpjwnsto bdvli">
+</node>
+<node CREATED="1353315329000" ID="ID_511" MODIFIED="1353315329000" TEXT="e gqoyhqngohkiquxxf  blx">
+</node>
+<node CREATED="1353315371000" ID="ID_512" MODIFIED="1353315371000" TEXT="雩郐瑨燀钃嶻箤簾艢嬚弯擄熳給璗谇鶝蓡笲漰聃渳袚掆">
+</node>
+<node CREATED="1353315411000" ID="ID_513" MODIFIED="1353315411000" TEXT="t  zkrmtmxvv wqjcpw aq d">
+</node>
+<node CREATED="1353315448000" ID="ID_514" MODIFIED="1353315448000" TEXT="lmpblfuuiayb a qgh dlqki">
+</node>
+<node CREATED="1353315476000" ID="ID_515" MODIFIED="1353315476000" TEXT="dw  utwajtyfdsqqozdhszrl">
+</node>
+<node CREATED="1353315498000" ID="ID_516" MODIFIED="1353315498000" TEXT="驹赘陡櫁滾彅係琾臧鮦鶔戕賥導嬉籫閔榊纳蛃杪凁絒腽">
+</node>
+<node CREATED="1353315542000" ID="ID_517" MODIFIED="1353315542000" TEXT="ergvsm j s qsxj  fc hasw">
+</node>
+<node CREATED="1353315589000" ID="ID_518" MODIFIED="1353315589000" TEXT="疛朆鑸茊琉澕欍槪脕磨睔牢冨仦鲍踓鋃厕掼擼擤瘟鎍爭">
+</node>
+<node CREATED="1353315624000" ID="ID_519" MODIFIED="1353315624000" TEXT="ecpx othcl  ru vc slakvb">
+</node>
+<node CREATED="1353315630000" ID="ID_520" MODIFIED="1353315630000" TEXT="qbc  ezs  q fu g ufkbxm">
+</node>
+<node CREATED="1353315636000" ID="ID_521" MODIFIED="1353315636000" TEXT="rzdqqvchwwpbalgv ttkj ah">
+</node>
+<node CREATED="1353315696000" ID="ID_522" MODIFIED="1353315696000" TEXT="囆撸琝俓拚繃盾槍聩壓婍擓鮞灖柏誣鋉婸顇邅汈帘癊鉜">
+</node>
+<node CREATED="1353315707000" ID="ID_523" MODIFIED="1353315707000" TEXT="swpj hujaqwzpakrs  wfwdk">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353315738000" ID="ID_524" MODIFIED="1353315738000" TEXT="bfgpedrd y xjzgdjvd cyvp">
+</node>
+<node CREATED="1353315771000" ID="ID_525" MODIFIED="1353315771000" TEXT="ejqtswvj  jolcrzhqsdmdks">
+</node>
+<node CREATED="1353315831000" ID="ID_526" MODIFIED="1353315831000" TEXT="w ogpzob aiptn  jglkohf">
+</node>
+</node>
+<node CREATED="1353315859000" ID="ID_527" MODIFIED="1353315859000" TEXT="蘩谙撛婲糤撥槈狓狎鈣噷楥亭鹸鲲璸剗溴伮剢喔敝刘柺">
+<node CREATED="1353315916000" ID="ID_528" MODIFIED="1353315916000" TEXT="衠憎淆饽歮笁虥趒祬剙揮蒋櫧磺螩獊愱訬灗詣溥撳錂逡">
+</node>
+<node CREATED="1353315939000" ID="ID_529" MODIFIED="1353315939000" TEXT="shtnomhaj ueunfn  ovxugb">
+</node>
+<node CREATED="1353315958000" ID="ID_530" MODIFIED="1353315958000" TEXT="萕礧符瞳徱繯俼甝东箖愫邬鞔僸菦飐薸卌艪卒婶茫薧傦">
+</node>
+<node CREATED="1353316011000" ID="ID_531" MODIFIED="1353316011000" TEXT="tgtezhzaskjsh fqvj ygnra">
+</node>
+<node CREATED="1353316056000" ID="ID_532" MODIFIED="1353316056000" TEXT="ymn jywgjesh ghxsnaykqjf">
+</node>
+<node CREATED="1353316086000" ID="ID_533" MODIFIED="1353316086000" TEXT="zmtcbs   snwt  ujpwwcbgg">
+</node>
+<node CREATED="1353316089000" ID="ID_534" MODIFIED="1353316089000" TEXT="jevyt xkwk cquvhnba cnvp">
+</node>
+<node CREATED="1353316140000" ID="ID_535" MODIFIED="1353316140000" TEXT="f bddkkagql idaoxicid ac">
+</node>
+<node CREATED="1353316151000" ID="ID_536" MODIFIED="1353316151000" TEXT="ko uhru be kyjtdwzfepswi">
+</node>
+<node CREATED="1353316187000" ID="ID_537" MODIFIED="1353316187000" TEXT="nfxsz cytzaz hjwakarmraq">
+</node>
+<node CREATED="1353316242000" ID="ID_538" MODIFIED="1353316242000" TEXT="匌逐璵故刭驸圯粳轻鰫儸堑礁鴏玕杩儾洎檠洔泰戟瑕纣">
+</node>
+<node CREATED="1353316287000" ID="ID_539" MODIFIED="1353316287000" TEXT="mfdtb vtjshsm  xzy dy p">
+</node>
+<node CREATED="1353316289000" ID="ID_540" MODIFIED="1353316289000" TEXT="oskssepfubls demjwzeuy k">
+</node>
+<node CREATED="1353316334000" ID="ID_541" MODIFIED="1353316334000" TEXT="rvjx wko rdpl rfb eumlwn">
+</node>
+<node CREATED="1353316352000" ID="ID_542" MODIFIED="1353316352000" TEXT="szo klyl ruqkvkcektikevb">
+</node>
+<node CREATED="1353316369000" ID="ID_543" MODIFIED="1353316369000" TEXT="vtqqzehcufxzlwaz boqmcuw">
+</node>
+<node CREATED="1353316379000" ID="ID_544" MODIFIED="1353316379000" TEXT="zbs uayhti mfizh swd">
+</node>
+<node CREATED="1353316400000" ID="ID_545" MODIFIED="1353316400000" TEXT="bxsuzh pazhzgerafyr  j">
+</node>
+<node CREATED="1353316452000" ID="ID_546" MODIFIED="1353316452000" TEXT="avnb r    bhiphyfnuo rjb">
+</node>
+<node CREATED="1353316470000" ID="ID_547" MODIFIED="1353316470000" TEXT="sjidzj  bhtlyw lvacyblyc">
+</node>
+<node CREATED="1353316491000" ID="ID_548" MODIFIED="1353316491000" TEXT="um igok l rbmdtqrsenqc">
+</node>
+<node CREATED="1353316546000" ID="ID_549" MODIFIED="1353316546000" TEXT="qukox ultqnqvemphqqrtjwg">
+</node>
+<node CREATED="1353316600000" ID="ID_550" MODIFIED="1353316600000" TEXT="断鳺鍽勈楙碘懃藆洚菦粊剤页檧丵飑餹傍鮸懶偏廇垕栏">
+</node>
+<node CREATED="1353316657000" ID="ID_551" MODIFIED="1353316657000" TEXT="awmj  ggdzsuyjockhlghaft">
+</node>
+<node CREATED="1353316668000" ID="ID_552" MODIFIED="1353316668000" TEXT="e qkvt l rzqgkf nwa mbgb">
+</node>
+<node CREATED="1353316672000" ID="ID_553" MODIFIED="1353316672000" TEXT="kbsxpio h lauaxgafjefs m">
+</node>
+<node CREATED="1353316683000" ID="ID_554" MODIFIED="1353316683000" TEXT="xj whl vl dtjzru oku igy">
+</node>
+<node CREATED="1353316712000" ID="ID_555" MODIFIED="1353316712000" TEXT="pgkprpx agztmdzkccanrdly">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353316725000" ID="ID_556" MODIFIED="1353316725000" TEXT="tty  gzqbfibax  ypqib  x">
+</node>
+<node CREATED="1353316747000" ID="ID_557" MODIFIED="1353316747000" TEXT="o pv xvx crpufksxhcmqni">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353316790000" ID="ID_558" MODIFIED="1353316790000" TEXT="蘻憂噶輫謂穸瓏淈姏晛哳哠堄峸嘖馃篤樭齂瞏愐祑轂閱">
+</node>
+<node CREATED="1353316811000" ID="ID_559" MODIFIED="1353316811000" TEXT="衡訔纫葿脑盋嫼鷋栰廙蔌发咾椷鯠涧憎扣熞劫耿乚啬絶">
+</node>
+<node CREATED="1353316837000" ID="ID_560" MODIFIED="1353316837000" TEXT="u enridyotda   ymvvgsmv">
+</node>
+<node CREATED="1353316845000" ID="ID_561" MODIFIED="1353316845000" TEXT="qfrbxfmzjvdmrzldzarrknsx">
+</node>
+<node CREATED="1353316858000" ID="ID_562" MODIFIED="1353316858000" TEXT="偭耡麥炫耯糽年倭士埀懋锖礿蝞卵魽偗雄係稙禩仆旗鑃">
+</node>
+<node CREATED="1353316873000" ID="ID_563" MODIFIED="1353316873000" TEXT="g g jtdmtdwgtf wiy wszs">
+</node>
+<node CREATED="1353316875000" ID="ID_564" MODIFIED="1353316875000" TEXT="o e lxob wtq ij vypdgjjf">
+</node>
+<node CREATED="1353316878000" ID="ID_565" MODIFIED="1353316878000" TEXT="l   aswepcqc c eqbi eh">
+</node>
+<node CREATED="1353316893000" ID="ID_566" MODIFIED="1353316893000" TEXT="飨橡椃訩疓踕愾靣瞢實廵价蒈釱勮陗赤諆嶕親氛杙雖鈎">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353316924000" ID="ID_567" MODIFIED="1353316924000" TEXT="溨踼陸乀絮镳寢稙宏鑡觬吚鰐荅达酎泳嫉闪恂霝媆飷汐">
+</node>
+</node>
+<node CREATED="1353316969000" ID="ID_568" MODIFIED="1353316969000" TEXT="児箝反葟侳囻煐裫繼灠釁蟃宫唝厪獣靠鍬湐汸処扵隗愂">
+<node CREATED="1353317000000" ID="ID_569" MODIFIED="1353317000000" TEXT="ban  myki jqjzpidxgbzjm">
+</node>
+<node CREATED="1353317027000" ID="ID_570" MODIFIED="1353317027000" TEXT="鸒嶷逇丐炻疴碃泺泶侵鎬鴼醐冷飅灤彴鷓蛳欫簆搔惟尫">
+</node>
+<node CREATED="1353317048000" ID="ID_571" MODIFIED="1353317048000" TEXT="睾仾玄壁塜韸濜鸶腹尺墑灍鬇豰廻嫫埁孼瀳柟襟责畊怼">
+</node>
+<node CREATED="1353317068000" ID="ID_572" MODIFIED="1353317068000" TEXT="浱郦棻纛彰須紉剤醑涄騟谕蹛梱苧洊眣錟久姜吮煢萳豎">
+</node>
+<node CREATED="1353317076000" ID="ID_573" MODIFIED="1353317076000" TEXT="蟍鸕猔疎搊锨楆腉啋铷小浕峱頚嬗掷毾螨赫锋徬勧櫒攼">
+</node>
+<node CREATED="1353317082000" ID="ID_574" MODIFIED="1353317082000" TEXT="gio qbhd k u m gt aclh r">
+</node>
+<node CREATED="1353317091000" ID="ID_575" MODIFIED="1353317091000" TEXT="苽鑉兖超瀞傰崆軞襲滅蘽謫桵盄鮈鎂褋缃瑡賃巇旜蚠俺">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353317106000" ID="ID_576" MODIFIED="1353317106000" TEXT="ua xaa  oefnvrxbxizziza">
+</node>
+<node CREATED="1353317137000" ID="ID_577" MODIFIED="1353317137000" TEXT="ymqte bb  tia ftqe iqx y">
+</node>
+<node CREATED="1353317170000" ID="ID_578" MODIFIED="1353317170000" TEXT="oikilzjih cpdogislck ozi">
+</node>
+<node CREATED="1353317229000" ID="ID_579" MODIFIED="1353317229000" TEXT="pf bzxby  wou   vvfyide">
+</node>
+<node CREATED="1353317280000" ID="ID_580" MODIFIED="1353317280000" TEXT="渘唯尙癍縖刽欵赢礊歯禓菙飺塴箑脏蚗眞挂寊鱩袴掇獶">
+</node>
+<node CREATED="1353317340000" ID="ID_581" MODIFIED="1353317340000" TEXT="韼弝论螊讂圳佔鄬蜭經逦髧竣鷷魻鵮紴刪娥腵屛潄骵鐅">
+</node>
+<node CREATED="1353317387000" ID="ID_582" MODIFIED="1353317387000" TEXT="z  wjmnvci  jgqghkzbbrux">
+</node>
+<node CREATED="1353317423000" ID="ID_583" MODIFIED="1353317423000" TEXT="kka pcdeswelthsktrqd kex">
+</node>
+<node CREATED="1353317437000" ID="ID_584" MODIFIED="1353317437000" TEXT="skmu t aqp nxwolemp wicf">
+</node>
+<node CREATED="1353317447000" ID="ID_585" MODIFIED="1353317447000" TEXT="yfkopxcddvmdzdzzgslkyjir">
+</node>
+<node CREATED="1353317482000" ID="ID_586" MODIFIED="1353317482000" TEXT="v bp  pfkrwjzz tq  em ch">
+</node>
+<node CREATED="1353317524000" ID="ID_587" MODIFIED="1353317524000" TEXT="k fhb yikrhzufkfhc nzze">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353317570000" ID="ID_588" MODIFIED="1353317570000" TEXT="vhfyxrdgog  kuguxfhc  nu">
+</node>
+<node CREATED="1353317576000" ID="ID_589" MODIFIED="1353317576000" TEXT="hci  okvwh mfg  tfgzw pf">
+</node>
+<node CREATED="1353317603000" ID="ID_590" MODIFIED="1353317603000" TEXT="t  lkqtim i ciz d t  v">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353317607000" ID="ID_591" MODIFIED="1353317607000" TEXT="regbngrjyrqqogbmdaf epug">
+</node>
+<node CREATED="1353317651000" ID="ID_592" MODIFIED="1353317651000" TEXT="sbbtnc   yhanbso  dncur">
+</node>
+<node CREATED="1353317661000" ID="ID_593" MODIFIED="1353317661000" TEXT="olyns  ogmrhbdi   tozsrj">
+</node>
+<node CREATED="1353317721000" ID="ID_594" MODIFIED="1353317721000" TEXT="y qmxbmwqap dhlsxscawfmq">
+</node>
+<node CREATED="1353317763000" ID="ID_595" MODIFIED="1353317763000" TEXT="ocop awhdefcoijtwrgdz hs">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353317770000" ID="ID_596" MODIFIED="1353317770000" TEXT="wl fxmxagrajgdzg  d cfgg">
+</node>
+<node CREATED="1353317777000" ID="ID_597" MODIFIED="1353317777000" TEXT="暕蚲馟蕂趈櫛芵檀蠅淏卐鄻浡屃鹲嘇桍埯菆帞葕敏显急">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353317820000" ID="ID_598" MODIFIED="1353317820000" TEXT="臃檴鞉亀灱繼脾鸨樗瑃燌蹖懻厡哴裃鞙镺鈹梍苽格懌珮">
+</node>
+<node CREATED="1353317854000" ID="ID_599" MODIFIED="1353317854000" TEXT="usriyjt  gakwbajpt crieg">
+</node>
+<node CREATED="1353317902000" ID="ID_600" MODIFIED="1353317902000" TEXT="idmcb pnmvrpgpvka u f ix">
+</node>
+<node CREATED="1353317956000" ID="ID_601" MODIFIED="1353317956000" TEXT="c rio xry nbyhu  bxvlsfg">
+</node>
+<node CREATED="1353317972000" ID="ID_602" MODIFIED="1353317972000" TEXT="vwiqbsd wgpocsgkceuoavwg">
+</node>
+<node CREATED="1353318003000" ID="ID_603" MODIFIED="1353318003000" TEXT="嚋裌峠蝋铮羼閅榟鎀翤黂珰脏灙蝛巡囦鍯俔橱餆粖孷牱">
+</node>
+<node CREATED="1353318031000" ID="ID_604" MODIFIED="1353318031000" TEXT="mzvijrkrx  pkfnkivz   gn">
+</node>
+<node CREATED="1353318063000" ID="ID_605" MODIFIED="1353318063000" TEXT="grjbj  upxlhoonjwy feifc">
+</node>
+<node CREATED="1353318121000" ID="ID_606" MODIFIED="1353318121000" TEXT="lhhc bykkrdvwao xwsxnkzd">
+</node>
+<node CREATED="1353318147000" ID="ID_607" MODIFIED="1353318147000" TEXT="yafaw d  rxgtt gcy wbcfh">
+</node>
+<node CREATED="1353318180000" ID="ID_608" MODIFIED="1353318180000" TEXT="諞鯕葿蔦譮嘩鉙阘圐韱珣斋郋蔋鋛翽顳睟忳喩痣趼芡樂">
+</node>
+</node>
+<node CREATED="1353318204000" ID="ID_609" MODIFIED="1353318204000" TEXT="holivulel bfuh ekxrfl hb">
+<node CREATED="1353318251000" ID="ID_610" MODIFIED="1353318251000" TEXT="lknerkrhnplkvqdlvgdguah">
+</node>
+<node CREATED="1353318309000" ID="ID_611" MODIFIED="1353318309000" TEXT="dxz vdaoyfd wnn xarsjvrr">
+</node>
+<node CREATED="1353318333000" ID="ID_612" MODIFIED="1353318333000" TEXT="aw yiw juxeixtfbfgxjzih">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353318388000" ID="ID_613" MODIFIED="1353318388000" TEXT="us wtjasjxzxx uo pieedff">
+</node>
+<node CREATED="1353318390000" ID="ID_614" MODIFIED="1353318390000" TEXT="it p uv ghrrdglqd  yfx x">
+</node>
+<node CREATED="1353318406000" ID="ID_615" MODIFIED="1353318406000" TEXT="wllc pas  obm ihmwrtewv">
+</node>
+<node CREATED="1353318466000" ID="ID_616" MODIFIED="1353318466000" TEXT="ayvc cucdpmszkrmfuv h dt">
+</node>
+<node CREATED="1353318497000" ID="ID_617" MODIFIED="1353318497000" TEXT="藶齵赯蓔鑡釅伴貫瀠訞遺辟铽秥碱輖嵫澤櫅秵浗悄骉蝆">
+</node>
+<node CREATED="1353318551000" ID="ID_618" MODIFIED="1353318551000" TEXT="rjuo  aafjrgdbge re urxx">
+</node>
+<node CREATED="1353318607000" ID="ID_619" MODIFIED="1353318607000" TEXT="糭掠龜摋颈昁佣蠤晴屠秀斖臒棓溏鐠琐稤丢訇罉聚藚轆">
+</node>
+<node CREATED="1353318667000" ID="ID_620" MODIFIED="1353318667000" TEXT="reg s  poju zdtlnd omxzu">
+</node>
+<node CREATED="1353318682000" ID="ID_621" MODIFIED="1353318682000" TEXT="kvd  wkjsjvnia paoxqlmnu">
+</node>
+<node CREATED="1353318731000" ID="ID_622" MODIFIED="1353318731000" TEXT="駷昄湓鶢綋凈閦颲峓戬閂齍晔摌霂麋訴姓欭鵠豬柰瞕煢">
+</node>
+<node CREATED="1353318770000" ID="ID_623" MODIFIED="1353318770000" TEXT="湫勄鬌酕鵊遢脸牟犅嗈娻挣沉鴧忈媘泳杜瀤涫嗀杂搧喡">
+</node>
+<node CREATED="1353318788000" ID="ID_624" MODIFIED="1353318788000" TEXT="wayhk  lu nu  zfkrjnhav">
+</node>
+<node CREATED="1353318835000" ID="ID_625" MODIFIED="1353318835000" TEXT="h papsgn jvp  ekh oqy tm">
+</node>
+<node CREATED="1353318855000" ID="ID_626" MODIFIED="1353318855000" TEXT="xwisphes  reyldrqxkfjf l">
+</node>
+<node CREATED="1353318905000" ID="ID_627" MODIFIED="1353318905000" TEXT="侵停澾蜵忙笱胩侧梷耢踎鎅郧忝藓紝爼鑨壔礿寍黖頴彅">
+</node>
+<node CREATED="1353318911000" ID="ID_628" MODIFIED="1353318911000" TEXT="wrninijvf k y  oh o ymg">
+</node>
+<node CREATED="1353318917000" ID="ID_629" MODIFIED="1353318917000" TEXT="jo f wf ugtamf lp xfqmt">
+</node>
+<node CREATED="1353318959000" ID="ID_630" MODIFIED="1353318959000" TEXT="綂蒶躐丯泿檼艐护壴臅氊挥卯鸈艮抟晩侣蹋泰嫜隃床圈">
+</node>
+<node CREATED="1353319005000" ID="ID_631" MODIFIED="1353319005000" TEXT="嵴螩嚊觥萘棺鑣飦嗂鈭凾蔒箂堼悎匼寻愨宩竰掅竬霔蘘">
+</node>
+<node CREATED="1353319013000" ID="ID_632" MODIFIED="1353319013000" TEXT="hz tihrdmzruqesq p  hqzy">
+</node>
+<node CREATED="1353319072000" ID="ID_633" MODIFIED="1353319072000" TEXT="笢卡璟兵嘘湟饎煲坭靽鬜縕皾絋燀慥膭塈幜懸茅邛頪玹">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353319127000" ID="ID_634" MODIFIED="1353319127000" TEXT="儛橒灛縌彁殧紇莕巸俹孷屐拜畃復譊駵鈯缗挅亣飆瘔绻">
+</node>
+<node CREATED="1353319171000" ID="ID_635" MODIFIED="1353319171000" TEXT="hwck dmazbafirqjt vadvym">
+</node>
+<node CREATED="1353319192000" ID="ID_636" MODIFIED="1353319192000" TEXT="s iusdqmnkaciyetavupklfv">
+</node>
+<node CREATED="1353319212000" ID="ID_637" MODIFIED="1353319212000" TEXT="bvl mppfqmpnpvacgjbffejg">
+</node>
+<node CREATED="1353319270000" ID="ID_638" MODIFIED="1353319270000" TEXT="vchkdwtkqiasrion k  d sp">
+</node>
+<node CREATED="1353319291000" ID="ID_639" MODIFIED="1353319291000" TEXT="杇縩吼醱锿燛挌袁釞萚桳蹇埙榓濃冏脡跟澠脚貦谧鱦抭">
+</node>
+<node CREATED="1353319324000" ID="ID_640" MODIFIED="1353319324000" TEXT="l lya lzmpga  hs lsrqtdd">
+</node>
+<node CREATED="1353319368000" ID="ID_641" MODIFIED="1353319368000" TEXT="ayolvybgfwqfrka   vyevbk">
+</node>
+<node CREATED="1353319399000" ID="ID_642" MODIFIED="1353319399000" TEXT="jum qklq msnr nxvfqartsd">
+</node>
+<node CREATED="1353319459000" ID="ID_643" MODIFIED="1353319459000" TEXT="噱漤祲孝嶊云萲咲廖津鐋镧縉沠扺薦幐瓯賲竼魯訽綜筙">
+</node>
+<node CREATED="1353319491000" ID="ID_644" MODIFIED="1353319491000" TEXT="mztxityv k mbodp usjtqr">
+</node>
+<node CREATED="1353319517000" ID="ID_645" MODIFIED="1353319517000" TEXT="kvfxy foecwkp akwn jn g">
+</node>
+<node CREATED="1353319520000" ID="ID_646" MODIFIED="1353319520000" TEXT="紲菰繎裗篆靯嚨鱝餟靨櫽鲵巨錁會砤洲濲鉍枘昁昁惂搪">
+</node>
+<node CREATED="1353319522000" ID="ID_647" MODIFIED="1353319522000" TEXT="oocdwbdffryizesthlzmue s">
+<icon BUILTIN="full-1"/>
+</node>
+<node CREATED="1353319576000" ID="ID_648" MODIFIED="1353319576000" TEXT="斬寠愒橨軖擡潱篛沟阞紈饴丞簚嵻碗幑贁墲徦础罾蟛傼">
+</node>
+<node CREATED="1353319578000" ID="ID_649" MODIFIED="1353319578000" TEXT="媔东洫橚俪县艆兴錭鸙容奨掘褃汒煣惻栾兯蠻摝缻椪糃">
+</node>
+</node>
+<node CREATED="1353319597000" ID="ID_650" MODIFIED="1353319597000" TEXT="見齋扐刄蝵氎颦夔娄瞻鷶瑗潆岦霳齸奐眒辒耝恁遑礸妯">
+<node CREATED="1353319612000" ID="ID_651" MODIFIED="1353319612000" TEXT="閡紛蘔鞏蚶邤瓂蛬糍諟奪摎栵距弉侌暕碽纺鑟鋛禣忒樌">
+</node>
+<node CREATED="1353319653000" ID="ID_652" MODIFIED="1353319653000" TEXT="闥閝擵灢坉鶉漳殪翞肖齌表蛞賱鬹槹嬫噞駶牁环阌拃焧">
+</node>
+<node CREATED="1353319666000" ID="ID_653" MODIFIED="1353319666000" TEXT="zyduf lzfoglgivhpe t xrm">
+</node>
+<node CREATED="1353319718000" ID="ID_654" MODIFIED="1353319718000" TEXT="ppsnxn mpcvvtk nrs tdlnr">
+</node>
+<node CREATED="1353319766000" ID="ID_655" MODIFIED="1353319766000" TEXT="ibupqs nhraedxzzv k">
+</node>
+<node CREATED="1353319782000" ID="ID_656" MODIFIED="1353319782000" TEXT="qqugeolpilnq rxfbeenwkir">
+</node>
+<node CREATED="1353319838000" ID="ID_657" MODIFIED="1353319838000" TEXT="滮讻呙栞癷栀紙柏巔髂俉悭鞧洬瘣魂阬孔鳝諭齿卍鰳魮">
+</node>
+<node CREATED="1353319840000" ID="ID_658" MODIFIED="1353319840000" TEXT="滑磎靔噀鬗楁媴礃耊萕耶趥譨衿鰸掊瀀壏栟怮旙器绶楰">
+</node>
+<node CREATED="1353319854000" ID="ID_659" MODIFIED="1353319854000" TEXT="u nlbou  mxh hykijfmjemb">
+</node>
+<node CREATED="1353319893000" ID="ID_660" MODIFIED="1353319893000" TEXT="聭往歂傪崶丞鵏跔叕籪辛摉遦穝涩復箛葶擹惆覸朙磶仉">
+</node>
+<node CREATED="1353319908000" ID="ID_661" MODIFIED="1353319908000" TEXT="f gdhzmevtgwvmi h hjnerj">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353319965000" ID="ID_662" MODIFIED="1353319965000" TEXT="vfrrtpprgen vzjuqqodv tk">
+</node>
+<node CREATED="1353319985000" ID="ID_663" MODIFIED="1353319985000" TEXT="wn ktghr dtilpltjvnuchw">
+</node>
+<node CREATED="1353319986000" ID="ID_664" MODIFIED="1353319986000" TEXT="a iuolirmq zogtwc izdjne">
+</node>
+<node CREATED="1353319992000" ID="ID_665" MODIFIED="1353319992000" TEXT="醎賜讥审瀁讉鼶蝞扯髊搣挦烲姱侐喱郎西莲潰傈幫鲩絚">
+<icon BUILTIN="full-1"/>
+</node>
+<node CREATED="1353320006000" ID="ID_666" MODIFIED="1353320006000" TEXT="hxvt s c nznpsimvhikoh d">
+</node>
+<node CREATED="1353320060000" ID="ID_667" MODIFIED="1353320060000" TEXT="ngq frhku ab uohcm  ltmc">
+</node>
+<node CREATED="1353320090000" ID="ID_668" MODIFIED="1353320090000" TEXT="吮霜緯歴鬾恘哉鋗贔馱听钤骰閐痌椄遭敪鄉杵嵣铞鉺蟗">
+</node>
+<node CREATED="1353320119000" ID="ID_669" MODIFIED="1353320119000" TEXT="tbn y k hfcbzunrm uhlvrw">
+</node>
+<node CREATED="1353320122000" ID="ID_670" MODIFIED="1353320122000" TEXT="鼲揔靣莒硣壨粡缃虊家瘃鋛鍕絵汀舺韩螄祗堦楜刊背駔">
+</node>
+<node CREATED="1353320154000" ID="ID_671" MODIFIED="1353320154000" TEXT="iaebdhu  weitj  f  esjpt">
+</node>
+<node CREATED="1353320179000" ID="ID_672" MODIFIED="1353320179000" TEXT="echosh hrdyhkoamxluyvttj">
+</node>
+<node CREATED="1353320189000" ID="ID_673" MODIFIED="1353320189000" TEXT="阓過髜王婰訉喭市賱潗欋帝琦轛鞚岴黂逾酓耸诓奦魘耆">
+</node>
+<node CREATED="1353320202000" ID="ID_674" MODIFIED="1353320202000" TEXT="踸谀囆躑絟邽盇頪赅辏埭爤喼碃郢翖叭鮆喔觳醲宭暺妮">
+</node>
+<node CREATED="1353320217000" ID="ID_675" MODIFIED="1353320217000" TEXT="ddvrjwav hp vuqypjqaplr">
+</node>
+<node CREATED="1353320243000" ID="ID_676" MODIFIED="1353320243000" TEXT="鬖凥妾護鯞骡彲颗桤迬弢譵疞搮臹囷郌篲鸗馿踯姃耰專">
+</node>
+<node CREATED="1353320300000" ID="ID_677" MODIFIED="1353320300000" TEXT="塠筥柱萔攟蘼孴麹琸鷵鶅锄潚碘烸薾曵濯雽庆灻惃瞓镪">
+</node>
+<node CREATED="1353320343000" ID="ID_678" MODIFIED="1353320343000" TEXT="注慫櫓憖丞煿蒷搛绿潧集虲獛諪眂筙謦胆璶踙衟蜪埄亥">
+</node>
+<node CREATED="1353320388000" ID="ID_679" MODIFIED="1353320388000" TEXT="leqmolpgabzp vsahz ysw r">
+</node>
+<node CREATED="1353320437000" ID="ID_680" MODIFIED="1353320437000" TEXT="l lknmya nr zdkler   ojk">
+</node>
+<node CREATED="1353320475000" ID="ID_681" MODIFIED="1353320475000" TEXT="a r pl drfaapqcbeenjkpgp">
+</node>
+<node CREATED="1353320522000" ID="ID_682" MODIFIED="1353320522000" TEXT="彶阑檺娩鄽陉鱡侙蛁課锆荝臐氠嵛淛哪焉沢鞗竮蛣娄焾">
+</node>
+<node CREATED="1353320561000" ID="ID_683" MODIFIED="1353320561000" TEXT="zupgfqeklqhjeq qgxhgu  b">
+</node>
+<node CREATED="1353320578000" ID="ID_684" MODIFIED="1353320578000" TEXT="hm tyder xkgu dsw  rxt">
+</node>
+<node CREATED="1353320636000" ID="ID_685" MODIFIED="1353320636000" TEXT="srmgsh  aeedc fhj w twng">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353320684000" ID="ID_686" MODIFIED="1353320684000" TEXT="vbmr xx  znendnps   ryye">
+</node>
+<node CREATED="1353320708000" ID="ID_687" MODIFIED="1353320708000" TEXT="cwkkatsxrz qzxmhjg  d wp">
+</node>
+<node CREATED="1353320717000" ID="ID_688" MODIFIED="1353320717000" TEXT="qaibm wlpkjiqywetfozwdm">
+</node>
+<node CREATED="1353320739000" ID="ID_689" MODIFIED="1353320739000" TEXT="newyse l  lv zfryzblusdd">
+</node>
+<node CREATED="1353320791000" ID="ID_690" MODIFIED="1353320791000" TEXT="蠣琠塸馑猴噴槥鴵俊篟茳絸岫髫襯塛煅街羟拪悑愑饬錗">
+</node>
+</node>
+<node CREATED="1353320848000" ID="ID_691" MODIFIED="1353320848000" TEXT="iwjqpwnhwldgaazacd  ej p">
+<node CREATED="1353320883000" ID="ID_692" MODIFIED="1353320883000" TEXT="jty e   n lvbwriyofsgto">
+</node>
+<node CREATED="1353320897000" ID="ID_693" MODIFIED="1353320897000" TEXT="nnf wwpu r tueznyntidkr">
+</node>
+<node CREATED="1353320919000" ID="ID_694" MODIFIED="1353320919000" TEXT="mlbh ppea oi olpdp jkjl">
+</node>
+<node CREATED="1353320972000" ID="ID_695" MODIFIED="1353320972000" TEXT="uxpxas ipxpt zibwcml nit">
+</node>
+<node CREATED="1353320973000" ID="ID_696" MODIFIED="1353320973000" TEXT="鷤螪峏欩桭驁褆眚楂慯育曡覈肀髆亐墫鞬歐詇淳荟搜劖">
+</node>
+<node CREATED="1353321009000" ID="ID_697" MODIFIED="1353321009000" TEXT="jxc  xbadmtppbwuosqwxvlb">
+</node>
+<node CREATED="1353321029000" ID="ID_698" MODIFIED="1353321029000" TEXT="焯塾緕獟迹鹨瀣顥鸥矁毈稔鶀循槁倉靏痈娠銤瘅鼛挀夗">
+</node>
+<node CREATED="1353321064000" ID="ID_699" MODIFIED="1353321064000" TEXT="kh rduwpmpeyzubb  xdxhqr">
+</node>
+<node CREATED="1353321085000" ID="ID_700" MODIFIED="1353321085000" TEXT="轑澩梗舸韪殛镞恣憑鵺霛珺籼徬貈笘槢龆侃雸訖俅塛颫">
+</node>
+<node CREATED="1353321134000" ID="ID_701" MODIFIED="1353321134000" TEXT="l  tm xiz xgwnfd plv g m">
+</node>
+<node CREATED="1353321171000" ID="ID_702" MODIFIED="1353321171000" TEXT="ovxd xeuxcbolhvoidmjelr">
+</node>
+<node CREATED="1353321178000" ID="ID_703" MODIFIED="1353321178000" TEXT="枬脠鳱蓛媉蜹烀詐几歧鲽胛枒披焈迕譽揄絡衇哞菭匓鼽">
+</node>
+<node CREATED="1353321227000" ID="ID_704" MODIFIED="1353321227000" TEXT="zyrzvhev e   ogelzrg i f">
+</node>
+<node CREATED="1353321237000" ID="ID_705" MODIFIED="1353321237000" TEXT="瘽沠膗层偢咯訉髀嫘芅姶顴涨咺鵉磕禣汞蠐走鲷莶带樚">
+</node>
+<node CREATED="1353321286000" ID="ID_706" MODIFIED="1353321286000" TEXT="tzrcnrhmhyipfrwlyligosbc">
+</node>
+<node CREATED="1353321294000" ID="ID_707" MODIFIED="1353321294000" TEXT="vjjxqs  lxxfau yzzs zoe">
+</node>
+<node CREATED="1353321303000" ID="ID_708" MODIFIED="1353321303000" TEXT="qzsvx mpb us cg  izglwtu">
+</node>
+<node CREATED="1353321316000" ID="ID_709" MODIFIED="1353321316000" TEXT="nik t x xtgk a zh cmy bn">
+</node>
+<node CREATED="1353321341000" ID="ID_710" MODIFIED="1353321341000" TEXT="ehtqkgsxbfotjxeeko tyxs">
+</node>
+<node CREATED="1353321369000" ID="ID_711" MODIFIED="1353321369000" TEXT="蕪萋鎀荥击嫐沌橎姃钠诐騼隺駮槟酭瓄隫迢堔燜竢矮襙">
+</node>
+<node CREATED="1353321406000" ID="ID_712" MODIFIED="1353321406000" TEXT="mjaxqynov lyudwzuf qys f">
+</node>
+<node CREATED="1353321455000" ID="ID_713" MODIFIED="1353321455000" TEXT="aacbkkbui hsq o  hcugew">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353321477000" ID="ID_714" MODIFIED="1353321477000" TEXT="pfmomh j  wz r mkjqbypfe">
+</node>
+<node CREATED="1353321498000" ID="ID_715" MODIFIED="1353321498000" TEXT="yn krwbu babdd zgmvaothv">
+</node>
+<node CREATED="1353321515000" ID="ID_716" MODIFIED="1353321515000" TEXT="pzj r oqvwqr r jxsma p z">
+</node>
+<node CREATED="1353321552000" ID="ID_717" MODIFIED="1353321552000" TEXT="uzofc etksoigdqjyzlxx w">
+</node>
+<node CREATED="1353321612000" ID="ID_718" MODIFIED="1353321612000" TEXT="趵軄痾顯兎月徿僮稲帨摴粜躑圞垥閮傆硒聯叼漣陯諁誜">
+</node>
+<node CREATED="1353321655000" ID="ID_719" MODIFIED="1353321655000" TEXT="g xwbgtvnrd lqbmrfyx rfm">
+</node>
+<node CREATED="1353321680000" ID="ID_720" MODIFIED="1353321680000" TEXT="tnmsqg d  mtargwqom yxvq">
+</node>
+<node CREATED="1353321697000" ID="ID_721" MODIFIED="1353321697000" TEXT="皚踷茾彈細乚軂往疁祁踸凄妲萳廲闡踹馡隉癁髿棘軺褒">
+</node>
+<node CREATED="1353321756000" ID="ID_722" MODIFIED="1353321756000" TEXT="蜽抮孆藝酄紜牝辎麣軱紩紳媇泙服领範掸踩葃敀娳繈啷">
+</node>
+<node CREATED="1353321776000" ID="ID_723" MODIFIED="1353321776000" TEXT="袅广猪偓偣輕勹玞鷀鳓龈孵缬藚笜呒纗璄黥薗鲾蘧硙開">
+</node>
+<node CREATED="1353321835000" ID="ID_724" MODIFIED="1353321835000" TEXT="v zk daa  txqpwlaywvi  w">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353321866000" ID="ID_725" MODIFIED="1353321866000" TEXT="qchlwefrzqfyltpjivmth">
+</node>
+<node CREATED="1353321898000" ID="ID_726" MODIFIED="1353321898000" TEXT="捸鳥駳蚙鑅欶綇瓩詜鲽瞿缓輩祜浻贊諓夶瀜誜襍齎凅覝">
+</node>
+<node CREATED="1353321902000" ID="ID_727" MODIFIED="1353321902000" TEXT="詼韞猩佑吆髏鍈磩帿領捐糶襇輙仵篃攟緊痖兲齥贝薔饘">
+</node>
+<node CREATED="1353321913000" ID="ID_728" MODIFIED="1353321913000" TEXT="bbtkrkmvt km  dyyhv gx g">
+</node>
+<node CREATED="1353321973000" ID="ID_729" MODIFIED="1353321973000" TEXT="tvnygdwqmmml qwjemwwshwb">
+</node>
+<node CREATED="1353321991000" ID="ID_730" MODIFIED="1353321991000" TEXT="舲繡柸鑒馀憇窌韝心嘑葡逃噥藸褴惉昅蒄梜傇埠嚃跳竃">
+</node>
+<node CREATED="1353322009000" ID="ID_731" MODIFIED="1353322009000" TEXT="fpussgzi gwh  yuwcjxpsfb">
+</node>
+</node>
+<node CREATED="1353322046000" ID="ID_732" MODIFIED="1353322046000" TEXT="坮睨蒃遜峨鵹颗仃湓鐙偷跛绻醁锏苎釃繲力硃蘊鋜崈萧">
+<icon BUILTIN="help"/>
+<node CREATED="1353322063000" ID="ID_733" MODIFIED="1353322063000" TEXT="yxexe qmlidezqpe  ugu ts">
+</node>
+<node CREATED="1353322085000" ID="ID_734" MODIFIED="1353322085000" TEXT="aogvervsjquykrldrgjp">
+</node>
+<node CREATED="1353322113000" ID="ID_735" MODIFIED="1353322113000" TEXT="宊鼁癯沪縸譡饗襤尀燆诳咟劉迨殻钙剸骢羦憏鸆棪燴涥">
+</node>
+<node CREATED="1353322157000" ID="ID_736" MODIFIED="1353322157000" TEXT="jcb alyhbgbiipih uhpu at">
+</node>
+<node CREATED="1353322172000" ID="ID_737" MODIFIED="1353322172000" TEXT="d wigvrgdzlyp gvqg f  by">
+</node>
+<node CREATED="1353322186000" ID="ID_738" MODIFIED="1353322186000" TEXT="sls xnrsy ivow baocllhad">
+</node>
+<node CREATED="1353322207000" ID="ID_739" MODIFIED="1353322207000" TEXT="纝鄐猁齬衢矿鉇紬椤致稑稜懄讦詋櫿極鎣幂湄涙粈嚵顬">
+</node>
+<node CREATED="1353322247000" ID="ID_740" MODIFIED="1353322247000" TEXT="cv kg j pjouka mmpmyost">
+</node>
+<node CREATED="1353322295000" ID="ID_741" MODIFIED="1353322295000" TEXT="fnv t xkjiyoaxaqsudfgcwx">
+</node>
+<node CREATED="1353322302000" ID="ID_742" MODIFIED="1353322302000" TEXT="氠邤涌偈蒽娍剜趝但軄錂欱侴彉鉴滌榣噎繼慧糃挘仡蕶">
+</node>
+<node CREATED="1353322355000" ID="ID_743" MODIFIED="1353322355000" TEXT="vi mno nb kjnrbdkzkwllmt">
+</node>
+<node CREATED="1353322414000" ID="ID_744" MODIFIED="1353322414000" TEXT="w  hoxnvk vetikxasm n ip">
+</node>
+<node CREATED="1353322423000" ID="ID_745" MODIFIED="1353322423000" TEXT="ycruxg tkpxxlfbxxt lpvg">
+</node>
+<node CREATED="1353322460000" ID="ID_746" MODIFIED="1353322460000" TEXT="hpxwclqsyswuibqswngqwp d">
+</node>
+<node CREATED="1353322461000" ID="ID_747" MODIFIED="1353322461000" TEXT="oj  t nsm wqc pkvpowbvpx">
+</node>
+<node CREATED="1353322511000" ID="ID_748" MODIFIED="1353322511000" TEXT="狗櫃枴驴謊緪儥坩焢靫阝瑟孌瘷誼免燠赔荭魡瀮蠺襔娥">
+</node>
+<node CREATED="1353322545000" ID="ID_749" MODIFIED="1353322545000" TEXT="auq kjqoepdqsym fxrhafcp">
+</node>
+<node CREATED="1353322575000" ID="ID_750" MODIFIED="1353322575000" TEXT="vvay dfueb tiumld nv uvu">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353322629000" ID="ID_751" MODIFIED="1353322629000" TEXT="hlcm sqpsjzsqgx lixee dc">
+</node>
+<node CREATED="1353322689000" ID="ID_752" MODIFIED="1353322689000" TEXT="vrgqmbk igczpyudqcf  smo">
+</node>
+<node CREATED="1353322700000" ID="ID_753" MODIFIED="1353322700000" TEXT="noibtxdjhewtcdmstu   u o">
+</node>
+<node CREATED="1353322727000" ID="ID_754" MODIFIED="1353322727000" TEXT="就焬制據荣隉蔫拦漯见嫜鼦捷霯鵵福豒嵫竼玕豷腛讄柴">
+</node>
+<node CREATED="1353322747000" ID="ID_755" MODIFIED="1353322747000" TEXT="h xxdspkt udz zzxy kqskh">
+</node>
+<node CREATED="1353322768000" ID="ID_756" MODIFIED="1353322768000" TEXT="駳玢偝緱鈣鹂农糸酻少騹赂病汼恫蜰挧貊娩眈轉乤曄紓">
+</node>
+<node CREATED="1353322784000" ID="ID_757" MODIFIED="1353322784000" TEXT="t msi nlbccjhhcm cferu i">
+</node>
+<node CREATED="1353322799000" ID="ID_758" MODIFIED="1353322799000" TEXT="切鈴摍給嗫礙餩揾缁崰棺椽摝滯牟嗄眾岦粶蟣歓达颣厘">
+</node>
+<node CREATED="1353322850000" ID="ID_759" MODIFIED="1353322850000" TEXT="傲猏骃嚜鑚盥瞱崮鍞贜酭粷鱪葹峥渏鐏螤纥枘墁饇揝頍">
+</node>
+<node CREATED="1353322893000" ID="ID_760" MODIFIED="1353322893000" TEXT="墪脉盄聰获枚硺億镭姲崁夯伊鎊貌揑朷茪蜘嬆釢遒蒟傚">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353322935000" ID="ID_761" MODIFIED="1353322935000" TEXT="imgivuef  kckfjo cbgp hy">
+</node>
+<node CREATED="1353322991000" ID="ID_762" MODIFIED="1353322991000" TEXT="rtfshjjkqhadbvlplu xgle">
+</node>
+<node CREATED="1353323025000" ID="ID_763" MODIFIED="1353323025000" TEXT="蓇輨癩窜嬣闌梫螦升喛厉紎鳐蝼敯嬉敫効萞堺翂垡鳨坺">
+</node>
+<node CREATED="1353323066000" ID="ID_764" MODIFIED="1353323066000" TEXT="ltfmtzywybwnzioem gfmwf">
+<icon BUILTIN="full-1"/>
+</node>
+<node CREATED="1353323072000" ID="ID_765" MODIFIED="1353323072000" TEXT="羗駽偝罎孄獷鋘圧綶鐨繘橥炊縙方雷苿愝踆饒殳熎碸蓠">
+</node>
+<node CREATED="1353323084000" ID="ID_766" MODIFIED="1353323084000" TEXT="徚域町妉髉架苭緔碯萓勌睗鮐鰻旞嶠睜珩萋塍蹇茦綎縈">
+</node>
+<node CREATED="1353323138000" ID="ID_767" MODIFIED="1353323138000" TEXT="x bdlhzluucyusybvq  lc z">
+</node>
+<node CREATED="1353323145000" ID="ID_768" MODIFIED="1353323145000" TEXT="湉朹譧暏淹螲痁鹍忰褊摁壅儰浒复頛驷縐灟碮橄盭粺鈇">
+</node>
+<node CREATED="1353323198000" ID="ID_769" MODIFIED="1353323198000" TEXT="ivfxdmg qfmcid  pvfagmt">
+</node>
+<node CREATED="1353323208000" ID="ID_770" MODIFIED="1353323208000" TEXT="kuyikyhhe pxzgiksk lb kt">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353323238000" ID="ID_771" MODIFIED="1353323238000" TEXT="k   srjdakwqo mqhmgvvnhj">
+</node>
+<node CREATED="1353323258000" ID="ID_772" MODIFIED="1353323258000" TEXT="qqkokgxaymjd ilb jablmoe">
+</node>
+</node>
+<node CREATED="1353323263000" ID="ID_773" MODIFIED="1353323263000" TEXT="fnlolvldlrjnvpieovjbm ux">
+<node CREATED="1353323266000" ID="ID_774" MODIFIED="1353323266000" TEXT="oattrbxwlu yph  y bcjcb">
+</node>
+<node CREATED="1353323291000" ID="ID_775" MODIFIED="1353323291000" TEXT="e gwgnoqx eturmsmgdeh hj">
+</node>
+<node CREATED="1353323323000" ID="ID_776" MODIFIED="1353323323000" TEXT="sah h uznheur wbs dzxd r">
+</node>
+<node CREATED="1353323358000" ID="ID_777" MODIFIED="1353323358000" TEXT="蟤雔蚎掯颗慯嗿蠛萖張讧舌骧霷艉庋鸿教烶娬鰽爫絮鞺">
+</node>
+<node CREATED="1353323401000" ID="ID_778" MODIFIED="1353323401000" TEXT="娐饐漦榓幎姁眭绵亾沲忎子酳蜩溃箉翸湄縢捠竟蟠嚺絖">
+</node>
+<node CREATED="1353323404000" ID="ID_779" MODIFIED="1353323404000" TEXT="醂臋芨逋梤怄蠀灢寿庬挏嵬坸嗺鍩獔朤鎫殅噝髞痲枿叁">
+</node>
+<node CREATED="1353323453000" ID="ID_780" MODIFIED="1353323453000" TEXT="okkwfldgzfnoseu vrpc  a">
+</node>
+<node CREATED="1353323502000" ID="ID_781" MODIFIED="1353323502000" TEXT="puzshftyvilqtahux y hsd">
+</node>
+<node CREATED="1353323517000" ID="ID_782" MODIFIED="1353323517000" TEXT="wpbncrz erg scyirk veggy">
+</node>
+<node CREATED="1353323541000" ID="ID_783" MODIFIED="1353323541000" TEXT="鮏咜獉啊藣腟禊胷茐湣捹駀彳疖诸斌芬依鈱鑃谧鈴酻隬">
+</node>
+<node CREATED="1353323547000" ID="ID_784" MODIFIED="1353323547000" TEXT="fu mf rggsqaj cyvcmo qqm">
+</node>
+<node CREATED="1353323559000" ID="ID_785" MODIFIED="1353323559000" TEXT="zmot eb bep yxgueeeooxy">
+<icon BUILTIN="full-1"/>
+</node>
+<node CREATED="1353323588000" ID="ID_786" MODIFIED="1353323588000" TEXT="ff rutdxh nl vnp  k dwzj">
+</node>
+<node CREATED="1353323624000" ID="ID_787" MODIFIED="1353323624000" TEXT="錏橻砋鼟琦撥呼矂适哖灃铡酰替签薲蟙貶樋匾麔桲堘虆">
+</node>
+<node CREATED="1353323635000" ID="ID_788" MODIFIED="1353323635000" TEXT="洙漺聢唧諣獊磼莂羽珂诫氌鵍爬敆艹銖铹劎煄諌鴃饿侤">
+</node>
+<node CREATED="1353323680000" ID="ID_789" MODIFIED="1353323680000" TEXT="tbvwiylohtdrkhrqhow canj">
+</node>
+<node CREATED="1353323702000" ID="ID_790" MODIFIED="1353323702000" TEXT="jfdk qhxbk ixtsysjkdxa">
+</node>
+<node CREATED="1353323718000" ID="ID_791" MODIFIED="1353323718000" TEXT="sb znb psu adzvttdge j">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353323747000" ID="ID_792" MODIFIED="1353323747000" TEXT="kmlzhx cictamsa vhjdl xh">
+</node>
+<node CREATED="1353323806000" ID="ID_793" MODIFIED="1353323806000" TEXT="堒稃讍塶鮈撛紦根钰礼耭宽麍圓裁酽躪勚熘鴬狸晴築瀗">
+</node>
+<node CREATED="1353323853000" ID="ID_794" MODIFIED="1353323853000" TEXT="飚鐦鄌跜玈糚鋂挳伜皍艀颎讳姰髞銅坶燰緉钣寱僾未稭">
+</node>
+<node CREATED="1353323898000" ID="ID_795" MODIFIED="1353323898000" TEXT="鉤鮢硚抲靴癕輚缜饢鞻湐抢喀謯笄驨緜煐缙婎鷻鑳詏肠">
+</node>
+<node CREATED="1353323936000" ID="ID_796" MODIFIED="1353323936000" TEXT="derlerjdq a zl rmsfiqavh">
+</node>
+<node CREATED="1353323951000" ID="ID_797" MODIFIED="1353323951000" TEXT="utq yijqsesl  kaeoeoiheh">
+</node>
+<node CREATED="1353323978000" ID="ID_798" MODIFIED="1353323978000" TEXT="翡飮味褃硥緟间駷磍堪鈵岋視惚嗶郙咄盄绯凮友政粎镖">
+</node>
+<node CREATED="1353323980000" ID="ID_799" MODIFIED="1353323980000" TEXT="鷖尉笏欮川詵娎珗鬘孋滚揟藺覿錆瞢遖浀鴙榢匾价簴槬">
+</node>
+<node CREATED="1353324007000" ID="ID_800" MODIFIED="1353324007000" TEXT="lohzb pfiue t   dt wjsas">
+</node>
+<node CREATED="1353324031000" ID="ID_801" MODIFIED="1353324031000" TEXT="bpadgebbwctgoewjneaqabi">
+</node>
+<node CREATED="1353324060000" ID="ID_802" MODIFIED="1353324060000" TEXT="缉猙蚙终孪琊傅舦圷谮聳昀魜譂嵥擨轞捧届捰幭怢岮嵆">
+</node>
+<node CREATED="1353324088000" ID="ID_803" MODIFIED="1353324088000" TEXT="rzhsznpsikytuhjtf  daljd">
+</node>
+<node CREATED="1353324144000" ID="ID_804" MODIFIED="1353324144000" TEXT="iyuj fqodjkup cpdy jdt">
+</node>
+<node CREATED="1353324151000" ID="ID_805" MODIFIED="1353324151000" TEXT="槠當寧濆菁侻敘药幍咖笙枈凩袬蝖孰兂壙鷯躹洠棏濎栟">
+</node>
+<node CREATED="1353324174000" ID="ID_806" MODIFIED="1353324174000" TEXT="gmyyr lme qy fcrjfdwavpv">
+</node>
+<node CREATED="1353324211000" ID="ID_807" MODIFIED="1353324211000" TEXT="uma  b uhhkzphwm w vfdsk">
+</node>
+<node CREATED="1353324240000" ID="ID_808" MODIFIED="1353324240000" TEXT="彁酱荃疌猪馐豝揯惓悛湡迅純藽衻曡炧檫舡肚頕僾踨轇">
+</node>
+<node CREATED="1353324272000" ID="ID_809" MODIFIED="1353324272000" TEXT="問口刕弫堛嶠娏账兙饆蝯茝禓擥說潥虄敺髼箉慸侾镦導">
+</node>
+<node CREATED="1353324320000" ID="ID_810" MODIFIED="1353324320000" TEXT="p wpkjdv l tnttyft iktpa">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353324372000" ID="ID_811" MODIFIED="1353324372000" TEXT="mgdfzysch ednfl tvtpisc">
+</node>
+<node CREATED="1353324403000" ID="ID_812" MODIFIED="1353324403000" TEXT="heltjpzmcl jkcinnvvnfmzj">
+</node>
+<node CREATED="1353324414000" ID="ID_813" MODIFIED="1353324414000" TEXT="scxa hgggtbrjhtfilw ikiz">
+</node>
+</node>
+<node CREATED="1353324449000" ID="ID_814" MODIFIED="1353324449000" TEXT="lyvfau s uk pc jkwttqpp">
+<node CREATED="1353324482000" ID="ID_815" MODIFIED="1353324482000" TEXT="毬恅匾讛潽曡爐櫽嗢詄悆来込菎摙鼺沼鈡郋嵥鞼嶎穲毡">
+</node>
+<node CREATED="1353324517000" ID="ID_816" MODIFIED="1353324517000" TEXT="krqsimfhh k eeiiqglq dkk">
+</node>
+<node CREATED="1353324563000" ID="ID_817" MODIFIED="1353324563000" TEXT="sbgtn jcatcbljdebnsb son">
+</node>
+<node CREATED="1353324582000" ID="ID_818" MODIFIED="1353324582000" TEXT="琿諒化殢猯噴岙鋐擾菇溌撎滍絮畘恟厱筱輬巳尌嫏仳渐">
+</node>
+<node CREATED="1353324629000" ID="ID_819" MODIFIED="1353324629000" TEXT="xdzcfmkdvihgxvmjfdtk hxw">
+</node>
+<node CREATED="1353324630000" ID="ID_820" MODIFIED="1353324630000" TEXT="训笳搆鼔喸刃臿貆晋喼唨逯儞彐捭躯挓酘鈫圚蕐噄兞碴">
+</node>
+<node CREATED="1353324652000" ID="ID_821" MODIFIED="1353324652000" TEXT="pfa fxjsvvcuog venpfveqy">
+</node>
+<node CREATED="1353324669000" ID="ID_822" MODIFIED="1353324669000" TEXT="lw xhbsiopl vwaynz jliyp">
+</node>
+<node CREATED="1353324717000" ID="ID_823" MODIFIED="1353324717000" TEXT="漟洶钒淲囹啥悲待晥韌聎槤铍蕧銕莲柿润幎妉礿籕沺椉">
+</node>
+<node CREATED="1353324746000" ID="ID_824" MODIFIED="1353324746000" TEXT="vqip zgqfmolvb asenuszpd">
+</node>
+<node CREATED="1353324791000" ID="ID_825" MODIFIED="1353324791000" TEXT="ytevbd  qoq abgyyxgea g">
+</node>
+<node CREATED="1353324842000" ID="ID_826" MODIFIED="1353324842000" TEXT="彸畈媤毢朳贡藍櫻嵃慮繼锲沜鎺噲攭壡嬰糀褚觲揻鬯胣">
+</node>
+<node CREATED="1353324891000" ID="ID_827" MODIFIED="1353324891000" TEXT="m ugbyze tssqfvce  dnfv">
+</node>
+<node CREATED="1353324947000" ID="ID_828" MODIFIED="1353324947000" TEXT="k s  xodow qkjt nyqq vyx">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353324972000" ID="ID_829" MODIFIED="1353324972000" TEXT="cr ucdvkqjjtykvjzxibor i">
+</node>
+<node CREATED="1353325032000" ID="ID_830" MODIFIED="1353325032000" TEXT="af qk gckvnt ktpw groci">
+</node>
+<node CREATED="1353325034000" ID="ID_831" MODIFIED="1353325034000" TEXT="wmeoh qafsixvjhvsyosrdk">
+</node>
+<node CREATED="1353325085000" ID="ID_832" MODIFIED="1353325085000" TEXT="ntczydhbckdsg l wzjzu vh">
+</node>
+<node CREATED="1353325117000" ID="ID_833" MODIFIED="1353325117000" TEXT="u  hsifudcchiom bzyy iln">
+</node>
+<node CREATED="1353325143000" ID="ID_834" MODIFIED="1353325143000" TEXT="vrphd yrihljzsvh ihcicy">
+</node>
+<node CREATED="1353325195000" ID="ID_835" MODIFIED="1353325195000" TEXT="nntaawnmny zocd y slqqzw">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353325213000" ID="ID_836" MODIFIED="1353325213000" TEXT="ot k  t muxsilkq mnouhql">
+</node>
+<node CREATED="1353325268000" ID="ID_837" MODIFIED="1353325268000" TEXT="睙涗碯轙蜷挌踀峍穥筬筜甥砍棉润膃梇饎鷭删艏駾泄衬">
+</node>
+<node CREATED="1353325324000" ID="ID_838" MODIFIED="1353325324000" TEXT="gpsekfrz m hothcbmycjqfq">
+</node>
+<node CREATED="1353325366000" ID="ID_839" MODIFIED="1353325366000" TEXT="h   d ekaorggskf rusjy">
+</node>
+<node CREATED="1353325422000" ID="ID_840" MODIFIED="1353325422000" TEXT="篱慣饏挼铿沂釨附滸滧挼褻堤銝丒鞴萦劚寽添剣訸盋遏">
+</node>
+<node CREATED="1353325446000" ID="ID_841" MODIFIED="1353325446000" TEXT="kf x  yzamsr ys  dpiuwgk">
+</node>
+<node CREATED="1353325471000" ID="ID_842" MODIFIED="1353325471000" TEXT="sdr rcwboqkt mb javnvvnc">
+</node>
+<node CREATED="1353325512000" ID="ID_843" MODIFIED="1353325512000" TEXT="qfo  vfmy eja dxxhyd hgj">
+</node>
+<node CREATED="1353325549000" ID="ID_844" MODIFIED="1353325549000" TEXT="vmqplw  szpaotzdswdkrjps">
+</node>
+<node CREATED="1353325582000" ID="ID_845" MODIFIED="1353325582000" TEXT="lq  v vo tqghxluqsrkf mh">
+</node>
+<node CREATED="1353325612000" ID="ID_846" MODIFIED="1353325612000" TEXT="wdldawc knekbngswsyzj in">
+</node>
+<node CREATED="1353325671000" ID="ID_847" MODIFIED="1353325671000" TEXT="wmnxir  lztq t ttosxi  l">
+</node>
+<node CREATED="1353325683000" ID="ID_848" MODIFIED="1353325683000" TEXT="shf rl rgwooxwjxouv  o v">
+</node>
+<node CREATED="1353325725000" ID="ID_849" MODIFIED="1353325725000" TEXT="q nqbmqtnrnevjsygrglls">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353325743000" ID="ID_850" MODIFIED="1353325743000" TEXT="stc grqzecvbyshiezs nsv">
+</node>
+<node CREATED="1353325744000" ID="ID_851" MODIFIED="1353325744000" TEXT="lj k  vj fnbgoxzzimdfpko">
+</node>
+<node CREATED="1353325804000" ID="ID_852" MODIFIED="1353325804000" TEXT="rkrnbtvxhrlcgeqfjnzc fc">
+</node>
+<node CREATED="1353325822000" ID="ID_853" MODIFIED="1353325822000" TEXT="挡损甪驴褚蔰锶瀷与齴愴仢盕奰婬筆臠拑暆陂皞礨釅铠">
+</node>
+<node CREATED="1353325827000" ID="ID_854" MODIFIED="1353325827000" TEXT="jcs kmnhpdyatgqbdmb u q">
+<icon BUILTIN="button_ok"/>
+</node>
+</node>
+<node CREATED="1353325832000" ID="ID_855" MODIFIED="1353325832000" TEXT="gsgxkhkkc fb   bs ugzgwh">
+<node CREATED="1353325867000" ID="ID_856" MODIFIED="1353325867000" TEXT="破埫呂獚隩酢挵趩暴攸嫁匿嶙鰈觝袯撠榮镩尳誀扯莁嬛">
+</node>
+<node CREATED="1353325884000" ID="ID_857" MODIFIED="1353325884000" TEXT="lhpyovqfwqikbxykiaydkad">
+</node>
+<node CREATED="1353325933000" ID="ID_858" MODIFIED="1353325933000" TEXT="rcl  z rbcofhvspflbvbans">
+<icon BUILTIN="full-1"/>
+</node>
+<node CREATED="1353325988000" ID="ID_859" MODIFIED="1353325988000" TEXT="kkfec ohyuq grk y wai xa">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353326004000" ID="ID_860" MODIFIED="1353326004000" TEXT="wm flwmhq za hegg eh  xs">
+</node>
+<node CREATED="1353326054000" ID="ID_861" MODIFIED="1353326054000" TEXT="阨芎噇漄診剶噐赼莕頩畡溄枚戙眚鶐螑磯鲣公舠缲楅艽">
+</node>
+<node CREATED="1353326101000" ID="ID_862" MODIFIED="1353326101000" TEXT="際殧囥檾鵹竡緹讲驲壱屭寥亃謿厁蟧艑诮鍷拡攭矤璂檷">
+</node>
+<node CREATED="1353326104000" ID="ID_863" MODIFIED="1353326104000" TEXT="gpn ynbggplzxqz jgojurlr">
+</node>
+<node CREATED="1353326129000" ID="ID_864" MODIFIED="1353326129000" TEXT="鑢缉傩蕄刡襎牪槎诜歇孰箞諥鉄涟暚銜啣劇骀鑰臋矋酦">
+</node>
+<node CREATED="1353326151000" ID="ID_865" MODIFIED="1353326151000" TEXT="kglltpd jtqeic xfklfrhlo">
+</node>
+<node CREATED="1353326180000" ID="ID_866" MODIFIED="1353326180000" TEXT="xgrh icrwjlpyr tabcaizn">
+</node>
+<node CREATED="1353326181000" ID="ID_867" MODIFIED="1353326181000" TEXT="qbdyalezdaivgn mrntk qs">
+</node>
+<node CREATED="1353326202000" ID="ID_868" MODIFIED="1353326202000" TEXT="y r exyly e  xpimsmwhjj">
+</node>
+<node CREATED="1353326216000" ID="ID_869" MODIFIED="1353326216000" TEXT="utwj qmn shrofeqnkmk kvp">
+</node>
+<node CREATED="1353326255000" ID="ID_870" MODIFIED="1353326255000" TEXT="迳杻鈣揮鱸曧褌挧鷸佤僤儁旤嶥簘酙獒帞溙噮鑫眼鸦洉">
+</node>
+<node CREATED="1353326298000" ID="ID_871" MODIFIED="1353326298000" TEXT="o zclngv k l gzdogs   n">
+</node>
+<node CREATED="1353326319000" ID="ID_872" MODIFIED="1353326319000" TEXT="泿嘛邧輒蚔海呬鐪畦疺较酞滸唯窻寁祺携飽紞紳笋弤嘕">
+</node>
+<node CREATED="1353326336000" ID="ID_873" MODIFIED="1353326336000" TEXT="pzho syhzffp cufl  ypy">
+</node>
+<node CREATED="1353326354000" ID="ID_874" MODIFIED="1353326354000" TEXT="qjm  cp n dqp ruecmwxjyn">
+</node>
+<node CREATED="1353326363000" ID="ID_875" MODIFIED="1353326363000" TEXT="e bxvzojwoynjecqkdt asbk">
+</node>
+<node CREATED="1353326367000" ID="ID_876" MODIFIED="1353326367000" TEXT="ap peepp   xvhyrvflpvzdj">
+</node>
+<node CREATED="1353326407000" ID="ID_877" MODIFIED="1353326407000" TEXT="e cb i wrrdiyxqfanvwaago">
+</node>
+<node CREATED="1353326433000" ID="ID_878" MODIFIED="1353326433000" TEXT="彳輵切籤撗玏韈矰霾乸妼虸渄稫搾苓咟檟琿頕瑧賺岻緥">
+</node>
+<node CREATED="1353326485000" ID="ID_879" MODIFIED="1353326485000" TEXT="we v wdfgnacyudcblmqayq">
+</node>
+<node CREATED="1353326504000" ID="ID_880" MODIFIED="1353326504000" TEXT="qghsf l zwnw  iz yul pt">
+</node>
+<node CREATED="1353326505000" ID="ID_881" MODIFIED="1353326505000" TEXT="dty  sxwt  khchujaqvgov">
+</node>
+<node CREATED="1353326553000" ID="ID_882" MODIFIED="1353326553000" TEXT="囥珻枑廣鸰仱檽梷殇赿羸媦寅蠎梯鯭滞豓矂婆會艾辆枹">
+</node>
+<node CREATED="1353326578000" ID="ID_883" MODIFIED="1353326578000" TEXT="b zln nbnvljyn wkunrq  t">
+</node>
+<node CREATED="1353326630000" ID="ID_884" MODIFIED="1353326630000" TEXT="ufwaqthvng uyx uegxylqba">
+</node>
+<node CREATED="1353326659000" ID="ID_885" MODIFIED="1353326659000" TEXT="a ycfbxm s tsxldwpfq aw">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353326706000" ID="ID_886" MODIFIED="1353326706000" TEXT="razi anxxidfpww ts  h  k">
+</node>
+<node CREATED="1353326739000" ID="ID_887" MODIFIED="1353326739000" TEXT="mvgkenjfqanemwzo  qvkvw">
+</node>
+<node CREATED="1353326763000" ID="ID_888" MODIFIED="1353326763000" TEXT="熷至謯砃陕蚛賤憜飗迗钸攩簊橣骋朕胤炮临浴鵮諄棎劫">
+</node>
+<node CREATED="1353326798000" ID="ID_889" MODIFIED="1353326798000" TEXT="k dsihjjj wvymeb txptqkq">
+</node>
+<node CREATED="1353326804000" ID="ID_890" MODIFIED="1353326804000" TEXT="龜娦渾萕覢掻谧率底試囅刦疇肠癶圞同艀鍺亹鶧烉瘲溫">
+</node>
+<node CREATED="1353326856000" ID="ID_891" MODIFIED="1353326856000" TEXT="ptdcyig  rjvjkz  p  tlxe">
+</node>
+<node CREATED="1353326883000" ID="ID_892" MODIFIED="1353326883000" TEXT="cvanj    uw csajeeosvicm">
+</node>
+<node CREATED="1353326926000" ID="ID_893" MODIFIED="1353326926000" TEXT="圱俶隠鋇釩哠復垥鶤敃绅嬬寅破慖嶽骓鏜钿迤峭覚垥抱">
+</node>
+<node CREATED="1353326979000" ID="ID_894" MODIFIED="1353326979000" TEXT="rabx trhhosei j metktbh">
+</node>
+<node CREATED="1353326991000" ID="ID_895" MODIFIED="1353326991000" TEXT="r cvxnuzkuv adszwqomoekv">
+</node>
+</node>
+<node CREATED="1353327043000" ID="ID_896" MODIFIED="1353327043000" TEXT="瑘痳盡蟔増晖岄鼊鸉崥赤恖圹排鑼脮敘埠卡簮饁抳硆緛">
+<node CREATED="1353327048000" ID="ID_897" MODIFIED="1353327048000" TEXT="mbwugm xwcb spmkaf  swfb">
+</node>
+<node CREATED="1353327061000" ID="ID_898" MODIFIED="1353327061000" TEXT="藩翎愱飳覆算簀闕騏搰歔毒偼蒢铆觞謜也修寽暊護弘胆">
+</node>
+<node CREATED="1353327073000" ID="ID_899" MODIFIED="1353327073000" TEXT="beed khvjqgxyqhoq erh">
+</node>
+<node CREATED="1353327116000" ID="ID_900" MODIFIED="1353327116000" TEXT="q ard psf lipkoawxz m jk">
+</node>
+<node CREATED="1353327176000" ID="ID_901" MODIFIED="1353327176000" TEXT="辨泖潃蟜諯钁胫欔窛帾偐敽徉砧幐楛萆亅艠艗鋗汔圶鼾">
+</node>
+<node CREATED="1353327231000" ID="ID_902" MODIFIED="1353327231000" TEXT="o fervbljdr  qnmtcuydlxg">
+</node>
+<node CREATED="1353327256000" ID="ID_903" MODIFIED="1353327256000" TEXT="zju bmblwlhc  vp  spbubj">
+</node>
+<node CREATED="1353327309000" ID="ID_904" MODIFIED="1353327309000" TEXT="hgcw  iuwy fmctlbgf m cz">
+</node>
+<node CREATED="1353327311000" ID="ID_905" MODIFIED="1353327311000" TEXT="m hnoa c   lcec kzxtabhd">
+</node>
+<node CREATED="1353327345000" ID="ID_906" MODIFIED="1353327345000" TEXT="zg ptlnqa ee edf fgkmvpy">
+</node>
+<node CREATED="1353327402000" ID="ID_907" MODIFIED="1353327402000" TEXT="jxwl i azikomeqhp sfeub">
+</node>
+<node CREATED="1353327462000" ID="ID_908" MODIFIED="1353327462000" TEXT="bxltq uefkbi rfkqb s kbu">
+</node>
+<node CREATED="1353327509000" ID="ID_909" MODIFIED="1353327509000" TEXT="lagkelykekxuu wq  vvqha">
+</node>
+<node CREATED="1353327556000" ID="ID_910" MODIFIED="1353327556000" TEXT="vgnakvk  orart r c gvy j">
+</node>
+<node CREATED="1353327606000" ID="ID_911" MODIFIED="1353327606000" TEXT="lkmekcjf hjub h aorgvc a">
+</node>
+<node CREATED="1353327648000" ID="ID_912" MODIFIED="1353327648000" TEXT="研賜帉塠薑弐篡糐颤僘姶禟銔旡覮磬疓擠槧馯儃祾辺左">
+</node>
+<node CREATED="1353327699000" ID="ID_913" MODIFIED="1353327699000" TEXT="s ebeb rkyhagzjojjwf rqz">
+</node>
+<node CREATED="1353327711000" ID="ID_914" MODIFIED="1353327711000" TEXT="sv ze vdgrt vylzan xcxqh">
+</node>
+<node CREATED="1353327769000" ID="ID_915" MODIFIED="1353327769000" TEXT="啙嗸执橨哸溛鹈琫瑕刢婣黠囍謦繼情睝醆菹厀廏劅攊缯">
+</node>
+<node CREATED="1353327803000" ID="ID_916" MODIFIED="1353327803000" TEXT="癷黆希炇魬剦擯餃蘾隝趱嵀潝伓藕髃衠咢財鱑淔搏韛欂">
+</node>
+<node CREATED="1353327852000" ID="ID_917" MODIFIED="1353327852000" TEXT="k rc  has o n zmzzblhgyi">
+</node>
+<node CREATED="1353327904000" ID="ID_918" MODIFIED="1353327904000" TEXT="矘鯹鶞服蚇氥剫薫匧塴菧路媼苆太憙杩儕説啪瓔頀菅飫">
+</node>
+<node CREATED="1353327931000" ID="ID_919" MODIFIED="1353327931000" TEXT="讔軡舝弒筹畦箌闭鎘鵆澣薰粅処赝栶税濈絈攻输軾痬朊">
+</node>
+<node CREATED="1353327933000" ID="ID_920" MODIFIED="1353327933000" TEXT="bb bnoewexnopfb q wcmuzv">
+</node>
+<node CREATED="1353327985000" ID="ID_921" MODIFIED="1353327985000" TEXT="ekt w m ewehuxdzrzu  enn">
+</node>
+<node CREATED="1353328006000" ID="ID_922" MODIFIED="1353328006000" TEXT="vv tlt hipetoslmkg bg em">
+</node>
+<node CREATED="1353328021000" ID="ID_923" MODIFIED="1353328021000" TEXT="鶪稗幐茫韞驣炗樞魄杳栄喛唄鶜碱騰檩卆砿搵嶅臽铎滮">
+</node>
+<node CREATED="1353328077000" ID="ID_924" MODIFIED="1353328077000" TEXT="rb wc jfnc  vg wmf at  x">
+</node>
+<node CREATED="1353328121000" ID="ID_925" MODIFIED="1353328121000" TEXT="qrzxoyjdr cct  wnv hsgnp">
+</node>
+<node CREATED="1353328125000" ID="ID_926" MODIFIED="1353328125000" TEXT="媮螩懄吱姒砷肧驹楈艣沚鯴靾橅瀲秃嘓鱈掅贘潈颸濔厚">
+</node>
+<node CREATED="1353328129000" ID="ID_927" MODIFIED="1353328129000" TEXT="桙婒居凵嘫緯摛疊港郁悻哚鍦鞍藀弽齩慴阌逻覅垈畓媕">
+</node>
+<node CREATED="1353328155000" ID="ID_928" MODIFIED="1353328155000" TEXT="cmdodxdfdiigi ulisee  im">
+</node>
+<node CREATED="1353328183000" ID="ID_929" MODIFIED="1353328183000" TEXT="nvcmggpoc iymqygst z fxn">
+</node>
+<node CREATED="1353328193000" ID="ID_930" MODIFIED="1353328193000" TEXT="gc grtnfdcchdtgg rt johi">
+</node>
+<node CREATED="1353328217000" ID="ID_931" MODIFIED="1353328217000" TEXT="珇楸湨黆鰜韉瘀庮拨觘鶵驷盖擮鰦鋨恼璋怇誾罎綄俱柪">
+</node>
+<node CREATED="1353328237000" ID="ID_932" MODIFIED="1353328237000" TEXT="dduky   zq dimb m  j vbb">
+</node>
+<node CREATED="1353328245000" ID="ID_933" MODIFIED="1353328245000" TEXT="胑簚搚觱蛇驘覍勡谮讑蒈荶茖鲴業楴讱蝱鸉籤蠞消阴唚">
+</node>
+<node CREATED="1353328287000" ID="ID_934" MODIFIED="1353328287000" TEXT="sfmghhkowlmccqp  guqhdas">
+</node>
+<node CREATED="1353328304000" ID="ID_935" MODIFIED="1353328304000" TEXT="n xsdazzgiskvdnorj rb">
+</node>
+<node CREATED="1353328341000" ID="ID_936" MODIFIED="1353328341000" TEXT="cc rsy ropesxoadxih kcr">
+</node>
+</node>
+<node CREATED="1353328342000" ID="ID_937" MODIFIED="1353328342000" TEXT="aii vta yvfkzx xduro eji">
+<node CREATED="1353328400000" ID="ID_938" MODIFIED="1353328400000" TEXT="hqjldehmeioi lhwocsh jk">
+</node>
+<node CREATED="1353328414000" ID="ID_939" MODIFIED="1353328414000" TEXT="皺鴭偋稊晕詧茿靴琩毗浟钚鏊乽踖栵嶖餹琷睙柹镇瑩諠">
+</node>
+<node CREATED="1353328460000" ID="ID_940" MODIFIED="1353328460000" TEXT="fsmmukt uxwbr xuklasy">
+</node>
+<node CREATED="1353328497000" ID="ID_941" MODIFIED="1353328497000" TEXT="喽搸為泏樅現眾聵睊珋瑀叺藒菭蜁踯縐蝙磘贶薠耙苣稠">
+</node>
+<node CREATED="1353328532000" ID="ID_942" MODIFIED="1353328532000" TEXT="ubsfjlcqk pdfqyp ug e  n">
+</node>
+<node CREATED="1353328535000" ID="ID_943" MODIFIED="1353328535000" TEXT="齇俺芓烏枍栆鵾遻蒷訟輜拊侳拈珴魷剗蝙壮圿鞳鱈畽盅">
+</node>
+<node CREATED="1353328568000" ID="ID_944" MODIFIED="1353328568000" TEXT="mbu vlkyxfnpexp uhpwtta">
+</node>
+<node CREATED="1353328571000" ID="ID_945" MODIFIED="1353328571000" TEXT="靓牀擽莪喎秆綀槩炶該遑萩敃語嶥蒝瓵瞹莮訍硘穆玟睴">
+</node>
+<node CREATED="1353328627000" ID="ID_946" MODIFIED="1353328627000" TEXT="ykkmykmxj xpavu  x    r">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353328641000" ID="ID_947" MODIFIED="1353328641000" TEXT="ufxqrb  azsyrxipvktjyenj">
+</node>
+<node CREATED="1353328686000" ID="ID_948" MODIFIED="1353328686000" TEXT="b e kjuuiuvy cvmjc ub yr">
+</node>
+<node CREATED="1353328736000" ID="ID_949" MODIFIED="1353328736000" TEXT="怦潲橯擯蠑翵翤嵢謃噣脵墻赥蘸儩沱坵嗏猷挚抺鏀賁腎">
+</node>
+<node CREATED="1353328751000" ID="ID_950" MODIFIED="1353328751000" TEXT="d  zcxbzrcukwcbechjacqk">
+</node>
+<node CREATED="1353328802000" ID="ID_951" MODIFIED="1353328802000" TEXT="d hhha gsytvgahyhi wbaiu">
+</node>
+<node CREATED="1353328835000" ID="ID_952" MODIFIED="1353328835000" TEXT="dnljcelmvqoqaamu obmhlfe">
+</node>
+<node CREATED="1353328851000" ID="ID_953" MODIFIED="1353328851000" TEXT="ljfsevej cskm rgnmv i av">
+</node>
+<node CREATED="1353328893000" ID="ID_954" MODIFIED="1353328893000" TEXT="zu uymolyyqrlkdieej sk">
+</node>
+<node CREATED="1353328915000" ID="ID_955" MODIFIED="1353328915000" TEXT="訵鼺粽顨斔伶嫆琰配蕱面审謪蓍笼钡齀嵻禧穋曚挳羱悃">
+</node>
+<node CREATED="1353328923000" ID="ID_956" MODIFIED="1353328923000" TEXT="ngv  pqbr hc msc e e  u">
+</node>
+<node CREATED="1353328961000" ID="ID_957" MODIFIED="1353328961000" TEXT="pyfq lkpsrqjhvaazgkhpkqv">
+</node>
+<node CREATED="1353328992000" ID="ID_958" MODIFIED="1353328992000" TEXT="i whqmxu ggsg bmpx tqa">
+</node>
+<node CREATED="1353329035000" ID="ID_959" MODIFIED="1353329035000" TEXT="睙脨餈孡蒶唢嚖琻嘰屌锹拕稣喵厺镦傟誡伽诠詞真極曦">
+</node>
+<node CREATED="1353329041000" ID="ID_960" MODIFIED="1353329041000" TEXT="狉耽弅絋痂鞷欛屁婼霌捎裶皤隫乂谐詵踤鳸璤蕋誷瀄医">
+</node>
+<node CREATED="1353329049000" ID="ID_961" MODIFIED="1353329049000" TEXT="sbr fhi jm fykfnlbtts le">
+</node>
+<node CREATED="1353329085000" ID="ID_962" MODIFIED="1353329085000" TEXT="kjagudxjponnt  mqm ryrqo">
+</node>
+<node CREATED="1353329118000" ID="ID_963" MODIFIED="1353329118000" TEXT="堗镩磇栿干鞱毕超憀秇鯪漑憅蔗偁倵雄旜搾艓嫊爉泓鯨">
+</node>
+<node CREATED="1353329156000" ID="ID_964" MODIFIED="1353329156000" TEXT="鶿逕恖跮矿牺裤躠玂弃磹晶干夷匙詛獓胾嫹喷玙戍嬠迈">
+</node>
+<node CREATED="1353329201000" ID="ID_965" MODIFIED="1353329201000" TEXT="cf thlsrhpurc nubovlop f">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353329202000" ID="ID_966" MODIFIED="1353329202000" TEXT="nsgo jrczfuwxsfavjlgpvrs">
+</node>
+<node CREATED="1353329238000" ID="ID_967" MODIFIED="1353329238000" TEXT="萼槪屽療蠃呫讒粑怣濏鬬曹鋒瘋亵睴藫穄檉聣犪皊阗堄">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353329285000" ID="ID_968" MODIFIED="1353329285000" TEXT="垾穧窸暵滖繳烡粌淪柉剽鑂瀅鱦缁炸馦踲旹穇穆謯呼匘">
+</node>
+<node CREATED="1353329289000" ID="ID_969" MODIFIED="1353329289000" TEXT="x  wjis p zggd fmdeaeqcq">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353329312000" ID="ID_970" MODIFIED="1353329312000" TEXT="mwbgu qzmv  o lcin ldsdh">
+</node>
+<node CREATED="1353329364000" ID="ID_971" MODIFIED="1353329364000" TEXT="gbbtn  ekuoory  a qecvec">
+</node>
+<node CREATED="1353329415000" ID="ID_972" MODIFIED="1353329415000" TEXT="wofkeit zcer c qub xzvz">
+</node>
+<node CREATED="1353329441000" ID="ID_973" MODIFIED="1353329441000" TEXT="g  nzoebn pwsvjwpgqng l">
+</node>
+<node CREATED="1353329456000" ID="ID_974" MODIFIED="1353329456000" TEXT="kb b gxfqm oau  bullh">
+</node>
+<node CREATED="1353329497000" ID="ID_975" MODIFIED="1353329497000" TEXT="iitgcv njdolvoc uul eseb">
+</node>
+<node CREATED="1353329516000" ID="ID_976" MODIFIED="1353329516000" TEXT="玜寙塯魼鳮鴿閁豄誧挿翄腶笏释菚屯萜濓岝耡呴碐謄獫">
+</node>
+<node CREATED="1353329573000" ID="ID_977" MODIFIED="1353329573000" TEXT="tuo e euyc ho hg jbinhqb">
+</node>
+</node>
+<node CREATED="1353329623000" ID="ID_978" MODIFIED="1353329623000" TEXT="oyqfosd olfdolrbnvpnfbuv">
+<node CREATED="1353329658000" ID="ID_979" MODIFIED="1353329658000" TEXT="whyr tzhx c u qbzbbxxkpy">
+</node>
+<node CREATED="1353329669000" ID="ID_980" MODIFIED="1353329669000" TEXT="gxln  dsg z nzi jhenccjy">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353329702000" ID="ID_981" MODIFIED="1353329702000" TEXT="v mol m dik dcng rmmjogv">
+</node>
+<node CREATED="1353329714000" ID="ID_982" MODIFIED="1353329714000" TEXT="ahovzdufoef juenepueefj">
+</node>
+<node CREATED="1353329766000" ID="ID_983" MODIFIED="1353329766000" TEXT="斻诛箢芘培媣濛馼塘憡創懿轞疞鉸嘠槵戣吅秕佯裁鞍昡">
+</node>
+<node CREATED="1353329783000" ID="ID_984" MODIFIED="1353329783000" TEXT="cxkn erz kn hoovy d vxaf">
+</node>
+<node CREATED="1353329821000" ID="ID_985" MODIFIED="1353329821000" TEXT="徶愯朻披脼頦熨圬曙通伌踦単皍萺璯燨釽绨髛氇蝵峽爇">
+</node>
+<node CREATED="1353329854000" ID="ID_986" MODIFIED="1353329854000" TEXT="degg bic nji udqzkjatana">
+</node>
+<node CREATED="1353329890000" ID="ID_987" MODIFIED="1353329890000" TEXT="nx mpxebjuw vqigo jjl py">
+</node>
+<node CREATED="1353329946000" ID="ID_988" MODIFIED="1353329946000" TEXT="lymqc gyxi m  mgxpbc uyo">
+</node>
+<node CREATED="1353329951000" ID="ID_989" MODIFIED="1353329951000" TEXT="zhx  tuwumj rtaass w  qd">
+</node>
+<node CREATED="1353329966000" ID="ID_990" MODIFIED="1353329966000" TEXT="b w   majoqiubvxctmhojsp">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353330022000" ID="ID_991" MODIFIED="1353330022000" TEXT="vjawvitfd y ev  l jihi">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353330067000" ID="ID_992" MODIFIED="1353330067000" TEXT="疁齚嵾驲奃焐鞹涑四牗阃貊惴侣恇镕牭喺葤鯽癚纘聸窽">
+</node>
+<node CREATED="1353330087000" ID="ID_993" MODIFIED="1353330087000" TEXT="r numlpzknuelysu uzlerub">
+</node>
+<node CREATED="1353330115000" ID="ID_994" MODIFIED="1353330115000" TEXT="kzlosmt fze cxnweiyzdlw">
+</node>
+<node CREATED="1353330151000" ID="ID_995" MODIFIED="1353330151000" TEXT="nemfj wrog kkulunorq b c">
+</node>
+<node CREATED="1353330194000" ID="ID_996" MODIFIED="1353330194000" TEXT="香肂渕壄媻擂铴旓欐絶诹蠤兇墍端蜈歩蓝瘢浃踳顫恖漏">
+</node>
+<node CREATED="1353330253000" ID="ID_997" MODIFIED="1353330253000" TEXT="lrzepo qec x ixia vnpgx">
+</node>
+<node CREATED="1353330259000" ID="ID_998" MODIFIED="1353330259000" TEXT="qdwrhuwn rk rkwos xtracd">
+</node>
+<node CREATED="1353330291000" ID="ID_999" MODIFIED="1353330291000" TEXT="nbxxpoelmwoql lirlsldmdx">
+</node>
+<node CREATED="1353330305000" ID="ID_1000" MODIFIED="1353330305000" TEXT="jnkjun h i xrtqddccipydc">
+</node>
+<node CREATED="1353330323000" ID="ID_1001" MODIFIED="1353330323000" TEXT="tjvl koyseyyrfxezsy pdb">
+</node>
+<node CREATED="1353330378000" ID="ID_1002" MODIFIED="1353330378000" TEXT="筟壭踣裘膍潅乐埯蓃欻坉洩瀪喅謟錂詅嬟麨弴磆娞毱埦">
+</node>
+<node CREATED="1353330405000" ID="ID_1003" MODIFIED="1353330405000" TEXT="珉塐紒甡闫襾飓鴺袩珩璫饠榦稢苇盋鮿裿嫔躠謣埆仏箆">
+</node>
+<node CREATED="1353330460000" ID="ID_1004" MODIFIED="1353330460000" TEXT="fjjzydnv  dgeuybzhlhsmrg">
+</node>
+<node CREATED="1353330481000" ID="ID_1005" MODIFIED="1353330481000" TEXT="懭錰椆潢狝廳蓊畯嬝锓緾扼藄墸疩飣綎妽飼瘾羊鴂欟壄">
+</node>
+<node CREATED="1353330513000" ID="ID_1006" MODIFIED="1353330513000" TEXT="han oywlgarkhkuvs ezt">
+</node>
+<node CREATED="1353330541000" ID="ID_1007" MODIFIED="1353330541000" TEXT="nt uoaed xumppm udvhpmdi">
+</node>
+<node CREATED="1353330569000" ID="ID_1008" MODIFIED="1353330569000" TEXT="mffnvjypdtsdlcqjskfhr  a">
+</node>
+<node CREATED="1353330594000" ID="ID_1009" MODIFIED="1353330594000" TEXT="醔澀韚茘鴌咭欺獓栘頜貰縑餓篑笥拢篖翃廬熺辱軺鲢饦">
+</node>
+<node CREATED="1353330618000" ID="ID_1010" MODIFIED="1353330618000" TEXT="槁泬飅墦峲营奏姝耸歌饊艉嘢矌皃闻鰍櫯覇檔訅翂砀鷝">
+</node>
+<node CREATED="1353330655000" ID="ID_1011" MODIFIED="1353330655000" TEXT="eh  nddwbiivqswdduzdhehb">
+</node>
+<node CREATED="1353330663000" ID="ID_1012" MODIFIED="1353330663000" TEXT="y c bjxkr lplaggj xohyhu">
+</node>
+<node CREATED="1353330710000" ID="ID_1013" MODIFIED="1353330710000" TEXT="iv yl ihpffas  gzhjz ylp">
+</node>
+<node CREATED="1353330734000" ID="ID_1014" MODIFIED="1353330734000" TEXT="b pln wj o gc  isxx jiv">
+</node>
+<node CREATED="1353330773000" ID="ID_1015" MODIFIED="1353330773000" TEXT="dbccinbbectzhazat kadke">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353330814000" ID="ID_1016" MODIFIED="1353330814000" TEXT="vkfwbxo o br qo ijsrrjij">
+</node>
+<node CREATED="1353330852000" ID="ID_1017" MODIFIED="1353330852000" TEXT="emf wcvl qaclneq   ibheh">
+</node>
+<node CREATED="1353330906000" ID="ID_1018" MODIFIED="1353330906000" TEXT="jdd kxlvvwwv    kizqmghj">
+</node>
+</node>
+<node CREATED="1353330963000" ID="ID_1019" MODIFIED="1353330963000" TEXT="bufncqbqezvkuw kqepfnb">
+<node CREATED="1353330999000" ID="ID_1020" MODIFIED="1353330999000" TEXT="v    y toyqwdkzppchwf d">
+</node>
+<node CREATED="1353331050000" ID="ID_1021" MODIFIED="1353331050000" TEXT="脓没戾玏謿蒮喼熙薳围湠瞃炼縬倡袮甋谿銑矣抩渆芟伓">
+</node>
+<node CREATED="1353331107000" ID="ID_1022" MODIFIED="1353331107000" TEXT="xbbd kpz worxrzx xuax mp">
+</node>
+<node CREATED="1353331124000" ID="ID_1023" MODIFIED="1353331124000" TEXT="kjo y q kaowuynhgzhrq  w">
+</node>
+<node CREATED="1353331173000" ID="ID_1024" MODIFIED="1353331173000" TEXT="btfqjtfbnbmyiutboxlfbkmg">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353331202000" ID="ID_1025" MODIFIED="1353331202000" TEXT="cw nkehysqadjoijm lqgg">
+</node>
+<node CREATED="1353331226000" ID="ID_1026" MODIFIED="1353331226000" TEXT="rbamsrju qtgaqtytwy  tkq">
+</node>
+<node CREATED="1353331283000" ID="ID_1027" MODIFIED="1353331283000" TEXT="眚砠誃鱰烠甀厚肪隍景磝蝒经崌酡椵鑟给镌塘挃莂痗媙">
+</node>
+<node CREATED="1353331314000" ID="ID_1028" MODIFIED="1353331314000" TEXT="ojsqs zbqu ugvmtzkpv qhs">
+</node>
+<node CREATED="1353331374000" ID="ID_1029" MODIFIED="1353331374000" TEXT="z v ghbbcymljltxvgm lfho">
+</node>
+<node CREATED="1353331400000" ID="ID_1030" MODIFIED="1353331400000" TEXT="ksdp jsmtbmiexfd flqyorp">
+</node>
+<node CREATED="1353331415000" ID="ID_1031" MODIFIED="1353331415000" TEXT="ue fpjas chysiggsl lfai">
+</node>
+<node CREATED="1353331420000" ID="ID_1032" MODIFIED="1353331420000" TEXT="骇敉澆剥琅蔪蔣弊蛡畋礿咵耲羊恠誚晪焲灊鏵馔淺鵨礄">
+</node>
+<node CREATED="1353331445000" ID="ID_1033" MODIFIED="1353331445000" TEXT="m  x w u qesodsgfjwcbdv">
+</node>
+<node CREATED="1353331472000" ID="ID_1034" MODIFIED="1353331472000" TEXT="jmlyu ct hccvdjweqeglwtc">
+</node>
+<node CREATED="1353331514000" ID="ID_1035" MODIFIED="1353331514000" TEXT="ux aerltqf  gfeu  lcz ee">
+</node>
+<node CREATED="1353331570000" ID="ID_1036" MODIFIED="1353331570000" TEXT="hztk   zceq fygfrlipfri">
+</node>
+<node CREATED="1353331589000" ID="ID_1037" MODIFIED="1353331589000" TEXT="kq e lo r ax ggsqog jjlq">
+</node>
+<node CREATED="1353331621000" ID="ID_1038" MODIFIED="1353331621000" TEXT="lyuh jynhmj k yy eyvh s">
+<icon BUILTIN="full-1"/>
+</node>
+<node CREATED="1353331664000" ID="ID_1039" MODIFIED="1353331664000" TEXT="lgoesuka lzxvqjwxybirf">
+</node>
+<node CREATED="1353331681000" ID="ID_1040" MODIFIED="1353331681000" TEXT="dvf pt vhwib  jfxd e xku">
+</node>
+<node CREATED="1353331710000" ID="ID_1041" MODIFIED="1353331710000" TEXT="胱萙杤孑游阩婞窛祬甏譑绝喐峱鶻痚贋阍顐纉鶚樵輷纾">
+</node>
+<node CREATED="1353331746000" ID="ID_1042" MODIFIED="1353331746000" TEXT="r fwsa ozs zewdufrunb p">
+<icon BUILTIN="full-1"/>
+</node>
+<node CREATED="1353331806000" ID="ID_1043" MODIFIED="1353331806000" TEXT="ltqri tstyptzzg bklxwis">
+</node>
+<node CREATED="1353331811000" ID="ID_1044" MODIFIED="1353331811000" TEXT="lr  axpiuv elqzeowabjxks">
+</node>
+<node CREATED="1353331820000" ID="ID_1045" MODIFIED="1353331820000" TEXT="gx  oe xbqkhquxttz  vg q">
+</node>
+<node CREATED="1353331869000" ID="ID_1046" MODIFIED="1353331869000" TEXT="tmbk ny h vo bxsdl smcd">
+</node>
+<node CREATED="1353331911000" ID="ID_1047" MODIFIED="1353331911000" TEXT="ms yjyek mawruxd cy fg a">
+</node>
+<node CREATED="1353331921000" ID="ID_1048" MODIFIED="1353331921000" TEXT="lnmbkdwwvjnaw tsrrizslue">
+</node>
+<node CREATED="1353331955000" ID="ID_1049" MODIFIED="1353331955000" TEXT="eysqkcb ntsd jefsrwpqfi">
+</node>
+<node CREATED="1353332002000" ID="ID_1050" MODIFIED="1353332002000" TEXT="gofo rgbjpgmpvssiwvsgsyr">
+</node>
+<node CREATED="1353332041000" ID="ID_1051" MODIFIED="1353332041000" TEXT="lsbomkbwexboffmxio dxiy">
+<icon BUILTIN="full-1"/>
+</node>
+<node CREATED="1353332042000" ID="ID_1052" MODIFIED="1353332042000" TEXT="詷楴奼轍焴緯鋲梠棱樷钐镓熲偀鸰鞵膸蛺蕊証鮰癮捼饪">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353332074000" ID="ID_1053" MODIFIED="1353332074000" TEXT="孅郔迎膀鋄咧斘琇監暘胶紩繝與徧镹兢房妓怰腺孝噼洘">
+</node>
+<node CREATED="1353332108000" ID="ID_1054" MODIFIED="1353332108000" TEXT="zenwrjqlrzcl vtb  cptunu">
+</node>
+<node CREATED="1353332118000" ID="ID_1055" MODIFIED="1353332118000" TEXT="qj u ffty hcb aa haj r">
+</node>
+<node CREATED="1353332173000" ID="ID_1056" MODIFIED="1353332173000" TEXT="qkv seqgq kihn tk pdbtb">
+</node>
+<node CREATED="1353332214000" ID="ID_1057" MODIFIED="1353332214000" TEXT="萧讃芉黿衒鳀鏁紉沣鲓骟砣浄犦杼拖遪袚饔栃蠤繁擐琂">
+</node>
+<node CREATED="1353332221000" ID="ID_1058" MODIFIED="1353332221000" TEXT="qm url lbvitr h v vhqzm">
+</node>
+<node CREATED="1353332267000" ID="ID_1059" MODIFIED="1353332267000" TEXT="n vqwz sgxpqjr wsokgjpzu">
+</node>
+</node>
+<node CREATED="1353332275000" ID="ID_1060" MODIFIED="1353332275000" TEXT="mga gvpguldej f ym uv n">
+<node CREATED="1353332327000" ID="ID_1061" MODIFIED="1353332327000" TEXT="角灕樳鬊漦誑螘夁窧喣枭荍旐匄沸嬜柘腆阳鸾敃古筪妝">
+</node>
+<node CREATED="1353332353000" ID="ID_1062" MODIFIED="1353332353000" TEXT="饻璊踩偛鬫鲑敁嶠骸鮹珟攵替蒣渝痮棦鱥垑嶋蔻鵋枿竿">
+</node>
+<node CREATED="1353332400000" ID="ID_1063" MODIFIED="1353332400000" TEXT="a njaplvzsqbv cktsxvquc">
+</node>
+<node CREATED="1353332401000" ID="ID_1064" MODIFIED="1353332401000" TEXT="鴥蘐荚攭勗饏梫識瘍甘嗲腕汒璗奌牼黑沃齷鶂隝鮣寑黕">
+</node>
+<node CREATED="1353332449000" ID="ID_1065" MODIFIED="1353332449000" TEXT="dvpqeuwm leaehbi fqp xho">
+</node>
+<node CREATED="1353332462000" ID="ID_1066" MODIFIED="1353332462000" TEXT="秤酏紺痣喈赵覟鈦舿蜪嬩邗繫粼薚濲騕驅焀嗂錂扴蝐悃">
+</node>
+<node CREATED="1353332496000" ID="ID_1067" MODIFIED="1353332496000" TEXT="cfbmfq  t mpdurnje gnvsq">
+</node>
+<node CREATED="1353332543000" ID="ID_1068" MODIFIED="1353332543000" TEXT="xozrbb icgpailpp jiowup">
+</node>
+<node CREATED="1353332573000" ID="ID_1069" MODIFIED="1353332573000" TEXT="摄钀花狯訌熕鶢晩孞宂馼騽裉霧蚾磄櫩栊酔醬痑詡廎珅">
+</node>
+<node CREATED="1353332603000" ID="ID_1070" MODIFIED="1353332603000" TEXT="籥秠崳缺媎砿虡嘵笛沺蠚师嶏靽溏眐髖戎鰷垃惥楶箾棭">
+</node>
+<node CREATED="1353332622000" ID="ID_1071" MODIFIED="1353332622000" TEXT="紛悪瑪鐸瞲笉轓坘癐魢线木贐秅惛诨芙蜑籿嘻理墸渮楬">
+</node>
+<node CREATED="1353332679000" ID="ID_1072" MODIFIED="1353332679000" TEXT="髷够汦鹎淕馰耄乑笍灱嬑菞鸲肞熶華繚緻合耧秌陁胕眪">
+</node>
+<node CREATED="1353332702000" ID="ID_1073" MODIFIED="1353332702000" TEXT="oxu pv riai mjzihsullhny">
+</node>
+<node CREATED="1353332752000" ID="ID_1074" MODIFIED="1353332752000" TEXT="f is klj k  poqwmvhwi p">
+</node>
+<node CREATED="1353332771000" ID="ID_1075" MODIFIED="1353332771000" TEXT="jhnfouwlvo ga  giq lubmr">
+</node>
+<node CREATED="1353332792000" ID="ID_1076" MODIFIED="1353332792000" TEXT="nafkp urnlw ds fpyerilax">
+</node>
+<node CREATED="1353332813000" ID="ID_1077" MODIFIED="1353332813000" TEXT="kg f qy tqldwmerbc c kqw">
+</node>
+<node CREATED="1353332861000" ID="ID_1078" MODIFIED="1353332861000" TEXT="axnoriy g wlqcm qjk  au">
+</node>
+<node CREATED="1353332869000" ID="ID_1079" MODIFIED="1353332869000" TEXT="risthjui mv ol cyugrw tt">
+</node>
+<node CREATED="1353332876000" ID="ID_1080" MODIFIED="1353332876000" TEXT="甾甹埧箘湘搶鸣呭灟簍躉銳唿幤紵節瀬唹窱躛偗嚣挅鞎">
+</node>
+<node CREATED="1353332886000" ID="ID_1081" MODIFIED="1353332886000" TEXT="ea cmuwxhrx xik sgnwdhkq">
+</node>
+<node CREATED="1353332898000" ID="ID_1082" MODIFIED="1353332898000" TEXT="bqz qfvznuy  lcb d aye y">
+</node>
+<node CREATED="1353332934000" ID="ID_1083" MODIFIED="1353332934000" TEXT="m mxcx w lt bae tzxakosy">
+</node>
+<node CREATED="1353332992000" ID="ID_1084" MODIFIED="1353332992000" TEXT="牆厬溄陇頣沎搕刾鱋秙豇寫頪魼葁鼒遻貭俴巔泧镻鏲戡">
+</node>
+<node CREATED="1353333046000" ID="ID_1085" MODIFIED="1353333046000" TEXT="qqhcuwicvq gxgvdlcpkp no">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353333078000" ID="ID_1086" MODIFIED="1353333078000" TEXT="kfdbsghtwiltxe pxcdok mv">
+</node>
+<node CREATED="1353333129000" ID="ID_1087" MODIFIED="1353333129000" TEXT="lzr ahcwaigy yzvhprtbx g">
+</node>
+<node CREATED="1353333165000" ID="ID_1088" MODIFIED="1353333165000" TEXT="艰嗓烂碴籠劜蒄謶騏鎾咭梖詿辶哓疕蟶鬌爖夵飊滓岃鲾">
+</node>
+<node CREATED="1353333185000" ID="ID_1089" MODIFIED="1353333185000" TEXT="xovg tgp cpq bpvgrlcoocb">
+</node>
+<node CREATED="1353333233000" ID="ID_1090" MODIFIED="1353333233000" TEXT="堀會笴癘媺畀錥邠鱞瓋豼忢涐拤馅钐謆鶻垅症迌髎積米">
+</node>
+<node CREATED="1353333257000" ID="ID_1091" MODIFIED="1353333257000" TEXT="ztabp sstkbf twewsfeicfl">
+</node>
+<node CREATED="1353333296000" ID="ID_1092" MODIFIED="1353333296000" TEXT="nymdwij s  ufjh gwncdn">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353333320000" ID="ID_1093" MODIFIED="1353333320000" TEXT="ubxzuwzr auoj udh aquq k">
+</node>
+<node CREATED="1353333349000" ID="ID_1094" MODIFIED="1353333349000" TEXT="lyykeeligrjpfx zhdvfiarh">
+</node>
+<node CREATED="1353333380000" ID="ID_1095" MODIFIED="1353333380000" TEXT="ygskhnvkylekndjc hmdmj i">
+</node>
+<node CREATED="1353333417000" ID="ID_1096" MODIFIED="1353333417000" TEXT="魖鍧葢閁宺綅搗捤殄頸覫獧譢報瘄殟溄匾魈沲入駦麰卟">
+</node>
+<node CREATED="1353333421000" ID="ID_1097" MODIFIED="1353333421000" TEXT="re mr z hmvkeqm f bt cfh">
+</node>
+<node CREATED="1353333437000" ID="ID_1098" MODIFIED="1353333437000" TEXT="tdvjmmjiehex xkgdvtb cai">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353333440000" ID="ID_1099" MODIFIED="1353333440000" TEXT="b jayguixe w um avnxqu z">
+</node>
+<node CREATED="1353333461000" ID="ID_1100" MODIFIED="1353333461000" TEXT="崌绻繊齚玡敎弫栏扗侧冏睞鶨聙剢繧燠恻鱴傂橇绲牯姯">
+</node>
+</node>
+<node CREATED="1353333492000" ID="ID_1101" MODIFIED="1353333492000" TEXT="賛癮姉魻耯霴琇菳嫅砿俇蒏婙多軽蓾凣爬謹奩熙鸔楂砉">
+<node CREATED="1353333522000" ID="ID_1102" MODIFIED="1353333522000" TEXT="r tqoru lztpymil lytcoh">
+</node>
+<node CREATED="1353333523000" ID="ID_1103" MODIFIED="1353333523000" TEXT="gyisfnmtoergxs jtjt s">
+</node>
+<node CREATED="1353333526000" ID="ID_1104" MODIFIED="1353333526000" TEXT="whvdmhwc vm qw yzovl iu">
+</node>
+<node CREATED="1353333530000" ID="ID_1105" MODIFIED="1353333530000" TEXT="czyk nhyrh ioiqldenqrde">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353333561000" ID="ID_1106" MODIFIED="1353333561000" TEXT="a oadczrfx ts moxgtae">
+</node>
+<node CREATED="1353333578000" ID="ID_1107" MODIFIED="1353333578000" TEXT="afak rhcggikicqwoeaxt t">
+</node>
+<node CREATED="1353333630000" ID="ID_1108" MODIFIED="1353333630000" TEXT="rc w zuyetbdoqqggvzemrvb">
+</node>
+<node CREATED="1353333667000" ID="ID_1109" MODIFIED="1353333667000" TEXT="x   g b babkwgsh yc scxc">
+</node>
+<node CREATED="1353333695000" ID="ID_1110" MODIFIED="1353333695000" TEXT="q hev cr tiwxzdqx av c k">
+</node>
+<node CREATED="1353333754000" ID="ID_1111" MODIFIED="1353333754000" TEXT="p objn eecjxv  oivxoyn r">
+</node>
+<node CREATED="1353333759000" ID="ID_1112" MODIFIED="1353333759000" TEXT="aolmt  flwk jfmlzm uczll">
+</node>
+<node CREATED="1353333796000" ID="ID_1113" MODIFIED="1353333796000" TEXT="gwlippfp ic ivm v scmdzj">
+</node>
+<node CREATED="1353333829000" ID="ID_1114" MODIFIED="1353333829000" TEXT="翁襹與鄔钸簊裒萕艶龡鈧煄演潈髬秺衏跎龍滌皤儰呯橞">
+</node>
+<node CREATED="1353333877000" ID="ID_1115" MODIFIED="1353333877000" TEXT="tmpnlrbzqgikswscnsaiupzu">
+</node>
+<node CREATED="1353333886000" ID="ID_1116" MODIFIED="1353333886000" TEXT="sh f   mtod clacy g spo">
+</node>
+<node CREATED="1353333904000" ID="ID_1117" MODIFIED="1353333904000" TEXT="iyagfb swssaelmczeezheb">
+</node>
+<node CREATED="1353333962000" ID="ID_1118" MODIFIED="1353333962000" TEXT="gnrfi h  sgcncaj sm gkto">
+</node>
+<node CREATED="1353333995000" ID="ID_1119" MODIFIED="1353333995000" TEXT="gjzpkgapkkttjcctaiezywz">
+</node>
+<node CREATED="1353334033000" ID="ID_1120" MODIFIED="1353334033000" TEXT="m tapjjsulinm akgkn  byv">
+</node>
+<node CREATED="1353334087000" ID="ID_1121" MODIFIED="1353334087000" TEXT="xtwh vlk s btn k cuj kc">
+</node>
+<node CREATED="1353334134000" ID="ID_1122" MODIFIED="1353334134000" TEXT="rkev c zujkrtkjs hwkravy">
+</node>
+<node CREATED="1353334165000" ID="ID_1123" MODIFIED="1353334165000" TEXT="赅殲閛璐靊厍糙緲湵樆洄挲鐎伃錧錗琖阒轶棭艣笳揍穌">
+</node>
+<node CREATED="1353334199000" ID="ID_1124" MODIFIED="1353334199000" TEXT="de fk lzpriyxpfu uiw ycy">
+</node>
+<node CREATED="1353334235000" ID="ID_1125" MODIFIED="1353334235000" TEXT="vxwimmdogw  ejmoj iqy w">
+</node>
+<node CREATED="1353334267000" ID="ID_1126" MODIFIED="1353334267000" TEXT="ws yo dfkaw feiuwgdpmetw">
+</node>
+<node CREATED="1353334292000" ID="ID_1127" MODIFIED="1353334292000" TEXT="浶簟鉏并谿笙榮骕飂韺遥豝箦罨昻箸鯥衐娊舤鯊敫膓坵">
+</node>
+<node CREATED="1353334307000" ID="ID_1128" MODIFIED="1353334307000" TEXT="sr   rtmmj iwqbajlyajdqx">
+</node>
+<node CREATED="1353334318000" ID="ID_1129" MODIFIED="1353334318000" TEXT="嬄铕啇滒蛮尟矆荆淯蟩鮋旑鑄葚竇氭釹涏尒象妇鋵獸榹">
+</node>
+<node CREATED="1353334362000" ID="ID_1130" MODIFIED="1353334362000" TEXT="lpmkk kgiehsiqiyrjphrebn">
+</node>
+<node CREATED="1353334366000" ID="ID_1131" MODIFIED="1353334366000" TEXT="m tuel jfnml ijerz lwvpc">
+</node>
+<node CREATED="1353334370000" ID="ID_1132" MODIFIED="1353334370000" TEXT="zkay hvfamduqhwnmmpo">
+</node>
+<node CREATED="1353334420000" ID="ID_1133" MODIFIED="1353334420000" TEXT="o tq  kxdazjxeivs u tzee">
+</node>
+<node CREATED="1353334427000" ID="ID_1134" MODIFIED="1353334427000" TEXT="韬豓仱嗄唭鮒莘実邜薽拺偗茅辆鋱憆巠糲鸟钕二逃饥鷏">
+</node>
+<node CREATED="1353334474000" ID="ID_1135" MODIFIED="1353334474000" TEXT="戕央濤绤峨梧檝雨麮犐瞦茮礽澿閗烄蘷觤磿烫趕荲邔頕">
+</node>
+<node CREATED="1353334522000" ID="ID_1136" MODIFIED="1353334522000" TEXT="b f dkwhj olz a ekdpsju">
+</node>
+<node CREATED="1353334581000" ID="ID_1137" MODIFIED="1353334581000" TEXT="wseazsl q btf iien pkabv">
+</node>
+<node CREATED="1353334619000" ID="ID_1138" MODIFIED="1353334619000" TEXT="yioqdjpbti bfaaotn f uts">
+</node>
+<node CREATED="1353334670000" ID="ID_1139" MODIFIED="1353334670000" TEXT="hx be  bzgcst wyadswvepo">
+</node>
+<node CREATED="1353334677000" ID="ID_1140" MODIFIED="1353334677000" TEXT="y ykotsracnk eah yq nxo">
+</node>
+<node CREATED="1353334694000" ID="ID_1141" MODIFIED="1353334694000" TEXT="hwn i aazmgfegmwfueh  cg">
+<icon BUILTIN="help"/>
+</node>
+</node>
+<node CREATED="1353334705000" ID="ID_1142" MODIFIED="1353334705000" TEXT="rpkofgivjgwzvlkqejspujft">
+<node CREATED="1353334737000" ID="ID_1143" MODIFIED="1353334737000" TEXT="f azrv ebv qcwiohgt  g u">
+</node>
+<node CREATED="1353334751000" ID="ID_1144" MODIFIED="1353334751000" TEXT="kdmr rppwx y pi uin  lgq">
+<icon BUILTIN="full-1"/>
+</node>
+<node CREATED="1353334767000" ID="ID_1145" MODIFIED="1353334767000" TEXT="竆襶薨蓗瑸吂壹漕憠岉砪試錚軔廂瞸矮嘵丄低犗馌販幋">
+</node>
+<node CREATED="1353334801000" ID="ID_1146" MODIFIED="1353334801000" TEXT="gp j e yqzvtto vjpvcdgnh">
+</node>
+<node CREATED="1353334808000" ID="ID_1147" MODIFIED="1353334808000" TEXT="xbdkcpvxugrpbrzkmzg v rr">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353334865000" ID="ID_1148" MODIFIED="1353334865000" TEXT="gg wxpzwwu  rb  l lu abf">
+</node>
+<node CREATED="1353334922000" ID="ID_1149" MODIFIED="1353334922000" TEXT="r  ojshd rjkgeajk goi bl">
+</node>
+<node CREATED="1353334975000" ID="ID_1150" MODIFIED="1353334975000" TEXT="paizbohqkubn ggr chwwcle">
+</node>
+<node CREATED="1353335031000" ID="ID_1151" MODIFIED="1353335031000" TEXT="fmncqt txuetb purbyva ql">
+</node>
+<node CREATED="1353335082000" ID="ID_1152" MODIFIED="1353335082000" TEXT="xcqcuc ze   eurcoinll  g">
+</node>
+<node CREATED="1353335135000" ID="ID_1153" MODIFIED="1353335135000" TEXT="tqoqg mwoihnp ivnkt jwym">
+</node>
+<node CREATED="1353335136000" ID="ID_1154" MODIFIED="1353335136000" TEXT="gkf e hreveoga ju r varc">
+</node>
+<node CREATED="1353335173000" ID="ID_1155" MODIFIED="1353335173000" TEXT="n grvbi ijikqtdfwj uz  e">
+</node>
+<node CREATED="1353335176000" ID="ID_1156" MODIFIED="1353335176000" TEXT="whhoonnd tcm bx mjfcbew">
+</node>
+<node CREATED="1353335205000" ID="ID_1157" MODIFIED="1353335205000" TEXT="jsgmzeh ycehn kacj m trk">
+</node>
+<node CREATED="1353335254000" ID="ID_1158" MODIFIED="1353335254000" TEXT="hjf vz npi f a ogte myvs">
+</node>
+<node CREATED="1353335275000" ID="ID_1159" MODIFIED="1353335275000" TEXT="h  baf ibnd sdzdqp fhi r">
+</node>
+<node CREATED="1353335295000" ID="ID_1160" MODIFIED="1353335295000" TEXT="o  eg ggknsoebmkwzs hvmc">
+</node>
+<node CREATED="1353335305000" ID="ID_1161" MODIFIED="1353335305000" TEXT="qmrxow oabc cvzkonp p j">
+</node>
+<node CREATED="1353335313000" ID="ID_1162" MODIFIED="1353335313000" TEXT="llcacaj avhyriecqle yozw">
+</node>
+<node CREATED="1353335316000" ID="ID_1163" MODIFIED="1353335316000" TEXT="o m bl f p d humfau nv">
+<icon BUILTIN="full-1"/>
+</node>
+<node CREATED="1353335345000" ID="ID_1164" MODIFIED="1353335345000" TEXT="atcqcuvob  kdy cfklotgzh">
+</node>
+<node CREATED="1353335353000" ID="ID_1165" MODIFIED="1353335353000" TEXT="x nufxkemwphpfl xau my">
+</node>
+<node CREATED="1353335391000" ID="ID_1166" MODIFIED="1353335391000" TEXT="xpysgyehd xjeezzmf nkzdx">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353335392000" ID="ID_1167" MODIFIED="1353335392000" TEXT="rqiynu  s  wdolms jarfaf">
+</node>
+<node CREATED="1353335408000" ID="ID_1168" MODIFIED="1353335408000" TEXT="nvni  zshct zk bkm xnqc">
+</node>
+<node CREATED="1353335437000" ID="ID_1169" MODIFIED="1353335437000" TEXT="xjqjzb suiqxls  xz b vwu">
+</node>
+<node CREATED="1353335493000" ID="ID_1170" MODIFIED="1353335493000" TEXT="mjufeao rh uskmhrukyaost">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353335528000" ID="ID_1171" MODIFIED="1353335528000" TEXT="鱋檧轹丙茢茲齌虙噑蟄泒佐絢胕幺阣赹圽慢竭极艙嵈穨">
+</node>
+<node CREATED="1353335541000" ID="ID_1172" MODIFIED="1353335541000" TEXT="瓁螻斲麪鍟斷鏻菸璵溄譌缃鬙嚈拏鰈毖佌耸鸙啊挞睈滒">
+</node>
+<node CREATED="1353335543000" ID="ID_1173" MODIFIED="1353335543000" TEXT="bthsq k cazjx txgcy n uq">
+</node>
+<node CREATED="1353335597000" ID="ID_1174" MODIFIED="1353335597000" TEXT="rekvg  ibqvmjhomhuranw">
+</node>
+<node CREATED="1353335646000" ID="ID_1175" MODIFIED="1353335646000" TEXT="躃醹懅箖羰墟概臇毵弤跬噞銙寚墌暤栖钏団民茱沋罸騻">
+</node>
+<node CREATED="1353335671000" ID="ID_1176" MODIFIED="1353335671000" TEXT="xcujbl igzwfyi a uppnf m">
+</node>
+<node CREATED="1353335705000" ID="ID_1177" MODIFIED="1353335705000" TEXT="slnsoahx  pesq bxk xk ik">
+</node>
+<node CREATED="1353335745000" ID="ID_1178" MODIFIED="1353335745000" TEXT="h ldjfkqw pfwvlq rlhddoo">
+</node>
+<node CREATED="1353335801000" ID="ID_1179" MODIFIED="1353335801000" TEXT="筂鵠劚冠嬀嵄眰崸铬歉啪霴蔘鬧糁釽缆砐弈甫廵廸矧鉐">
+</node>
+<node CREATED="1353335810000" ID="ID_1180" MODIFIED="1353335810000" TEXT="oekkdxwhtt arbvukw    p">
+</node>
+<node CREATED="1353335858000" ID="ID_1181" MODIFIED="1353335858000" TEXT="s ydx paep bstp w  dmncw">
+</node>
+<node CREATED="1353335913000" ID="ID_1182" MODIFIED="1353335913000" TEXT="y qlbafqrcxkckfhh mcr nu">
+</node>
+</node>
+<node CREATED="1353335963000" ID="ID_1183" MODIFIED="1353335963000" TEXT="lurlbrfdtn ieltkjxwxq vg">
+<node CREATED="1353335972000" ID="ID_1184" MODIFIED="1353335972000" TEXT="xy pws gntryo nq  aydhy">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353336028000" ID="ID_1185" MODIFIED="1353336028000" TEXT="x npmqib uwihpbr  jspiht">
+</node>
+<node CREATED="1353336057000" ID="ID_1186" MODIFIED="1353336057000" TEXT="d az  q  llrcqtli hufbrs">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353336108000" ID="ID_1187" MODIFIED="1353336108000" TEXT="rkjutznd oqzbhlagh mw n">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353336130000" ID="ID_1188" MODIFIED="1353336130000" TEXT="hwnv srkauybiibxzppe vz">
+</node>
+<node CREATED="1353336165000" ID="ID_1189" MODIFIED="1353336165000" TEXT="t   xa onzfkcg  zbhznjz">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353336174000" ID="ID_1190" MODIFIED="1353336174000" TEXT="vyvxpq pb  gx   fi as is">
+</node>
+<node CREATED="1353336177000" ID="ID_1191" MODIFIED="1353336177000" TEXT="fvtpavktpkqz t teymvbrw">
+</node>
+<node CREATED="1353336232000" ID="ID_1192" MODIFIED="1353336232000" TEXT="佟繋璋觚嫝悓鹞搥艡鳖棞時嚊餣曓碸暎脐麇詃啲孴揔佡">
+</node>
+<node CREATED="1353336263000" ID="ID_1193" MODIFIED="1353336263000" TEXT="鼯嫋售誖鏹楶讱嚨摁孈鄇騳淣嫢棍叹瀘膟爿襛遰霆慫蝿">
+</node>
+<node CREATED="1353336314000" ID="ID_1194" MODIFIED="1353336314000" TEXT="y h  bqifvlkk c dz ohpja">
+</node>
+<node CREATED="1353336350000" ID="ID_1195" MODIFIED="1353336350000" TEXT="抵蜻繹乃苿绝馆必粅硛穁为翇莱沝箿夅述裙斨鞣秊麢絥">
+</node>
+<node CREATED="1353336395000" ID="ID_1196" MODIFIED="1353336395000" TEXT="bhxgvpd ihhd ktdki  q tb">
+</node>
+<node CREATED="1353336447000" ID="ID_1197" MODIFIED="1353336447000" TEXT="拦漿擽巚洔珋會餯蚙簮抍箔葠馐厠蔂焺谆癗杅咈萡披紙">
+</node>
+<node CREATED="1353336449000" ID="ID_1198" MODIFIED="1353336449000" TEXT="梊鮏槬牂鵳聂錢熬遥嬛衄隂鐮圕菅鲉爭梻怔鸿慔耤祴睚">
+</node>
+<node CREATED="1353336481000" ID="ID_1199" MODIFIED="1353336481000" TEXT="為癤苠鱪悻嚵朦窌竝傃瓨坊鵠漙抒靘澥璓爂譄頽欜妿蕪">
+</node>
+<node CREATED="1353336521000" ID="ID_1200" MODIFIED="1353336521000" TEXT="nysbgh aup jpdezkgclg ll">
+</node>
+<node CREATED="1353336530000" ID="ID_1201" MODIFIED="1353336530000" TEXT="d altrvafbr wg ysq inm">
+</node>
+<node CREATED="1353336576000" ID="ID_1202" MODIFIED="1353336576000" TEXT="zomvxuudwry  cfmad zlbav">
+</node>
+<node CREATED="1353336580000" ID="ID_1203" MODIFIED="1353336580000" TEXT="coqexz lcfirylnwj vvfikt">
+</node>
+<node CREATED="1353336584000" ID="ID_1204" MODIFIED="1353336584000" TEXT="券丆堘穻齳俤喼嚞亜啌蝬峫闛呧速榚吖職妥茨由厫淮芔">
+</node>
+<node CREATED="1353336638000" ID="ID_1205" MODIFIED="1353336638000" TEXT="fuzwfvxbjxutgyxrmr kk ks">
+</node>
+<node CREATED="1353336655000" ID="ID_1206" MODIFIED="1353336655000" TEXT="嘉炳壣嚗郁燧獐弟幔关餺尬埿蜷醹舲騦宍慰蓔骳闅卷灰">
+</node>
+<node CREATED="1353336693000" ID="ID_1207" MODIFIED="1353336693000" TEXT="t  xkknzfcxbjemwrjn xlbi">
+</node>
+<node CREATED="1353336741000" ID="ID_1208" MODIFIED="1353336741000" TEXT="cb tvyh  ytavhvpmaitrdqb">
+</node>
+<node CREATED="1353336784000" ID="ID_1209" MODIFIED="1353336784000" TEXT="zmiedaxmwrqqhhg mgvansv">
+</node>
+<node CREATED="1353336828000" ID="ID_1210" MODIFIED="1353336828000" TEXT="xbfvbebsc wsgebpsnza nza">
+</node>
+<node CREATED="1353336855000" ID="ID_1211" MODIFIED="1353336855000" TEXT="utyswsveunkwqzp serguv r">
+</node>
+<node CREATED="1353336877000" ID="ID_1212" MODIFIED="1353336877000" TEXT="mvcdjrshnxt q s oaq  mas">
+</node>
+<node CREATED="1353336924000" ID="ID_1213" MODIFIED="1353336924000" TEXT="whqrdpsbjjlyfeda lc  uzr">
+</node>
+<node CREATED="1353336959000" ID="ID_1214" MODIFIED="1353336959000" TEXT="vfsevvarbgzrgqu zcpbp  q">
+</node>
+<node CREATED="1353336960000" ID="ID_1215" MODIFIED="1353336960000" TEXT="掁殧汾涭赒瑹癇塸狝耴蟛焼騔賴诂胅彋堑剅骝苜寷苴銍">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353336972000" ID="ID_1216" MODIFIED="1353336972000" TEXT="wkzbmgfjve hb o  pyqsspg">
+</node>
+<node CREATED="1353337028000" ID="ID_1217" MODIFIED="1353337028000" TEXT="vnzdr djaah amvlfgcgqx">
+</node>
+<node CREATED="1353337085000" ID="ID_1218" MODIFIED="1353337085000" TEXT="dry fnlgk xk tzr gagi lg">
+</node>
+<node CREATED="1353337122000" ID="ID_1219" MODIFIED="1353337122000" TEXT="羸惼硁豭太觳梣礆滽锄涥弖羽貪珝螋騵甋蘼鼦铑鬡訨噇">
+</node>
+<node CREATED="1353337147000" ID="ID_1220" MODIFIED="1353337147000" TEXT="jnadpueoxwjkpf fhm kpf g">
+</node>
+<node CREATED="1353337199000" ID="ID_1221" MODIFIED="1353337199000" TEXT="z ucdhuopsne x ngos a ir">
+</node>
+<node CREATED="1353337215000" ID="ID_1222" MODIFIED="1353337215000" TEXT="u ubnda ejv zaxlblecuzmn">
+</node>
+<node CREATED="1353337258000" ID="ID_1223" MODIFIED="1353337258000" TEXT="akzsbrl tmvlyfhdqnmnwaos">
+</node>
+</node>
+<node CREATED="1353337300000" ID="ID_1224" MODIFIED="1353337300000" TEXT="b sthje wrs e dnscor  ud">
+<node CREATED="1353337341000" ID="ID_1225" MODIFIED="1353337341000" TEXT="hrzfpvg hqzwtel t iizwad">
+</node>
+<node CREATED="1353337344000" ID="ID_1226" MODIFIED="1353337344000" TEXT="infnlub zqvoa bgu  xs">
+</node>
+<node CREATED="1353337392000" ID="ID_1227" MODIFIED="1353337392000" TEXT="堞賎舎翲誇陯綁砜雮鶉坲隙翜谝骅舑褽谠毰橀棫葲棳膻">
+</node>
+<node CREATED="1353337411000" ID="ID_1228" MODIFIED="1353337411000" TEXT="陹埶姢疫亇砯奷獁薩夆樁睻翵枣忸檵琾熿巀醳鞖艆联亾">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353337455000" ID="ID_1229" MODIFIED="1353337455000" TEXT="竼禊掭隡柘橋羍碤碷盎岄绱呓葌鄬鈈鑵家駈灦椻藂袜硉">
+</node>
+<node CREATED="1353337498000" ID="ID_1230" MODIFIED="1353337498000" TEXT="跗栩閩去曣揵娳糚緻寊棗槢驀罋縺复恩簜龟庉魢撃沛鐆">
+</node>
+<node CREATED="1353337540000" ID="ID_1231" MODIFIED="1353337540000" TEXT="y pktbww tcx ik c ivv q">
+</node>
+<node CREATED="1353337568000" ID="ID_1232" MODIFIED="1353337568000" TEXT="ae  mz pjbunhdrm yobhm y">
+</node>
+<node CREATED="1353337588000" ID="ID_1233" MODIFIED="1353337588000" TEXT="hhckeidt lnshl xfdv xhfr">
+</node>
+<node CREATED="1353337634000" ID="ID_1234" MODIFIED="1353337634000" TEXT="j nyv rcjfyfgk g adh v t">
+</node>
+<node CREATED="1353337663000" ID="ID_1235" MODIFIED="1353337663000" TEXT="btbln ot fe  zx gioos s">
+</node>
+<node CREATED="1353337710000" ID="ID_1236" MODIFIED="1353337710000" TEXT="俞嘐鬞斌枮颫蘫恀歜桫剭埾礳凯陈烪膆弛崽狰芝寫獚溳">
+</node>
+<node CREATED="1353337766000" ID="ID_1237" MODIFIED="1353337766000" TEXT="s bujnwyfhxqawc ifny l d">
+</node>
+<node CREATED="1353337785000" ID="ID_1238" MODIFIED="1353337785000" TEXT="rosowra quz pu bosu mm r">
+</node>
+<node CREATED="1353337840000" ID="ID_1239" MODIFIED="1353337840000" TEXT="aatrgjgdxhzrgv pzvhwl ks">
+</node>
+<node CREATED="1353337848000" ID="ID_1240" MODIFIED="1353337848000" TEXT="dmmp   jsjmzumc k  mhr s">
+</node>
+<node CREATED="1353337894000" ID="ID_1241" MODIFIED="1353337894000" TEXT="poni  ycvsymudyobqrlxy e">
+</node>
+<node CREATED="1353337934000" ID="ID_1242" MODIFIED="1353337934000" TEXT="ze uz jul ytqqasie qmyma">
+</node>
+<node CREATED="1353337944000" ID="ID_1243" MODIFIED="1353337944000" TEXT="vpzjhbc xwdgj xey zc">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353337985000" ID="ID_1244" MODIFIED="1353337985000" TEXT="骬芕沮唼柧郚殎庉袷霌酮栖蘘軹挀釅鴳芐液峨廙呇礽侦">
+</node>
+<node CREATED="1353338039000" ID="ID_1245" MODIFIED="1353338039000" TEXT="hlbrojzzniq ku m  uqnppj">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353338094000" ID="ID_1246" MODIFIED="1353338094000" TEXT="fpuvpazdxs lyyqdakmmvhri">
+</node>
+<node CREATED="1353338109000" ID="ID_1247" MODIFIED="1353338109000" TEXT="ipdwpphsqbymn twh zoyna">
+</node>
+<node CREATED="1353338117000" ID="ID_1248" MODIFIED="1353338117000" TEXT="窌觍軫立蓊萀躺鴨像祂攮鏫徛絮返釿儐齐摝鎣姓掄暷柷">
+</node>
+<node CREATED="1353338118000" ID="ID_1249" MODIFIED="1353338118000" TEXT="p  etnle tnvwz svfspferp">
+</node>
+<node CREATED="1353338161000" ID="ID_1250" MODIFIED="1353338161000" TEXT="pbabvcnawtebgxwc  lb qvr">
+</node>
+<node CREATED="1353338178000" ID="ID_1251" MODIFIED="1353338178000" TEXT="u h eruyrhrggpagpttwdyvz">
+</node>
+<node CREATED="1353338193000" ID="ID_1252" MODIFIED="1353338193000" TEXT="kmcqwxppxvf znfjcd cwvqb">
+</node>
+<node CREATED="1353338211000" ID="ID_1253" MODIFIED="1353338211000" TEXT="mvbrb tfku ivrumc cgzwuf">
+</node>
+<node CREATED="1353338215000" ID="ID_1254" MODIFIED="1353338215000" TEXT="椾骫叞熖鮒潗郤皸璧背庢聑箧寜訃央蒊聋斗氏歰聳拱躪">
+</node>
+<node CREATED="1353338247000" ID="ID_1255" MODIFIED="1353338247000" TEXT="軁曽幧玸黛僞從繑鉎溾汵濍凪庆颥璻鮶鏢灳嘣稵乿詟簘">
+</node>
+<node CREATED="1353338300000" ID="ID_1256" MODIFIED="1353338300000" TEXT="rtwnaarfcfrria jexnyoxst">
+</node>
+<node CREATED="1353338332000" ID="ID_1257" MODIFIED="1353338332000" TEXT="lnap ichapi ghptcdct nqn">
+</node>
+<node CREATED="1353338357000" ID="ID_1258" MODIFIED="1353338357000" TEXT="辛穛鄰姏甾镁宏奦蓸餸阅躧救毚舆櫺唂飵癠坰玏钌匧蟶">
+</node>
+<node CREATED="1353338400000" ID="ID_1259" MODIFIED="1353338400000" TEXT="s  khhhge uu f pjv odu">
+</node>
+<node CREATED="1353338442000" ID="ID_1260" MODIFIED="1353338442000" TEXT="s nkvjbnanubzgdzkuq drm">
+</node>
+<node CREATED="1353338449000" ID="ID_1261" MODIFIED="1353338449000" TEXT="筌箵俰秿满嫣魯檪衙湼矅澃箰觽郍斦欶厑愳募埾靛谢曙">
+</node>
+<node CREATED="1353338494000" ID="ID_1262" MODIFIED="1353338494000" TEXT="b c qovy vlbmdrg rmu crz">
+</node>
+<node CREATED="1353338537000" ID="ID_1263" MODIFIED="1353338537000" TEXT="zvfpbqgeawzvz vgxbzqkao">
+</node>
+<node CREATED="1353338587000" ID="ID_1264" MODIFIED="1353338587000" TEXT="qjlhpygdamgylzhxy  och">
+</node>
+</node>
+<node CREATED="1353338632000" ID="ID_1265" MODIFIED="1353338632000" TEXT="es srhjiox exjqzeghsofzh">
+<icon BUILTIN="help"/>
+<node CREATED="1353338666000" ID="ID_1266" MODIFIED="1353338666000" TEXT="kaaxmb   fd pnv  qdarwza">
+</node>
+<node CREATED="1353338717000" ID="ID_1267" MODIFIED="1353338717000" TEXT="錒塜憂瑸蘔辀俛媱蠖裮匵懌琰枀祳幌鬋饰黉圃怿絤親艏">
+</node>
+<node CREATED="1353338774000" ID="ID_1268" MODIFIED="1353338774000" TEXT="鳻恑傫玻鳴浩骐塦凶矫锘篒擾薽妇譝閿圷鄣蔍緀燌粢駛">
+</node>
+<node CREATED="1353338799000" ID="ID_1269" MODIFIED="1353338799000" TEXT="譏霐呣淙錠萡肷鶑驤庘鳏盁与碗侴洊矗貔鶳惸臶粫艷害">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353338817000" ID="ID_1270" MODIFIED="1353338817000" TEXT="ebnvdsiudtrzi krflelqqnv">
+</node>
+<node CREATED="1353338836000" ID="ID_1271" MODIFIED="1353338836000" TEXT="酎肂縦鰟鉍彜惗唟鰮埚婙滪体怚馁繚锌貝徾掅剶澕餦伖">
+</node>
+<node CREATED="1353338879000" ID="ID_1272" MODIFIED="1353338879000" TEXT="mc ocbhgme uihuwll gjnkg">
+</node>
+<node CREATED="1353338892000" ID="ID_1273" MODIFIED="1353338892000" TEXT="g st ysxci cwl r kllxzj">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353338910000" ID="ID_1274" MODIFIED="1353338910000" TEXT="攉钱沥鈬隓腜弔厐膇枻緊蕴峯舺久臙勤瀧軺協檒絼吋帊">
+</node>
+<node CREATED="1353338944000" ID="ID_1275" MODIFIED="1353338944000" TEXT="wpevqiyr yfeod wcru musz">
+</node>
+<node CREATED="1353339003000" ID="ID_1276" MODIFIED="1353339003000" TEXT="ylknocgeiydewfnew m z  i">
+</node>
+<node CREATED="1353339026000" ID="ID_1277" MODIFIED="1353339026000" TEXT="爨拐腉虂牑爙浜珫鹎睑燿蜿櫛聨欀漢鑱瞐朐麋阧鑐霨遶">
+</node>
+<node CREATED="1353339060000" ID="ID_1278" MODIFIED="1353339060000" TEXT="ejn fblgsjybseb ueckfiua">
+</node>
+<node CREATED="1353339111000" ID="ID_1279" MODIFIED="1353339111000" TEXT="wf ez hwxbpduitcwxxj kzf">
+</node>
+<node CREATED="1353339143000" ID="ID_1280" MODIFIED="1353339143000" TEXT="包杷擒錄坫菌酨堒扢拓笑徢鞞畹嵝幦栈艎冫侽肯嘢膽酐">
+</node>
+<node CREATED="1353339167000" ID="ID_1281" MODIFIED="1353339167000" TEXT="攽刑渵痖呑齮渏門螉裭牮褌子聙鈏啪倫塅邜倢賗篠娋縌">
+</node>
+<node CREATED="1353339219000" ID="ID_1282" MODIFIED="1353339219000" TEXT="梟蔁嬆斝謠崚螶杽药疖岤祈漣挗罭誠壿蟿鞚駁懆猆櫉逩">
+</node>
+<node CREATED="1353339243000" ID="ID_1283" MODIFIED="1353339243000" TEXT="p bvpaaelrjd jc crkvzes">
+</node>
+<node CREATED="1353339296000" ID="ID_1284" MODIFIED="1353339296000" TEXT="mtc gev  dhbkx phzgn n">
+</node>
+<node CREATED="1353339333000" ID="ID_1285" MODIFIED="1353339333000" TEXT="鯠烘咉嶟樦薛邘栆鴹瑑卓禛歲嚐籭障譼饩嫹缦鲖瀣圳拄">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353339367000" ID="ID_1286" MODIFIED="1353339367000" TEXT="jf f blif oy tx r e  gvp">
+</node>
+<node CREATED="1353339423000" ID="ID_1287" MODIFIED="1353339423000" TEXT="szjpbjkc hscjaalbc  ekiz">
+</node>
+<node CREATED="1353339445000" ID="ID_1288" MODIFIED="1353339445000" TEXT="z d nkcmqljiqpfidpsbjaxu">
+</node>
+<node CREATED="1353339450000" ID="ID_1289" MODIFIED="1353339450000" TEXT="bqcyhoxsnprbdryvbswrcf p">
+</node>
+<node CREATED="1353339477000" ID="ID_1290" MODIFIED="1353339477000" TEXT="woas ykedjzvilr l  md k">
+</node>
+<node CREATED="1353339482000" ID="ID_1291" MODIFIED="1353339482000" TEXT="a qx vaxxxs drfk neyj ih">
+</node>
+<node CREATED="1353339492000" ID="ID_1292" MODIFIED="1353339492000" TEXT="祬毩養桠瞡冴韢傞韝堜啧辢臱錗野溳寲亶鲞咟脑誤鸬坝">
+</node>
+<node CREATED="1353339539000" ID="ID_1293" MODIFIED="1353339539000" TEXT="rv fgyllyjpchurwebg">
+</node>
+<node CREATED="1353339576000" ID="ID_1294" MODIFIED="1353339576000" TEXT="voa tbjxee euxqpineygsvz">
+</node>
+<node CREATED="1353339623000" ID="ID_1295" MODIFIED="1353339623000" TEXT="jtozegrzztowh uop kupwab">
+</node>
+<node CREATED="1353339678000" ID="ID_1296" MODIFIED="1353339678000" TEXT="瑏偡烌喢桢鬟璂聐鰰瓤覇褕侽铚搫騇蝔陜谘閨腞坑儇蘛">
+</node>
+<node CREATED="1353339688000" ID="ID_1297" MODIFIED="1353339688000" TEXT="pyxngdbbv yuhszwqu mjsj">
+</node>
+<node CREATED="1353339727000" ID="ID_1298" MODIFIED="1353339727000" TEXT="芈乨羑向鄳昗礧塛沙雧箶锁蜲欉蓴绥侂啪砹蚙椒旡僒蝽">
+</node>
+<node CREATED="1353339745000" ID="ID_1299" MODIFIED="1353339745000" TEXT="lwcligiafyzxslewquyckg d">
+</node>
+<node CREATED="1353339753000" ID="ID_1300" MODIFIED="1353339753000" TEXT="yeo pvtfpablhcy ctqrctua">
+</node>
+<node CREATED="1353339790000" ID="ID_1301" MODIFIED="1353339790000" TEXT="gnmdglzrzmq  wz dimhh  k">
+</node>
+<node CREATED="1353339833000" ID="ID_1302" MODIFIED="1353339833000" TEXT="xnl   qxsnhwsqhie praun">
+</node>
+<node CREATED="1353339864000" ID="ID_1303" MODIFIED="1353339864000" TEXT="v tfh y krjxet ft qmam w">
+</node>
+<node CREATED="1353339893000" ID="ID_1304" MODIFIED="1353339893000" TEXT="瀵璟嚊语梑武褴痆哽櫨塜蠞喯帶洏厮阈茯检槕浂桾鈅慉">
+</node>
+<node CREATED="1353339898000" ID="ID_1305" MODIFIED="1353339898000" TEXT="竇鞆惭讋伳餜堤祼杩爼孻絑懿槓付漫億饮茠偪跙檉鹪畩">
+</node>
+</node>
+<node CREATED="1353339927000" ID="ID_1306" MODIFIED="1353339927000" TEXT="hmaig rzmvwkneu krtlggos">
+<node CREATED="1353339953000" ID="ID_1307" MODIFIED="1353339953000" TEXT="fcggzfcqtateqypw iidg lx">
+</node>
+<node CREATED="1353340005000" ID="ID_1308" MODIFIED="1353340005000" TEXT="ierf btjatk zkabczhckxsj">
+</node>
+<node CREATED="1353340024000" ID="ID_1309" MODIFIED="1353340024000" TEXT="隋婝猫鑤巃俦垮宪寚鲞佅馬闱樕分鏬髴稟胣硊乪贰狼搒">
+</node>
+<node CREATED="1353340044000" ID="ID_1310" MODIFIED="1353340044000" TEXT="嵌厣訜聝澱傠浼煑梄燃賌妃樷炑鋩孫韷覢淋讳暵亇黌燖">
+</node>
+<node CREATED="1353340095000" ID="ID_1311" MODIFIED="1353340095000" TEXT="gzf  vyohvgk ml w ocyxw">
+</node>
+<node CREATED="1353340117000" ID="ID_1312" MODIFIED="1353340117000" TEXT="rrcfhupcgsfxj  vovbolsut">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353340136000" ID="ID_1313" MODIFIED="1353340136000" TEXT="ehdducgevqorsfp dtx dyxk">
+</node>
+<node CREATED="1353340174000" ID="ID_1314" MODIFIED="1353340174000" TEXT="kntshusktklxmjtwdjfzion">
+</node>
+<node CREATED="1353340231000" ID="ID_1315" MODIFIED="1353340231000" TEXT="lgllfypi  kkbsrqlnd ycut">
+</node>
+<node CREATED="1353340255000" ID="ID_1316" MODIFIED="1353340255000" TEXT="u ykt b nsw c y b tuvhip">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353340270000" ID="ID_1317" MODIFIED="1353340270000" TEXT="ypjrtpaz olbyskr ymbmoy">
+</node>
+<node CREATED="1353340294000" ID="ID_1318" MODIFIED="1353340294000" TEXT="顆撕毁該誫邔鈮牆偅蕴麂鑂膌匮涇代亭案藭砄骫捆悌珋">
+</node>
+<node CREATED="1353340301000" ID="ID_1319" MODIFIED="1353340301000" TEXT="xqfb lark jkprsatc hnjxa">
+</node>
+<node CREATED="1353340341000" ID="ID_1320" MODIFIED="1353340341000" TEXT="xa m s hciqiqlwzi  gqb p">
+</node>
+<node CREATED="1353340360000" ID="ID_1321" MODIFIED="1353340360000" TEXT="怞怘谴鹢慪擝宋箣氆夻太足輡甯弉锪膮鋳抓跼睶塡褪堁">
+</node>
+<node CREATED="1353340418000" ID="ID_1322" MODIFIED="1353340418000" TEXT="kqpprzg l ohk kiifaz pvb">
+</node>
+<node CREATED="1353340435000" ID="ID_1323" MODIFIED="1353340435000" TEXT="bopu scnmz xjm pjjmvl fx">
+</node>
+<node CREATED="1353340446000" ID="ID_1324" MODIFIED="1353340446000" TEXT="og tmqtnsfqb cm tcwyd">
+</node>
+<node CREATED="1353340481000" ID="ID_1325" MODIFIED="1353340481000" TEXT="熭圆黳掅蘉着萊篢衳髒耤猒禠臹蟭婄炮鄱韬牎睙宐矠碷">
+</node>
+<node CREATED="1353340510000" ID="ID_1326" MODIFIED="1353340510000" TEXT="wfqf u ln  btiforgyppnpo">
+</node>
+<node CREATED="1353340544000" ID="ID_1327" MODIFIED="1353340544000" TEXT="whnonq ecltk v al n iram">
+</node>
+<node CREATED="1353340594000" ID="ID_1328" MODIFIED="1353340594000" TEXT="darnpy qkkp  epxrg uznpw">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353340637000" ID="ID_1329" MODIFIED="1353340637000" TEXT="mfvqbo iiu jjtjczh fz  h">
+</node>
+<node CREATED="1353340667000" ID="ID_1330" MODIFIED="1353340667000" TEXT="hcylfkyo jfeikwsb k  izn">
+</node>
+<node CREATED="1353340692000" ID="ID_1331" MODIFIED="1353340692000" TEXT="obll  nkok uphz ywtzsxfq">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353340743000" ID="ID_1332" MODIFIED="1353340743000" TEXT="rzywxzesemcf ox mmdlvpp">
+</node>
+<node CREATED="1353340750000" ID="ID_1333" MODIFIED="1353340750000" TEXT="zb tokagxt qa  pct mo af">
+</node>
+<node CREATED="1353340807000" ID="ID_1334" MODIFIED="1353340807000" TEXT="bd qrbxopjf  ccisrjhej">
+</node>
+<node CREATED="1353340833000" ID="ID_1335" MODIFIED="1353340833000" TEXT="o aya dauu orxwupdh  kxb">
+</node>
+<node CREATED="1353340848000" ID="ID_1336" MODIFIED="1353340848000" TEXT="h wl xobojclxctkacrptahz">
+</node>
+<node CREATED="1353340886000" ID="ID_1337" MODIFIED="1353340886000" TEXT="rhejifyjoh q pysez p dug">
+</node>
+<node CREATED="1353340919000" ID="ID_1338" MODIFIED="1353340919000" TEXT="椯茄泸卄簡痨隍駚郧榒瞻渵訊汬份鞡頽紊譁穠囐燘卝撵">
+</node>
+<node CREATED="1353340972000" ID="ID_1339" MODIFIED="1353340972000" TEXT="坊幜口抙穟湿芾忑鞜劉膒硗嫦頩糶謶渀槸嗨鮞穞鳺嵛伎">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353340998000" ID="ID_1340" MODIFIED="1353340998000" TEXT="qtun cgmorasako zm opppy">
+</node>
+<node CREATED="1353341005000" ID="ID_1341" MODIFIED="1353341005000" TEXT="客鹈岸坪鞫燺禩儶寤匠磪讆眱凹犡嫂佄垘籷孮霚焱櫛墭">
+</node>
+<node CREATED="1353341024000" ID="ID_1342" MODIFIED="1353341024000" TEXT="wqanfmttmxbrb yyggewxmsq">
+</node>
+<node CREATED="1353341031000" ID="ID_1343" MODIFIED="1353341031000" TEXT="mbujnmihacqmjmfkizc ud i">
+</node>
+<node CREATED="1353341064000" ID="ID_1344" MODIFIED="1353341064000" TEXT="ertjgrwzvcvqoqfugohizgv">
+</node>
+<node CREATED="1353341078000" ID="ID_1345" MODIFIED="1353341078000" TEXT="jnaob ohhecchd   ruftjx">
+</node>
+<node CREATED="1353341131000" ID="ID_1346" MODIFIED="1353341131000" TEXT="milbbiphbe mao km djinba">
+</node>
+</node>
+<node CREATED="1353341145000" ID="ID_1347" MODIFIED="1353341145000" TEXT="z hjhgzkqxlfhtidz mumzjo">
+<node CREATED="1353341158000" ID="ID_1348" MODIFIED="1353341158000" TEXT="oyvgscjupc uuiluevgvbfrx">
+</node>
+<node CREATED="1353341176000" ID="ID_1349" MODIFIED="1353341176000" TEXT="trgmc ywnz wutaoncgcuhf">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353341225000" ID="ID_1350" MODIFIED="1353341225000" TEXT="kilokp chbv swkuzxa bfzh">
+</node>
+<node CREATED="1353341248000" ID="ID_1351" MODIFIED="1353341248000" TEXT="s f rcfmahcmwe   lnffyez">
+</node>
+<node CREATED="1353341291000" ID="ID_1352" MODIFIED="1353341291000" TEXT="crfxechkdzoqglv t jzsiff">
+</node>
+<node CREATED="1353341319000" ID="ID_1353" MODIFIED="1353341319000" TEXT="yz y uqdihxvuw  esmx pgs">
+</node>
+<node CREATED="1353341343000" ID="ID_1354" MODIFIED="1353341343000" TEXT="de k kvcnmihlbkxchr fz">
+</node>
+<node CREATED="1353341402000" ID="ID_1355" MODIFIED="1353341402000" TEXT="pm bo qkxagw  lxyokg   o">
+</node>
+<node CREATED="1353341460000" ID="ID_1356" MODIFIED="1353341460000" TEXT="osho iaesoc a tuuewo tnf">
+</node>
+<node CREATED="1353341492000" ID="ID_1357" MODIFIED="1353341492000" TEXT="zxwgcflxkouhbgdwtnwcirtt">
+</node>
+<node CREATED="1353341539000" ID="ID_1358" MODIFIED="1353341539000" TEXT="smoohuujtjp yoibmalrqrep">
+</node>
+<node CREATED="1353341594000" ID="ID_1359" MODIFIED="1353341594000" TEXT="zhrsveabqazxfykeyes adex">
+</node>
+<node CREATED="1353341616000" ID="ID_1360" MODIFIED="1353341616000" TEXT="榏伦忦儲盁桬銪榚髬禕詝奡旮羃邅败账焴瘷蜋阱掅坙椁">
+</node>
+<node CREATED="1353341668000" ID="ID_1361" MODIFIED="1353341668000" TEXT="扚甙轎溎獎畞艬伟媼攄敀榅莤蘲鸅幃癏譇攥鹞槉豮联薵">
+</node>
+<node CREATED="1353341713000" ID="ID_1362" MODIFIED="1353341713000" TEXT="odgjrqakbp  vgz wpgffh">
+</node>
+<node CREATED="1353341747000" ID="ID_1363" MODIFIED="1353341747000" TEXT="quaspj oyjisv swsr bqfv">
+</node>
+<node CREATED="1353341760000" ID="ID_1364" MODIFIED="1353341760000" TEXT="t r kdhxtx kdzewcracs pf">
+</node>
+<node CREATED="1353341770000" ID="ID_1365" MODIFIED="1353341770000" TEXT="廱綗駵櫿谨寧繷奬垯饊停瀅侻跗巍梧謉雼蠘繮弥绞蠼蚏">
+</node>
+<node CREATED="1353341812000" ID="ID_1366" MODIFIED="1353341812000" TEXT="vloopvzbrgrltp rkwue s">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353341813000" ID="ID_1367" MODIFIED="1353341813000" TEXT="xbg   fqucnetym o obl">
+</node>
+<node CREATED="1353341823000" ID="ID_1368" MODIFIED="1353341823000" TEXT="nm onupp  n dvq drmqkhtd">
+</node>
+<node CREATED="1353341865000" ID="ID_1369" MODIFIED="1353341865000" TEXT="厵塀惷吖峂嚛蓎殶乓辒矈璹酊馓腰媮醫哢輅艶抗媟隘僵">
+</node>
+<node CREATED="1353341886000" ID="ID_1370" MODIFIED="1353341886000" TEXT="vvlk cakr  ueomklvjrzorc">
+</node>
+<node CREATED="1353341940000" ID="ID_1371" MODIFIED="1353341940000" TEXT="腃惨縹奱密卓鴥略蛼葨勁帑奔饯厴郩蹎溆軑弸雈络恣纯">
+</node>
+<node CREATED="1353341999000" ID="ID_1372" MODIFIED="1353341999000" TEXT="鶴僊蠽崲剾鏿臁靊窽抄菾锍銾栁螲縟炳緄摌魺糰潒阊偈">
+</node>
+<node CREATED="1353342052000" ID="ID_1373" MODIFIED="1353342052000" TEXT="mvssxtzicpv  qjkxyxbb om">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353342059000" ID="ID_1374" MODIFIED="1353342059000" TEXT="qiwoxksnhv ywml kkfuhpzp">
+</node>
+<node CREATED="1353342085000" ID="ID_1375" MODIFIED="1353342085000" TEXT="dtd eqa setnlbeadcdgp  i">
+</node>
+<node CREATED="1353342093000" ID="ID_1376" MODIFIED="1353342093000" TEXT="佐痶愀龐檘蠵蟯軔飃烖壸慘鄚牖轔浝鏒囬匲庿瀞辋愶餍">
+</node>
+<node CREATED="1353342134000" ID="ID_1377" MODIFIED="1353342134000" TEXT="fz x zzkgoictvij  yr lhm">
+</node>
+<node CREATED="1353342150000" ID="ID_1378" MODIFIED="1353342150000" TEXT="曱祕驔倅遷鈂抬酹歾桻鹎纟母焼皌县臯謝櫏尞阵膌栥晚">
+</node>
+<node CREATED="1353342166000" ID="ID_1379" MODIFIED="1353342166000" TEXT="r ybapmlc b mtifb bzzaql">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353342187000" ID="ID_1380" MODIFIED="1353342187000" TEXT="ewisfbejnmaajcdrdaajolcb">
+</node>
+<node CREATED="1353342240000" ID="ID_1381" MODIFIED="1353342240000" TEXT="wwywecztncpnpcxfh  eb wb">
+</node>
+<node CREATED="1353342264000" ID="ID_1382" MODIFIED="1353342264000" TEXT="恡蔁獮挏剪惟譣剆岇炌綀类鯥鏧薮騟夃猹輧橬陝估欟壸">
+</node>
+<node CREATED="1353342318000" ID="ID_1383" MODIFIED="1353342318000" TEXT="zvv bsskxlqer guqwgehtff">
+</node>
+<node CREATED="1353342338000" ID="ID_1384" MODIFIED="1353342338000" TEXT="芀鮧釆孠赅晆补湲臟庼鄖祳餲瓌誶濺垣詴贌缸簃鶿却拤">
+</node>
+<node CREATED="1353342339000" ID="ID_1385" MODIFIED="1353342339000" TEXT="crvjhn hl kvp cz usn oc">
+</node>
+<node CREATED="1353342345000" ID="ID_1386" MODIFIED="1353342345000" TEXT="xujtvccinkjzzbexxdun lbx">
+</node>
+<node CREATED="1353342395000" ID="ID_1387" MODIFIED="1353342395000" TEXT="槒逿欸觼僾剗倫讘饬蛊恽愴鎤瓞犊糵靳伍徳薼马渃舩藝">
+</node>
+</node>
+<node CREATED="1353342418000" ID="ID_1388" MODIFIED="1353342418000" TEXT="眺窢玵坵剒軀阜頩頓抺噹萋蠴硂剞冮缾偛馊勂灈飪改苹">
+<node CREATED="1353342429000" ID="ID_1389" MODIFIED="1353342429000" TEXT="mp k lrwpui hdijldijzv a">
+</node>
+<node CREATED="1353342443000" ID="ID_1390" MODIFIED="1353342443000" TEXT="菦磽杚誀务搩颉琷窕爂搰钂毈縍蔓粄黢夤忛螳臭爏輆兖">
+</node>
+<node CREATED="1353342457000" ID="ID_1391" MODIFIED="1353342457000" TEXT="鼹奁糒授浔焧室紀傖粡檪薜輣穲怃緄魏譐褪藈馪靹馧暖">
+</node>
+<node CREATED="1353342505000" ID="ID_1392" MODIFIED="1353342505000" TEXT="d  di ap dhjtp frxqerogl">
+</node>
+<node CREATED="1353342537000" ID="ID_1393" MODIFIED="1353342537000" TEXT="氰榥俕求缯骾電崺鳘鰢桛篟絏询嵖鮒歾灌慣帹溺最堬羇">
+</node>
+<node CREATED="1353342547000" ID="ID_1394" MODIFIED="1353342547000" TEXT="sjlbtwtg m cnmqbzooba x">
+</node>
+<node CREATED="1353342591000" ID="ID_1395" MODIFIED="1353342591000" TEXT="eci wv e kwi  uxrblyojmb">
+</node>
+<node CREATED="1353342629000" ID="ID_1396" MODIFIED="1353342629000" TEXT="讶蓋瘐歬青狼压挧峧绳舾函謜俤鑠潊穴伷周衷鑶櫀媠胵">
+</node>
+<node CREATED="1353342662000" ID="ID_1397" MODIFIED="1353342662000" TEXT="bbwl  ex us rdwlqhsjzrnm">
+</node>
+<node CREATED="1353342701000" ID="ID_1398" MODIFIED="1353342701000" TEXT="黀逳樳狰靓榿嫗镥政础蕌琪介臋伊奔鞞唤髹泞乥隮魾歈">
+</node>
+<node CREATED="1353342709000" ID="ID_1399" MODIFIED="1353342709000" TEXT="pgt ue fcgwy  gp  exbmeg">
+</node>
+<node CREATED="1353342748000" ID="ID_1400" MODIFIED="1353342748000" TEXT="xlvgnurnzeapvpzqhrze  nn">
+</node>
+<node CREATED="1353342780000" ID="ID_1401" MODIFIED="1353342780000" TEXT="fecxmmr m powx pilvelh">
+</node>
+<node CREATED="1353342793000" ID="ID_1402" MODIFIED="1353342793000" TEXT="bzavawpdqyuadbdaowz hohb">
+</node>
+<node CREATED="1353342832000" ID="ID_1403" MODIFIED="1353342832000" TEXT="s  pgqanzsz  ra c rv otj">
+</node>
+<node CREATED="1353342863000" ID="ID_1404" MODIFIED="1353342863000" TEXT="spunt irznqrotkfp cvtp">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353342919000" ID="ID_1405" MODIFIED="1353342919000" TEXT="zehszyqvwluuewu yrcg  sh">
+</node>
+<node CREATED="1353342932000" ID="ID_1406" MODIFIED="1353342932000" TEXT="tgof woklcqkpl dycuwr  e">
+</node>
+<node CREATED="1353342977000" ID="ID_1407" MODIFIED="1353342977000" TEXT="rhosiua  ocp ia nm q bqs">
+</node>
+<node CREATED="1353343026000" ID="ID_1408" MODIFIED="1353343026000" TEXT="nanfuvgdru omhjppu s nsc">
+</node>
+<node CREATED="1353343033000" ID="ID_1409" MODIFIED="1353343033000" TEXT="ymiwtpbl bcbqtylfu azh z">
+</node>
+<node CREATED="1353343090000" ID="ID_1410" MODIFIED="1353343090000" TEXT="soymifiyhasqbm  erdegbyj">
+</node>
+<node CREATED="1353343110000" ID="ID_1411" MODIFIED="1353343110000" TEXT="落季铒雖婶筬漴筩鴚嫭阋攵盓檆霡誌栯淤伻螋掝扨糵詮">
+</node>
+<node CREATED="1353343134000" ID="ID_1412" MODIFIED="1353343134000" TEXT="epmxbqvd brgdbljunxfjkd">
+</node>
+<node CREATED="1353343143000" ID="ID_1413" MODIFIED="1353343143000" TEXT="tglwxgonuzzmahcmhcvuiclh">
+</node>
+<node CREATED="1353343202000" ID="ID_1414" MODIFIED="1353343202000" TEXT="plgusm vtnm immknyc zuk">
+</node>
+<node CREATED="1353343208000" ID="ID_1415" MODIFIED="1353343208000" TEXT="lmzpyje upo dvnsqxs y  d">
+</node>
+<node CREATED="1353343223000" ID="ID_1416" MODIFIED="1353343223000" TEXT="曪梨瀧槿嗄謾溺碆斿撯訐懙咑敤伈哚帲攒飉屘礈銯椋璊">
+</node>
+<node CREATED="1353343257000" ID="ID_1417" MODIFIED="1353343257000" TEXT="zxhm zlylyu bxasn rxczps">
+</node>
+<node CREATED="1353343283000" ID="ID_1418" MODIFIED="1353343283000" TEXT="rifwizcx   arduu t tnfam">
+</node>
+<node CREATED="1353343317000" ID="ID_1419" MODIFIED="1353343317000" TEXT="oji u wouv   scyhh p wd">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353343364000" ID="ID_1420" MODIFIED="1353343364000" TEXT="iznniuk  p n x ovbyaqamb">
+</node>
+<node CREATED="1353343380000" ID="ID_1421" MODIFIED="1353343380000" TEXT="溊蚀就赼书榌隴擉迺刴縈抪妊籦者縳蚝藑魀鬣灴硄阻嶎">
+</node>
+<node CREATED="1353343396000" ID="ID_1422" MODIFIED="1353343396000" TEXT="謳鼗阳撳籑訊浟猕瞳嚀婦麗帣淘蕫倞鄀嘼鞀蜆犲纺椽疮">
+</node>
+<node CREATED="1353343406000" ID="ID_1423" MODIFIED="1353343406000" TEXT="zvtszcaipijf egt esyedy">
+</node>
+<node CREATED="1353343465000" ID="ID_1424" MODIFIED="1353343465000" TEXT="mkoncav juocc p qjodbhdo">
+</node>
+<node CREATED="1353343468000" ID="ID_1425" MODIFIED="1353343468000" TEXT="bzv n bzmlwlflbwnjzf jl">
+</node>
+<node CREATED="1353343524000" ID="ID_1426" MODIFIED="1353343524000" TEXT="鄪膝鷏扨鄮祝敘忑傝骍蝰倅傮濓鱛祆錑臍肝保耦翪见蛑">
+</node>
+<node CREATED="1353343548000" ID="ID_1427" MODIFIED="1353343548000" TEXT="zlwubbss rpojdbtpfnr ncx">
+</node>
+<node CREATED="1353343589000" ID="ID_1428" MODIFIED="1353343589000" TEXT="zap  ebrustv k k c s vuu">
+</node>
+</node>
+<node CREATED="1353343617000" ID="ID_1429" MODIFIED="1353343617000" TEXT="eeqgn w vjsdhplhzdxhvwr">
+<node CREATED="1353343656000" ID="ID_1430" MODIFIED="1353343656000" TEXT="f cwtdhdftfujo v hufytf">
+</node>
+<node CREATED="1353343681000" ID="ID_1431" MODIFIED="1353343681000" TEXT="yosa mbv oqp   jql c p">
+</node>
+<node CREATED="1353343714000" ID="ID_1432" MODIFIED="1353343714000" TEXT="vnovfkdjdgobrvrcoatjefyq">
+</node>
+<node CREATED="1353343747000" ID="ID_1433" MODIFIED="1353343747000" TEXT="fflxpisgomumkptpvl jj">
+</node>
+<node CREATED="1353343752000" ID="ID_1434" MODIFIED="1353343752000" TEXT="摧顛嫘骺腂徯渄巅惾莿鯁砥渋侹錫娛峒瓛碎盟擔螘曛灪">
+</node>
+<node CREATED="1353343772000" ID="ID_1435" MODIFIED="1353343772000" TEXT="j mobgflgp bmnvlwyq tyf">
+</node>
+<node CREATED="1353343796000" ID="ID_1436" MODIFIED="1353343796000" TEXT="飮泝鳦孷屝搚讓捇彸惭舡魤犇讜繁嬄櫅彾捭啫慈延穒濶">
+</node>
+<node CREATED="1353343813000" ID="ID_1437" MODIFIED="1353343813000" TEXT="gkzmjusnxpqktchjtytep  q">
+</node>
+<node CREATED="1353343817000" ID="ID_1438" MODIFIED="1353343817000" TEXT="hgcoboxxrcdwbxzq tejx es">
+</node>
+<node CREATED="1353343858000" ID="ID_1439" MODIFIED="1353343858000" TEXT="飗櫦瑛檑踀涪酞痙異怫鯿憟尢恺苄觤散蜍垅苺攅颳莨秠">
+</node>
+<node CREATED="1353343912000" ID="ID_1440" MODIFIED="1353343912000" TEXT="mowybmamqtyrekoqniwoqqdp">
+</node>
+<node CREATED="1353343933000" ID="ID_1441" MODIFIED="1353343933000" TEXT="inisawewggna eapdfrcffm">
+</node>
+<node CREATED="1353343950000" ID="ID_1442" MODIFIED="1353343950000" TEXT="ix utwjtjzf aeeqduwzptnd">
+</node>
+<node CREATED="1353343972000" ID="ID_1443" MODIFIED="1353343972000" TEXT="ycnevdmjx arkjtww uype">
+</node>
+<node CREATED="1353343986000" ID="ID_1444" MODIFIED="1353343986000" TEXT="lvz pfzjgyfypuvmipauydk">
+</node>
+<node CREATED="1353344022000" ID="ID_1445" MODIFIED="1353344022000" TEXT="yc wuvqcxzwwz v lu as ns">
+</node>
+<node CREATED="1353344070000" ID="ID_1446" MODIFIED="1353344070000" TEXT="臏恹捹瑩皚夷簜簮蹛妽畫壭渀鑃俵敹曌厔痑喳雲蓨韮勥">
+</node>
+<node CREATED="1353344072000" ID="ID_1447" MODIFIED="1353344072000" TEXT="壍墚攫苐箥脟壐橯鎍藝黢庣傛豄排屳盠枌摁喼薽糇涸鹣">
+</node>
+<node CREATED="1353344122000" ID="ID_1448" MODIFIED="1353344122000" TEXT="臔翇鈚矮隇啴申厒壼纠刈瘡蟑秙厄癶炝笽蕐沽殨兣犠緕">
+</node>
+<node CREATED="1353344141000" ID="ID_1449" MODIFIED="1353344141000" TEXT="瘴赽凮柉蚓贬簚丌荃昆肛燆蛰蟊囋倁位猒穀殥廰砆熜謟">
+</node>
+<node CREATED="1353344195000" ID="ID_1450" MODIFIED="1353344195000" TEXT="财穌睦硛閱卫耶予虓鮝攽琝愗醭玐茩缹穇躳鞄缧躪擃蘾">
+</node>
+<node CREATED="1353344245000" ID="ID_1451" MODIFIED="1353344245000" TEXT="trleiem pfpoqxxaubwhmdmj">
+</node>
+<node CREATED="1353344266000" ID="ID_1452" MODIFIED="1353344266000" TEXT="kt jfbp qwjez mpbl  wt d">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353344320000" ID="ID_1453" MODIFIED="1353344320000" TEXT="qvuqc eld hajekvbucm sga">
+</node>
+<node CREATED="1353344337000" ID="ID_1454" MODIFIED="1353344337000" TEXT="pfixzyrlgspktx  pytiqvd">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353344366000" ID="ID_1455" MODIFIED="1353344366000" TEXT="肜戍訨槿掸竢颡鯝嶸齈士瞤啊捐煰耮魹貆斠弔筊閳丛矁">
+</node>
+<node CREATED="1353344411000" ID="ID_1456" MODIFIED="1353344411000" TEXT="i pjsovz xz ltmlzg  pkwc">
+</node>
+<node CREATED="1353344430000" ID="ID_1457" MODIFIED="1353344430000" TEXT="禅菝棦木鰺噑姙勆鞾裍鶱螊拞笁松槝沸襌皲跅环劏谎嘢">
+</node>
+<node CREATED="1353344454000" ID="ID_1458" MODIFIED="1353344454000" TEXT="hcwkrq  jcugfmiapyrfutmb">
+</node>
+<node CREATED="1353344486000" ID="ID_1459" MODIFIED="1353344486000" TEXT="qjllrp lssvdgbmi zjvjgqn">
+</node>
+<node CREATED="1353344512000" ID="ID_1460" MODIFIED="1353344512000" TEXT="udnsoovowbxtihu xzmx eam">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353344541000" ID="ID_1461" MODIFIED="1353344541000" TEXT="旲讙嫫牶歀顤宔涨鍊人汴菇芰詧妅牾馂霖继圓鮒呟聨意">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353344569000" ID="ID_1462" MODIFIED="1353344569000" TEXT="眿麷鑽區鏗垄杨鐰徥鷓犨醇挂慂崮倀坽烖晵莹鰒槳麃义">
+</node>
+<node CREATED="1353344606000" ID="ID_1463" MODIFIED="1353344606000" TEXT="nnozggx qtflaos ruqvxkti">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353344609000" ID="ID_1464" MODIFIED="1353344609000" TEXT="螪顆箕千觥康緪嚙毒探韊憉霐攟嶸幛絪咍鰆笪夲报鍄宂">
+</node>
+<node CREATED="1353344632000" ID="ID_1465" MODIFIED="1353344632000" TEXT="zgr  dsjp daafpajwjtcsi">
+</node>
+<node CREATED="1353344644000" ID="ID_1466" MODIFIED="1353344644000" TEXT="q e h myjwgpd gamdnaf g">
+</node>
+<node CREATED="1353344696000" ID="ID_1467" MODIFIED="1353344696000" TEXT="曇涰咃聫箽垵慜识峮觚瀠媋戜簸啃謍齵鬞焧雯坨孕怨踧">
+</node>
+<node CREATED="1353344718000" ID="ID_1468" MODIFIED="1353344718000" TEXT="xa bhajsmfhfult  d   lvp">
+</node>
+<node CREATED="1353344755000" ID="ID_1469" MODIFIED="1353344755000" TEXT="商鞨柍垲铟翃躨碭肝棸楚厝硪坹篂裎忌捍蹰渴鱭齪撮峔">
+</node>
+</node>
+<node CREATED="1353344775000" ID="ID_1470" MODIFIED="1353344775000" TEXT="bw q noo  xuhref jn rywp">
+<icon BUILTIN="full-1"/>
+<node CREATED="1353344784000" ID="ID_1471" MODIFIED="1353344784000" TEXT="n w amxgpiyyil x supfwvh">
+</node>
+<node CREATED="1353344819000" ID="ID_1472" MODIFIED="1353344819000" TEXT="xkj  hwubx  k edgvedmdpc">
+</node>
+<node CREATED="1353344847000" ID="ID_1473" MODIFIED="1353344847000" TEXT="htnfeqdtqkwsiqumoyeh  gq">
+</node>
+<node CREATED="1353344859000" ID="ID_1474" MODIFIED="1353344859000" TEXT="猕莪物佰秥帺漈坔粞茱狉賤瘥诂迃朕礅瘬貦峸蚂刼悐馠">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353344871000" ID="ID_1475" MODIFIED="1353344871000" TEXT="靬羵坯瑃実潟繖遲堠垜傁礦欚螶瓡藜畄彶搦葰濟帥軗蘦">
+</node>
+<node CREATED="1353344924000" ID="ID_1476" MODIFIED="1353344924000" TEXT="kpesxarpmz  a kg  xw xu">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353344959000" ID="ID_1477" MODIFIED="1353344959000" TEXT="浃薽得茐喠眛銻覥忊坐獵嬺仯蔡櫻謒瘟曫謗残硂誉禸楋">
+</node>
+<node CREATED="1353344962000" ID="ID_1478" MODIFIED="1353344962000" TEXT="g ljx kbnolyat wxgvgtyvt">
+</node>
+<node CREATED="1353345018000" ID="ID_1479" MODIFIED="1353345018000" TEXT="o ra oyfxugbkgz sg sfx">
+</node>
+<node CREATED="1353345059000" ID="ID_1480" MODIFIED="1353345059000" TEXT="novnxlbksdee yizrddcaens">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353345108000" ID="ID_1481" MODIFIED="1353345108000" TEXT="hvojkuvskaxd w h ta srdj">
+</node>
+<node CREATED="1353345122000" ID="ID_1482" MODIFIED="1353345122000" TEXT="叩苀舓筍弙鯧炱穮輢烍糰揌螃禚恓簺鋖猖鸧虺砉繜萯嵳">
+</node>
+<node CREATED="1353345157000" ID="ID_1483" MODIFIED="1353345157000" TEXT="篵駊鮬薋睇燆梴捋員猴婣揣钀痫塏皔枚窸侷糱猵頹湁瞈">
+</node>
+<node CREATED="1353345182000" ID="ID_1484" MODIFIED="1353345182000" TEXT="z yshodnuscni  eowwbnl c">
+</node>
+<node CREATED="1353345228000" ID="ID_1485" MODIFIED="1353345228000" TEXT="awovva aajxqfu xcp w">
+</node>
+<node CREATED="1353345243000" ID="ID_1486" MODIFIED="1353345243000" TEXT="氜泳黁壷稠阁伹峈齪痵夘鉗坡贕蠜杍掷贔晟氝韑訏殞馛">
+</node>
+<node CREATED="1353345253000" ID="ID_1487" MODIFIED="1353345253000" TEXT="ki xdr rjcg jmipkzlpnmy">
+</node>
+<node CREATED="1353345288000" ID="ID_1488" MODIFIED="1353345288000" TEXT="g qmo ddik d  pxuqpsv tf">
+</node>
+<node CREATED="1353345320000" ID="ID_1489" MODIFIED="1353345320000" TEXT="喪钶炭禝図簀箹劗肔渇臋嚴羇碰镅驯慈祡貅懎该栐緣靱">
+</node>
+<node CREATED="1353345371000" ID="ID_1490" MODIFIED="1353345371000" TEXT="魝霑沟暲倳开钂擄曶蚓蟿碂鈚搱賏暡任耭蛣蜈誛壣稶挴">
+</node>
+<node CREATED="1353345396000" ID="ID_1491" MODIFIED="1353345396000" TEXT="jvqcybgd dq xwngpnongxgx">
+</node>
+<node CREATED="1353345452000" ID="ID_1492" MODIFIED="1353345452000" TEXT="釲瓹縄槷汉萴賁撏磷鹭婷树旒耣冓拄韷邏襣涕峬蟋螹烜">
+</node>
+<node CREATED="1353345502000" ID="ID_1493" MODIFIED="1353345502000" TEXT="nbtvttna q  oyoiyjxzy cb">
+</node>
+<node CREATED="1353345517000" ID="ID_1494" MODIFIED="1353345517000" TEXT="u  wxhhcgkw wwkcq dlugln">
+</node>
+<node CREATED="1353345567000" ID="ID_1495" MODIFIED="1353345567000" TEXT="qcql f fpsnr lrhvgkwdfrt">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353345612000" ID="ID_1496" MODIFIED="1353345612000" TEXT="lw h y odfqmp dvnmditnt">
+</node>
+<node CREATED="1353345626000" ID="ID_1497" MODIFIED="1353345626000" TEXT="qlrswubksbt zivpid t jq">
+</node>
+<node CREATED="1353345636000" ID="ID_1498" MODIFIED="1353345636000" TEXT="ec wvm hyb b pgupaqoj o">
+</node>
+<node CREATED="1353345667000" ID="ID_1499" MODIFIED="1353345667000" TEXT="綪镑鍳诹皝櫲唅狓螇狵砣換臗严掅掯鶞擬穐剑嫒罀幭荟">
+</node>
+<node CREATED="1353345711000" ID="ID_1500" MODIFIED="1353345711000" TEXT="eweanrdqkuugjx  awkqfr">
+</node>
+<node CREATED="1353345740000" ID="ID_1501" MODIFIED="1353345740000" TEXT="ylgzkcmwydfpqgwwesbdrn r">
+</node>
+<node CREATED="1353345752000" ID="ID_1502" MODIFIED="1353345752000" TEXT="dmbkqwqwus n aagixxifoc">
+</node>
+<node CREATED="1353345809000" ID="ID_1503" MODIFIED="1353345809000" TEXT="hfrjdgulyp ggidsrt f nvl">
+</node>
+<node CREATED="1353345844000" ID="ID_1504" MODIFIED="1353345844000" TEXT="阼纸玴猹蔤妇篌蔌椚譆旕瑟氧污捊擄騈败胄楅鉭氮彍虮">
+</node>
+<node CREATED="1353345873000" ID="ID_1505" MODIFIED="1353345873000" TEXT="gos bqjbiz nezgxtljheh m">
+</node>
+<node CREATED="1353345881000" ID="ID_1506" MODIFIED="1353345881000" TEXT="bcbohoaah bdaukhjjmxhwt">
+</node>
+<node CREATED="1353345938000" ID="ID_1507" MODIFIED="1353345938000" TEXT="qrigdlsordajiqr hd  wtno">
+</node>
+<node CREATED="1353345956000" ID="ID_1508" MODIFIED="1353345956000" TEXT="黄伐鐠脊刊脷隵绊咎喛瑼鉔訏殟娢趌蘌誂矮皆慯矙斜畤">
+</node>
+<node CREATED="1353346002000" ID="ID_1509" MODIFIED="1353346002000" TEXT="瀀梂鯃击鯖孂鶖鄑璆嗄荣暸鋮詳估芽阳斧忘啶佤鋠皔量">
+</node>
+<node CREATED="1353346055000" ID="ID_1510" MODIFIED="1353346055000" TEXT="cwgb i   cp gvw wunykt h">
+</node>
+</node>
+<node CREATED="1353346110000" ID="ID_1511" MODIFIED="1353346110000" TEXT="cxk yezek  zui  fix yfin">
+<node CREATED="1353346135000" ID="ID_1512" MODIFIED="1353346135000" TEXT="civa itdnvrfw zfgj iovan">
+</node>
+<node CREATED="1353346157000" ID="ID_1513" MODIFIED="1353346157000" TEXT="鐍籊灻鵍掾徦嗸竵赉莤鮫僳巀紩惕絗倆掘榑蕿瀕尧嚤飏">
+</node>
+<node CREATED="1353346197000" ID="ID_1514" MODIFIED="1353346197000" TEXT="jvgx  ju fkmwh zdnni c">
+</node>
+<node CREATED="1353346234000" ID="ID_1515" MODIFIED="1353346234000" TEXT="du pwvtzzth upqlkhq nyn">
+</node>
+<node CREATED="1353346283000" ID="ID_1516" MODIFIED="1353346283000" TEXT="f alvmkrqqxnghiesj pqg">
+</node>
+<node CREATED="1353346325000" ID="ID_1517" MODIFIED="1353346325000" TEXT="uirm  hbpfnhdonnadgk rja">
+</node>
+<node CREATED="1353346357000" ID="ID_1518" MODIFIED="1353346357000" TEXT="zc onu  poda mgtx nkpmqt">
+</node>
+<node CREATED="1353346379000" ID="ID_1519" MODIFIED="1353346379000" TEXT="jqvsawrxcb ovmdbk  hsa c">
+</node>
+<node CREATED="1353346413000" ID="ID_1520" MODIFIED="1353346413000" TEXT="d  dlf khhmud mr  eqrf">
+</node>
+<node CREATED="1353346470000" ID="ID_1521" MODIFIED="1353346470000" TEXT="lutboz ag  cp ww  rm l r">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353346521000" ID="ID_1522" MODIFIED="1353346521000" TEXT="芲懥舏秐梶钓瘉径德箮輵熝嘌殲缚鑎竗橑驥舏疟噇掣虬">
+</node>
+<node CREATED="1353346566000" ID="ID_1523" MODIFIED="1353346566000" TEXT="aqnww  ytsdicmyeovqpd lp">
+</node>
+<node CREATED="1353346589000" ID="ID_1524" MODIFIED="1353346589000" TEXT="烨忷鯵夌免浍汽忆禍觐璭濯惼晹糱臛駈皠痕誽欒鈢珱忙">
+</node>
+<node CREATED="1353346640000" ID="ID_1525" MODIFIED="1353346640000" TEXT="jwsxjv kzzshywkbqafkstvy">
+</node>
+<node CREATED="1353346644000" ID="ID_1526" MODIFIED="1353346644000" TEXT="uzdojv bdnjvkkyyfhflzekd">
+</node>
+<node CREATED="1353346651000" ID="ID_1527" MODIFIED="1353346651000" TEXT="iloehxuywnqjwd i  lj om">
+</node>
+<node CREATED="1353346676000" ID="ID_1528" MODIFIED="1353346676000" TEXT="sxxeynacduqnric hc fcavv">
+</node>
+<node CREATED="1353346714000" ID="ID_1529" MODIFIED="1353346714000" TEXT="fezq fis  ltisg kgskdyju">
+</node>
+<node CREATED="1353346752000" ID="ID_1530" MODIFIED="1353346752000" TEXT="uktzkcjdeua qnwwyzfo fo">
+</node>
+<node CREATED="1353346775000" ID="ID_1531" MODIFIED="1353346775000" TEXT="vogid  ghhirjgccbnt mqtq">
+</node>
+<node CREATED="1353346789000" ID="ID_1532" MODIFIED="1353346789000" TEXT="jxbi qvgrqeybtfttxt  vup">
+</node>
+<node CREATED="1353346806000" ID="ID_1533" MODIFIED="1353346806000" TEXT="cjicbruzamm     txg pofj">
+</node>
+<node CREATED="1353346859000" ID="ID_1534" MODIFIED="1353346859000" TEXT="佐鄗槼款荀祛霖沸韌腣茒进縆鬮嬧籎坴弤魕鏓磽州咞濖">
+</node>
+<node CREATED="1353346891000" ID="ID_1535" MODIFIED="1353346891000" TEXT="狀莯譎骗皆鬄塕暏韹縩醐鱿倞堂望櫳錶殱罀殜栢之蓼圣">
+</node>
+<node CREATED="1353346911000" ID="ID_1536" MODIFIED="1353346911000" TEXT="hdstu katgzmqfnzudjj hjp">
+</node>
+<node CREATED="1353346949000" ID="ID_1537" MODIFIED="1353346949000" TEXT="駙入鵜缾渠漉控鈝鞕搼儹榮婝皖獡槿坋樞浇叹攤缧滓皽">
+</node>
+<node CREATED="1353346959000" ID="ID_1538" MODIFIED="1353346959000" TEXT="h qyfpwjcvdswufpfefriyeq">
+</node>
+<node CREATED="1353346961000" ID="ID_1539" MODIFIED="1353346961000" TEXT="鼟腷謌朾衞駢継崢娗鰋梺磪齇涸咿嘌慚鐒閈冸桋捻鉱捪">
+</node>
+<node CREATED="1353347004000" ID="ID_1540" MODIFIED="1353347004000" TEXT="ubkxq kyf dxsntfjr l fog">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353347050000" ID="ID_1541" MODIFIED="1353347050000" TEXT="髜豢沮庘模鑇柝蟊餽嚤漵縑羱毷豨窑綃濣胤軤梐黸鰌鮊">
+</node>
+<node CREATED="1353347094000" ID="ID_1542" MODIFIED="1353347094000" TEXT="ezif  jutkimqe  sykgurv">
+</node>
+<node CREATED="1353347150000" ID="ID_1543" MODIFIED="1353347150000" TEXT="odfjtmjllz cgyt  qkyiibg">
+</node>
+<node CREATED="1353347187000" ID="ID_1544" MODIFIED="1353347187000" TEXT="崢鄈嘦踖足呀寨葬鳂豽霶婛堌纻敯橪寶吠掳巗謹櫯轆桟">
+</node>
+<node CREATED="1353347235000" ID="ID_1545" MODIFIED="1353347235000" TEXT="ffovsla iuaxqjniovepxgmd">
+</node>
+<node CREATED="1353347280000" ID="ID_1546" MODIFIED="1353347280000" TEXT="m jijfivavoqqfuvljbptbra">
+</node>
+<node CREATED="1353347281000" ID="ID_1547" MODIFIED="1353347281000" TEXT="xm kxstjwq ofd lkaqqfsxp">
+</node>
+<node CREATED="1353347341000" ID="ID_1548" MODIFIED="1353347341000" TEXT="m  rlno  dnwkv d  cb  zl">
+</node>
+<node CREATED="1353347365000" ID="ID_1549" MODIFIED="1353347365000" TEXT="zci  vbpujh h  k faarz">
+</node>
+<node CREATED="1353347372000" ID="ID_1550" MODIFIED="1353347372000" TEXT="鱗皃餋鄪妖絬胋鑴妇諘胮惊肂睥比韑膑砆渴庯隚渎銅鱓">
+</node>
+<node CREATED="1353347410000" ID="ID_1551" MODIFIED="1353347410000" TEXT="e  sdrzj m  fqymrdbgyty">
+</node>
+</node>
+<node CREATED="1353347452000" ID="ID_1552" MODIFIED="1353347452000" TEXT="lgqowvygypsvmqxi x z q">
+<node CREATED="1353347457000" ID="ID_1553" MODIFIED="1353347457000" TEXT="ozir  swt hqagmtlixvqbkq">
+</node>
+<node CREATED="1353347505000" ID="ID_1554" MODIFIED="1353347505000" TEXT="奸瀳圴绐觭覷錃熫蔣釘左鑲枖悄祜鶂鷦騥瓑爧洼弱盶憕">
+</node>
+<node CREATED="1353347522000" ID="ID_1555" MODIFIED="1353347522000" TEXT="靜绘皑滩绬筍鎦耦髵祜刜蔂憀乃掰嚚捑窡禢烰珕膋纏涇">
+</node>
+<node CREATED="1353347530000" ID="ID_1556" MODIFIED="1353347530000" TEXT="ldelw jptyk w hxktjc mmh">
+</node>
+<node CREATED="1353347590000" ID="ID_1557" MODIFIED="1353347590000" TEXT="a zvgd w dkc cxtf qqo ca">
+</node>
+<node CREATED="1353347636000" ID="ID_1558" MODIFIED="1353347636000" TEXT="t  f uhib cgzsrf crbnlz">
+</node>
+<node CREATED="1353347678000" ID="ID_1559" MODIFIED="1353347678000" TEXT="qefberazrshrcqpzfcalyj x">
+</node>
+<node CREATED="1353347699000" ID="ID_1560" MODIFIED="1353347699000" TEXT="醚鄾筭燭董歌暯鰡簶硤盥舲挚毎锋嵕遷俨鈬炬慂退齫擳">
+</node>
+<node CREATED="1353347732000" ID="ID_1561" MODIFIED="1353347732000" TEXT="虜觸證揎斘皤啗嚷囊圖掠瓤鶰貈愯櫔鮶仁瀔塡讏杰錫瓽">
+</node>
+<node CREATED="1353347768000" ID="ID_1562" MODIFIED="1353347768000" TEXT="曽懁惰扑圚燔讉蠷煈榙誋軪玬暆缲爒娳蚗勘馳烷栆軳峏">
+</node>
+<node CREATED="1353347804000" ID="ID_1563" MODIFIED="1353347804000" TEXT="ooackpn v xxgqupwyprs nm">
+</node>
+<node CREATED="1353347833000" ID="ID_1564" MODIFIED="1353347833000" TEXT="l htxgbrskju hmkxnp ykf">
+</node>
+<node CREATED="1353347866000" ID="ID_1565" MODIFIED="1353347866000" TEXT="祊犘怵旰軮崩鞆慪跦胺柉鱭壽宧筯承補坡欨攄釪翓嬌陵">
+</node>
+<node CREATED="1353347891000" ID="ID_1566" MODIFIED="1353347891000" TEXT="voav c c ssgypukpcue p d">
+</node>
+<node CREATED="1353347940000" ID="ID_1567" MODIFIED="1353347940000" TEXT="nnfuh mwa ow eay mubgcfd">
+</node>
+<node CREATED="1353347949000" ID="ID_1568" MODIFIED="1353347949000" TEXT="ojcniuload  kcyxjr ovog">
+</node>
+<node CREATED="1353347975000" ID="ID_1569" MODIFIED="1353347975000" TEXT="縈簲唕駧穚胝騴燙偱技渫礈冂觩掵哗苠邰着饠袸沟染察">
+</node>
+<node CREATED="1353348033000" ID="ID_1570" MODIFIED="1353348033000" TEXT="ghstdmlsohgpxetkejhgmurg">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353348074000" ID="ID_1571" MODIFIED="1353348074000" TEXT="睁鰀抬圪嶝陇湫溡訄歖鬻娨唽斯稞捐庶氍洴飌煍丆臭裌">
+</node>
+<node CREATED="1353348101000" ID="ID_1572" MODIFIED="1353348101000" TEXT="妌吁郺骈楰愊呹鰳鄛孜乜蜂沫邬沔鲂迍褖蹙试凈塨玜墚">
+</node>
+<node CREATED="1353348117000" ID="ID_1573" MODIFIED="1353348117000" TEXT="罢穻鎟涺悝隚頷浯婦頑憙峁鐣搏泱輊傦凡蟤瀢坜爤鐒署">
+</node>
+<node CREATED="1353348134000" ID="ID_1574" MODIFIED="1353348134000" TEXT="nvuvccrugri dcj nnoqdjb">
+</node>
+<node CREATED="1353348166000" ID="ID_1575" MODIFIED="1353348166000" TEXT="谊媤諧嵄鼺腔駀妀维陶艖捣恴臓浯礶遧邝殦箜呁枤稣彇">
+</node>
+<node CREATED="1353348169000" ID="ID_1576" MODIFIED="1353348169000" TEXT="pyjmtpdzonyahqyourhd w z">
+</node>
+<node CREATED="1353348211000" ID="ID_1577" MODIFIED="1353348211000" TEXT="x   foxtttfxecjcd w y fu">
+</node>
+<node CREATED="1353348224000" ID="ID_1578" MODIFIED="1353348224000" TEXT="cqdaloag hkf xtluxkln">
+</node>
+<node CREATED="1353348230000" ID="ID_1579" MODIFIED="1353348230000" TEXT="o e   ytocijitvcrg y  f">
+</node>
+<node CREATED="1353348252000" ID="ID_1580" MODIFIED="1353348252000" TEXT="赗惢红钇窢甤状犃桋褣禫劘巺齕伡粇垜弋嚎渎钨鳹鬉骖">
+</node>
+<node CREATED="1353348285000" ID="ID_1581" MODIFIED="1353348285000" TEXT="lcen ote rj   pffowsxni">
+</node>
+<node CREATED="1353348292000" ID="ID_1582" MODIFIED="1353348292000" TEXT="緁铹琣蹞岞髟悸継劮霎枀峰婒輶墁说躤鶶專瑴捱怜包割">
+</node>
+<node CREATED="1353348342000" ID="ID_1583" MODIFIED="1353348342000" TEXT="x vlclzee q cbcxlrrl   d">
+</node>
+<node CREATED="1353348343000" ID="ID_1584" MODIFIED="1353348343000" TEXT="愤瘸慷徤挲橶薸搬纾衋嘈垈卆蠛丩局癀汫鲼篒镊箝彀搸">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353348350000" ID="ID_1585" MODIFIED="1353348350000" TEXT="茖刮鉯垾媯湘姛廮幌耴奴鲮薨褿飢赠椯壛俹夔梶觽切穠">
+</node>
+<node CREATED="1353348391000" ID="ID_1586" MODIFIED="1353348391000" TEXT="t ektcx gq j ow naa s xf">
+</node>
+<node CREATED="1353348401000" ID="ID_1587" MODIFIED="1353348401000" TEXT="q  s ol psbtya dxxxtmb">
+</node>
+<node CREATED="1353348412000" ID="ID_1588" MODIFIED="1353348412000" TEXT="晭诒眺臲汝蜧驧镪冱岳尲渓俟愕篃斏橼螄垕棻篥聱遘娴">
+</node>
+<node CREATED="1353348471000" ID="ID_1589" MODIFIED="1353348471000" TEXT="峓诀稢瘙滀鹕畱赣睨嗍鑸娣灈伶癌襠酑琂胾腒毸寠捦癵">
+</node>
+<node CREATED="1353348491000" ID="ID_1590" MODIFIED="1353348491000" TEXT="wuwvou  lvpyr lybomcpmws">
+</node>
+<node CREATED="1353348511000" ID="ID_1591" MODIFIED="1353348511000" TEXT="晢慶蕊函鯂樗掍黲鄹揋欤澝焄嫣嚩隒袭銪沾疚墉銐裬陎">
+</node>
+<node CREATED="1353348518000" ID="ID_1592" MODIFIED="1353348518000" TEXT="ls vahdpk mcbxagjhngycun">
+</node>
+</node>
+<node CREATED="1353348526000" ID="ID_1593" MODIFIED="1353348526000" TEXT="t gnolgwzubx mal ogt">
+<icon BUILTIN="help"/>
+<node CREATED="1353348572000" ID="ID_1594" MODIFIED="1353348572000" TEXT="eouxnanjq   adt cebd jje">
+</node>
+<node CREATED="1353348601000" ID="ID_1595" MODIFIED="1353348601000" TEXT="iubcyvtznqykry pm voyud">
+</node>
+<node CREATED="1353348659000" ID="ID_1596" MODIFIED="1353348659000" TEXT="ibzpfnf puv gif nefxn jk">
+</node>
+<node CREATED="1353348710000" ID="ID_1597" MODIFIED="1353348710000" TEXT="b k     vcmxhfei rvsr w">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353348726000" ID="ID_1598" MODIFIED="1353348726000" TEXT="ocaxjpakpunia sqfcnltz l">
+</node>
+<node CREATED="1353348729000" ID="ID_1599" MODIFIED="1353348729000" TEXT="aiouz giykydlwibbbvlbcji">
+</node>
+<node CREATED="1353348788000" ID="ID_1600" MODIFIED="1353348788000" TEXT="mb cruinsq an sb bt eojp">
+</node>
+<node CREATED="1353348817000" ID="ID_1601" MODIFIED="1353348817000" TEXT="dkycv hhr  uzqzuhpbjeiro">
+</node>
+<node CREATED="1353348856000" ID="ID_1602" MODIFIED="1353348856000" TEXT="ywllfzc ac hoxkixom    p">
+</node>
+<node CREATED="1353348858000" ID="ID_1603" MODIFIED="1353348858000" TEXT="溷骓鹟渎煴亴擠兆碬艵郰啼溣徻吹蝤廗蟵亴蚻粙閆贙窬">
+</node>
+<node CREATED="1353348871000" ID="ID_1604" MODIFIED="1353348871000" TEXT="xs   jxlftgjhigqde  ffev">
+</node>
+<node CREATED="1353348917000" ID="ID_1605" MODIFIED="1353348917000" TEXT="oxqoyucxhw   xdmaiihjots">
+</node>
+<node CREATED="1353348968000" ID="ID_1606" MODIFIED="1353348968000" TEXT="svuprfh jegifeeu n dkbr">
+</node>
+<node CREATED="1353349015000" ID="ID_1607" MODIFIED="1353349015000" TEXT="產韊鳊跜汒给躺觼蔹冪謈觌粖檊黧稝惐嚩渣蕹煜桨躶箟">
+</node>
+<node CREATED="1353349054000" ID="ID_1608" MODIFIED="1353349054000" TEXT="茥盭泓礽鐸犿攼廊圪昏暙禪伹擳獘玉蘇逡停斳牂摤掸骴">
+</node>
+<node CREATED="1353349090000" ID="ID_1609" MODIFIED="1353349090000" TEXT="dmsubrden b xxdp eoaf p">
+</node>
+<node CREATED="1353349111000" ID="ID_1610" MODIFIED="1353349111000" TEXT="滒粒俌堝餆嬇瑅鲾鍴桷銼佷斈嗿菞概畤輾眜宛悋獍魬徲">
+</node>
+<node CREATED="1353349160000" ID="ID_1611" MODIFIED="1353349160000" TEXT="帆溆鼨嶸螋荺卼樵傐濩俉又笅塸瀉砌謖杢侾翾捛祽窉覀">
+</node>
+<node CREATED="1353349176000" ID="ID_1612" MODIFIED="1353349176000" TEXT="peu  l lb fzovr z kqucyp">
+</node>
+<node CREATED="1353349230000" ID="ID_1613" MODIFIED="1353349230000" TEXT="onnzwgpgv jqootyxzxv gvx">
+</node>
+<node CREATED="1353349237000" ID="ID_1614" MODIFIED="1353349237000" TEXT="ov gavfqa sxbfhpeavqopda">
+</node>
+<node CREATED="1353349290000" ID="ID_1615" MODIFIED="1353349290000" TEXT="闊硥愀嶼撜戞箚麬杙婚繓瀞茮廣倴蝝鞬怇暐諜嬱滹除鏃">
+</node>
+<node CREATED="1353349332000" ID="ID_1616" MODIFIED="1353349332000" TEXT="髮鹶隳砯鶨灠镴耖灋硙埩誝乚篋鲪暾穄菔噤镝禚挛皔鯩">
+</node>
+<node CREATED="1353349367000" ID="ID_1617" MODIFIED="1353349367000" TEXT="nzxgfgondjycefntzp pxuy">
+</node>
+<node CREATED="1353349406000" ID="ID_1618" MODIFIED="1353349406000" TEXT="ar lno zjorwztgz arbuid">
+</node>
+<node CREATED="1353349409000" ID="ID_1619" MODIFIED="1353349409000" TEXT="mfawc sr xpsnyfgitd  qsu">
+</node>
+<node CREATED="1353349441000" ID="ID_1620" MODIFIED="1353349441000" TEXT="ccumoxzmzxcgkdsddsvhpue">
+</node>
+<node CREATED="1353349460000" ID="ID_1621" MODIFIED="1353349460000" TEXT="gfco srw  gxg o bchhgoxf">
+</node>
+<node CREATED="1353349476000" ID="ID_1622" MODIFIED="1353349476000" TEXT="觲烮遧銮髅粿丵蜩粇凙被毴檶済擴嚓畤袌蓇硝煆巐譕伵">
+</node>
+<node CREATED="1353349514000" ID="ID_1623" MODIFIED="1353349514000" TEXT="jv g v  rlojmpgzmks owul">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353349516000" ID="ID_1624" MODIFIED="1353349516000" TEXT="峕疘邟醳抱慟撾倎浣坼吊法紷阡鎻楋膓婠悺首厖漍髦邬">
+</node>
+<node CREATED="1353349542000" ID="ID_1625" MODIFIED="1353349542000" TEXT="厚匣椒桯豞皬醕墌尊痢嵶娋惶葪氚飛忽蟚鳼塍磁齮靓楺">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353349591000" ID="ID_1626" MODIFIED="1353349591000" TEXT="tf qbgl hg g sohvrrsyzxk">
+</node>
+<node CREATED="1353349618000" ID="ID_1627" MODIFIED="1353349618000" TEXT="cedgfnbyyvvcgc ufdjlwhha">
+</node>
+<node CREATED="1353349627000" ID="ID_1628" MODIFIED="1353349627000" TEXT="iptluchkxxqqe cnsofkycdq">
+</node>
+<node CREATED="1353349683000" ID="ID_1629" MODIFIED="1353349683000" TEXT="鯠紕茎豞鬿掓溝褸絖撀渦愽鞞漈磴哒墒籀锪靀鰳殦话痥">
+</node>
+<node CREATED="1353349733000" ID="ID_1630" MODIFIED="1353349733000" TEXT="欁鹚廽榺鶠蠣梕骩索雭簮焺菝湽賌鐈劇瑸鎒椨茚纥驌氅">
+</node>
+<node CREATED="1353349759000" ID="ID_1631" MODIFIED="1353349759000" TEXT="ytcnffqlmsraf  wjuyah  q">
+</node>
+<node CREATED="1353349793000" ID="ID_1632" MODIFIED="1353349793000" TEXT="krixyawsjybgbekkhflbsibb">
+</node>
+<node CREATED="1353349830000" ID="ID_1633" MODIFIED="1353349830000" TEXT="dsllphjwutoa  dtdmm h by">
+</node>
+</node>
+<node CREATED="1353349878000" ID="ID_1634" MODIFIED="1353349878000" TEXT="z  uka u uly ccx oy  wk">
+<node CREATED="1353349927000" ID="ID_1635" MODIFIED="1353349927000" TEXT="b   gwxi  qgmbdlych  e x">
+</node>
+<node CREATED="1353349961000" ID="ID_1636" MODIFIED="1353349961000" TEXT="啛輣鼏螧稦訐對驲岤翫辑鬱閴焦甩憢敆召譒级崐艡蜊汐">
+</node>
+<node CREATED="1353349965000" ID="ID_1637" MODIFIED="1353349965000" TEXT="epkeqfc duct u sgpjucsq">
+</node>
+<node CREATED="1353349989000" ID="ID_1638" MODIFIED="1353349989000" TEXT="兇语幆謨銆宎聞鋃碿仺燓荋亴陹黺隑膰褛厧籱膋妳鞀畞">
+</node>
+<node CREATED="1353349994000" ID="ID_1639" MODIFIED="1353349994000" TEXT="dag  efgymaihiauoimwrwls">
+</node>
+<node CREATED="1353350000000" ID="ID_1640" MODIFIED="1353350000000" TEXT="闲覠疲頕国紋孻莯麞吼猺潠垆襫薌陎懙汬蹿彺孎孭竖襍">
+</node>
+<node CREATED="1353350060000" ID="ID_1641" MODIFIED="1353350060000" TEXT="骜界泇帿亰谵朘薲体砈漕维咳筁既峌钐虐搶堆秓有層松">
+</node>
+<node CREATED="1353350084000" ID="ID_1642" MODIFIED="1353350084000" TEXT="zl eycmqwk faz bl unu ia">
+</node>
+<node CREATED="1353350130000" ID="ID_1643" MODIFIED="1353350130000" TEXT="钴豻擘茨恂庹禙覨蟺粳覷簋寯琓劤飋潒蹣浽甙县嗙潻硩">
+</node>
+<node CREATED="1353350177000" ID="ID_1644" MODIFIED="1353350177000" TEXT="ujyhe zm  myjk wu jms">
+</node>
+<node CREATED="1353350228000" ID="ID_1645" MODIFIED="1353350228000" TEXT="asnn ggb eoetk azagm ylj">
+</node>
+<node CREATED="1353350286000" ID="ID_1646" MODIFIED="1353350286000" TEXT="亽侉苸垓漼葟龞裿磩鞘唋府熏菨蛓蛗濌汏鞀闚閼錈瞍嬋">
+</node>
+<node CREATED="1353350328000" ID="ID_1647" MODIFIED="1353350328000" TEXT="cjfaxwi czp xt  p zzityd">
+</node>
+<node CREATED="1353350350000" ID="ID_1648" MODIFIED="1353350350000" TEXT="vcwtx lza zkg gqoblhi  z">
+</node>
+<node CREATED="1353350357000" ID="ID_1649" MODIFIED="1353350357000" TEXT="n se wo mzl kjpjclsfz y">
+</node>
+<node CREATED="1353350383000" ID="ID_1650" MODIFIED="1353350383000" TEXT="fqvzjgqk eyoqdf bmuf sbv">
+</node>
+<node CREATED="1353350422000" ID="ID_1651" MODIFIED="1353350422000" TEXT="kwryekikhpl lgqfk n exwi">
+<icon BUILTIN="full-1"/>
+</node>
+<node CREATED="1353350451000" ID="ID_1652" MODIFIED="1353350451000" TEXT="h nunl wpbmgmrntnfym glc">
+</node>
+<node CREATED="1353350461000" ID="ID_1653" MODIFIED="1353350461000" TEXT="wskc sjzoofcnl ofe  njf">
+</node>
+<node CREATED="1353350494000" ID="ID_1654" MODIFIED="1353350494000" TEXT="jwnpjsdsitertos eei eymv">
+</node>
+<node CREATED="1353350508000" ID="ID_1655" MODIFIED="1353350508000" TEXT="wy uouayxzadttz pobxtrs">
+</node>
+<node CREATED="1353350545000" ID="ID_1656" MODIFIED="1353350545000" TEXT="嬦炅熻烈缽钴泘卌針櫛蒄颉夜驜鉖诙嬷刿曄瘅彶襕呼蛣">
+</node>
+<node CREATED="1353350597000" ID="ID_1657" MODIFIED="1353350597000" TEXT="zmrvpmb nha tdb  qulngpy">
+</node>
+<node CREATED="1353350615000" ID="ID_1658" MODIFIED="1353350615000" TEXT="锂鑷讷颤蚲浹映槭曆楣噼垶拿朼鬅嚍颶闂瑘劦皎撺袟慮">
+</node>
+<node CREATED="1353350659000" ID="ID_1659" MODIFIED="1353350659000" TEXT="o fdnpohf o v wbvwt yimp">
+</node>
+<node CREATED="1353350694000" ID="ID_1660" MODIFIED="1353350694000" TEXT="zkkmi qc  y  p ltu tuqis">
+</node>
+<node CREATED="1353350720000" ID="ID_1661" MODIFIED="1353350720000" TEXT="pk f  xrj hb fk ervo yy">
+</node>
+<node CREATED="1353350733000" ID="ID_1662" MODIFIED="1353350733000" TEXT="yg fciujbgd  muvilf udv">
+</node>
+<node CREATED="1353350780000" ID="ID_1663" MODIFIED="1353350780000" TEXT="肵髑觽镏朐汳犂楩嘺葻絾纸吤闦誛郹勫憣袆妠憵湢櫻钽">
+</node>
+<node CREATED="1353350837000" ID="ID_1664" MODIFIED="1353350837000" TEXT="琎鉒鑃戈拝跢柪椧襎昔枏纛朐賭倰佢鄅鰁鳓鱂襮澼奉蝭">
+</node>
+<node CREATED="1353350886000" ID="ID_1665" MODIFIED="1353350886000" TEXT="ujkoh pvx w ndjdsbin wlr">
+<icon BUILTIN="full-1"/>
+</node>
+<node CREATED="1353350942000" ID="ID_1666" MODIFIED="1353350942000" TEXT="ui tf hpa husdzaerv wq t">
+</node>
+<node CREATED="1353350975000" ID="ID_1667" MODIFIED="1353350975000" TEXT="hsntquhloj rwmnuaxtsirdf">
+</node>
+<node CREATED="1353351007000" ID="ID_1668" MODIFIED="1353351007000" TEXT="欢捠鯰貉霒琀籫齞庫螉租志圮憍襇崔刁蛅曮獶鈰鶎齪刮">
+<icon BUILTIN="full-1"/>
+</node>
+<node CREATED="1353351020000" ID="ID_1669" MODIFIED="1353351020000" TEXT="djtowsxj gwfgx ocj qdoz">
+</node>
+<node CREATED="1353351051000" ID="ID_1670" MODIFIED="1353351051000" TEXT="aaxnels mw qm  tchvhlnjx">
+</node>
+<node CREATED="1353351065000" ID="ID_1671" MODIFIED="1353351065000" TEXT="矙鴞陔緉湯碒甡祯儰樵秝但黜祈慦密疍绍豕饗蘖詀軛钒">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353351116000" ID="ID_1672" MODIFIED="1353351116000" TEXT="fntw fhtqpq ozssd iyf  t">
+</node>
+<node CREATED="1353351156000" ID="ID_1673" MODIFIED="1353351156000" TEXT="ypfoh   m sa ntstpd  sy">
+</node>
+<node CREATED="1353351206000" ID="ID_1674" MODIFIED="1353351206000" TEXT="蛏庮箐婆曅泥惚然掶轔缳坱匏鋃禓鹖兪戽萿椵彳暑脆叚">
+</node>
+</node>
+<node CREATED="1353351225000" ID="ID_1675" MODIFIED="1353351225000" TEXT="j poqo htwuclko tihezufv">
+<node CREATED="1353351247000" ID="ID_1676" MODIFIED="1353351247000" TEXT="lnw povkxarcxqxt angzw v">
+</node>
+<node CREATED="1353351254000" ID="ID_1677" MODIFIED="1353351254000" TEXT="zp srsgbnwvcia inehbgmmc">
+</node>
+<node CREATED="1353351263000" ID="ID_1678" MODIFIED="1353351263000" TEXT="omg qi sngoq  sppr pbaxd">
+</node>
+<node CREATED="1353351304000" ID="ID_1679" MODIFIED="1353351304000" TEXT="也仅瑕煩箒怵选桷靿晵檛籥囻鳄郖臷霃緪噟狜湿跠褤缦">
+</node>
+<node CREATED="1353351315000" ID="ID_1680" MODIFIED="1353351315000" TEXT="hkk  zcad tmpqbfhulwdjqi">
+</node>
+<node CREATED="1353351354000" ID="ID_1681" MODIFIED="1353351354000" TEXT="arvnocf j mczlucgwwrvewa">
+</node>
+<node CREATED="1353351412000" ID="ID_1682" MODIFIED="1353351412000" TEXT="rst   bqzuuuz lyxh wknkn">
+</node>
+<node CREATED="1353351416000" ID="ID_1683" MODIFIED="1353351416000" TEXT="鵦籿嬖绤狖墍衢蟣櫮竝坪銾玹矒倛螁簅據維诽鷴疲劭囶">
+</node>
+<node CREATED="1353351444000" ID="ID_1684" MODIFIED="1353351444000" TEXT="txsdo groo neoqbejtkrriw">
+</node>
+<node CREATED="1353351482000" ID="ID_1685" MODIFIED="1353351482000" TEXT="wrr pfptzpo pcy jyev cdj">
+</node>
+<node CREATED="1353351522000" ID="ID_1686" MODIFIED="1353351522000" TEXT="zl  ivvptqblytrzggtxbcqm">
+</node>
+<node CREATED="1353351546000" ID="ID_1687" MODIFIED="1353351546000" TEXT="踕淘毫筝滘願尜淬紙鶧嘷醶窙怵鑍楢煞顡滽涪昳鑃庍姂">
+</node>
+<node CREATED="1353351570000" ID="ID_1688" MODIFIED="1353351570000" TEXT="ntbuotf  fkdils jckfnkwg">
+</node>
+<node CREATED="1353351623000" ID="ID_1689" MODIFIED="1353351623000" TEXT="xvtkpxigyh wqqujrlq quao">
+</node>
+<node CREATED="1353351633000" ID="ID_1690" MODIFIED="1353351633000" TEXT="u t o rvmixufgb kwkbtpz">
+</node>
+<node CREATED="1353351662000" ID="ID_1691" MODIFIED="1353351662000" TEXT="蹶弹澶盂顽栘裐辣哩姡核腬送網樗癰聻渕緬鬅蜻蒣赌纠">
+</node>
+<node CREATED="1353351696000" ID="ID_1692" MODIFIED="1353351696000" TEXT="vwnyvhmzeavwsyej nyovbe">
+</node>
+<node CREATED="1353351722000" ID="ID_1693" MODIFIED="1353351722000" TEXT="hqgtojpn  vn esofbiminm">
+</node>
+<node CREATED="1353351768000" ID="ID_1694" MODIFIED="1353351768000" TEXT="a x  x ogmmskstsepeppukz">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353351794000" ID="ID_1695" MODIFIED="1353351794000" TEXT="eiad ehiiexpzeglhl oikxe">
+</node>
+<node CREATED="1353351824000" ID="ID_1696" MODIFIED="1353351824000" TEXT="s  lp ibxxa m cnljpgi cl">
+</node>
+<node CREATED="1353351847000" ID="ID_1697" MODIFIED="1353351847000" TEXT="gcr kbg mxkrnewpbndqbtzy">
+</node>
+<node CREATED="1353351859000" ID="ID_1698" MODIFIED="1353351859000" TEXT="wzfk nmctaxbrwdbvz ruz">
+</node>
+<node CREATED="1353351860000" ID="ID_1699" MODIFIED="1353351860000" TEXT="czllwsokrh ubrzifdor vt">
+</node>
+<node CREATED="1353351906000" ID="ID_1700" MODIFIED="1353351906000" TEXT="mnttxvoftiq   rzt  pqgwi">
+</node>
+<node CREATED="1353351937000" ID="ID_1701" MODIFIED="1353351937000" TEXT="qlgqt yp ctq pvaaznzurua">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353351951000" ID="ID_1702" MODIFIED="1353351951000" TEXT="浓鴉筶乖塆羁緙剪炕邊栝横懜驡条浾坉鹕塄壞釯惌椵杧">
+</node>
+<node CREATED="1353352008000" ID="ID_1703" MODIFIED="1353352008000" TEXT="fnrxeztprd lka   s v zx">
+</node>
+<node CREATED="1353352057000" ID="ID_1704" MODIFIED="1353352057000" TEXT="mnhnlipgpvkcnxuir lreu">
+</node>
+<node CREATED="1353352078000" ID="ID_1705" MODIFIED="1353352078000" TEXT="cqw ohupgjvfabd izjauvb">
+</node>
+<node CREATED="1353352087000" ID="ID_1706" MODIFIED="1353352087000" TEXT="nduul  jo wijgd  z jwl s">
+</node>
+<node CREATED="1353352130000" ID="ID_1707" MODIFIED="1353352130000" TEXT="vqzszvwcdixot zmkgaru xz">
+</node>
+<node CREATED="1353352135000" ID="ID_1708" MODIFIED="1353352135000" TEXT="oefe aqdd p  bbjdyvv i r">
+</node>
+<node CREATED="1353352186000" ID="ID_1709" MODIFIED="1353352186000" TEXT="綷柵佻閉塇获闈鎽队饓趣璟桤埃彋颔勜囎緓洔踒赮貅裄">
+<icon BUILTIN="full-1"/>
+</node>
+<node CREATED="1353352218000" ID="ID_1710" MODIFIED="1353352218000" TEXT="zx iwcsh jgbgbl tf awetn">
+</node>
+<node CREATED="1353352264000" ID="ID_1711" MODIFIED="1353352264000" TEXT="法鱉厪尹怰愻籓鄫啀懬裂覮巣洊軄郣呖劈訔懆鄘鵭趏緞">
+</node>
+<node CREATED="1353352289000" ID="ID_1712" MODIFIED="1353352289000" TEXT="銨歳鐲飒詾棼鳔杨廅皸棟昿蕅秊敹野倘憣牯澞妌仳瓗蔍">
+</node>
+<node CREATED="1353352300000" ID="ID_1713" MODIFIED="1353352300000" TEXT="栝烟楽凴橕泞樸嘏鲣壬鱉摹廂椝鵉荑雥缲鲅鼘窩蠼巣鑜">
+</node>
+<node CREATED="1353352327000" ID="ID_1714" MODIFIED="1353352327000" TEXT="fmuc uddkinab lhquknvpoc">
+</node>
+<node CREATED="1353352372000" ID="ID_1715" MODIFIED="1353352372000" TEXT="颗爭橖橓望寑椾焽班讴鵚鈯俒茮扶栽躽伊冣祆迋瞯闩鞒">
+<icon BUILTIN="stop"/>
+</node>
+</node>
+<node CREATED="1353352431000" ID="ID_1716" MODIFIED="1353352431000" TEXT="坧倳瓇粸鴡矖柰屔岾现癉穝朜箅顉簝糔籱湶婖樣尐采麚">
+<node CREATED="1353352461000" ID="ID_1717" MODIFIED="1353352461000" TEXT="jfyzqfhy ts  qcw l drwwf">
+</node>
+<node CREATED="1353352508000" ID="ID_1718" MODIFIED="1353352508000" TEXT="judptjpalk ceokcwhqii a">
+</node>
+<node CREATED="1353352534000" ID="ID_1719" MODIFIED="1353352534000" TEXT="njcze  wclfuq  npz nfh v">
+</node>
+<node CREATED="1353352537000" ID="ID_1720" MODIFIED="1353352537000" TEXT="n  hcrleqdfe nz e shwdwv">
+</node>
+<node CREATED="1353352591000" ID="ID_1721" MODIFIED="1353352591000" TEXT="clljk anukexsmjqhtim ybw">
+</node>
+<node CREATED="1353352627000" ID="ID_1722" MODIFIED="1353352627000" TEXT="qqh  z esgvfwqdbrv gve o">
+</node>
+<node CREATED="1353352663000" ID="ID_1723" MODIFIED="1353352663000" TEXT="x fh e hnhfb jphwk cl q">
+</node>
+<node CREATED="1353352696000" ID="ID_1724" MODIFIED="1353352696000" TEXT="p lb kucdpxuqb pmm xb ff">
+</node>
+<node CREATED="1353352705000" ID="ID_1725" MODIFIED="1353352705000" TEXT="rmoowjyrtb olysk wvc bbg">
+</node>
+<node CREATED="1353352745000" ID="ID_1726" MODIFIED="1353352745000" TEXT="xbyy  xioaolbdqhwmewn qr">
+</node>
+<node CREATED="1353352793000" ID="ID_1727" MODIFIED="1353352793000" TEXT="洊擖愭鎬艩韣菂娆虗構搛錠觻鑾塦幙挥棅渫趙芿焚戙褕">
+</node>
+<node CREATED="1353352846000" ID="ID_1728" MODIFIED="1353352846000" TEXT="暟圝洋演綈瀲姕遮倝倚糽婗萸晕習賄滏掌翼瀑鴻鑾豣誎">
+</node>
+<node CREATED="1353352882000" ID="ID_1729" MODIFIED="1353352882000" TEXT="ukg jpojfileoa xbygyxjks">
+</node>
+<node CREATED="1353352886000" ID="ID_1730" MODIFIED="1353352886000" TEXT="勇飽磴稅灝撑夑蟧墻獮偙伴卤灮涃瞗蒸畲輨蘁呑橢奄嵼">
+</node>
+<node CREATED="1353352923000" ID="ID_1731" MODIFIED="1353352923000" TEXT="sfdczoj j ym ychrsygzdme">
+</node>
+<node CREATED="1353352937000" ID="ID_1732" MODIFIED="1353352937000" TEXT="蔱攸埱嗁毼嵛茓琪湓偀橉颇趏順纰靾任莥塦鮘糕懄蜒迡">
+</node>
+<node CREATED="1353352950000" ID="ID_1733" MODIFIED="1353352950000" TEXT="縨觩爣蕆壺罳墔靟争襳烮颣裔靏詥姺擉撐翠艛攔夽涖颻">
+</node>
+<node CREATED="1353353009000" ID="ID_1734" MODIFIED="1353353009000" TEXT="跹膿珛曎侇螩鐃蠲瞽哮欫薱嶚締妧飺譬蹊觵瞚夸轥邹惩">
+</node>
+<node CREATED="1353353063000" ID="ID_1735" MODIFIED="1353353063000" TEXT="鐷導犯潶鬃噡鋦協僗痑攩茄倅捷件隌認玃珎鄗帡讓鼓猈">
+</node>
+<node CREATED="1353353079000" ID="ID_1736" MODIFIED="1353353079000" TEXT="jbedngpkvyp o derdcbrxer">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353353106000" ID="ID_1737" MODIFIED="1353353106000" TEXT="od f lzi km v ta txlvnin">
+</node>
+<node CREATED="1353353108000" ID="ID_1738" MODIFIED="1353353108000" TEXT="pmj odstdrvpe  ntbtsrebi">
+</node>
+<node CREATED="1353353131000" ID="ID_1739" MODIFIED="1353353131000" TEXT="ehxjuijic zoxegf    wemb">
+</node>
+<node CREATED="1353353149000" ID="ID_1740" MODIFIED="1353353149000" TEXT="g pyarnupkfczxa bgswd wr">
+</node>
+<node CREATED="1353353161000" ID="ID_1741" MODIFIED="1353353161000" TEXT="l b sbemvptbxxglsrzaxahd">
+</node>
+<node CREATED="1353353170000" ID="ID_1742" MODIFIED="1353353170000" TEXT="obh e soml fqlcxqmknbfoh">
+</node>
+<node CREATED="1353353217000" ID="ID_1743" MODIFIED="1353353217000" TEXT="閥踅绷殥謽鱴思猱虙郡趉荔垠钌玱賯瞢諦巪徎迩颋蓺頼">
+</node>
+<node CREATED="1353353223000" ID="ID_1744" MODIFIED="1353353223000" TEXT="ee r xzp tiewehxdcobdnpf">
+</node>
+<node CREATED="1353353226000" ID="ID_1745" MODIFIED="1353353226000" TEXT="vioi wfxasfkolw nzsorj i">
+</node>
+<node CREATED="1353353230000" ID="ID_1746" MODIFIED="1353353230000" TEXT="hqgormbkkx syo kloxwn ui">
+</node>
+<node CREATED="1353353276000" ID="ID_1747" MODIFIED="1353353276000" TEXT="pjde twtsg q fgxlqaegsfv">
+</node>
+<node CREATED="1353353317000" ID="ID_1748" MODIFIED="1353353317000" TEXT="尺棏獿賀靐琻赳錐帤襁止适钢烡瀍湂寂俒簼舎縰墇级澄">
+</node>
+<node CREATED="1353353347000" ID="ID_1749" MODIFIED="1353353347000" TEXT="ixgidhaqhw jvhfnxsvjxsxl">
+</node>
+<node CREATED="1353353381000" ID="ID_1750" MODIFIED="1353353381000" TEXT="筘铟瞁鳨怮銡聙闸呓窃氿蕾霵颚郳糢晹姈艘欕黜炳塀岐">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353353410000" ID="ID_1751" MODIFIED="1353353410000" TEXT="xkc ahitzbdbxhbmt qfszji">
+</node>
+<node CREATED="1353353454000" ID="ID_1752" MODIFIED="1353353454000" TEXT="kmslld elhr wtpxnvcdfuqc">
+</node>
+<node CREATED="1353353497000" ID="ID_1753" MODIFIED="1353353497000" TEXT="凮澾峳鮳溻腆甔捹婓赅坃汕墸遯鱻祟耉凳疗匚跊靎锶畇">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353353501000" ID="ID_1754" MODIFIED="1353353501000" TEXT="fkx hyofctjrkkxlmpuwekhu">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353353517000" ID="ID_1755" MODIFIED="1353353517000" TEXT="r mkpkrtiboobscwym   szh">
+<icon BUILTIN="stop"/>
+</node>
+<node CREATED="1353353568000" ID="ID_1756" MODIFIED="1353353568000" TEXT="bs rchnyeynuzdh k afuchj">
+</node>
+</node>
+<node CREATED="1353353590000" ID="ID_1757" MODIFIED="1353353590000" TEXT="m fnyxssvdalnlawt bhk  i">
+<node CREATED="1353353609000" ID="ID_1758" MODIFIED="1353353609000" TEXT="vzknkz ftak lqvyivwalivl">
+</node>
+<node CREATED="1353353660000" ID="ID_1759" MODIFIED="1353353660000" TEXT="juvmwp ikoja p c ay mfyo">
+</node>
+<node CREATED="1353353706000" ID="ID_1760" MODIFIED="1353353706000" TEXT="c ctm u gfmd xwwmk    u">
+</node>
+<node CREATED="1353353714000" ID="ID_1761" MODIFIED="1353353714000" TEXT="dun o r snfjumgksce uz s">
+</node>
+<node CREATED="1353353722000" ID="ID_1762" MODIFIED="1353353722000" TEXT="qxfqcsfodle cs u g nso v">
+</node>
+<node CREATED="1353353735000" ID="ID_1763" MODIFIED="1353353735000" TEXT="gt dehl rmj vxnpuh hao h">
+</node>
+<node CREATED="1353353761000" ID="ID_1764" MODIFIED="1353353761000" TEXT="n kcer aymk  iq agzhtzyv">
+</node>
+<node CREATED="1353353804000" ID="ID_1765" MODIFIED="1353353804000" TEXT="fxhc ifawcic xkefztmkvtg">
+</node>
+<node CREATED="1353353818000" ID="ID_1766" MODIFIED="1353353818000" TEXT="垽縭豐鮈娥誂峗駩銹粕敻辰帟迾郩屘猎籄噏瓦鄠観賛贙">
+</node>
+<node CREATED="1353353868000" ID="ID_1767" MODIFIED="1353353868000" TEXT="olitswk lezbpyqfoqkkjx x">
+</node>
+<node CREATED="1353353910000" ID="ID_1768" MODIFIED="1353353910000" TEXT="裱庯遟璐鄎椽煡闥櫾臎蛽繝獛腵靲卖艵舥揨钫旃匹龅縼">
+</node>
+<node CREATED="1353353917000" ID="ID_1769" MODIFIED="1353353917000" TEXT="f sososbddpvumam ybk mkr">
+</node>
+<node CREATED="1353353921000" ID="ID_1770" MODIFIED="1353353921000" TEXT="讼日擆玊蚞酣據迦黃冿蛦罉敻桖誻鯚芸胪锿鞘壱甛躄趄">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353353935000" ID="ID_1771" MODIFIED="1353353935000" TEXT="峠劶彖魝澯鬇滩膚幑傪姠堲市韱崸泫价活堂婻覝亮鯻譆">
+</node>
+<node CREATED="1353353955000" ID="ID_1772" MODIFIED="1353353955000" TEXT="hoptenqkdifg mgf fk uquc">
+</node>
+<node CREATED="1353353970000" ID="ID_1773" MODIFIED="1353353970000" TEXT="z hbmiktjkbbyjek  oql">
+</node>
+<node CREATED="1353354026000" ID="ID_1774" MODIFIED="1353354026000" TEXT="gikrr g lz venpmavibf un">
+</node>
+<node CREATED="1353354069000" ID="ID_1775" MODIFIED="1353354069000" TEXT="z k zbj bc b whlvyskursz">
+</node>
+<node CREATED="1353354127000" ID="ID_1776" MODIFIED="1353354127000" TEXT="a qx hu kurx jexwc fynoy">
+</node>
+<node CREATED="1353354184000" ID="ID_1777" MODIFIED="1353354184000" TEXT="rvrnd od ddhhldnzbipfa">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353354194000" ID="ID_1778" MODIFIED="1353354194000" TEXT="atcxwbq  eouydjhjhbb s a">
+</node>
+<node CREATED="1353354224000" ID="ID_1779" MODIFIED="1353354224000" TEXT="蟨膷楾倌螏誥倚雳锫澟獈挡鯇圍萔軬幓鴸继筳骮街煯段">
+</node>
+<node CREATED="1353354275000" ID="ID_1780" MODIFIED="1353354275000" TEXT="kcaclk efbyoabfergfy ivv">
+</node>
+<node CREATED="1353354329000" ID="ID_1781" MODIFIED="1353354329000" TEXT="sh bpaoukd bhg  bwzr lx">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353354345000" ID="ID_1782" MODIFIED="1353354345000" TEXT="qfwkfxqjn  tnnwrua ilz k">
+</node>
+<node CREATED="1353354393000" ID="ID_1783" MODIFIED="1353354393000" TEXT="oz ka pibaerpfx s rghhxc">
+</node>
+<node CREATED="1353354432000" ID="ID_1784" MODIFIED="1353354432000" TEXT="kyvqv t fwk yeqf ylckrxv">
+</node>
+<node CREATED="1353354473000" ID="ID_1785" MODIFIED="1353354473000" TEXT="ita mz klfqencp  tsmqu">
+</node>
+<node CREATED="1353354480000" ID="ID_1786" MODIFIED="1353354480000" TEXT="ucqq jih  hfhdtsbk lgem">
+<icon BUILTIN="help"/>
+</node>
+<node CREATED="1353354536000" ID="ID_1787" MODIFIED="1353354536000" TEXT="w jr  t np mvdeamyhkolax">
+</node>
+<node CREATED="1353354564000" ID="ID_1788" MODIFIED="1353354564000" TEXT="纨糼堡璀驧糼馢掭糊蕫靿骄湄杰餼瑈擬缕萆鯻軇褕巠奎">
+</node>
+<node CREATED="1353354595000" ID="ID_1789" MODIFIED="1353354595000" TEXT="hgba mhylqdpecl  ycklqey">
+</node>
+<node CREATED="1353354619000" ID="ID_1790" MODIFIED="1353354619000" TEXT="隉麖籅橺迒裴沉陱鍰泸蒻絙殇砎袟撺于閝密拜菻贊嗝蕞">
+</node>
+<node CREATED="1353354659000" ID="ID_1791" MODIFIED="1353354659000" TEXT="p  tiiwilp   alvo vs t s">
+</node>
+<node CREATED="1353354715000" ID="ID_1792" MODIFIED="1353354715000" TEXT="qnhmnfvtlhjnigupjaqvb pj">
+</node>
+<node CREATED="1353354756000" ID="ID_1793" MODIFIED="1353354756000" TEXT="钦蹠竡鍃搕霻愯榝姜蹩眖璖钢箍寠茵熦婔桌煊啭吂盡璸">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353354816000" ID="ID_1794" MODIFIED="1353354816000" TEXT="kcijbyvixhgwwjbutuefpmp">
+<icon BUILTIN="full-1"/>
+</node>
+<node CREATED="1353354817000" ID="ID_1795" MODIFIED="1353354817000" TEXT="ua ktyq omdrwnqgic czyyb">
+</node>
+<node CREATED="1353354862000" ID="ID_1796" MODIFIED="1353354862000" TEXT="桕嶔徕髧种柶羑阾壔僺顓魋幜髫瑊枳鯩呥擩錤婲鹛贴汓">
+</node>
+<node CREATED="1353354874000" ID="ID_1797" MODIFIED="1353354874000" TEXT="cipykgow t ce iq cfx re">
+</node>
+</node>
+<node CREATED="1353354875000" ID="ID_1798" MODIFIED="1353354875000" TEXT="h ltoqzvlvr o mzda uvo">
+<node CREATED="1353354907000" ID="ID_1799" MODIFIED="1353354907000" TEXT="击柴鹂峟祅疠堝帮鳙汲瀝鄭殴橀穓鉃镞嬵腂仹荊羡碀析">
+</node>
+<node CREATED="1353354922000" ID="ID_1800" MODIFIED="1353354922000" TEXT="zlrdrhxzwz  xdetxr f z">
+</node>
+<node CREATED="1353354962000" ID="ID_1801" MODIFIED="1353354962000" TEXT="杕娴碠荛兯篕東谟飑鬺枆滜銢麙譅烾赪繣脕褅翍閻旤觟">
+</node>
+<node CREATED="1353355022000" ID="ID_1802" MODIFIED="1353355022000" TEXT="rt ufarrskpeuyzugkstkgl">
+</node>
+<node CREATED="1353355046000" ID="ID_1803" MODIFIED="1353355046000" TEXT="oxgq gtashkzo n uiuocps">
+</node>
+<node CREATED="1353355070000" ID="ID_1804" MODIFIED="1353355070000" TEXT="nrquy nwcoar d f dymutzn">
+</node>
+<node CREATED="1353355107000" ID="ID_1805" MODIFIED="1353355107000" TEXT="飘鯸箔拒泛癨魜签袺粻縇郝碇矿纎竄鄕銰蓅銩焭憪蟈靤">
+</node>
+<node CREATED="1353355163000" ID="ID_1806" MODIFIED="1353355163000" TEXT="萭鮩彔狢遬桔窢阸瑢败嫓亭嶍総颙鑯烓碢糩橇荣螝欿藃">
+</node>
+<node CREATED="1353355193000" ID="ID_1807" MODIFIED="1353355193000" TEXT="fzwdmkgjli  poddaqlqexmf">
+</node>
+<node CREATED="1353355206000" ID="ID_1808" MODIFIED="1353355206000" TEXT="db zosrioswtxv  xzvwbvgx">
+</node>
+<node CREATED="1353355218000" ID="ID_1809" MODIFIED="1353355218000" TEXT="u ljs shqabzwndwqvezrcrk">
+</node>
+<node CREATED="1353355271000" ID="ID_1810" MODIFIED="1353355271000" TEXT="nbrz cxdfy cciuioglkbfom">
+</node>
+<node CREATED="1353355309000" ID="ID_1811" MODIFIED="1353355309000" TEXT="bsi vyxv dpjj  a uj ertz">
+</node>
+<node CREATED="1353355312000" ID="ID_1812" MODIFIED="1353355312000" TEXT="臋袄遅髓葐乧獧瑙贺澏垟穆畲詋櫥眂腺葸隽餰汬給沣慺">
+</node>
+<node CREATED="1353355316000" ID="ID_1813" MODIFIED="1353355316000" TEXT="nidsctgffnovcispkpkc ry">
+</node>
+<node CREATED="1353355346000" ID="ID_1814" MODIFIED="1353355346000" TEXT="邻毤郤楡綷膞阉嶕岶鲎舋祼榰鲼蟟櫶潕儋妦誟辺八雔藂">
+<icon BUILTIN="button_ok"/>
+</node>
+<node CREATED="1353355404000" ID="ID_1815" MODIFIED="1353355404000" TEXT="puhipuvpmxbezh b  iyesgv">
+</node>
+<node CREATED="1353355414000" ID="ID_1816" MODIFIED="1353355414000" TEXT="b bikwulainntijpbz ynz q">
+</node>
+<node CREATED="1353355420000" ID="ID_1817" MODIFIED="1353355420000" TEXT="断嗭闽璗溸喇怃逥矶寤婶肟铚蒌嚕赻閍遙颰就嫙抚獳记">
+</node>
+<node CREATED="1353355466000" ID="ID_1818" MODIFIED="1353355466000" TEXT="uwlzzic aosokkamwhqdtjkf">
+</node>
+<node CREATED="1353355520000" ID="ID_1819" MODIFIED="1353355520000" TEXT="bhd yp bnkgwsf neh jaouh">
+</node>
+<node CREATED="1353355578000" ID="ID_1820" MODIFIED="1353355578000" TEXT="常辭葦醶薪欅磯欪鹠瘞撅鳕靏矮蕾佑郼净趁悪衲矶頿硥">
+</node>
+<node CREATED="1353355605000" ID="ID_1821" MODIFIED="1353355605000" TEXT="j mxdynpqitmigwpsxerqepx">
+</node>
+<node CREATED="1353355608000" ID="ID_1822" MODIFIED="1353355608000" TEXT="nehhljrt w mlmaoom  ytvu">
+</node>
+<node CREATED="1353355621000" ID="ID_1823" MODIFIED="1353355621000" TEXT="ydo afnndkbknzdli dyyri">
+</node>
+<node CREATED="1353355642000" ID="ID_1824" MODIFIED="1353355642000" TEXT="梁獺餒旾淫菴啋晋橑殾餳殱鸫鴀橚慎蒩塳鰣祅妵顂披次">
+</node>
+<node CREATED="1353355652000" ID="ID_1825" MODIFIED="1353355652000" TEXT="餝命諃讅冟跇磚湗擇攵銜兕汤褓坾顔僙電毦壉亘鵽讦韸">
+</node>
+<node CREATED="1353355695000" ID="ID_1826" MODIFIED="1353355695000" TEXT="蝟蟎飃铳咛賗宜氿炁挟肙硕駵譼鎟勸餘腝圷嫧徸顺鈢氢">
+</node>
+<node CREATED="1353355746000" ID="ID_1827" MODIFIED="1353355746000" TEXT="nqwbgteatul ucabgtvsbb m">
+</node>
+<node CREATED="1353355790000" ID="ID_1828" MODIFIED="1353355790000" TEXT="蓭垜蚕菛鴴嶜銎抓奕眹眡姝禴厌悯榺矿龀拔熵榽钮瘕蛩">
+</node>
+<node CREATED="1353355807000" ID="ID_1829" MODIFIED="1353355807000" TEXT="xmlorlpasdaidmnpwp heqcm">
+</node>
+<node CREATED="1353355849000" ID="ID_1830" MODIFIED="1353355849000" TEXT="檫斫巼衾糟唍蝎魢獲鶦寐閵泶齫岅愾侱禿儞察鄒裨皭鶙">
+</node>
+<node CREATED="1353355908000" ID="ID_1831" MODIFIED="1353355908000" TEXT="qtrwba  llf  eqjrlhafv e">
+<icon BUILTIN="idea"/>
+</node>
+<node CREATED="1353355961000" ID="ID_1832" MODIFIED="1353355961000" TEXT="dkcmkvn f l ittkfdmsg mf">
+</node>
+<node CREATED="1353355992000" ID="ID_1833" MODIFIED="1353355992000" TEXT="薊及夬钹醑埢顙閽酪渶嘚剮輱鋚擶勨韎癓稵漖溟溑喍怼">
+</node>
+<node CREATED="1353356027000" ID="ID_1834" MODIFIED="1353356027000" TEXT="jd qojstis tmx hdgnawrl">
+</node>
+<node CREATED="1353356071000" ID="ID_1835" MODIFIED="1353356071000" TEXT="蓀嘲盖纖衢鬱価辑瓽褌軑殗贆盾碥悼蝠螚竨靮裤崆檁詏">
+</node>
+<node CREATED="1353356079000" ID="ID_1836" MODIFIED="1353356079000" TEXT="qdh shgyj nepuxextpwasan">
+</node>
+<node CREATED="1353356132000" ID="ID_1837" MODIFIED="1353356132000" TEXT="挻铁鳰楏叜経欛鞵檑槫阍慦壎汙臷敞擿嫰蕗訢爀嬎縼橝">
+</node>
+<node CREATED="1353356148000" ID="ID_1838" MODIFIED="1353356148000" TEXT="onjc ocnjagu bntslcshnke">
+</node>
+</node>
+<node CREATED="1353356171000" ID="ID_1839" MODIFIED="1353356171000" TEXT="Tables">
+<node CREATED="1353356212000" ID="ID_1840" MODIFIED="1353356212000" TEXT="__table__">
+<node CREATED="1353356237000" ID="ID_1841" MODIFIED="1353356237000" TEXT="row 0">
+<node CREATED="1353356242000" ID="ID_1842" MODIFIED="1353356242000" TEXT="cell 0.0">
+</node>
+<node CREATED="1353356301000" ID="ID_1843" MODIFIED="1353356301000" TEXT="cell 0.1">
+</node>
+<node CREATED="1353356361000" ID="ID_1844" MODIFIED="1353356361000" TEXT="cell 0.2">
+</node>
+</node>
+<node CREATED="1353356403000" ID="ID_1845" MODIFIED="1353356403000" TEXT="row 1">
+<node CREATED="1353356454000" ID="ID_1846" MODIFIED="1353356454000" TEXT="cell 1.0">
+</node>
+<node CREATED="1353356477000" ID="ID_1847" MODIFIED="1353356477000" TEXT="cell 1.1">
+</node>
+<node CREATED="1353356536000" ID="ID_1848" MODIFIED="1353356536000" TEXT="cell 1.2">
+</node>
+</node>
+<node CREATED="1353356587000" ID="ID_1849" MODIFIED="1353356587000" TEXT="row 2">
+<node CREATED="1353356595000" ID="ID_1850" MODIFIED="1353356595000" TEXT="cell 2.0">
+</node>
+<node CREATED="1353356653000" ID="ID_1851" MODIFIED="1353356653000" TEXT="cell 2.1">
+</node>
+<node CREATED="1353356681000" ID="ID_1852" MODIFIED="1353356681000" TEXT="cell 2.2">
+</node>
+</node>
+<node CREATED="1353356733000" ID="ID_1853" MODIFIED="1353356733000" TEXT="row 3">
+<node CREATED="1353356762000" ID="ID_1854" MODIFIED="1353356762000" TEXT="cell 3.0">
+</node>
+<node CREATED="1353356771000" ID="ID_1855" MODIFIED="1353356771000" TEXT="cell 3.1">
+</node>
+<node CREATED="1353356803000" ID="ID_1856" MODIFIED="1353356803000" TEXT="cell 3.2">
+</node>
+</node>
+<node CREATED="1353356815000" ID="ID_1857" MODIFIED="1353356815000" TEXT="row 4">
+<node CREATED="1353356830000" ID="ID_1858" MODIFIED="1353356830000" TEXT="cell 4.0">
+</node>
+<node CREATED="1353356890000" ID="ID_1859" MODIFIED="1353356890000" TEXT="cell 4.1">
+</node>
+<node CREATED="1353356912000" ID="ID_1860" MODIFIED="1353356912000" TEXT="cell 4.2">
+</node>
+</node>
+<node CREATED="1353356946000" ID="ID_1861" MODIFIED="1353356946000" TEXT="row 5">
+<node CREATED="1353356947000" ID="ID_1862" MODIFIED="1353356947000" TEXT="cell 5.0">
+</node>
+<node CREATED="1353356950000" ID="ID_1863" MODIFIED="1353356950000" TEXT="cell 5.1">
+</node>
+<node CREATED="1353356970000" ID="ID_1864" MODIFIED="1353356970000" TEXT="cell 5.2">
+</node>
+</node>
+<node CREATED="1353357019000" ID="ID_1865" MODIFIED="1353357019000" TEXT="row 6">
+<node CREATED="1353357037000" ID="ID_1866" MODIFIED="1353357037000" TEXT="cell 6.0">
+</node>
+<node CREATED="1353357041000" ID="ID_1867" MODIFIED="1353357041000" TEXT="cell 6.1">
+</node>
+<node CREATED="1353357064000" ID="ID_1868" MODIFIED="1353357064000" TEXT="cell 6.2">
+</node>
+</node>
+<node CREATED="1353357097000" ID="ID_1869" MODIFIED="1353357097000" TEXT="row 7">
+<node CREATED="1353357114000" ID="ID_1870" MODIFIED="1353357114000" TEXT="cell 7.0">
+</node>
+<node CREATED="1353357173000" ID="ID_1871" MODIFIED="1353357173000" TEXT="cell 7.1">
+</node>
+<node CREATED="1353357214000" ID="ID_1872" MODIFIED="1353357214000" TEXT="cell 7.2">
+</node>
+</node>
+<node CREATED="1353357234000" ID="ID_1873" MODIFIED="1353357234000" TEXT="row 8">
+<node CREATED="1353357260000" ID="ID_1874" MODIFIED="1353357260000" TEXT="cell 8.0">
+</node>
+<node CREATED="1353357313000" ID="ID_1875" MODIFIED="1353357313000" TEXT="cell 8.1">
+</node>
+<node CREATED="1353357321000" ID="ID_1876" MODIFIED="1353357321000" TEXT="cell 8.2">
+</node>
+</node>
+<node CREATED="1353357357000" ID="ID_1877" MODIFIED="1353357357000" TEXT="row 9">
+<node CREATED="1353357370000" ID="ID_1878" MODIFIED="1353357370000" TEXT="cell 9.0">
+</node>
+<node CREATED="1353357421000" ID="ID_1879" MODIFIED="1353357421000" TEXT="cell 9.1">
+</node>
+<node CREATED="1353357447000" ID="ID_1880" MODIFIED="1353357447000" TEXT="cell 9.2">
+</node>
+</node>
+<node CREATED="1353357468000" ID="ID_1881" MODIFIED="1353357468000" TEXT="row 10">
+<node CREATED="1353357509000" ID="ID_1882" MODIFIED="1353357509000" TEXT="cell 10.0">
+</node>
+<node CREATED="1353357545000" ID="ID_1883" MODIFIED="1353357545000" TEXT="cell 10.1">
+</node>
+<node CREATED="1353357580000" ID="ID_1884" MODIFIED="1353357580000" TEXT="cell 10.2">
+</node>
+</node>
+<node CREATED="1353357627000" ID="ID_1885" MODIFIED="1353357627000" TEXT="row 11">
+<node CREATED="1353357676000" ID="ID_1886" MODIFIED="1353357676000" TEXT="cell 11.0">
+</node>
+<node CREATED="1353357710000" ID="ID_1887" MODIFIED="1353357710000" TEXT="cell 11.1">
+</node>
+<node CREATED="1353357732000" ID="ID_1888" MODIFIED="1353357732000" TEXT="cell 11.2">
+</node>
+</node>
+<node CREATED="1353357750000" ID="ID_1889" MODIFIED="1353357750000" TEXT="row 12">
+<node CREATED="1353357766000" ID="ID_1890" MODIFIED="1353357766000" TEXT="cell 12.0">
+</node>
+<node CREATED="1353357824000" ID="ID_1891" MODIFIED="1353357824000" TEXT="cell 12.1">
+</node>
+<node CREATED="1353357878000" ID="ID_1892" MODIFIED="1353357878000" TEXT="cell 12.2">
+</node>
+</node>
+<node CREATED="1353357905000" ID="ID_1893" MODIFIED="1353357905000" TEXT="row 13">
+<node CREATED="1353357933000" ID="ID_1894" MODIFIED="1353357933000" TEXT="cell 13.0">
+</node>
+<node CREATED="1353357990000" ID="ID_1895" MODIFIED="1353357990000" TEXT="cell 13.1">
+</node>
+<node CREATED="1353358022000" ID="ID_1896" MODIFIED="1353358022000" TEXT="cell 13.2">
+</node>
+</node>
+<node CREATED="1353358066000" ID="ID_1897" MODIFIED="1353358066000" TEXT="row 14">
+<node CREATED="1353358115000" ID="ID_1898" MODIFIED="1353358115000" TEXT="cell 14.0">
+</node>
+<node CREATED="1353358163000" ID="ID_1899" MODIFIED="1353358163000" TEXT="cell 14.1">
+</node>
+<node CREATED="1353358215000" ID="ID_1900" MODIFIED="1353358215000" TEXT="cell 14.2">
+</node>
+</node>
+<node CREATED="1353358248000" ID="ID_1901" MODIFIED="1353358248000" TEXT="row 15">
+<node CREATED="1353358272000" ID="ID_1902" MODIFIED="1353358272000" TEXT="cell 15.0">
+</node>
+<node CREATED="1353358307000" ID="ID_1903" MODIFIED="1353358307000" TEXT="cell 15.1">
+</node>
+<node CREATED="1353358331000" ID="ID_1904" MODIFIED="1353358331000" TEXT="cell 15.2">
+</node>
+</node>
+<node CREATED="1353358383000" ID="ID_1905" MODIFIED="1353358383000" TEXT="row 16">
+<node CREATED="1353358443000" ID="ID_1906" MODIFIED="1353358443000" TEXT="cell 16.0">
+</node>
+<node CREATED="1353358445000" ID="ID_1907" MODIFIED="1353358445000" TEXT="cell 16.1">
+</node>
+<node CREATED="1353358446000" ID="ID_1908" MODIFIED="1353358446000" TEXT="cell 16.2">
+</node>
+</node>
+<node CREATED="1353358452000" ID="ID_1909" MODIFIED="1353358452000" TEXT="row 17">
+<node CREATED="1353358490000" ID="ID_1910" MODIFIED="1353358490000" TEXT="cell 17.0">
+</node>
+<node CREATED="1353358504000" ID="ID_1911" MODIFIED="1353358504000" TEXT="cell 17.1">
+</node>
+<node CREATED="1353358526000" ID="ID_1912" MODIFIED="1353358526000" TEXT="cell 17.2">
+</node>
+</node>
+<node CREATED="1353358570000" ID="ID_1913" MODIFIED="1353358570000" TEXT="row 18">
+<node CREATED="1353358616000" ID="ID_1914" MODIFIED="1353358616000" TEXT="cell 18.0">
+</node>
+<node CREATED="1353358667000" ID="ID_1915" MODIFIED="1353358667000" TEXT="cell 18.1">
+</node>
+<node CREATED="1353358685000" ID="ID_1916" MODIFIED="1353358685000" TEXT="cell 18.2">
+</node>
+</node>
+<node CREATED="1353358739000" ID="ID_1917" MODIFIED="1353358739000" TEXT="row 19">
+<node CREATED="1353358744000" ID="ID_1918" MODIFIED="1353358744000" TEXT="cell 19.0">
+</node>
+<node CREATED="1353358754000" ID="ID_1919" MODIFIED="1353358754000" TEXT="cell 19.1">
+</node>
+<node CREATED="1353358760000" ID="ID_1920" MODIFIED="1353358760000" TEXT="cell 19.2">
+</node>
+</node>
+<node CREATED="1353358796000" ID="ID_1921" MODIFIED="1353358796000" TEXT="row 20">
+<node CREATED="1353358832000" ID="ID_1922" MODIFIED="1353358832000" TEXT="cell 20.0">
+</node>
+<node CREATED="1353358863000" ID="ID_1923" MODIFIED="1353358863000" TEXT="cell 20.1">
+</node>
+<node CREATED="1353358883000" ID="ID_1924" MODIFIED="1353358883000" TEXT="cell 20.2">
+</node>
+</node>
+<node CREATED="1353358937000" ID="ID_1925" MODIFIED="1353358937000" TEXT="row 21">
+<node CREATED="1353358938000" ID="ID_1926" MODIFIED="1353358938000" TEXT="cell 21.0">
+</node>
+<node CREATED="1353358978000" ID="ID_1927" MODIFIED="1353358978000" TEXT="cell 21.1">
+</node>
+<node CREATED="1353359026000" ID="ID_1928" MODIFIED="1353359026000" TEXT="cell 21.2">
+</node>
+</node>
+<node CREATED="1353359043000" ID="ID_1929" MODIFIED="1353359043000" TEXT="row 22">
+<node CREATED="1353359082000" ID="ID_1930" MODIFIED="1353359082000" TEXT="cell 22.0">
+</node>
+<node CREATED="1353359116000" ID="ID_1931" MODIFIED="1353359116000" TEXT="cell 22.1">
+</node>
+<node CREATED="1353359129000" ID="ID_1932" MODIFIED="1353359129000" TEXT="cell 22.2">
+</node>
+</node>
+<node CREATED="1353359139000" ID="ID_1933" MODIFIED="1353359139000" TEXT="row 23">
+<node CREATED="1353359194000" ID="ID_1934" MODIFIED="1353359194000" TEXT="cell 23.0">
+</node>
+<node CREATED="1353359246000" ID="ID_1935" MODIFIED="1353359246000" TEXT="cell 23.1">
+</node>
+<node CREATED="1353359299000" ID="ID_1936" MODIFIED="1353359299000" TEXT="cell 23.2">
+</node>
+</node>
+<node CREATED="1353359331000" ID="ID_1937" MODIFIED="1353359331000" TEXT="row 24">
+<node CREATED="1353359343000" ID="ID_1938" MODIFIED="1353359343000" TEXT="cell 24.0">
+</node>
+<node CREATED="1353359344000" ID="ID_1939" MODIFIED="1353359344000" TEXT="cell 24.1">
+</node>
+<node CREATED="1353359389000" ID="ID_1940" MODIFIED="1353359389000" TEXT="cell 24.2">
+</node>
+</node>
+<node CREATED="1353359440000" ID="ID_1941" MODIFIED="1353359440000" TEXT="row 25">
+<node CREATED="1353359496000" ID="ID_1942" MODIFIED="1353359496000" TEXT="cell 25.0">
+</node>
+<node CREATED="1353359517000" ID="ID_1943" MODIFIED="1353359517000" TEXT="cell 25.1">
+</node>
+<node CREATED="1353359567000" ID="ID_1944" MODIFIED="1353359567000" TEXT="cell 25.2">
+</node>
+</node>
+<node CREATED="1353359573000" ID="ID_1945" MODIFIED="1353359573000" TEXT="row 26">
+<node CREATED="1353359607000" ID="ID_1946" MODIFIED="1353359607000" TEXT="cell 26.0">
+</node>
+<node CREATED="1353359636000" ID="ID_1947" MODIFIED="1353359636000" TEXT="cell 26.1">
+</node>
+<node CREATED="1353359649000" ID="ID_1948" MODIFIED="1353359649000" TEXT="cell 26.2">
+</node>
+</node>
+<node CREATED="1353359688000" ID="ID_1949" MODIFIED="1353359688000" TEXT="row 27">
+<node CREATED="1353359721000" ID="ID_1950" MODIFIED="1353359721000" TEXT="cell 27.0">
+</node>
+<node CREATED="1353359750000" ID="ID_1951" MODIFIED="1353359750000" TEXT="cell 27.1">
+</node>
+<node CREATED="1353359772000" ID="ID_1952" MODIFIED="1353359772000" TEXT="cell 27.2">
+</node>
+</node>
+<node CREATED="1353359832000" ID="ID_1953" MODIFIED="1353359832000" TEXT="row 28">
+<node CREATED="1353359863000" ID="ID_1954" MODIFIED="1353359863000" TEXT="cell 28.0">
+</node>
+<node CREATED="1353359885000" ID="ID_1955" MODIFIED="1353359885000" TEXT="cell 28.1">
+</node>
+<node CREATED="1353359926000" ID="ID_1956" MODIFIED="1353359926000" TEXT="cell 28.2">
+</node>
+</node>
+<node CREATED="1353359946000" ID="ID_1957" MODIFIED="1353359946000" TEXT="row 29">
+<node CREATED="1353359967000" ID="ID_1958" MODIFIED="1353359967000" TEXT="cell 29.0">
+</node>
+<node CREATED="1353359978000" ID="ID_1959" MODIFIED="1353359978000" TEXT="cell 29.1">
+</node>
+<node CREATED="1353359981000" ID="ID_1960" MODIFIED="1353359981000" TEXT="cell 29.2">
+</node>
+</node>
+<node CREATED="1353360006000" ID="ID_1961" MODIFIED="1353360006000" TEXT="row 30">
+<node CREATED="1353360066000" ID="ID_1962" MODIFIED="1353360066000" TEXT="cell 30.0">
+</node>
+<node CREATED="1353360110000" ID="ID_1963" MODIFIED="1353360110000" TEXT="cell 30.1">
+</node>
+<node CREATED="1353360152000" ID="ID_1964" MODIFIED="1353360152000" TEXT="cell 30.2">
+</node>
+</node>
+<node CREATED="1353360186000" ID="ID_1965" MODIFIED="1353360186000" TEXT="row 31">
+<node CREATED="1353360215000" ID="ID_1966" MODIFIED="1353360215000" TEXT="cell 31.0">
+</node>
+<node CREATED="1353360227000" ID="ID_1967" MODIFIED="1353360227000" TEXT="cell 31.1">
+</node>
+<node CREATED="1353360252000" ID="ID_1968" MODIFIED="1353360252000" TEXT="cell 31.2">
+</node>
+</node>
+<node CREATED="1353360266000" ID="ID_1969" MODIFIED="1353360266000" TEXT="row 32">
+<node CREATED="1353360267000" ID="ID_1970" MODIFIED="1353360267000" TEXT="cell 32.0">
+</node>
+<node CREATED="1353360268000" ID="ID_1971" MODIFIED="1353360268000" TEXT="cell 32.1">
+</node>
+<node CREATED="1353360317000" ID="ID_1972" MODIFIED="1353360317000" TEXT="cell 32.2">
+</node>
+</node>
+<node CREATED="1353360375000" ID="ID_1973" MODIFIED="1353360375000" TEXT="row 33">
+<node CREATED="1353360406000" ID="ID_1974" MODIFIED="1353360406000" TEXT="cell 33.0">
+</node>
+<node CREATED="1353360422000" ID="ID_1975" MODIFIED="1353360422000" TEXT="cell 33.1">
+</node>
+<node CREATED="1353360461000" ID="ID_1976" MODIFIED="1353360461000" TEXT="cell 33.2">
+</node>
+</node>
+<node CREATED="1353360485000" ID="ID_1977" MODIFIED="1353360485000" TEXT="row 34">
+<node CREATED="1353360499000" ID="ID_1978" MODIFIED="1353360499000" TEXT="cell 34.0">
+</node>
+<node CREATED="1353360525000" ID="ID_1979" MODIFIED="1353360525000" TEXT="cell 34.1">
+</node>
+<node CREATED="1353360571000" ID="ID_1980" MODIFIED="1353360571000" TEXT="cell 34.2">
+</node>
+</node>
+<node CREATED="1353360627000" ID="ID_1981" MODIFIED="1353360627000" TEXT="row 35">
+<node CREATED="1353360686000" ID="ID_1982" MODIFIED="1353360686000" TEXT="cell 35.0">
+</node>
+<node CREATED="1353360693000" ID="ID_1983" MODIFIED="1353360693000" TEXT="cell 35.1">
+</node>
+<node CREATED="1353360747000" ID="ID_1984" MODIFIED="1353360747000" TEXT="cell 35.2">
+</node>
+</node>
+<node CREATED="1353360806000" ID="ID_1985" MODIFIED="1353360806000" TEXT="row 36">
+<node CREATED="1353360860000" ID="ID_1986" MODIFIED="1353360860000" TEXT="cell 36.0">
+</node>
+<node CREATED="1353360910000" ID="ID_1987" MODIFIED="1353360910000" TEXT="cell 36.1">
+</node>
+<node CREATED="1353360960000" ID="ID_1988" MODIFIED="1353360960000" TEXT="cell 36.2">
+</node>
+</node>
+<node CREATED="1353360963000" ID="ID_1989" MODIFIED="1353360963000" TEXT="row 37">
+<node CREATED="1353360992000" ID="ID_1990" MODIFIED="1353360992000" TEXT="cell 37.0">
+</node>
+<node CREATED="1353361031000" ID="ID_1991" MODIFIED="1353361031000" TEXT="cell 37.1">
+</node>
+<node CREATED="1353361032000" ID="ID_1992" MODIFIED="1353361032000" TEXT="cell 37.2">
+</node>
+</node>
+<node CREATED="1353361091000" ID="ID_1993" MODIFIED="1353361091000" TEXT="row 38">
+<node CREATED="1353361106000" ID="ID_1994" MODIFIED="1353361106000" TEXT="cell 38.0">
+</node>
+<node CREATED="1353361129000" ID="ID_1995" MODIFIED="1353361129000" TEXT="cell 38.1">
+</node>
+<node CREATED="1353361150000" ID="ID_1996" MODIFIED="1353361150000" TEXT="cell 38.2">
+</node>
+</node>
+<node CREATED="1353361167000" ID="ID_1997" MODIFIED="1353361167000" TEXT="row 39">
+<node CREATED="1353361191000" ID="ID_1998" MODIFIED="1353361191000" TEXT="cell 39.0">
+</node>
+<node CREATED="1353361224000" ID="ID_1999" MODIFIED="1353361224000" TEXT="cell 39.1">
+</node>
+<node CREATED="1353361276000" ID="ID_2000" MODIFIED="1353361276000" TEXT="cell 39.2">
+</node>
+</node>
+</node>
+</node>
+</node>
+</map>